@@ -0,0 +1,41 @@
+"""Benchmarks Module - Offline benchmarks of the framework's hot paths.
+
+The suite runs against MockBot, so it needs no API keys or network access. It
+times Bot.respond overhead, message building and cache planning, save/load
+and autosave, deepcopy/fork/branch_self fan-out, and par_branch /
+broadcast_to_leaves scaling, writes the timings as JSON and compares them
+against a stored baseline.
+
+Example:
+    >>> from bots.benchmarks import BenchmarkConfig, compare, load_report, run
+    >>> report = run(BenchmarkConfig.quick(), only=["respond", "save_load"])
+    >>> regressions = compare(report, load_report("benchmarks/baseline.json"))
+
+    From the command line:
+        python -m bots.benchmarks --output results.json --baseline benchmarks/baseline.json
+        python -m bots.benchmarks --output benchmarks/baseline.json  # record a baseline
+"""
+
+from .suite import (
+    BENCHMARKS,
+    BenchmarkConfig,
+    BenchmarkResult,
+    Regression,
+    benchmark,
+    compare,
+    load_report,
+    run,
+    save_report,
+)
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkConfig",
+    "BenchmarkResult",
+    "Regression",
+    "benchmark",
+    "compare",
+    "load_report",
+    "run",
+    "save_report",
+]
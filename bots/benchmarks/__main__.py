@@ -0,0 +1,46 @@
+"""Command-line entry point: python -m bots.benchmarks --help"""
+
+import argparse
+import sys
+
+from .suite import BENCHMARKS, BenchmarkConfig, compare, load_report, run, save_report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bots.benchmarks", description="Offline benchmarks of bots hot paths")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and fewer repeats")
+    parser.add_argument("--repeat", type=int, help="Timed repetitions per case")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated mailbox latency in seconds")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against this JSON report; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    config = BenchmarkConfig.quick(args.latency) if args.quick else BenchmarkConfig(latency=args.latency)
+    if args.repeat:
+        config.repeat = args.repeat
+    report = run(config, only=args.only)
+
+    for name, timings in report["results"].items():
+        print(f"{name:<60} {timings['median'] * 1000:>10.3f} ms")
+    if args.output:
+        save_report(report, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), tolerance=args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(
+                    f"  {regression.name}: {regression.baseline * 1000:.3f} ms -> "
+                    f"{regression.current * 1000:.3f} ms ({regression.ratio:.2f}x)"
+                )
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
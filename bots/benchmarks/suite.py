@@ -0,0 +1,350 @@
+"""Benchmarks for the framework's own hot paths, run offline against MockBot.
+
+Each benchmark builds its fixtures with MockBot (MockMailbox with an optional
+simulated latency, MockToolHandler) and times one operation at several sizes:
+
+- respond: Bot.respond overhead per turn vs conversation depth
+- build_messages: ConversationNode._build_messages on a growing conversation
+- cache_planning: AnthropicMailbox._build_create_dict (messages plus
+  CachePlanner) and CacheController.manage_cache_controls vs depth
+- save_load: save, load and autosaved respond cost vs tree size
+- fan_out: copy.deepcopy, Bot.fork and branch_self with N branches
+- parallel: par_branch and broadcast_to_leaves with N branches
+
+Results are keyed "<benchmark>.<operation>[<param>=<value>]" and hold the
+per-repeat wall-clock seconds. compare() checks a run against a stored
+baseline; a case regresses when its median grows by more than the tolerance.
+"""
+
+import copy
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import chdir
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from bots.testing.mock_bot import MockBot
+
+DEPTHS = (10, 100, 1000)
+QUICK_DEPTHS = (10, 100)
+FAN_OUT = (1, 4, 16)
+QUICK_FAN_OUT = (1, 4)
+
+
+@dataclass
+class BenchmarkConfig:
+    """Sizes and repetitions for a benchmark run.
+
+    Attributes:
+        depths: Conversation depths (number of turns) to measure at
+        fan_out: Branch counts for the fan-out and parallel benchmarks
+        repeat: Timed repetitions per case
+        latency: Simulated MockMailbox latency in seconds
+    """
+
+    depths: Iterable[int] = DEPTHS
+    fan_out: Iterable[int] = FAN_OUT
+    repeat: int = 5
+    latency: float = 0.0
+
+    @classmethod
+    def quick(cls, latency: float = 0.0) -> "BenchmarkConfig":
+        """Smaller sizes for smoke runs and CI."""
+        return cls(depths=QUICK_DEPTHS, fan_out=QUICK_FAN_OUT, repeat=3, latency=latency)
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark case.
+
+    Attributes:
+        name: Case name, e.g. "respond.per_turn[depth=100]"
+        seconds: Wall-clock seconds of each repetition
+    """
+
+    name: str
+    seconds: List[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.seconds)
+
+    @property
+    def best(self) -> float:
+        return min(self.seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"median": self.median, "min": self.best, "repeat": len(self.seconds), "seconds": self.seconds}
+
+
+@dataclass
+class Regression:
+    """A case whose median grew beyond the tolerance."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkConfig], List[BenchmarkResult]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark function under name."""
+
+    def register(func: Callable[[BenchmarkConfig], List[BenchmarkResult]]) -> Callable:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def measure(name: str, func: Callable[[Any], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> BenchmarkResult:
+    """Time func(setup()) repeat times; setup runs outside the timed region."""
+    result = BenchmarkResult(name)
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        func(state)
+        result.seconds.append(time.perf_counter() - start)
+    return result
+
+
+def mock_bot(depth: int = 0, latency: float = 0.0, tools: int = 2) -> MockBot:
+    """Return a MockBot with depth user/assistant turns and a few mock tools."""
+    bot = MockBot(autosave=False, enable_tracing=False)
+    bot.set_system_message("You are a benchmark fixture.")
+    bot.set_response_delay(latency)
+    for index in range(tools):
+        bot.add_mock_tool(f"tool_{index}")
+    grow(bot, depth)
+    return bot
+
+
+def grow(bot: Any, turns: int) -> None:
+    """Append turns user/assistant pairs without going through the mailbox."""
+    for index in range(turns):
+        bot.conversation = bot.conversation._add_reply(role="user", content=f"Question {index}: " + "lorem ipsum " * 20)
+        bot.conversation = bot.conversation._add_reply(role="assistant", content=f"Answer {index}: " + "dolor sit " * 40)
+
+
+@benchmark("respond")
+def bench_respond(config: BenchmarkConfig) -> List[BenchmarkResult]:
+    results = []
+    for depth in config.depths:
+        bot = mock_bot(depth, config.latency)
+        results.append(measure(f"respond.per_turn[depth={depth}]", lambda _: bot.respond("next"), config.repeat))
+    return results
+
+
+@benchmark("build_messages")
+def bench_build_messages(config: BenchmarkConfig) -> List[BenchmarkResult]:
+    results = []
+    for depth in config.depths:
+        bot = mock_bot(depth)
+
+        def next_turn(bot=bot):
+            grow(bot, 1)
+            return bot
+
+        results.append(
+            measure(
+                f"build_messages.per_turn[depth={depth}]", lambda b: b.conversation._build_messages(), config.repeat, next_turn
+            )
+        )
+    return results
+
+
+@benchmark("cache_planning")
+def bench_cache_planning(config: BenchmarkConfig) -> List[BenchmarkResult]:
+    from bots.foundation.anthropic_bots import AnthropicBot, AnthropicMailbox, CacheController
+
+    results = []
+    for depth in config.depths:
+        bot = AnthropicBot(api_key="benchmark", autosave=False, enable_tracing=False)
+        bot.set_system_message("You are a benchmark fixture.")
+        grow(bot, depth)
+
+        def next_turn(bot=bot):
+            grow(bot, 1)
+            bot.conversation = bot.conversation._add_reply(role="user", content="next")
+            return bot
+
+        def drop_turn(bot):
+            AnthropicMailbox._build_create_dict(bot, None)
+            bot.conversation = bot.conversation.parent
+
+        results.append(measure(f"cache_planning.create_dict[depth={depth}]", drop_turn, config.repeat, next_turn))
+        messages = bot.conversation._build_messages()
+        results.append(
+            measure(
+                f"cache_planning.cache_controller[depth={depth}]",
+                CacheController().manage_cache_controls,
+                config.repeat,
+                lambda: copy.deepcopy(messages),
+            )
+        )
+    return results
+
+
+@benchmark("save_load")
+def bench_save_load(config: BenchmarkConfig) -> List[BenchmarkResult]:
+    from bots.foundation.base import Bot
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory, chdir(directory):
+        for depth in config.depths:
+            bot = mock_bot(depth)
+            for format in ("json", "binary"):
+                path = f"{format}_{depth}.bot"
+                results.append(
+                    measure(
+                        f"save_load.save[depth={depth},format={format}]",
+                        lambda _: bot.save(path, format=format),
+                        config.repeat,
+                    )
+                )
+                results.append(
+                    measure(f"save_load.load[depth={depth},format={format}]", lambda _: Bot.load(path), config.repeat)
+                )
+            bot.autosave = True
+            bot.respond("warm up the autosave journal")
+            results.append(measure(f"save_load.autosave_respond[depth={depth}]", lambda _: bot.respond("next"), config.repeat))
+    return results
+
+
+@benchmark("fan_out")
+def bench_fan_out(config: BenchmarkConfig) -> List[BenchmarkResult]:
+    from bots.tools.self_tools import branch_self
+
+    results = []
+    for depth in config.depths:
+        bot = mock_bot(depth, config.latency)
+        results.append(measure(f"fan_out.deepcopy[depth={depth}]", lambda _: copy.deepcopy(bot), config.repeat))
+        results.append(measure(f"fan_out.fork[depth={depth}]", lambda _: bot.fork(), config.repeat))
+    for branches in config.fan_out:
+        bot = mock_bot(max(config.depths), config.latency)
+        bot.respond("start")
+        node = bot.conversation
+        prompts = repr([f"task {index}" for index in range(branches)])
+
+        def run_branch_self(_, bot=bot, node=node, prompts=prompts):
+            branch_self(prompts, parallel="True", _bot=bot)
+            bot.conversation = node
+
+        results.append(measure(f"fan_out.branch_self[n={branches}]", run_branch_self, config.repeat))
+    return results
+
+
+@benchmark("parallel")
+def bench_parallel(config: BenchmarkConfig) -> List[BenchmarkResult]:
+    from bots.flows import functional_prompts as fp
+
+    results = []
+    depth = min(config.depths)
+    for branches in config.fan_out:
+        prompts = [f"task {index}" for index in range(branches)]
+        bot = mock_bot(depth, config.latency)
+        node = bot.conversation
+
+        def run_par_branch(_, bot=bot, node=node, prompts=prompts):
+            fp.par_branch(bot, prompts)
+            bot.conversation = node
+
+        results.append(measure(f"parallel.par_branch[n={branches}]", run_par_branch, config.repeat))
+
+        def leaves(branches=branches):
+            bot = mock_bot(depth, config.latency)
+            fp.par_branch(bot, [f"task {index}" for index in range(branches)])
+            return bot
+
+        results.append(
+            measure(
+                f"parallel.broadcast_to_leaves[n={branches}]",
+                lambda bot: fp.broadcast_to_leaves(bot, "continue", skip=[]),
+                config.repeat,
+                leaves,
+            )
+        )
+    return results
+
+
+def run(config: Optional[BenchmarkConfig] = None, only: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Run the registered benchmarks and return a JSON-serializable report.
+
+    Args:
+        config: Sizes and repetitions; defaults to BenchmarkConfig()
+        only: Benchmark names to run; defaults to all of BENCHMARKS
+
+    Returns:
+        Dict with "environment", "config" and "results" (case name to timings)
+
+    Raises:
+        KeyError: If only names an unknown benchmark
+    """
+    config = config or BenchmarkConfig()
+    names = list(only) if only else list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise KeyError(f"Unknown benchmark: {name} (available: {', '.join(BENCHMARKS)})")
+    results = {}
+    for name in names:
+        for result in BENCHMARKS[name](config):
+            results[result.name] = result.to_dict()
+    return {
+        "environment": {"python": sys.version.split()[0], "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": {
+            "depths": list(config.depths),
+            "fan_out": list(config.fan_out),
+            "repeat": config.repeat,
+            "latency": config.latency,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25, floor: float = 0.0005
+) -> List[Regression]:
+    """Return the cases of report that regressed against baseline.
+
+    Args:
+        report: Output of run()
+        baseline: An earlier run() output
+        tolerance: Allowed relative growth of a case's median
+        floor: Cases whose baseline and current medians are both below this
+            many seconds are ignored, as their timings are mostly noise
+
+    Returns:
+        List[Regression]: Regressed cases, worst first; cases missing from
+        either side are not compared
+    """
+    regressions = []
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None or max(current["median"], previous["median"]) < floor:
+            continue
+        if current["median"] > previous["median"] * (1 + tolerance):
+            regressions.append(Regression(name, previous["median"], current["median"]))
+    return sorted(regressions, key=lambda regression: regression.ratio, reverse=True)
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    """Write a run() report as JSON."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """Read a report written by save_report()."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
@@ -564,6 +564,7 @@ class CLIConfig:
         self.auto_backup = True  # Enable backups by default
         self.auto_restore_on_error = True  # Enable restore on error by default
         self.color = "auto"  # Color mode: 'auto', 'always', 'never'
+        self.stream = False  # Stream responses as they are generated (Anthropic bots)
         self.config_file = "cli_config.json"
         self.load_config()
 
@@ -587,6 +588,7 @@ class CLIConfig:
                     self.auto_backup = config_data.get("auto_backup", True)
                     self.auto_restore_on_error = config_data.get("auto_restore_on_error", True)
                     self.color = config_data.get("color", "auto")
+                    self.stream = config_data.get("stream", False)
         except Exception:
             pass  # Use defaults if config loading fails
 
@@ -606,6 +608,7 @@ class CLIConfig:
                 "auto_backup": self.auto_backup,
                 "auto_restore_on_error": self.auto_restore_on_error,
                 "color": self.color,
+                "stream": self.stream,
             }
             with open(self.config_file, "w") as f:
                 json.dump(config_data, f, indent=2)
@@ -618,9 +621,33 @@ class RealTimeDisplayCallbacks(BotCallbacks):
 
     def __init__(self, context: "CLIContext"):
         self.context = context
+        self._streaming = False  # A streamed text block is being printed
+        self._streamed = False  # Text was streamed during the current API call
+
+    def on_text_delta(self, text: str, metadata=None):
+        """Print streamed text as it arrives, starting with the bot's name."""
+        if not self._streaming:
+            bot_name = self.context.bot_instance.name if self.context.bot_instance else "Bot"
+            sys.stdout.write(f"\n{COLOR_BOT}{COLOR_BOLD}{bot_name}: {COLOR_RESET}{COLOR_BOT}")
+            self._streaming = True
+            self._streamed = True
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def _end_stream(self):
+        """Finish the line of a streamed text block."""
+        if self._streaming:
+            sys.stdout.write(f"{COLOR_RESET}\n\n")
+            sys.stdout.flush()
+            self._streaming = False
 
     def on_api_call_complete(self, metadata=None):
         """Display bot response immediately after API call completes, before tools execute."""
+        if self._streamed:
+            # Already shown as it streamed
+            self._end_stream()
+            self._streamed = False
+            return
         if metadata and "bot_response" in metadata:
             bot_response = metadata["bot_response"]
             bot_name = self.context.bot_instance.name if self.context.bot_instance else "Bot"
@@ -635,6 +662,8 @@ class RealTimeDisplayCallbacks(BotCallbacks):
 
     def on_tool_start(self, tool_name: str, metadata=None):
         """Display tool request when it starts - show only the tool name and input parameters."""
+        # Streamed tools can start while text is still arriving
+        self._end_stream()
         if not self.context.config.verbose:
             return
 
@@ -683,6 +712,13 @@ class RealTimeDisplayCallbacks(BotCallbacks):
             )
 
 
+def attach_display_callbacks(bot: Bot, context: "CLIContext") -> None:
+    """Attach real-time display callbacks to a bot and apply the stream setting."""
+    bot.callbacks = RealTimeDisplayCallbacks(context)
+    if hasattr(bot, "stream"):
+        bot.stream = context.config.stream
+
+
 class CLICallbacks:
     """Centralized callback management for CLI operations."""
 
@@ -857,7 +893,7 @@ class CLIContext:
             self.bot_instance = restored_bot
 
             # Re-attach callbacks on the restored instance (pointing to current context)
-            self.bot_instance.callbacks = RealTimeDisplayCallbacks(self)
+            attach_display_callbacks(self.bot_instance, self)
 
             # Make the restored bot interruptible with Ctrl-C
             from bots.dev.bot_session import make_bot_interruptible
@@ -1599,7 +1635,7 @@ class StateHandler:
                 new_bot.conversation = new_bot.conversation.replies[-1]
 
             # Attach CLI callbacks for proper display
-            new_bot.callbacks = RealTimeDisplayCallbacks(context)
+            attach_display_callbacks(new_bot, context)
 
             # Make the bot interruptible with Ctrl-C
             from bots.dev.bot_session import make_bot_interruptible
@@ -1733,6 +1769,7 @@ class SystemHandler:
                 f"    auto_backup: {context.config.auto_backup}",
                 f"    auto_restore_on_error: {context.config.auto_restore_on_error}",
                 f"    color: {context.config.color}",
+                f"    stream: {context.config.stream}",
                 "Use '/config set <setting> <value>' to modify settings.",
             ]
             return "\n".join(config_lines)
@@ -1776,6 +1813,10 @@ class SystemHandler:
                     context.config.color = value
                     # Reinitialize colors with new setting
                     _init_colors(value)
+                elif setting == "stream":
+                    context.config.stream = value.lower() in ("true", "1", "yes", "on")
+                    if hasattr(bot, "stream"):
+                        bot.stream = context.config.stream
                 else:
                     return f"Unknown setting: {setting}"
                 context.config.save_config()
@@ -2803,7 +2844,7 @@ class CLI:
 
         # Attach real-time display callback to bot if it exists
         if self.context.bot_instance:
-            self.context.bot_instance.callbacks = RealTimeDisplayCallbacks(self.context)
+            attach_display_callbacks(self.context.bot_instance, self.context)
 
     @property
     def last_user_message(self):
@@ -2852,7 +2893,7 @@ class CLI:
 
             # Ensure bot has real-time callback
             if self.context.bot_instance:
-                self.context.bot_instance.callbacks = RealTimeDisplayCallbacks(self.context)
+                attach_display_callbacks(self.context.bot_instance, self.context)
 
             while True:
                 try:
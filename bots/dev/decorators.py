@@ -403,7 +403,7 @@ def log_errors(func: Callable) -> Callable:
     return wrapper
 
 
-def toolify(description: str = None, preconditions: list = None, postconditions: list = None):
+def toolify(description: str = None, preconditions: list = None, postconditions: list = None, parallel_safe: bool = False):
     """
     Convert any function into a bot tool with string-in, string-out interface.
 
@@ -412,12 +412,16 @@ def toolify(description: str = None, preconditions: list = None, postconditions:
     - Wraps in error handling (returns error strings, never raises)
     - Enhances docstring if description provided
     - Validates preconditions and postconditions before execution
+    - async def functions get an async wrapper, so the tool stays awaitable
 
     Args:
         description (str, optional): Override the function's docstring
         preconditions (list, optional): List of contract functions to check before execution
         postconditions (list, optional): List of contract functions to check before execution
             (despite the name, these run before execution to validate the operation)
+        parallel_safe (bool, optional): Mark the tool as safe to run concurrently with other
+            parallel-safe tools from the same response (e.g. read-only tools). Only takes effect
+            when the bot's ToolHandler has parallel_execution enabled.
 
     Contract functions should have signature: (*args, **kwargs) -> tuple[bool, str]
     They can also raise exceptions which will be caught and converted to error messages.
@@ -439,94 +443,115 @@ def toolify(description: str = None, preconditions: list = None, postconditions:
         @toolify(preconditions=[check_positive])
         def add_positive(x: int, y: int) -> int:
             return x + y
+
+        @toolify(parallel_safe=True)
+        def read_config(path: str) -> str:
+            return open(path).read()
     """
 
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                # Convert string inputs to proper types using type hints
-                converted_args, converted_kwargs = _convert_tool_inputs(func, args, kwargs)
-
-                # Check preconditions
-                if preconditions:
-                    precondition_errors = []
-                    for contract in preconditions:
-                        try:
-                            is_valid, error_msg = contract(*converted_args, **converted_kwargs)
-                            if not is_valid:
-                                precondition_errors.append(error_msg)
-                        except Exception as e:
-                            # Contract raised an exception - treat as validation failure
-                            from bots.utils.helpers import _process_error
-
-                            return _process_error(e)
-
-                    if precondition_errors:
-                        error_message = "Contract validation failed:\nPreconditions:\n"
-                        for error in precondition_errors:
-                            error_message += f"  - {error}\n"
-                        return error_message.strip()
-
-                # Check postconditions (despite the name, these run before execution)
-                if postconditions:
-                    postcondition_errors = []
-                    for contract in postconditions:
-                        try:
-                            is_valid, error_msg = contract(*converted_args, **converted_kwargs)
-                            if not is_valid:
-                                postcondition_errors.append(error_msg)
-                        except Exception as e:
-                            # Contract raised an exception - treat as validation failure
-                            from bots.utils.helpers import _process_error
-
-                            return _process_error(e)
-
-                    if postcondition_errors:
-                        error_message = "Contract validation failed:\nPostconditions:\n"
-                        for error in postcondition_errors:
-                            error_message += f"  - {error}\n"
-                        return error_message.strip()
-
-                # Call original function
-                result = func(*converted_args, **converted_kwargs)
-
-                # Convert result to string
-                return _convert_tool_output(result)
-
-            except KeyboardInterrupt as e:
+        # Work out the input converters once, not on every call
+        input_plan = _compile_input_converters(func)
+
+        def check_contracts(converted_args, converted_kwargs):
+            """Return a contract error message, or None if all contracts pass."""
+            # Check preconditions
+            if preconditions:
+                precondition_errors = []
+                for contract in preconditions:
+                    try:
+                        is_valid, error_msg = contract(*converted_args, **converted_kwargs)
+                        if not is_valid:
+                            precondition_errors.append(error_msg)
+                    except Exception as e:
+                        # Contract raised an exception - treat as validation failure
+                        from bots.utils.helpers import _process_error
+
+                        return _process_error(e)
+
+                if precondition_errors:
+                    error_message = "Contract validation failed:\nPreconditions:\n"
+                    for error in precondition_errors:
+                        error_message += f"  - {error}\n"
+                    return error_message.strip()
+
+            # Check postconditions (despite the name, these run before execution)
+            if postconditions:
+                postcondition_errors = []
+                for contract in postconditions:
+                    try:
+                        is_valid, error_msg = contract(*converted_args, **converted_kwargs)
+                        if not is_valid:
+                            postcondition_errors.append(error_msg)
+                    except Exception as e:
+                        # Contract raised an exception - treat as validation failure
+                        from bots.utils.helpers import _process_error
+
+                        return _process_error(e)
+
+                if postcondition_errors:
+                    error_message = "Contract validation failed:\nPostconditions:\n"
+                    for error in postcondition_errors:
+                        error_message += f"  - {error}\n"
+                    return error_message.strip()
+            return None
+
+        def handle_error(e):
+            """Turn an exception raised by the tool into an error string."""
+            from bots.utils.helpers import _process_error
+
+            if isinstance(e, KeyboardInterrupt):
                 # Convert KeyboardInterrupt to ToolExecutionError to prevent it from
                 # bubbling up to CLI and being treated as user Ctrl+C
-                from bots.utils.helpers import _process_error
-
-                tool_error = ToolExecutionError(f"Tool execution interrupted: {str(e)}")
-                return _process_error(tool_error)
-
-            except TypeError as e:
-                # Check if this is a missing required argument error
-                error_msg = str(e)
-                if "missing" in error_msg and "required" in error_msg and "argument" in error_msg:
-                    # Add special message for output token limitation
-                    enhanced_error = TypeError(
-                        f"{error_msg}\n\n"
-                        f"⚠️  This error is commonly caused by hitting the max_tokens limit "
-                        f"before completing the tool call.\n"
-                        f"The response was truncated mid-parameter, making it appear that "
-                        f"required parameters are missing.\n"
-                        f"To fix this: Work in SMALLER CHUNKS. Edit fewer lines at a time, "
-                        f"or break your task into multiple steps."
-                    )
-                    from bots.utils.helpers import _process_error
-
-                    return _process_error(enhanced_error)
-                else:
-                    from bots.utils.helpers import _process_error
-
-                    return _process_error(e)
-            except Exception as e:
-                from bots.utils.helpers import _process_error
-
-                return _process_error(e)
+                return _process_error(ToolExecutionError(f"Tool execution interrupted: {str(e)}"))
+
+            error_msg = str(e)
+            if isinstance(e, TypeError) and "missing" in error_msg and "required" in error_msg and "argument" in error_msg:
+                # Add special message for output token limitation
+                enhanced_error = TypeError(
+                    f"{error_msg}\n\n"
+                    f"⚠️  This error is commonly caused by hitting the max_tokens limit "
+                    f"before completing the tool call.\n"
+                    f"The response was truncated mid-parameter, making it appear that "
+                    f"required parameters are missing.\n"
+                    f"To fix this: Work in SMALLER CHUNKS. Edit fewer lines at a time, "
+                    f"or break your task into multiple steps."
+                )
+                return _process_error(enhanced_error)
+            return _process_error(e)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    converted_args, converted_kwargs = _convert_tool_inputs(func, args, kwargs, input_plan)
+                    contract_error = check_contracts(converted_args, converted_kwargs)
+                    if contract_error is not None:
+                        return contract_error
+                    result = await func(*converted_args, **converted_kwargs)
+                    return _convert_tool_output(result)
+                except (KeyboardInterrupt, Exception) as e:
+                    return handle_error(e)
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    # Convert string inputs to proper types using type hints
+                    converted_args, converted_kwargs = _convert_tool_inputs(func, args, kwargs, input_plan)
+                    contract_error = check_contracts(converted_args, converted_kwargs)
+                    if contract_error is not None:
+                        return contract_error
+
+                    # Call original function
+                    result = func(*converted_args, **converted_kwargs)
+
+                    # Convert result to string
+                    return _convert_tool_output(result)
+                except (KeyboardInterrupt, Exception) as e:
+                    return handle_error(e)
 
         # Update docstring if description provided
         if description:
@@ -535,41 +560,65 @@ def toolify(description: str = None, preconditions: list = None, postconditions:
             # Generate minimal docstring from function name
             wrapper.__doc__ = f"Execute {func.__name__.replace('_', ' ')}"
 
+        wrapper.__parallel_safe__ = parallel_safe
+
         return wrapper
 
     return decorator
 
 
-def _convert_tool_inputs(func, args, kwargs):
-    """Convert string inputs to proper types using function's type hints."""
-    import inspect
+def _compile_input_converters(func):
+    """Build the input conversion plan for a tool function.
+
+    Returns:
+        tuple: (converters, by_name), where converters lists one converter per
+        parameter in signature order and by_name maps parameter names to the
+        same converters. A converter is None for parameters without a type
+        hint. Returns None if the signature cannot be read.
+    """
+    try:
+        sig = inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+    by_name = {}
+    for name, param in sig.parameters.items():
+        if param.annotation is inspect.Parameter.empty:
+            by_name[name] = None
+        else:
+            by_name[name] = functools.partial(_convert_string_to_type, type_hint=param.annotation)
+    return list(by_name.values()), by_name
+
+
+def _convert_tool_inputs(func, args, kwargs, plan=None):
+    """Convert string inputs to proper types using function's type hints.
 
-    sig = inspect.signature(func)
+    Args:
+        func: The tool function
+        args: Positional arguments
+        kwargs: Keyword arguments
+        plan: Result of _compile_input_converters(func); built on the fly if omitted
+    """
+    if plan is None:
+        plan = _compile_input_converters(func)
+        if plan is None:
+            return tuple(args), dict(kwargs)
+    converters, by_name = plan
 
     converted_args = []
     converted_kwargs = {}
 
     # Convert positional args
-    param_names = list(sig.parameters.keys())
     for i, arg in enumerate(args):
-        if i < len(param_names):
-            param_name = param_names[i]
-            param = sig.parameters[param_name]
-            converted_value = _convert_string_to_type(arg, param.annotation)
-            converted_args.append(converted_value)
-        else:
-            # No type hint available, keep as string
-            converted_args.append(arg)
+        converter = converters[i] if i < len(converters) else None
+        # No type hint available, keep as string
+        converted_args.append(arg if converter is None else converter(arg))
 
     # Convert keyword args
     for key, value in kwargs.items():
-        if key in sig.parameters:
-            param = sig.parameters[key]
-            converted_value = _convert_string_to_type(value, param.annotation)
-            converted_kwargs[key] = converted_value
-        else:
-            # No type hint available, keep as string
-            converted_kwargs[key] = value
+        converter = by_name.get(key)
+        # No type hint available, keep as string
+        converted_kwargs[key] = value if converter is None else converter(value)
 
     return tuple(converted_args), converted_kwargs
 
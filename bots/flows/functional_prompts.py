@@ -22,6 +22,11 @@ Key Features:
     - prompt_for(): Dynamic prompts from data
     - par_dispatch(): Compare multiple bots
 
+- Async (for use inside an event loop, built on Bot.arespond()):
+    - achain(): Async version of chain()
+    - apar_branch(): Async version of par_branch()
+    - abroadcast_to_leaves(): Async version of broadcast_to_leaves()
+
 Common Parameters:
 - bot (Bot): The bot instance to use
 - prompts (List[Prompt]): List of prompts to process
@@ -39,8 +44,8 @@ Example:
     ... ])
 """
 
+import asyncio
 import logging
-import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable, List, Optional, Tuple, Union
 
@@ -1103,22 +1108,20 @@ def par_branch(
         )
 
     Note:
-        This function temporarily disables bot autosave and creates a temporary
-        file to facilitate parallel processing. The file is cleaned up after
-        completion.
+        This function temporarily disables bot autosave and gives each thread
+        its own bot.fork(), which shares the conversation history and tools
+        with the original bot.
     """
 
     original_autosave = bot.autosave
     original_conversation = bot.conversation
     bot.autosave = False
-    temp_file = "temp_bot.bot"
-    bot.save(temp_file)
     responses = [None] * len(prompts)
     nodes = [None] * len(prompts)
 
     def process_prompt(index: int, prompt: str) -> Tuple[int, Response, ResponseNode]:
         try:
-            branch_bot = Bot.load(temp_file)
+            branch_bot = bot.fork()
             branch_bot.autosave = False
             response = branch_bot.respond(prompt)
             new_node = branch_bot.conversation
@@ -1152,10 +1155,6 @@ def par_branch(
                 nodes[idx] = None
 
     bot.autosave = original_autosave
-    try:
-        os.remove(temp_file)
-    except OSError:
-        pass
     return responses, nodes
 
 
@@ -1228,26 +1227,22 @@ def par_branch_while(
         ... )
 
     Implementation Notes:
-        - Uses temporary file to store bot state for thread safety
+        - Each branch runs on its own bot.fork() to prevent interference
         - Disables autosave during parallel processing
-        - Each branch gets its own bot instance to prevent interference
         - Conversation nodes are properly re-linked after parallel execution
-        - Temporary resources are cleaned up after completion
     """
 
     original_autosave = bot.autosave
     original_conversation = bot.conversation
     bot.autosave = False
-    temp_file = "temp_bot.bot"
-    bot.save(temp_file)
     responses = [None] * len(prompt_list)
     nodes = [None] * len(prompt_list)
 
     def process_branch(
-        index: int, initial_prompt: str, temp_file: str, stop_condition: Condition, continue_prompt: str, use_callback: bool
+        index: int, initial_prompt: str, stop_condition: Condition, continue_prompt: str, use_callback: bool
     ) -> Tuple[int, Response, ResponseNode]:
         try:
-            branch_bot = Bot.load(temp_file)
+            branch_bot = bot.fork()
             branch_bot.autosave = False
             first_response = branch_bot.respond(initial_prompt)
             first_response_node = branch_bot.conversation
@@ -1270,7 +1265,7 @@ def par_branch_while(
     with ThreadPoolExecutor() as executor:
         # Submit all tasks with explicit parameters instead of closure
         futures = [
-            executor.submit(process_branch, i, prompt, temp_file, stop_condition, continue_prompt, callback is not None)
+            executor.submit(process_branch, i, prompt, stop_condition, continue_prompt, callback is not None)
             for i, prompt in enumerate(prompt_list)
         ]
 
@@ -1300,10 +1295,6 @@ def par_branch_while(
                     nodes[idx] = None
 
     bot.autosave = original_autosave
-    try:
-        os.remove(temp_file)
-    except OSError:
-        pass
     return responses, nodes
 
 
@@ -1409,8 +1400,6 @@ def broadcast_to_leaves(
     original_autosave = bot.autosave
     original_conversation = bot.conversation
     bot.autosave = False
-    temp_file = "temp_broadcast_bot.bot"
-    bot.save(temp_file)
 
     # Find all leaf nodes starting from current position
     def find_leaves(node: ConversationNode) -> List[ConversationNode]:
@@ -1442,7 +1431,7 @@ def broadcast_to_leaves(
     def process_leaf(index: int, leaf: ConversationNode):
         """Process a single leaf node with optional iteration in parallel."""
         try:
-            leaf_bot = Bot.load(temp_file)
+            leaf_bot = bot.fork()
             leaf_bot.autosave = False
             leaf_bot.conversation = leaf
             response = leaf_bot.respond(prompt)
@@ -1477,10 +1466,6 @@ def broadcast_to_leaves(
     # Restore bot state
     bot.autosave = original_autosave
     bot.conversation = original_conversation
-    try:
-        os.remove(temp_file)
-    except OSError:
-        pass
     return responses, nodes
 
 
@@ -1545,8 +1530,6 @@ def broadcast_fp(
     original_autosave = bot.autosave
     original_conversation = bot.conversation
     bot.autosave = False
-    temp_file = "temp_broadcast_fp_bot.bot"
-    bot.save(temp_file)
 
     # Find all leaf nodes starting from current position
     def find_leaves(node: ConversationNode) -> List[ConversationNode]:
@@ -1578,7 +1561,7 @@ def broadcast_fp(
     def process_leaf(index: int, leaf: ConversationNode):
         """Process a single leaf node with the functional prompt."""
         try:
-            leaf_bot = Bot.load(temp_file)
+            leaf_bot = bot.fork()
             leaf_bot.autosave = False
             leaf_bot.conversation = leaf
 
@@ -1618,9 +1601,166 @@ def broadcast_fp(
     # Restore bot state
     bot.autosave = original_autosave
     bot.conversation = original_conversation
+
+    return responses, nodes
+
+
+async def achain(
+    bot: Bot, prompt_list: List[Prompt], callback: Optional[Callable[[List[Response], List[ResponseNode]], None]] = None
+) -> Tuple[List[Response], List[ResponseNode]]:
+    """Async version of chain() using bot.arespond().
+
+    Use inside an event loop, e.g. to run several chains concurrently with
+    asyncio.gather() on different bots or forks.
+
+    Args:
+        bot (Bot): The bot to interact with
+        prompt_list (List[Prompt]): Ordered list of prompts to process sequentially
+        callback (Optional[Callable[[List[Response], List[ResponseNode]], None]]):
+            A function (with arguments list[respose], list[node]) which is called
+            after each response from the bot.
+
+    Returns:
+        Tuple[List[Response], List[ResponseNode]]: A tuple containing a list of response strings
+            and a list of corresponding ConversationNodes.
+    """
+    responses = []
+    nodes = []
+    for prompt in prompt_list:
+        response = await bot.arespond(prompt)
+        responses.append(response)
+        nodes.append(bot.conversation)
+        if callback:
+            try:
+                callback(responses, nodes)
+            except Exception:
+                pass  # Don't let callback errors break the main function
+    return responses, nodes
+
+
+async def apar_branch(
+    bot: Bot, prompts: List[Prompt], callback: Optional[Callable[[List[Response], List[ResponseNode]], None]] = None
+) -> Tuple[List[Response], List[ResponseNode]]:
+    """Async version of par_branch().
+
+    Each prompt runs on its own bot.fork() and all branches are awaited
+    concurrently on the current event loop instead of in threads.
+
+    Args:
+        bot (Bot): The bot to interact with
+        prompts (List[Prompt]): List of prompts to process concurrently
+        callback (Optional[Callable[[List[Response], List[ResponseNode]], None]]):
+            A function (with arguments list[respose], list[node]) which is called
+            after each branch completes.
+
+    Returns:
+        Tuple[List[Response], List[ResponseNode]]: A tuple containing:
+            - List of responses, one per prompt
+            - List of conversation nodes containing those responses
+            Note: Failed branches return (None, None) at their positions
+
+    Example:
+        responses, nodes = await apar_branch(bot, ["Analyze code...", "Review docs..."])
+    """
+    original_autosave = bot.autosave
+    original_conversation = bot.conversation
+    bot.autosave = False
+    responses = [None] * len(prompts)
+    nodes = [None] * len(prompts)
+
+    async def process_prompt(prompt: str) -> Tuple[Response, ResponseNode]:
+        try:
+            branch_bot = bot.fork()
+            branch_bot.autosave = False
+            response = await branch_bot.arespond(prompt)
+            return response, branch_bot.conversation
+        except Exception:
+            return None, None
+
     try:
-        os.remove(temp_file)
-    except OSError:
-        pass
+        results = await asyncio.gather(*(process_prompt(prompt) for prompt in prompts))
+    finally:
+        bot.autosave = original_autosave
+
+    for idx, (response, new_node) in enumerate(results):
+        if new_node is None:
+            continue
+        # Link the node to the original conversation once all branches are done
+        new_node.parent.parent = original_conversation
+        original_conversation.replies.append(new_node.parent)
+
+        responses[idx] = response
+        nodes[idx] = new_node.parent
+
+        if callback:
+            try:
+                callback([response], [new_node])
+            except Exception:
+                pass  # Don't let callback errors break the main function
+
+    return responses, nodes
+
+
+async def abroadcast_to_leaves(
+    bot: Bot,
+    prompt: Prompt,
+    skip: List[str],
+    continue_prompt: Optional[Prompt] = None,
+    stop_condition: Optional[Condition] = None,
+    callback: Optional[Callable[[List[Response], List[ResponseNode]], None]] = None,
+) -> Tuple[List[Response], List[ResponseNode]]:
+    """Async version of broadcast_to_leaves(); leaves are processed concurrently."""
+    original_autosave = bot.autosave
+    original_conversation = bot.conversation
+    bot.autosave = False
+
+    def find_leaves(node: ConversationNode) -> List[ConversationNode]:
+        """Recursively find all leaf nodes from the given node."""
+        if not node.replies:
+            return [node]
+        leaves = []
+        for reply in node.replies:
+            leaves.extend(find_leaves(reply))
+        return leaves
+
+    target_leaves = [
+        leaf for leaf in find_leaves(bot.conversation) if not any(label in skip for label in getattr(leaf, "labels", []))
+    ]
+
+    async def process_leaf(leaf: ConversationNode) -> Tuple[Response, ResponseNode]:
+        """Process a single leaf node with optional iteration."""
+        try:
+            leaf_bot = bot.fork()
+            leaf_bot.autosave = False
+            leaf_bot.conversation = leaf
+            response = await leaf_bot.arespond(prompt)
+            if continue_prompt is not None and stop_condition is not None:
+                while not stop_condition(leaf_bot):
+                    response = await leaf_bot.arespond(continue_prompt)
+                    if callback:
+                        try:
+                            callback([response], [leaf_bot.conversation])
+                        except Exception:
+                            pass
+            elif callback:
+                try:
+                    callback([response], [leaf_bot.conversation])
+                except Exception:
+                    pass
+            final_node = leaf_bot.conversation
+            final_node.parent.parent = original_conversation
+            original_conversation.replies.append(final_node.parent)
+            return response, final_node.parent
+        except Exception:
+            return None, None
+
+    try:
+        results = await asyncio.gather(*(process_leaf(leaf) for leaf in target_leaves))
+    finally:
+        # Restore bot state
+        bot.autosave = original_autosave
+        bot.conversation = original_conversation
 
+    responses = [response for response, _ in results]
+    nodes = [node for _, node in results]
     return responses, nodes
@@ -23,8 +23,11 @@ Classes:
     AnthropicBot: Main bot implementation for Anthropic's Claude models
     CacheController: Manages conversation history caching for context
         optimization
+    CachePlanner: Places prompt-cache breakpoints on tools, system prompt
+        and messages, tracking them across turns
 """
 
+import asyncio
 import inspect
 import math
 import os
@@ -34,6 +37,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import anthropic
 
+from bots.foundation import client_pool, profiling, rate_limiter
 from bots.foundation.base import (
     Bot,
     ConversationNode,
@@ -88,6 +92,8 @@ class AnthropicNode(ConversationNode):
         Inherits all attributes from ConversationNode
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize an AnthropicNode.
 
@@ -119,37 +125,33 @@ class AnthropicNode(ConversationNode):
 
             self.pending_results = list(merged_dict.values())
 
-    def _build_messages(self) -> List[Dict[str, Any]]:
-        """Build message list for Anthropic API.
+    def _node_messages(self) -> List[Dict[str, Any]]:
+        """Format this node as an Anthropic API message.
 
-        Constructs the message history in Anthropic's expected format,
-        properly handling
-        empty nodes and tool calls. Empty nodes are preserved in the structure but
-        filtered from API messages.
+        Tool results are placed before the text block and tool calls after it.
+        The base class caches the result per node and _build_messages assembles
+        the history from root to this node; empty nodes are preserved in the
+        structure but filtered from API messages.
 
         Returns:
-            List of message dictionaries formatted for Anthropic's API
+            List containing this node's message dictionary
+        """
+        content_list = [{"type": "text", "text": self.content}]
+        if self.tool_calls:
+            for call in self.tool_calls:
+                content_list.append({"type": "tool_use", **call})
+        if self.tool_results:
+            content_list = [{"type": "tool_result", **result} for result in reversed(self.tool_results)] + content_list
+        return [{"role": self.role, "content": content_list}]
+
+    @staticmethod
+    def _copy_message(message: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached message down to its content blocks.
+
+        CachePlanner (and CacheController) add cache_control keys to content
+        blocks in place, so each build must hand out fresh block dicts.
         """
-        node = self
-        conversation_dict = []
-        while node:
-            # node._sync_tool_context() Don't sync here either
-            if not node._is_empty():
-                entry = {"role": node.role}
-                content_list = [{"type": "text", "text": node.content}]
-                if node.tool_calls:
-                    for call in node.tool_calls:
-                        sub_entry = {"type": "tool_use", **call}
-                        content_list.append(sub_entry)
-                if node.tool_results:
-                    for result in node.tool_results:
-                        sub_entry = {"type": "tool_result", **result}
-                        content_list.insert(0, sub_entry)
-                entry["content"] = content_list
-                conversation_dict = [entry] + conversation_dict
-            node = node.parent
-
-        return conversation_dict
+        return {"role": message["role"], "content": [block.copy() for block in message["content"]]}
 
 
 class AnthropicToolHandler(ToolHandler):
@@ -212,10 +214,14 @@ class AnthropicToolHandler(ToolHandler):
         requests: List[Dict[str, Any]] = []
         for block in response.content:
             if block.type == "tool_use":
-                request = {attr: getattr(block, attr) for attr in ["type", "id", "name", "input"]}
-                requests.append(request)
+                requests.append(self.request_from_block(block))
         return requests
 
+    @staticmethod
+    def request_from_block(block: Any) -> Dict[str, Any]:
+        """Build the request schema for a single tool_use content block."""
+        return {attr: getattr(block, attr) for attr in ["type", "id", "name", "input"]}
+
     def tool_name_and_input(self, request_schema: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
         """Extract tool name and input parameters from a request schema.
 
@@ -276,6 +282,7 @@ class AnthropicMailbox(Mailbox):
     Attributes:
         last_message: Optional[Dict[str, Any]] - The last message sent/received
         client: Optional[anthropic.Anthropic] - The Anthropic API client instance
+        cache_planner: CachePlanner - Places prompt-cache breakpoints across turns
     """
 
     def __init__(self, verbose: bool = False):
@@ -287,6 +294,7 @@ class AnthropicMailbox(Mailbox):
         super().__init__()
         self.last_message: Optional[Dict[str, Any]] = None
         self.client: Optional[anthropic.Anthropic] = None
+        self.cache_planner = CachePlanner()
 
     def send_message(
         self,
@@ -319,62 +327,12 @@ class AnthropicMailbox(Mailbox):
             anthropic.APITimeoutError: If request times out after retries
             Exception: If max retries are reached
         """
-        # Check if tracing is enabled for this bot
-        should_trace = TRACING_AVAILABLE and hasattr(bot, "_tracing_enabled") and bot._tracing_enabled
-
-        if should_trace:
-            span = tracer.start_span("mailbox.send_message")
-            span.set_attribute("provider", "anthropic")
-            span.set_attribute("model", bot.model_engine.value)
-            span.set_attribute("timeout", timeout)
-            span.set_attribute("max_retries", max_retries)
-        else:
-            span = None
-
+        span = self._start_span(bot, "mailbox.send_message", timeout, max_retries)
         try:
-            if span:
-                span.add_event("mailbox.send.start")
-
-            api_key: Optional[str] = bot.api_key
-            if not api_key:
-                api_key = os.getenv("ANTHROPIC_API_KEY")
-                if not api_key:
-                    logger.error("API key not found", extra={"provider": "anthropic"})
-                    raise ValueError("Anthropic API key not found. Set up 'ANTHROPIC_API_KEY' environment variable.")
-
-            # Initialize client with timeout
-            self.client = anthropic.Anthropic(api_key=api_key, timeout=timeout)
-            conversation: AnthropicNode = bot.conversation
-            tools: Optional[List[Dict[str, Any]]] = None
-            if bot.tool_handler and bot.tool_handler.tools:
-                tools = bot.tool_handler.tools
-
-                # Remove any existing cache_control from all tools to avoid duplicates
-                for tool in tools:
-                    tool.pop("cache_control", None)
-
-                # Add cache_control to the last tool only
-                tools[-1]["cache_control"] = {"type": "ephemeral"}
-
-            cc = CacheController()
-            # Build the create dictionary
-            create_dict: Dict[str, Any] = {
-                "model": bot.model_engine.value,
-                "max_tokens": bot.max_tokens,
-                "temperature": bot.temperature,
-                "messages": cc.manage_cache_controls(conversation._build_messages()),
-            }
-
-            if bot.system_message:
-                create_dict["system"] = bot.system_message
-
-            if tools:
-                create_dict["tools"] = tools
-
-            if span:
-                span.set_attribute("message_count", len(create_dict["messages"]))
-                if tools:
-                    span.set_attribute("tool_count", len(tools))
+            api_key = self._resolve_api_key(bot)
+            # Reuse the pooled client (and its warm connections) for this key/timeout
+            self.client = client_pool.get_client("anthropic", anthropic.Anthropic, api_key, timeout=timeout)
+            create_dict = self._build_create_dict(bot, span)
 
             # Retry loop with exponential backoff
             for attempt in range(max_retries):
@@ -382,136 +340,344 @@ class AnthropicMailbox(Mailbox):
                     if span:
                         span.add_event("api.call.attempt", {"attempt": attempt + 1})
 
-                    api_start_time = time.time()
-                    response = self.client.messages.create(**create_dict)
-
-                    # Capture token usage and cost
-                    if span and hasattr(response, "usage"):
-                        span.set_attribute("input_tokens", response.usage.input_tokens)
-                        span.set_attribute("output_tokens", response.usage.output_tokens)
-                        # Add cache token attributes if present
-                        if hasattr(response.usage, "cache_creation_input_tokens"):
-                            span.set_attribute(
-                                "cache_creation_input_tokens", response.usage.cache_creation_input_tokens
-                            )  # noqa: E501
-                        if hasattr(response.usage, "cache_read_input_tokens"):
-                            span.set_attribute("cache_read_input_tokens", response.usage.cache_read_input_tokens)
-
-                    # Calculate and record cost and metrics
-                    if METRICS_AVAILABLE and hasattr(response, "usage"):
-                        try:
-                            # Extract cache tokens if present
-                            cache_creation_tokens = getattr(response.usage, "cache_creation_input_tokens", 0)
-                            cache_read_tokens = getattr(response.usage, "cache_read_input_tokens", 0)
-                            # Total input tokens = regular + cache creation + cache read
-                            total_input_tokens = response.usage.input_tokens + cache_creation_tokens + cache_read_tokens
-                            # Record token usage with total input tokens
-                            metrics.record_tokens(
-                                total_input_tokens,
-                                response.usage.output_tokens,
-                                provider="anthropic",
-                                model=bot.model_engine.value,
-                                cached_tokens=cache_creation_tokens + cache_read_tokens,
-                            )
-                            # Calculate and record cost with separate cache token types
-                            cost = calculate_cost(
-                                provider="anthropic",
-                                model=bot.model_engine.value,
-                                input_tokens=response.usage.input_tokens,
-                                output_tokens=response.usage.output_tokens,
-                                cache_creation_tokens=cache_creation_tokens,
-                                cache_read_tokens=cache_read_tokens,
-                            )
-                            metrics.record_cost(cost, provider="anthropic", model=bot.model_engine.value)
-                        except Exception as e:
-                            logger.warning(f"Failed to record metrics: {e}")
-
-                    # Record API call metrics
-                    if METRICS_AVAILABLE:
-                        try:
-                            api_duration = time.time() - api_start_time
-                            metrics.record_api_call(
-                                duration=api_duration,
-                                provider="anthropic",
-                                model=bot.model_engine.value,
-                                status="success",  # noqa: E501
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to record API metrics: {e}")
+                    # Wait for the shared provider/model limiter before sending
+                    with rate_limiter.limit("anthropic", bot.model_engine.value):
+                        api_start_time = time.time()
+                        if getattr(bot, "stream", False):
+                            response = self._stream_message(bot, create_dict, span, api_start_time)
+                        else:
+                            response = self.client.messages.create(**create_dict)
+                    self._record_response(response, bot, span, api_start_time)
+                    return response
+
+                except anthropic.APITimeoutError as e:
+                    self._raise_if_tools_started(bot, e)
+                    time.sleep(self._timeout_delay(e, attempt, timeout_retries, timeout_base_delay, span))
+                except Exception as e:
+                    self._raise_if_tools_started(bot, e)
+                    retry_after = rate_limiter.record_error("anthropic", bot.model_engine.value, e)
+                    time.sleep(self._retry_delay(e, attempt, max_retries, base_delay, create_dict, span, retry_after))
+
+        finally:
+            if span:
+                span.end()
+
+    async def asend_message(
+        self,
+        bot: "AnthropicBot",
+        timeout: float = 600.0,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        timeout_retries: int = 2,
+        timeout_base_delay: float = 5.0,
+    ) -> Any:
+        """Async counterpart of send_message() using anthropic.AsyncAnthropic.
+
+        Retries, tracing and metrics behave exactly as in send_message(), but
+        the request and the backoff sleeps yield to the event loop.
+        """
+        span = self._start_span(bot, "mailbox.asend_message", timeout, max_retries)
+        try:
+            api_key = self._resolve_api_key(bot)
+            client = client_pool.get_async_client("anthropic", anthropic.AsyncAnthropic, api_key, timeout=timeout)
+            create_dict = self._build_create_dict(bot, span)
 
+            for attempt in range(max_retries):
+                try:
                     if span:
-                        span.add_event("api.call.success")
+                        span.add_event("api.call.attempt", {"attempt": attempt + 1})
 
+                    async with rate_limiter.alimit("anthropic", bot.model_engine.value):
+                        api_start_time = time.time()
+                        if getattr(bot, "stream", False):
+                            response = await self._astream_message(client, bot, create_dict, span, api_start_time)
+                        else:
+                            response = await client.messages.create(**create_dict)
+                    self._record_response(response, bot, span, api_start_time)
                     return response
 
                 except anthropic.APITimeoutError as e:
-                    # Record timeout error metric
-                    if METRICS_AVAILABLE:
-                        try:
-                            metrics.record_error(
-                                error_type="APITimeoutError", provider="anthropic", operation="api_call"
-                            )  # noqa: E501
-                        except Exception:
-                            pass
-
-                    # Special handling for timeout errors
-                    if attempt < timeout_retries:
-                        timeout_delay = timeout_base_delay * (attempt + 1)
-                        logger.warning(
-                            "API timeout, retrying",
-                            extra={"attempt": attempt + 1, "delay": timeout_delay, "provider": "anthropic"},  # noqa: E501
-                        )
-                        if span:
-                            span.add_event("api.timeout", {"attempt": attempt + 1, "delay": timeout_delay})
-                        time.sleep(timeout_delay)
-                        continue
-                    else:
-                        logger.exception(
-                            "Max timeout retries reached",
-                            extra={"timeout_retries": timeout_retries, "provider": "anthropic"},  # noqa: E501
-                        )
-                        if span:
-                            span.record_exception(e)
-                        raise
-
+                    self._raise_if_tools_started(bot, e)
+                    await asyncio.sleep(self._timeout_delay(e, attempt, timeout_retries, timeout_base_delay, span))
                 except Exception as e:
-                    # Handle other API errors with exponential backoff
-                    if attempt >= max_retries - 1:
-                        # Last attempt - log and raise
-                        logger.exception(
-                            "Max retries reached",
-                            extra={
-                                "error_type": e.__class__.__name__,
-                                "provider": "anthropic",
-                                "create_dict": str(create_dict),
-                            },
-                        )
-                        if span:
-                            span.record_exception(e)
-                        raise
-
-                    # Calculate exponential backoff delay
-                    delay = base_delay * (2**attempt) + random.uniform(0, 1)
-                    logger.warning(
-                        "API error, retrying with exponential backoff",
-                        extra={
-                            "attempt": attempt + 1,
-                            "error_type": e.__class__.__name__,
-                            "delay": delay,
-                            "provider": "anthropic",
-                        },
-                    )
-                    if span:
-                        span.add_event(
-                            "api.error.retry",
-                            {"attempt": attempt + 1, "error_type": e.__class__.__name__, "delay": delay},  # noqa: E501
-                        )
-                    time.sleep(delay)
+                    self._raise_if_tools_started(bot, e)
+                    retry_after = rate_limiter.record_error("anthropic", bot.model_engine.value, e)
+                    await asyncio.sleep(self._retry_delay(e, attempt, max_retries, base_delay, create_dict, span, retry_after))
 
         finally:
             if span:
                 span.end()
 
+    def _stream_message(
+        self, bot: "AnthropicBot", create_dict: Dict[str, Any], span: Optional[Any], api_start_time: float
+    ) -> Any:
+        """Stream a response, forwarding text deltas and starting tools early.
+
+        Text deltas go to the bot's on_text_delta callback. Each tool_use block
+        is handed to ToolHandler.start_request() as soon as its input JSON is
+        complete, so tools run while the model generates the remaining blocks.
+
+        Returns:
+            The complete message, as messages.create() would have returned it
+        """
+        seen_text = False
+        with self.client.messages.stream(**create_dict) as stream:
+            for event in stream:
+                seen_text = self._handle_stream_event(event, bot, span, api_start_time, seen_text)
+            return stream.get_final_message()
+
+    async def _astream_message(
+        self, client: Any, bot: "AnthropicBot", create_dict: Dict[str, Any], span: Optional[Any], api_start_time: float
+    ) -> Any:
+        """Async counterpart of _stream_message()."""
+        seen_text = False
+        async with client.messages.stream(**create_dict) as stream:
+            async for event in stream:
+                seen_text = self._handle_stream_event(event, bot, span, api_start_time, seen_text)
+            return await stream.get_final_message()
+
+    @staticmethod
+    def _handle_stream_event(
+        event: Any, bot: "AnthropicBot", span: Optional[Any], api_start_time: float, seen_text: bool
+    ) -> bool:
+        """Dispatch one stream event to callbacks or the tool handler.
+
+        Returns:
+            bool: Whether any text has arrived so far
+        """
+        if event.type == "text":
+            if span and not seen_text:
+                span.set_attribute("time_to_first_token", time.time() - api_start_time)
+            bot.tool_handler._invoke_callback("on_text_delta", event.text, metadata={"bot_name": bot.name})
+            return True
+        if event.type == "content_block_stop" and event.content_block.type == "tool_use":
+            bot.tool_handler.start_request(bot.tool_handler.request_from_block(event.content_block))
+        return seen_text
+
+    @staticmethod
+    def _raise_if_tools_started(bot: "AnthropicBot", error: Exception) -> None:
+        """Re-raise instead of retrying when a failed stream already started tools.
+
+        Retrying would run those tools a second time.
+        """
+        if bot.tool_handler and bot.tool_handler.discard_started_requests():
+            logger.warning(
+                "Streamed response failed after tools started; not retrying",
+                extra={"error_type": error.__class__.__name__, "provider": "anthropic"},
+            )
+            raise error
+
+    def _start_span(self, bot: "AnthropicBot", name: str, timeout: float, max_retries: int) -> Optional[Any]:
+        """Start a tracing span for a send, or return None if tracing is off."""
+        # Check if tracing is enabled for this bot
+        should_trace = TRACING_AVAILABLE and hasattr(bot, "_tracing_enabled") and bot._tracing_enabled
+        if not should_trace:
+            return None
+        span = tracer.start_span(name)
+        span.set_attribute("provider", "anthropic")
+        span.set_attribute("model", bot.model_engine.value)
+        span.set_attribute("timeout", timeout)
+        span.set_attribute("max_retries", max_retries)
+        span.add_event("mailbox.send.start")
+        return span
+
+    @staticmethod
+    def _resolve_api_key(bot: "AnthropicBot") -> str:
+        """Return the bot's API key, falling back to ANTHROPIC_API_KEY."""
+        api_key: Optional[str] = bot.api_key
+        if not api_key:
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+            if not api_key:
+                logger.error("API key not found", extra={"provider": "anthropic"})
+                raise ValueError("Anthropic API key not found. Set up 'ANTHROPIC_API_KEY' environment variable.")
+        return api_key
+
+    @staticmethod
+    def _build_create_dict(bot: "AnthropicBot", span: Optional[Any]) -> Dict[str, Any]:
+        """Build the messages.create() arguments for the bot's current conversation."""
+        tools = bot.tool_handler.tools if bot.tool_handler else None
+        # The planner keeps breakpoint placement across turns, so it lives on the bot's mailbox
+        planner = getattr(bot.mailbox, "cache_planner", None) or CachePlanner()
+        messages = bot._context_messages()
+        with profiling.phase(bot, "cache_placement"):
+            messages, system, tools = planner.plan(messages, bot.system_message, tools)
+
+        # Build the create dictionary
+        create_dict: Dict[str, Any] = {
+            "model": bot.model_engine.value,
+            "max_tokens": bot.max_tokens,
+            "temperature": bot.temperature,
+            "messages": messages,
+        }
+
+        if system:
+            create_dict["system"] = system
+
+        if tools:
+            create_dict["tools"] = tools
+
+        if span:
+            span.set_attribute("message_count", len(create_dict["messages"]))
+            if tools:
+                span.set_attribute("tool_count", len(tools))
+        return create_dict
+
+    @staticmethod
+    def _record_response(response: Any, bot: "AnthropicBot", span: Optional[Any], api_start_time: float) -> None:
+        """Record token usage, cost and call duration for a successful response."""
+        if hasattr(response, "usage"):
+            usage = response.usage
+            rate_limiter.record_usage(
+                "anthropic",
+                bot.model_engine.value,
+                usage.input_tokens
+                + usage.output_tokens
+                + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+                + (getattr(usage, "cache_read_input_tokens", 0) or 0),
+            )
+
+        # Capture token usage and cost
+        if span and hasattr(response, "usage"):
+            span.set_attribute("input_tokens", response.usage.input_tokens)
+            span.set_attribute("output_tokens", response.usage.output_tokens)
+            # Add cache token attributes if present
+            if hasattr(response.usage, "cache_creation_input_tokens"):
+                span.set_attribute("cache_creation_input_tokens", response.usage.cache_creation_input_tokens)
+            if hasattr(response.usage, "cache_read_input_tokens"):
+                span.set_attribute("cache_read_input_tokens", response.usage.cache_read_input_tokens)
+
+        # Calculate and record cost and metrics
+        if METRICS_AVAILABLE and hasattr(response, "usage"):
+            try:
+                # Extract cache tokens if present
+                cache_creation_tokens = getattr(response.usage, "cache_creation_input_tokens", 0) or 0
+                cache_read_tokens = getattr(response.usage, "cache_read_input_tokens", 0) or 0
+                # Per-bot cache read/creation ratios (see metrics.get_cache_stats)
+                metrics.record_cache_usage(
+                    cache_read_tokens,
+                    cache_creation_tokens,
+                    response.usage.input_tokens,
+                    provider="anthropic",
+                    model=bot.model_engine.value,
+                    bot_id=metrics.bot_metrics_id(bot),
+                )
+                # Total input tokens = regular + cache creation + cache read
+                total_input_tokens = response.usage.input_tokens + cache_creation_tokens + cache_read_tokens
+                # Record token usage with total input tokens
+                metrics.record_tokens(
+                    total_input_tokens,
+                    response.usage.output_tokens,
+                    provider="anthropic",
+                    model=bot.model_engine.value,
+                    cached_tokens=cache_creation_tokens + cache_read_tokens,
+                )
+                # Calculate and record cost with separate cache token types
+                cost = calculate_cost(
+                    provider="anthropic",
+                    model=bot.model_engine.value,
+                    input_tokens=response.usage.input_tokens,
+                    output_tokens=response.usage.output_tokens,
+                    cache_creation_tokens=cache_creation_tokens,
+                    cache_read_tokens=cache_read_tokens,
+                )
+                metrics.record_cost(cost, provider="anthropic", model=bot.model_engine.value)
+            except Exception as e:
+                logger.warning(f"Failed to record metrics: {e}")
+
+        # Record API call metrics
+        if METRICS_AVAILABLE:
+            try:
+                api_duration = time.time() - api_start_time
+                metrics.record_api_call(
+                    duration=api_duration,
+                    provider="anthropic",
+                    model=bot.model_engine.value,
+                    status="success",
+                )
+            except Exception as e:
+                logger.warning(f"Failed to record API metrics: {e}")
+
+        if span:
+            span.add_event("api.call.success")
+
+    @staticmethod
+    def _timeout_delay(
+        error: Exception, attempt: int, timeout_retries: int, timeout_base_delay: float, span: Optional[Any]
+    ) -> float:
+        """Return the delay before retrying a timed-out call, or re-raise the timeout."""
+        # Record timeout error metric
+        if METRICS_AVAILABLE:
+            try:
+                metrics.record_error(error_type="APITimeoutError", provider="anthropic", operation="api_call")
+            except Exception:
+                pass
+
+        # Special handling for timeout errors
+        if attempt < timeout_retries:
+            timeout_delay = timeout_base_delay * (attempt + 1)
+            logger.warning(
+                "API timeout, retrying",
+                extra={"attempt": attempt + 1, "delay": timeout_delay, "provider": "anthropic"},
+            )
+            if span:
+                span.add_event("api.timeout", {"attempt": attempt + 1, "delay": timeout_delay})
+            return timeout_delay
+        logger.exception(
+            "Max timeout retries reached",
+            extra={"timeout_retries": timeout_retries, "provider": "anthropic"},
+        )
+        if span:
+            span.record_exception(error)
+        raise error
+
+    @staticmethod
+    def _retry_delay(
+        error: Exception,
+        attempt: int,
+        max_retries: int,
+        base_delay: float,
+        create_dict: Dict[str, Any],
+        span: Optional[Any],
+        retry_after: Optional[float] = None,
+    ) -> float:
+        """Return the delay before retrying a failed call, or re-raise on the last attempt.
+
+        Uses the provider's retry-after delay when it sent one, otherwise
+        exponential backoff with jitter.
+        """
+        # Handle other API errors with exponential backoff
+        if attempt >= max_retries - 1:
+            # Last attempt - log and raise
+            logger.exception(
+                "Max retries reached",
+                extra={
+                    "error_type": error.__class__.__name__,
+                    "provider": "anthropic",
+                    "create_dict": str(create_dict),
+                },
+            )
+            if span:
+                span.record_exception(error)
+            raise error
+
+        # Calculate exponential backoff delay
+        delay = retry_after if retry_after is not None else base_delay * (2**attempt) + random.uniform(0, 1)
+        logger.warning(
+            "API error, retrying with exponential backoff",
+            extra={
+                "attempt": attempt + 1,
+                "error_type": error.__class__.__name__,
+                "delay": delay,
+                "provider": "anthropic",
+            },
+        )
+        if span:
+            span.add_event(
+                "api.error.retry",
+                {"attempt": attempt + 1, "error_type": error.__class__.__name__, "delay": delay},
+            )
+        return delay
+
     def process_response(self, response: Dict[str, Any], bot: "AnthropicBot") -> Tuple[str, str, Dict[str, Any]]:
         """Process the API response and handle incomplete responses.
 
@@ -603,6 +769,9 @@ class AnthropicBot(Bot):
         conversation (AnthropicNode): Manages conversation history
         mailbox (AnthropicMailbox): Handles API communication
         autosave (bool): Whether to automatically save state after responses
+        stream (bool): Stream responses, sending text deltas to the
+            on_text_delta callback and starting tools as soon as their input
+            is complete
 
     Example:
         ```python
@@ -634,6 +803,7 @@ class AnthropicBot(Bot):
         autosave: bool = True,
         enable_tracing: Optional[bool] = None,
         callbacks: Optional[BotCallbacks] = None,  # type: ignore
+        stream: bool = False,
     ):
         """Initialize an AnthropicBot.
 
@@ -652,6 +822,8 @@ class AnthropicBot(Bot):
             saves to cwd)
             enable_tracing: Enable OpenTelemetry tracing (default: None, uses global setting)
             callbacks: Optional callback system for progress/monitoring (default: None)
+            stream: Stream responses and start tools while later blocks are
+            still generating (default: False)
         """
         super().__init__(
             api_key,
@@ -671,6 +843,7 @@ class AnthropicBot(Bot):
 
         # Set bot reference in tool_handler so callbacks can be invoked
         self.tool_handler.bot = self
+        self.stream = stream
 
 
 # class AnthropicTools:
@@ -706,6 +879,9 @@ class CacheController:
     The controller maintains a balance between preserving important context and
     allowing older messages to be cached or dropped when the context
     window fills up.
+
+    AnthropicMailbox now uses CachePlanner, which keeps placement across
+    turns; this class remains for callers that mark messages themselves.
     """
 
     def find_cache_control_positions(self, messages: List[Dict[str, Any]]) -> List[int]:
@@ -944,3 +1120,121 @@ class CacheController:
                     for pos in cache_control_positions[2:]:
                         self.remove_cache_control_at_position(messages, pos)
         return messages
+
+
+class CachePlanner:
+    """Places prompt-cache breakpoints for one bot's requests, turn after turn.
+
+    Anthropic allows four cache_control breakpoints per request. The planner
+    spends them on:
+
+    - tools: the last tool schema
+    - system: the system prompt
+    - prefix: a message breakpoint that stays put across turns
+    - tail: the last message, so the next request reads everything up to it
+
+    A breakpoint also finds cache entries written up to LOOKBACK_BLOCKS content
+    blocks before it. While the tail stays within that distance of the prefix,
+    the prefix does not move and each request reads the previous tail's entry.
+    When the tail gets further away, the prefix moves to the previous tail,
+    which was written by the last request. The prefix also survives branching
+    back to an earlier point of the conversation as long as it lies on the new
+    path.
+
+    Placement is tracked with the index and a fingerprint of the marked
+    messages, so planning only looks at the messages since the prefix rather
+    than rescanning the history. Unlike CacheController, the planner never
+    modifies the tool schemas held by the tool handler.
+    """
+
+    LOOKBACK_BLOCKS = 20
+    CACHE_CONTROL = {"type": "ephemeral"}
+
+    def __init__(self) -> None:
+        self._prefix: Optional[Tuple[int, Tuple[Any, ...]]] = None
+        self._tail: Optional[Tuple[int, Tuple[Any, ...]]] = None
+
+    def plan(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Any, Optional[List[Dict[str, Any]]]]:
+        """Mark breakpoints for a request.
+
+        Args:
+            messages: Messages for the request; their content blocks are
+                marked in place, so pass freshly built messages
+            system: System prompt, if any
+            tools: Tool schemas, if any; not modified
+
+        Returns:
+            Tuple of (messages, system, tools) ready for messages.create():
+            system becomes a list with one marked text block and tools a new
+            list whose last schema is marked
+        """
+        if tools:
+            tools = [self._without_cache_control(tool) for tool in tools[:-1]] + [
+                {**tools[-1], "cache_control": dict(self.CACHE_CONTROL)}
+            ]
+        if system:
+            system = [{"type": "text", "text": system, "cache_control": dict(self.CACHE_CONTROL)}]
+        self._mark_messages(messages)
+        return messages, system, tools
+
+    def _mark_messages(self, messages: List[Dict[str, Any]]) -> None:
+        tail = len(messages) - 1
+        while tail >= 0 and self._cacheable_block(messages[tail]) is None:
+            tail -= 1
+        if tail < 0:
+            return
+        prefix = self._valid(self._prefix, messages, tail)
+        previous_tail = self._valid(self._tail, messages, tail)
+        if prefix is None:
+            prefix = previous_tail
+        elif previous_tail is not None and previous_tail > prefix:
+            blocks = sum(len(message["content"]) for message in messages[prefix + 1 : tail + 1])
+            if blocks > self.LOOKBACK_BLOCKS:
+                prefix = previous_tail
+
+        for index in (prefix, tail):
+            if index is not None:
+                self._cacheable_block(messages[index])["cache_control"] = dict(self.CACHE_CONTROL)
+        self._prefix = None if prefix is None else (prefix, self._fingerprint(messages[prefix]))
+        self._tail = (tail, self._fingerprint(messages[tail]))
+
+    def _valid(self, mark: Optional[Tuple[int, Tuple[Any, ...]]], messages: List[Dict[str, Any]], tail: int) -> Optional[int]:
+        """Return the marked index if it still holds the same message before tail."""
+        if mark is None or mark[0] >= tail or self._fingerprint(messages[mark[0]]) != mark[1]:
+            return None
+        return mark[0]
+
+    @staticmethod
+    def _cacheable_block(message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the last block of message that can carry cache_control (not empty text)."""
+        content = message.get("content")
+        if not isinstance(content, list):
+            return None
+        for block in reversed(content):
+            if isinstance(block, dict) and not (block.get("type") == "text" and not block.get("text")):
+                return block
+        return None
+
+    @staticmethod
+    def _fingerprint(message: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Cheap identity of a message: role and the type, id and size of each block."""
+        return (message.get("role"),) + tuple(
+            (
+                block.get("type"),
+                block.get("id") or block.get("tool_use_id"),
+                len(block["text"]) if "text" in block else len(str(block.get("content", ""))),
+            )
+            for block in message.get("content", ())
+            if isinstance(block, dict)
+        )
+
+    @staticmethod
+    def _without_cache_control(tool: Dict[str, Any]) -> Dict[str, Any]:
+        if "cache_control" not in tool:
+            return tool
+        return {key: value for key, value in tool.items() if key != "cache_control"}
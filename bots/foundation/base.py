@@ -1,4 +1,6 @@
 import ast
+import asyncio
+import contextvars
 import copy
 import hashlib
 import importlib
@@ -9,13 +11,19 @@ import os
 import re
 import sys
 import textwrap
+import threading
+import time
 import types
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from types import ModuleType
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+from bots.foundation import bot_file, code_cache, journal, profiling
+from bots.foundation.module_store import ModuleStore
 from bots.utils.helpers import _py_ast_to_source, formatted_datetime
 
 # Module-level logger
@@ -266,23 +274,30 @@ class Engines(str, Enum):
             node = node_class._create_empty(node_class)
             ```
         """
+        node_class = _NODE_CLASS_MAP.get(class_name)
+        if node_class is not None:
+            return node_class
+
         from bots.foundation.anthropic_bots import AnthropicNode
         from bots.foundation.gemini_bots import GeminiNode
         from bots.foundation.openai_bots import OpenAINode
         from bots.testing.mock_bot import MockConversationNode
 
-        NODE_CLASS_MAP = {
-            "ConversationNode": ConversationNode,
-            "OpenAINode": OpenAINode,
-            "AnthropicNode": AnthropicNode,
-            "GeminiNode": GeminiNode,
-            "MockConversationNode": MockConversationNode,
-        }
+        # Cached so rebuilding a large tree does not repeat the imports per node
+        _NODE_CLASS_MAP.update(
+            {
+                "ConversationNode": ConversationNode,
+                "OpenAINode": OpenAINode,
+                "AnthropicNode": AnthropicNode,
+                "GeminiNode": GeminiNode,
+                "MockConversationNode": MockConversationNode,
+            }
+        )
 
-        if class_name not in NODE_CLASS_MAP:
+        if class_name not in _NODE_CLASS_MAP:
             raise ValueError(f"Unsupported node class: {class_name}")
 
-        return NODE_CLASS_MAP[class_name]
+        return _NODE_CLASS_MAP[class_name]
 
     def get_info(self) -> Dict[str, Any]:
         """Get detailed information about this model engine.
@@ -316,6 +331,52 @@ class Engines(str, Enum):
         return info
 
 
+# Values ConversationNode._to_dict_self writes as-is; others are saved as str()
+_SERIALIZABLE_TYPES = (str, int, float, bool, list, dict, type(None))
+
+# Node class name -> class, filled by Engines.get_conversation_node_class
+_NODE_CLASS_MAP: Dict[str, Type["ConversationNode"]] = {}
+
+
+class _SavedReplies:
+    """Replies of a lazily loaded ConversationNode, still in saved form.
+
+    Holds the reply dicts as _to_dict_recursive wrote them. The subtree-size
+    table is shared by every node loaded from the same file, so preorder
+    positions (used by the autosave journal) can be computed without building
+    nodes, and each saved subtree is counted at most once.
+
+    Note:
+        Sizes are keyed by id() of the saved dicts, which all stay alive while
+        any node of the tree still holds them unloaded.
+    """
+
+    __slots__ = ("dicts", "sizes")
+
+    def __init__(self, dicts: List[Dict[str, Any]], sizes: Dict[int, int]) -> None:
+        self.dicts = dicts
+        self.sizes = sizes
+
+    def size_of(self, data: Dict[str, Any]) -> int:
+        """Return the number of nodes in the saved subtree rooted at data."""
+        sizes = self.sizes
+        if id(data) not in sizes:
+            stack = [(data, False)]
+            while stack:
+                item, children_done = stack.pop()
+                children = item.get("replies", ())
+                if children_done:
+                    sizes[id(item)] = 1 + sum(sizes[id(child)] for child in children)
+                elif id(item) not in sizes:
+                    stack.append((item, True))
+                    stack.extend((child, False) for child in children)
+        return sizes[id(data)]
+
+    def total(self) -> int:
+        """Return the number of nodes in all saved reply subtrees."""
+        return sum(self.size_of(data) for data in self.dicts)
+
+
 class ConversationNode:
     """Tree-based storage for conversation history and tool interactions.
 
@@ -332,6 +393,22 @@ class ConversationNode:
         tool_calls (List[Dict]): Tool invocations made in this message
         tool_results (List[Dict]): Results from tool executions
         pending_results (List[Dict]): Tool results waiting to be processed
+        labels (List[str]): Names the CLI uses to jump back to this node
+        extras (Optional[Dict[str, Any]]): Any other constructor keyword
+            arguments, such as provider-specific data or keys from older saves
+
+    Nodes are slotted: the fields above are the node's whole state, and
+    _to_dict_self writes them from the _schema table instead of scanning
+    attributes. Keys in extras are readable as attributes and saved at the top
+    level of the node dict, so files keep their shape. The list fields are
+    only allocated when first read or assigned, so an untouched node costs a
+    fixed-size object. Subclasses that need more state declare their own
+    __slots__; a subclass without __slots__ gets a __dict__, whose public
+    attributes are saved too.
+
+    Nodes loaded with _from_dict(data, lazy=True) keep their replies in saved
+    form until replies is first read, so loading a large tree only builds the
+    nodes that are actually visited.
 
     Example:
         ```python
@@ -341,6 +418,30 @@ class ConversationNode:
         ```
     """
 
+    __slots__ = (
+        "content",
+        "role",
+        "parent",
+        "extras",
+        "_replies",
+        "_unloaded_replies",
+        "_tool_calls",
+        "_tool_results",
+        "_pending_results",
+        "_labels",
+        "_message_cache",
+        "_journal_id",
+    )
+
+    # Serialized fields, in order: (key in the node dict, slot, empty value factory)
+    _schema: Tuple[Tuple[str, str, Optional[Callable[[], Any]]], ...] = (
+        ("content", "content", None),
+        ("role", "role", None),
+        ("tool_calls", "_tool_calls", list),
+        ("tool_results", "_tool_results", list),
+        ("pending_results", "_pending_results", list),
+    )
+
     def __init__(
         self,
         content: str,
@@ -358,22 +459,125 @@ class ConversationNode:
         tool_calls (Optional[List[Dict]]): Tool invocations made in this message
         tool_results (Optional[List[Dict]]): Results from tool executions
         pending_results (Optional[List[Dict]]): Tool results waiting to be processed
-        **kwargs: Additional attributes to set on the node
+        **kwargs: labels, or additional data kept in extras
         """
         self.content = content
         self.role = role
         self.parent: ConversationNode = None
-        self.replies: list[ConversationNode] = []
-        self.tool_calls = tool_calls or []
-        self._tool_results = tool_results or []
-        self.pending_results = pending_results or []
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        self._replies = None
+        self._unloaded_replies = None
+        self._tool_calls = tool_calls or None
+        self._tool_results = tool_results or None
+        self._pending_results = pending_results or None
+        self._labels = kwargs.pop("labels", None) or None
+        self._message_cache = None
+        self._journal_id = None
+        self.extras = None
+        if kwargs:
+            self._update_fields(kwargs)
+
+    def _update_fields(self, values: Dict[str, Any]) -> None:
+        """Set attributes from saved or keyword data.
+
+        Keys naming a slot or property are assigned normally; the rest go to a
+        subclass __dict__ if there is one, otherwise to extras.
+        """
+        for key, value in values.items():
+            try:
+                object.__setattr__(self, key, value)
+            except AttributeError:
+                if self.extras is None:
+                    self.extras = {}
+                self.extras[key] = value
+
+    def __getattr__(self, name: str) -> Any:
+        """Look up attributes missing from the slots in extras."""
+        if not name.startswith("__") and name != "extras":
+            extras = self.extras
+            if extras and name in extras:
+                return extras[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def replies(self) -> List["ConversationNode"]:
+        """Reply nodes, building them from saved data on first access."""
+        if self._unloaded_replies is not None:
+            self._load_replies()
+        replies = self._replies
+        if replies is None:
+            replies = self._replies = []
+        return replies
+
+    @replies.setter
+    def replies(self, value: List["ConversationNode"]) -> None:
+        self._unloaded_replies = None
+        self._replies = value
+
+    def _load_replies(self) -> None:
+        """Build this node's reply nodes from its saved replies.
+
+        Only the direct replies are built; their own replies stay unloaded.
+        If this node has an autosave journal id, the replies get the preorder
+        ids the journal reserved for them.
+        """
+        saved = self._unloaded_replies
+        self._unloaded_replies = None
+        replies = []
+        next_id = self._journal_id
+        if next_id is not None:
+            next_id += 1
+        for data in saved.dicts:
+            reply = self._from_dict(data, lazy=True, _sizes=saved.sizes)
+            reply.parent = self
+            if next_id is not None:
+                reply._journal_id = next_id
+                next_id += saved.size_of(data)
+            replies.append(reply)
+        self._replies = replies
+
+    @property
+    def tool_calls(self) -> List[Dict]:
+        """Tool invocations made in this message."""
+        tool_calls = self._tool_calls
+        if tool_calls is None:
+            tool_calls = self._tool_calls = []
+        return tool_calls
+
+    @tool_calls.setter
+    def tool_calls(self, value: List[Dict]) -> None:
+        self._tool_calls = value
+
+    @property
+    def pending_results(self) -> List[Dict]:
+        """Tool results waiting to be moved to the next reply."""
+        pending_results = self._pending_results
+        if pending_results is None:
+            pending_results = self._pending_results = []
+        return pending_results
+
+    @pending_results.setter
+    def pending_results(self, value: List[Dict]) -> None:
+        self._pending_results = value
+
+    @property
+    def labels(self) -> List[str]:
+        """Labels attached to this node."""
+        labels = self._labels
+        if labels is None:
+            labels = self._labels = []
+        return labels
+
+    @labels.setter
+    def labels(self, value: List[str]) -> None:
+        self._labels = value
 
     @property
     def tool_results(self):
         """Get tool results."""
-        return self._tool_results
+        tool_results = self._tool_results
+        if tool_results is None:
+            tool_results = self._tool_results = []
+        return tool_results
 
     @tool_results.setter
     def tool_results(self, value):
@@ -559,15 +763,27 @@ class ConversationNode:
             Dict[str, Any]: Dictionary containing this node and all its descendants
         """
         result = self._to_dict_self()
-        if self.replies:
-            result["replies"] = [reply._to_dict_recursive() for reply in self.replies]
+        # Iterative, so conversations deeper than the recursion limit still serialize
+        stack = [(self, result)]
+        while stack:
+            node, data = stack.pop()
+            if node._unloaded_replies is not None:
+                # Never visited since loading: write the saved form back unchanged
+                data["replies"] = list(node._unloaded_replies.dicts)
+            elif node._replies:
+                replies = data["replies"] = []
+                for reply in node._replies:
+                    reply_data = reply._to_dict_self()
+                    replies.append(reply_data)
+                    stack.append((reply, reply_data))
         return result
 
     def _to_dict_self(self) -> Dict[str, Any]:
         """Convert just this node to a dictionary.
 
         Use when serializing a single conversation node.
-        Omits replies, parent references, and callable attributes.
+        Writes the _schema fields, labels if any, then extras and the public
+        attributes of a subclass __dict__; omits replies and parent references.
 
         Returns:
             Dict[str, Any]: Dictionary containing this node's attributes
@@ -577,13 +793,20 @@ class ConversationNode:
             and converts other types to strings.
         """
         result = {}
-        for k in dir(self):
-            if not k.startswith("_") and k not in {"parent", "replies"} and (not callable(getattr(self, k))):
-                value = getattr(self, k)
-                if isinstance(value, (str, int, float, bool, list, dict, type(None))):
-                    result[k] = value
-                else:
-                    result[k] = str(value)
+        for key, slot, empty in self._schema:
+            value = getattr(self, slot)
+            if value is None and empty is not None:
+                value = empty()
+            result[key] = value if isinstance(value, _SERIALIZABLE_TYPES) else str(value)
+        if self._labels:
+            result["labels"] = self._labels
+        instance_dict = getattr(self, "__dict__", None)
+        for extras in (self.extras, instance_dict):
+            if extras:
+                for key, value in extras.items():
+                    if extras is instance_dict and key.startswith("_") or callable(value):
+                        continue
+                    result[key] = value if isinstance(value, _SERIALIZABLE_TYPES) else str(value)
         result["node_class"] = self.__class__.__name__
         return result
 
@@ -602,27 +825,122 @@ class ConversationNode:
 
         Note:
             Empty root nodes are excluded from the message list.
+            Each node caches its own formatted messages (see _cached_node_messages),
+            so repeated calls on a deep conversation only walk the parent chain
+            and copy the cached entries. Callers may freely mutate the returned
+            messages without affecting the cache.
         """
-        node = self
-        if node._is_empty():
+        if self._is_empty():
             return []
-        conversation_list_dict = []
+        chain = []
+        node = self
         while node:
-            if not node._is_empty():
-                entry = {"role": node.role, "content": node.content}
-                if node.tool_calls is not None:
-                    entry["tool_calls"] = node.tool_calls
-                if node.tool_results is not None:
-                    entry["tool_results"] = node.tool_results
-                conversation_list_dict = [entry] + conversation_list_dict
+            chain.append(node)
             node = node.parent
-        return conversation_list_dict
+        messages = []
+        copy_message = self._copy_message
+        for node in reversed(chain):
+            if not node._is_empty():
+                messages.extend(copy_message(message) for message in node._cached_node_messages())
+        return messages
+
+    def _node_messages(self) -> List[Dict[str, Any]]:
+        """Format this node alone as provider messages.
+
+        Override in provider-specific node classes. Called only when the node's
+        cached messages are missing or stale.
+
+        Returns:
+            List[Dict[str, Any]]: Messages contributed by this node, in order
+        """
+        entry = {"role": self.role, "content": self.content}
+        if self.tool_calls is not None:
+            entry["tool_calls"] = self.tool_calls
+        if self.tool_results is not None:
+            entry["tool_results"] = self.tool_results
+        return [entry]
+
+    @staticmethod
+    def _copy_message(message: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached message before handing it to a caller.
+
+        Override when callers are known to mutate nested structures of the
+        provider format (see AnthropicNode).
+        """
+        return dict(message)
+
+    def _message_cache_key(self) -> Tuple[Any, ...]:
+        """Return the fields whose change invalidates this node's cached messages.
+
+        Reassigning role, content, tool_calls or tool_results, or appending to
+        the tool lists, changes the key. In-place edits of an existing tool call
+        or result dict are not detected; call _invalidate_message_cache() after them.
+        """
+        # Empty lists count as None, so allocating one on read does not invalidate
+        tool_calls = self._tool_calls or None
+        tool_results = self._tool_results or None
+        return (
+            self.role,
+            self.content,
+            tool_calls,
+            len(tool_calls) if tool_calls else 0,
+            tool_results,
+            len(tool_results) if tool_results else 0,
+        )
+
+    def _cached_node_messages(self) -> List[Dict[str, Any]]:
+        """Return this node's formatted messages, rebuilding them only when stale.
+
+        Returns:
+            List[Dict[str, Any]]: Cached messages; treat as read-only
+        """
+        key = self._message_cache_key()
+        cache = self._message_cache
+        if cache is None or not self._same_cache_key(cache[0], key):
+            cache = (key, self._node_messages())
+            self._message_cache = cache
+        return cache[1]
+
+    @staticmethod
+    def _same_cache_key(old: Tuple[Any, ...], new: Tuple[Any, ...]) -> bool:
+        """Compare cache keys, treating the tool lists by identity."""
+        return (
+            old[0] == new[0]
+            and old[1] == new[1]
+            and old[2] is new[2]
+            and old[3] == new[3]
+            and old[4] is new[4]
+            and old[5] == new[5]
+        )
+
+    def _invalidate_message_cache(self) -> None:
+        """Drop this node's cached messages so the next build reformats it."""
+        self._message_cache = None
 
     @classmethod
-    def _from_dict(cls, data: Dict[str, Any]) -> "ConversationNode":
+    def _from_dict(
+        cls, data: Dict[str, Any], lazy: bool = False, _sizes: Optional[Dict[int, int]] = None
+    ) -> "ConversationNode":
+        """Build a node, and its replies, from _to_dict_recursive output.
+
+        Parameters:
+            data (Dict[str, Any]): Serialized node; not modified
+            lazy (bool): If True, keep the replies in saved form and build
+                them when replies is first read
+            _sizes (Optional[Dict[int, int]]): Subtree-size table shared by
+                lazily loaded nodes of one tree
+
+        Returns:
+            ConversationNode: The node, of the class named in data
+        """
+        data = dict(data)
         reply_data = data.pop("replies", [])
         node_class = Engines.get_conversation_node_class(data.pop("node_class", cls.__name__))
         node = node_class(**data)
+        if lazy:
+            if reply_data:
+                node._unloaded_replies = _SavedReplies(reply_data, {} if _sizes is None else _sizes)
+            return node
         for reply in reply_data:
             reply_node = cls._from_dict(reply)
             reply_node.parent = node
@@ -635,11 +953,76 @@ class ConversationNode:
         Returns:
             int: Total number of nodes including this one and all descendants
         """
+        if self._unloaded_replies is not None:
+            return 1 + self._unloaded_replies.total()
         count = 1
         for reply in self.replies:
             count += reply._node_count()
         return count
 
+    def _fork_leaf(self) -> "ConversationNode":
+        """Create a private copy of this node that shares its ancestors.
+
+        Use when a forked bot needs its own position in a conversation without
+        copying the history. The copy points at this node's parent but is not
+        added to the parent's replies, so replies added to it stay invisible to
+        the original tree until they are stitched back.
+
+        Returns:
+            ConversationNode: A reply-less copy with its own tool lists
+        """
+        leaf = copy.copy(self)
+        leaf.replies = []
+        leaf._tool_calls = list(self._tool_calls) if self._tool_calls else None
+        leaf._tool_results = list(self._tool_results) if self._tool_results else None
+        leaf._pending_results = list(self._pending_results) if self._pending_results else None
+        leaf._message_cache = None
+        leaf._journal_id = None
+        return leaf
+
+    def _attach_fork_leaf(self, source: "ConversationNode") -> None:
+        """Give a leaf from source._fork_leaf() a tree of its own.
+
+        Copies the node shells of the tree holding source (content and tool
+        lists stay shared, message caches are kept), then puts this node in
+        place of source's copy, adopting the copies of source's replies.
+
+        Parameters:
+            source (ConversationNode): The node this leaf was forked from
+        """
+        ancestors = []
+        node = source
+        while node is not None:
+            ancestors.append(node)
+            node = node.parent
+
+        # Ancestors missing from their parent's replies belong to an enclosing
+        # fork; copy their subtrees too so the whole path is reachable.
+        copies = {}
+        for ancestor in reversed(ancestors):
+            if id(ancestor) in copies:
+                continue
+            stack = [(ancestor, copies.get(id(ancestor.parent)))]
+            while stack:
+                node, parent_copy = stack.pop()
+                node_copy = copy.copy(node)
+                node_copy.parent = parent_copy
+                node_copy.replies = []
+                node_copy._journal_id = None
+                if parent_copy is not None:
+                    parent_copy.replies.append(node_copy)
+                copies[id(node)] = node_copy
+                stack.extend((reply, node_copy) for reply in reversed(node.replies))
+
+        source_copy = copies[id(source)]
+        for reply in source_copy.replies:
+            reply.parent = self
+        self.replies[:0] = source_copy.replies
+        self.parent = source_copy.parent
+        if self.parent is not None:
+            siblings = self.parent.replies
+            siblings[next(i for i, sibling in enumerate(siblings) if sibling is source_copy)] = self
+
     def _is_valid_conversation_position(self) -> bool:
         """
         Validate that this node position would create a valid message sequence for the API.
@@ -699,6 +1082,68 @@ class ConversationNode:
         return self
 
 
+def _run_awaitable(awaitable: Any) -> Any:
+    """Run an awaitable to completion from synchronous code.
+
+    Uses asyncio.run when the calling thread has no running event loop, and
+    a short-lived helper thread otherwise (e.g. a sync respond() called from
+    inside a coroutine).
+    """
+
+    async def _await() -> Any:
+        return await awaitable
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _await()).result()
+
+
+@dataclass(frozen=True)
+class ToolCallPlan:
+    """How ToolHandler calls one tool function, worked out once per function.
+
+    Attributes:
+        takes_bot (bool): Whether the function accepts a _bot argument
+        is_coroutine (bool): Whether the function is an async def
+    """
+
+    takes_bot: bool
+    is_coroutine: bool
+
+
+_tool_call_plans: "weakref.WeakKeyDictionary[Callable, ToolCallPlan]" = weakref.WeakKeyDictionary()
+_tool_call_plans_lock = threading.Lock()
+
+
+def get_tool_call_plan(func: Callable) -> ToolCallPlan:
+    """Return the cached ToolCallPlan for a tool function, compiling it if needed.
+
+    Plans are keyed by the function object, so forks and copies of a
+    ToolHandler that share functions share plans, and a replaced function
+    gets a new plan.
+    """
+    try:
+        plan = _tool_call_plans.get(func)
+    except TypeError:
+        plan = None  # Not hashable or weak-referenceable
+    if plan is not None:
+        return plan
+    try:
+        takes_bot = "_bot" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        takes_bot = False
+    plan = ToolCallPlan(takes_bot=takes_bot, is_coroutine=inspect.iscoroutinefunction(func))
+    try:
+        with _tool_call_plans_lock:
+            _tool_call_plans[func] = plan
+    except TypeError:
+        pass
+    return plan
+
+
 @dataclass
 class ModuleContext:
     """Context container for module-level tool preservation.
@@ -763,6 +1208,13 @@ class ToolHandler(ABC):
         requests (List[Dict[str, Any]]): Pending tool execution requests
         results (List[Dict[str, Any]]): Results from tool executions
         modules (Dict[str, ModuleContext]): Module contexts for imported tools
+        parallel_execution (bool): Run parallel-safe tools from one response concurrently
+        max_parallel_workers (Optional[int]): Size of the tool thread pool (None uses the
+            ThreadPoolExecutor default)
+
+    Requests can also be started before exec_requests() with start_request(),
+    which streaming mailboxes call as soon as a tool call's input is complete.
+    exec_requests() then waits for those results instead of re-running the tools.
 
     Example:
         ```python
@@ -782,6 +1234,31 @@ class ToolHandler(ABC):
         self.results: List[Dict[str, Any]] = []
         self.modules: Dict[str, ModuleContext] = {}
         self.tool_registry: Dict[str, Dict[str, Any]] = {}  # For lazy-loading tools
+        self.parallel_execution: bool = False
+        self.max_parallel_workers: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._callback_lock = threading.RLock()
+        self._started: Dict[str, Future] = {}
+        self._stream_executor: Optional[ThreadPoolExecutor] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the thread pool and locks, which cannot be pickled."""
+        state = self.__dict__.copy()
+        for key in ("_executor", "_executor_lock", "_callback_lock", "_started", "_stream_executor"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore state and recreate the thread pool lazily."""
+        self.__dict__.update(state)
+        self.parallel_execution = state.get("parallel_execution", False)
+        self.max_parallel_workers = state.get("max_parallel_workers", None)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._callback_lock = threading.RLock()
+        self._started = {}
+        self._stream_executor = None
 
     @staticmethod
     def _clean_decorator_source(source):
@@ -1006,6 +1483,13 @@ class ToolHandler(ABC):
             TypeError: If tool arguments are invalid
             Exception: For other tool execution errors
 
+        Note:
+            When parallel_execution is enabled, consecutive requests for tools
+            marked parallel-safe (see toolify(parallel_safe=True)) run concurrently
+            on the handler's thread pool. Any other tool acts as a barrier and runs
+            alone, so side effects keep their original order. Results are always
+            returned in request order.
+
         Example:
             ```python
             handler.extract_requests(response)
@@ -1013,261 +1497,353 @@ class ToolHandler(ABC):
             # [{"status": "success", "content": "file contents..."}, ...]
             ```
         """
-        results = []
         requests = self.requests
 
         # Check if tracing is available and enabled
         if TRACING_AVAILABLE and tracer:
             with tracer.start_as_current_span("tools.execute_all") as span:
                 span.set_attribute("tool.count", len(requests))
-                for request_schema in requests:
-                    tool_name, input_kwargs = self.tool_name_and_input(request_schema)
-                    if tool_name is None:
-                        continue
+                results = self._exec_request_batches(requests)
+        else:
+            results = self._exec_request_batches(requests)
 
-                    with tracer.start_as_current_span(f"tool.{tool_name}") as tool_span:
-                        tool_span.set_attribute("tool.name", tool_name)
+        self.results = results
+        return results
 
-                        # Invoke on_tool_start callback
-                        if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                            try:
-                                self.bot.callbacks.on_tool_start(
-                                    tool_name, metadata={"request": request_schema, "tool_args": input_kwargs}
-                                )
-                            except Exception:
-                                pass
+    async def aexec_requests(self) -> List[Dict[str, Any]]:
+        """Execute pending tool requests without blocking the event loop.
 
-                        import time
+        Async counterpart of exec_requests(). async def tools are awaited;
+        regular tools run in a worker thread. With parallel_execution enabled,
+        consecutive parallel-safe requests run concurrently, exactly as in
+        exec_requests().
 
-                        tool_start_time = time.time()
+        Returns:
+            List[Dict[str, Any]]: Result schemas in request order
+        """
+        requests = self.requests
 
-                        try:
-                            if tool_name not in self.function_map:
-                                raise ToolNotFoundError(f"Tool '{tool_name}' not found in function map")
-                            func = self.function_map[tool_name]
-
-                            # Inject _bot parameter if function signature includes it
-                            sig = inspect.signature(func)
-                            if "_bot" in sig.parameters:
-                                # Create a copy to avoid modifying the original kwargs
-                                call_kwargs = input_kwargs.copy()
-                                call_kwargs["_bot"] = getattr(self, "bot", None)
-                                output_kwargs = func(**call_kwargs)
-                            else:
-                                output_kwargs = func(**input_kwargs)
-
-                            response_schema = self.generate_response_schema(request_schema, output_kwargs)
-
-                            # Record metrics for successful tool execution
-                            tool_duration = time.time() - tool_start_time
-                            if METRICS_AVAILABLE and metrics:
-                                try:
-                                    metrics.record_tool_execution(tool_duration, tool_name, success=True)
-                                except Exception:
-                                    pass
-
-                            # Invoke on_tool_complete callback
-                            if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                                try:
-                                    self.bot.callbacks.on_tool_complete(
-                                        tool_name, output_kwargs, metadata={"duration": tool_duration}
-                                    )
-                                except Exception:
-                                    pass
-
-                            tool_span.set_attribute("tool.status", "success")
-                            if isinstance(output_kwargs, str):
-                                tool_span.set_attribute("tool.result_length", len(output_kwargs))
-                        except ToolNotFoundError as e:
-                            error_msg = "Error: Tool not found.\n\n" + str(e)
-                            response_schema = self.generate_error_schema(request_schema, error_msg)
-
-                            # Record error metrics
-                            tool_duration = time.time() - tool_start_time
-                            if METRICS_AVAILABLE and metrics:
-                                try:
-                                    metrics.record_tool_execution(tool_duration, tool_name, success=False)
-                                    metrics.record_tool_failure(tool_name, "ToolNotFoundError")
-                                except Exception:
-                                    pass
-
-                            # Invoke on_tool_error callback
-                            if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                                try:
-                                    self.bot.callbacks.on_tool_error(tool_name, e, metadata={"duration": tool_duration})
-                                except Exception:
-                                    pass
-
-                            tool_span.set_attribute("tool.status", "error")
-                            tool_span.set_attribute("tool.error_type", "ToolNotFoundError")
-                            tool_span.record_exception(e)
-                        except TypeError as e:
-                            error_msg = f"Invalid arguments for tool '{tool_name}': {str(e)}"
-                            response_schema = self.generate_error_schema(request_schema, error_msg)
-
-                            # Record error metrics
-                            tool_duration = time.time() - tool_start_time
-                            if METRICS_AVAILABLE and metrics:
-                                try:
-                                    metrics.record_tool_execution(tool_duration, tool_name, success=False)
-                                    metrics.record_tool_failure(tool_name, "TypeError")
-                                except Exception:
-                                    pass
-
-                            # Invoke on_tool_error callback
-                            if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                                try:
-                                    self.bot.callbacks.on_tool_error(tool_name, e, metadata={"duration": tool_duration})
-                                except Exception:
-                                    pass
-
-                            tool_span.set_attribute("tool.status", "error")
-                            tool_span.set_attribute("tool.error_type", "TypeError")
-                            tool_span.record_exception(e)
-                        except Exception as e:
-                            error_msg = f"Unexpected error while executing tool '{tool_name}': {str(e)}"
-                            response_schema = self.generate_error_schema(request_schema, error_msg)
-
-                            # Record error metrics
-                            tool_duration = time.time() - tool_start_time
-                            if METRICS_AVAILABLE and metrics:
-                                try:
-                                    metrics.record_tool_execution(tool_duration, tool_name, success=False)
-                                    metrics.record_tool_failure(tool_name, type(e).__name__)
-                                except Exception:
-                                    pass
-
-                            # Invoke on_tool_error callback
-                            if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                                try:
-                                    self.bot.callbacks.on_tool_error(tool_name, e, metadata={"duration": tool_duration})
-                                except Exception:
-                                    pass
-
-                            tool_span.set_attribute("tool.status", "error")
-                            tool_span.set_attribute("tool.error_type", type(e).__name__)
-                            tool_span.record_exception(e)
-
-                        results.append(response_schema)
-
-                self.results = results
-                return results
+        if TRACING_AVAILABLE and tracer:
+            with tracer.start_as_current_span("tools.execute_all") as span:
+                span.set_attribute("tool.count", len(requests))
+                results = await self._aexec_request_batches(requests)
         else:
-            # Non-tracing path
-            for request_schema in requests:
-                tool_name, input_kwargs = self.tool_name_and_input(request_schema)
-                if tool_name is None:
-                    continue
+            results = await self._aexec_request_batches(requests)
 
-                # Invoke on_tool_start callback
-                if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                    try:
-                        self.bot.callbacks.on_tool_start(
-                            tool_name, metadata={"request": request_schema, "tool_args": input_kwargs}
-                        )
-                    except Exception:
-                        pass
+        self.results = results
+        return results
 
-                import time
+    async def _aexec_request_batches(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async counterpart of _exec_request_batches."""
+        calls = []
+        for request_schema in requests:
+            tool_name, input_kwargs = self.tool_name_and_input(request_schema)
+            if tool_name is None:
+                continue
+            calls.append((request_schema, tool_name, input_kwargs))
 
-                tool_start_time = time.time()
+        if not self.parallel_execution or len(calls) < 2:
+            return [await self._aexec_single_request(*call) for call in calls]
 
-                try:
-                    if tool_name not in self.function_map:
-                        raise ToolNotFoundError(f"Tool '{tool_name}' not found in function map")
-                    func = self.function_map[tool_name]
-
-                    # Inject _bot parameter if function signature includes it
-                    sig = inspect.signature(func)
-                    if "_bot" in sig.parameters:
-                        # Create a copy to avoid modifying the original kwargs
-                        call_kwargs = input_kwargs.copy()
-                        call_kwargs["_bot"] = getattr(self, "bot", None)
-                        output_kwargs = func(**call_kwargs)
-                    else:
-                        output_kwargs = func(**input_kwargs)
+        results = []
+        batch = []
+        for call in calls:
+            if self._is_parallel_safe(call[1]):
+                batch.append(call)
+                continue
+            results.extend(await asyncio.gather(*(self._aexec_single_request(*c) for c in batch)))
+            batch = []
+            results.append(await self._aexec_single_request(*call))
+        results.extend(await asyncio.gather(*(self._aexec_single_request(*c) for c in batch)))
+        return results
 
-                    response_schema = self.generate_response_schema(request_schema, output_kwargs)
+    async def _aexec_single_request(
+        self, request_schema: Dict[str, Any], tool_name: str, input_kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Async counterpart of _exec_single_request."""
+        started = self._take_started(request_schema)
+        if started is not None:
+            return await asyncio.wrap_future(started)
+        if TRACING_AVAILABLE and tracer:
+            with tracer.start_as_current_span(f"tool.{tool_name}") as tool_span:
+                tool_span.set_attribute("tool.name", tool_name)
+                return await self._arun_tool(request_schema, tool_name, input_kwargs, tool_span)
+        return await self._arun_tool(request_schema, tool_name, input_kwargs, None)
 
-                    # Record metrics for successful tool execution
-                    tool_duration = time.time() - tool_start_time
-                    if METRICS_AVAILABLE and metrics:
-                        try:
-                            metrics.record_tool_execution(tool_duration, tool_name, success=True)
-                        except Exception:
-                            pass
+    def _exec_request_batches(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run requests serially or in parallel batches, preserving request order.
 
-                    # Invoke on_tool_complete callback
-                    if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                        try:
-                            self.bot.callbacks.on_tool_complete(tool_name, output_kwargs, metadata={"duration": tool_duration})
-                        except Exception:
-                            pass
+        Parameters:
+            requests (List[Dict[str, Any]]): Request schemas to execute
 
-                except ToolNotFoundError as e:
-                    error_msg = "Error: Tool not found.\n\n" + str(e)
-                    response_schema = self.generate_error_schema(request_schema, error_msg)
+        Returns:
+            List[Dict[str, Any]]: Response schemas in request order
+        """
+        calls = []
+        for request_schema in requests:
+            tool_name, input_kwargs = self.tool_name_and_input(request_schema)
+            if tool_name is None:
+                continue
+            calls.append((request_schema, tool_name, input_kwargs))
 
-                    # Record error metrics
-                    tool_duration = time.time() - tool_start_time
-                    if METRICS_AVAILABLE and metrics:
-                        try:
-                            metrics.record_tool_execution(tool_duration, tool_name, success=False)
-                            metrics.record_tool_failure(tool_name, "ToolNotFoundError")
-                        except Exception:
-                            pass
+        if not self.parallel_execution or len(calls) < 2:
+            return [self._exec_single_request(*call) for call in calls]
 
-                    # Invoke on_tool_error callback
-                    if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                        try:
-                            self.bot.callbacks.on_tool_error(tool_name, e, metadata={"duration": tool_duration})
-                        except Exception:
-                            pass
+        results = []
+        batch = []
+        for call in calls:
+            if self._is_parallel_safe(call[1]):
+                batch.append(call)
+                continue
+            results.extend(self._exec_parallel(batch))
+            batch = []
+            results.append(self._exec_single_request(*call))
+        results.extend(self._exec_parallel(batch))
+        return results
 
-                except TypeError as e:
-                    error_msg = f"Invalid arguments for tool '{tool_name}': {str(e)}"
-                    response_schema = self.generate_error_schema(request_schema, error_msg)
+    def start_request(self, request_schema: Dict[str, Any]) -> None:
+        """Start executing a tool request before exec_requests() is called.
 
-                    # Record error metrics
-                    tool_duration = time.time() - tool_start_time
-                    if METRICS_AVAILABLE and metrics:
-                        try:
-                            metrics.record_tool_execution(tool_duration, tool_name, success=False)
-                            metrics.record_tool_failure(tool_name, "TypeError")
-                        except Exception:
-                            pass
+        Use from a streaming mailbox when a tool call's input is complete but
+        the model is still generating the rest of the response. Started
+        requests run one at a time, in the order they were started, so tools
+        keep the same ordering guarantees as in exec_requests(). When
+        exec_requests() reaches an identical request it waits for the started
+        execution instead of running the tool again.
 
-                    # Invoke on_tool_error callback
-                    if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                        try:
-                            self.bot.callbacks.on_tool_error(tool_name, e, metadata={"duration": tool_duration})
-                        except Exception:
-                            pass
+        Parameters:
+            request_schema (Dict[str, Any]): A request as produced by
+                generate_request_schema()
+        """
+        tool_name, input_kwargs = self.tool_name_and_input(request_schema)
+        if tool_name is None:
+            return
+        with self._executor_lock:
+            if self._stream_executor is None:
+                self._stream_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bots-stream-tool")
+            executor = self._stream_executor
+        future = executor.submit(contextvars.copy_context().run, self._exec_traced, request_schema, tool_name, input_kwargs)
+        self._started[self._request_key(request_schema)] = future
 
-                except Exception as e:
-                    error_msg = f"Unexpected error while executing tool '{tool_name}': {str(e)}"
-                    response_schema = self.generate_error_schema(request_schema, error_msg)
+    def discard_started_requests(self) -> int:
+        """Wait for started requests to finish and forget their results.
 
-                    # Record error metrics
-                    tool_duration = time.time() - tool_start_time
-                    if METRICS_AVAILABLE and metrics:
-                        try:
-                            metrics.record_tool_execution(tool_duration, tool_name, success=False)
-                            metrics.record_tool_failure(tool_name, type(e).__name__)
-                        except Exception:
-                            pass
+        Use when a streamed response is abandoned, so stale results are not
+        matched against the next response.
 
-                    # Invoke on_tool_error callback
-                    if hasattr(self, "bot") and self.bot and hasattr(self.bot, "callbacks") and self.bot.callbacks:
-                        try:
-                            self.bot.callbacks.on_tool_error(tool_name, e, metadata={"duration": tool_duration})
-                        except Exception:
-                            pass
+        Returns:
+            int: Number of requests that had been started
+        """
+        started, self._started = self._started, {}
+        for future in started.values():
+            try:
+                future.result()
+            except Exception:
+                pass
+        return len(started)
+
+    @staticmethod
+    def _request_key(request_schema: Dict[str, Any]) -> str:
+        """Identify a request by its content, so re-extracted requests match started ones."""
+        return json.dumps(request_schema, sort_keys=True, default=str)
+
+    def _take_started(self, request_schema: Dict[str, Any]) -> Optional[Future]:
+        """Return and forget the started execution of a request, if any."""
+        started = getattr(self, "_started", None)
+        if not started:
+            return None
+        return started.pop(self._request_key(request_schema), None)
+
+    def _is_parallel_safe(self, tool_name: str) -> bool:
+        """Check whether a tool was marked safe for concurrent execution."""
+        func = self.function_map.get(tool_name)
+        return bool(getattr(func, "__parallel_safe__", False))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return this handler's tool thread pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_parallel_workers, thread_name_prefix="bots-tool")
+            return self._executor
+
+    def _exec_parallel(self, batch: List[Tuple[Dict[str, Any], str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Execute a batch of parallel-safe requests concurrently.
+
+        Each task runs in a copy of the caller's context so tool spans stay
+        parented to the active tools.execute_all span.
+
+        Parameters:
+            batch: (request_schema, tool_name, input_kwargs) tuples
+
+        Returns:
+            List[Dict[str, Any]]: Response schemas in batch order
+        """
+        if len(batch) < 2:
+            return [self._exec_single_request(*call) for call in batch]
+        executor = self._get_executor()
+        futures = [executor.submit(contextvars.copy_context().run, self._exec_single_request, *call) for call in batch]
+        return [future.result() for future in futures]
+
+    def _invoke_callback(self, name: str, *args: Any, **kwargs: Any) -> None:
+        """Invoke a bot callback if one is configured, ignoring callback errors.
+
+        Callbacks are serialized with a lock because tools may complete on
+        worker threads and callback implementations (e.g. CLI display) are
+        not expected to be thread-safe.
+        """
+        bot = getattr(self, "bot", None)
+        callbacks = getattr(bot, "callbacks", None) if bot else None
+        if not callbacks:
+            return
+        try:
+            with self._callback_lock:
+                getattr(callbacks, name)(*args, **kwargs)
+        except Exception:
+            pass
+
+    def _exec_single_request(
+        self, request_schema: Dict[str, Any], tool_name: str, input_kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute one tool request with its span, callbacks and metrics.
+
+        Parameters:
+            request_schema (Dict[str, Any]): The original request
+            tool_name (str): Name of the tool to call
+            input_kwargs (Dict[str, Any]): Arguments for the tool
+
+        Returns:
+            Dict[str, Any]: Response schema, or error schema if the tool failed
+        """
+        started = self._take_started(request_schema)
+        if started is not None:
+            return started.result()
+        return self._exec_traced(request_schema, tool_name, input_kwargs)
+
+    def _exec_traced(self, request_schema: Dict[str, Any], tool_name: str, input_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one tool inside its tracing span."""
+        if TRACING_AVAILABLE and tracer:
+            with tracer.start_as_current_span(f"tool.{tool_name}") as tool_span:
+                tool_span.set_attribute("tool.name", tool_name)
+                return self._run_tool(request_schema, tool_name, input_kwargs, tool_span)
+        return self._run_tool(request_schema, tool_name, input_kwargs, None)
+
+    def _run_tool(
+        self, request_schema: Dict[str, Any], tool_name: str, input_kwargs: Dict[str, Any], tool_span: Any
+    ) -> Dict[str, Any]:
+        """Call the tool function and translate the outcome into a schema."""
+        with profiling.phase(getattr(self, "bot", None), "tool", tool_name):
+            tool_start_time = self._tool_started(request_schema, tool_name, input_kwargs)
+            try:
+                func, call_kwargs = self._prepare_tool_call(tool_name, input_kwargs)
+                output_kwargs = func(**call_kwargs)
+                if inspect.isawaitable(output_kwargs):
+                    # async def tool called from the synchronous path
+                    output_kwargs = _run_awaitable(output_kwargs)
+                response_schema = self.generate_response_schema(request_schema, output_kwargs)
+            except Exception as e:
+                return self._tool_failed(request_schema, tool_name, e, tool_start_time, tool_span)
+            return self._tool_succeeded(tool_name, output_kwargs, response_schema, tool_start_time, tool_span)
+
+    async def _arun_tool(
+        self, request_schema: Dict[str, Any], tool_name: str, input_kwargs: Dict[str, Any], tool_span: Any
+    ) -> Dict[str, Any]:
+        """Async counterpart of _run_tool.
+
+        async def tools are awaited on the running loop; regular tools run in
+        a worker thread so they don't block it.
+        """
+        with profiling.phase(getattr(self, "bot", None), "tool", tool_name):
+            tool_start_time = self._tool_started(request_schema, tool_name, input_kwargs)
+            try:
+                func, call_kwargs = self._prepare_tool_call(tool_name, input_kwargs)
+                if get_tool_call_plan(func).is_coroutine:
+                    output_kwargs = await func(**call_kwargs)
+                else:
+                    output_kwargs = await asyncio.to_thread(func, **call_kwargs)
+                    if inspect.isawaitable(output_kwargs):
+                        output_kwargs = await output_kwargs
+                response_schema = self.generate_response_schema(request_schema, output_kwargs)
+            except Exception as e:
+                return self._tool_failed(request_schema, tool_name, e, tool_start_time, tool_span)
+            return self._tool_succeeded(tool_name, output_kwargs, response_schema, tool_start_time, tool_span)
+
+    def _tool_started(self, request_schema: Dict[str, Any], tool_name: str, input_kwargs: Dict[str, Any]) -> float:
+        """Invoke on_tool_start and return the start time."""
+        self._invoke_callback("on_tool_start", tool_name, metadata={"request": request_schema, "tool_args": input_kwargs})
+        return time.time()
+
+    def _prepare_tool_call(self, tool_name: str, input_kwargs: Dict[str, Any]) -> Tuple[Callable, Dict[str, Any]]:
+        """Look up a tool and build its call arguments.
+
+        Raises:
+            ToolNotFoundError: If the tool is not in the function map
+        """
+        if tool_name not in self.function_map:
+            raise ToolNotFoundError(f"Tool '{tool_name}' not found in function map")
+        func = self.function_map[tool_name]
+
+        # Inject _bot parameter if function signature includes it
+        if get_tool_call_plan(func).takes_bot:
+            # Create a copy to avoid modifying the original kwargs
+            call_kwargs = input_kwargs.copy()
+            call_kwargs["_bot"] = getattr(self, "bot", None)
+            return func, call_kwargs
+        return func, input_kwargs
+
+    def _tool_succeeded(
+        self, tool_name: str, output_kwargs: Any, response_schema: Dict[str, Any], tool_start_time: float, tool_span: Any
+    ) -> Dict[str, Any]:
+        """Record metrics, callbacks and span attributes for a successful tool call."""
+        # Record metrics for successful tool execution
+        tool_duration = time.time() - tool_start_time
+        if METRICS_AVAILABLE and metrics:
+            try:
+                metrics.record_tool_execution(tool_duration, tool_name, success=True)
+            except Exception:
+                pass
+
+        # Invoke on_tool_complete callback
+        self._invoke_callback("on_tool_complete", tool_name, output_kwargs, metadata={"duration": tool_duration})
+
+        if tool_span is not None:
+            tool_span.set_attribute("tool.status", "success")
+            if isinstance(output_kwargs, str):
+                tool_span.set_attribute("tool.result_length", len(output_kwargs))
+        return response_schema
+
+    def _tool_failed(
+        self, request_schema: Dict[str, Any], tool_name: str, error: Exception, tool_start_time: float, tool_span: Any
+    ) -> Dict[str, Any]:
+        """Build the error schema and record metrics, callbacks and span attributes for a failed tool call."""
+        if isinstance(error, ToolNotFoundError):
+            error_msg = "Error: Tool not found.\n\n" + str(error)
+            error_type = "ToolNotFoundError"
+        elif isinstance(error, TypeError):
+            error_msg = f"Invalid arguments for tool '{tool_name}': {str(error)}"
+            error_type = "TypeError"
+        else:
+            error_msg = f"Unexpected error while executing tool '{tool_name}': {str(error)}"
+            error_type = type(error).__name__
 
-                results.append(response_schema)
+        response_schema = self.generate_error_schema(request_schema, error_msg)
 
-            self.results = results
-            return results
+        # Record error metrics
+        tool_duration = time.time() - tool_start_time
+        if METRICS_AVAILABLE and metrics:
+            try:
+                metrics.record_tool_execution(tool_duration, tool_name, success=False)
+                metrics.record_tool_failure(tool_name, error_type)
+            except Exception:
+                pass
+
+        # Invoke on_tool_error callback
+        self._invoke_callback("on_tool_error", tool_name, error, metadata={"duration": tool_duration})
+
+        if tool_span is not None:
+            tool_span.set_attribute("tool.status", "error")
+            tool_span.set_attribute("tool.error_type", error_type)
+            tool_span.record_exception(error)
+        return response_schema
 
     def _create_builtin_wrapper(self, func: Callable) -> str:
         """Create a wrapper function source code for built-in functions.
@@ -1637,6 +2213,7 @@ class ToolHandler(ABC):
             self.tools.append(schema)
 
         self.function_map[func.__name__] = func
+        get_tool_call_plan(func)
 
     def register_tool(self, func: Callable, module_path: str = None) -> None:
         """Add tool to registry without loading it into active tools.
@@ -1671,6 +2248,7 @@ class ToolHandler(ABC):
         # Add to active tools
         self.tools.append(entry["schema"])
         self.function_map[tool_name] = entry["function"]
+        get_tool_call_plan(entry["function"])
         entry["loaded"] = True
         return True
 
@@ -1756,7 +2334,7 @@ class ToolHandler(ABC):
         module_context = ModuleContext(
             name=module_name, source=source, file_path=file_path, namespace=module, code_hash=self._get_code_hash(source)
         )
-        exec(source, module.__dict__)
+        exec(code_cache.get_code(source, module_context.code_hash), module.__dict__)
         new_func = module.__dict__[func.__name__]
         new_func.__module_context__ = module_context
         self.modules[file_path] = module_context
@@ -1804,9 +2382,10 @@ class ToolHandler(ABC):
             module.__file__ = abs_file_path
             tree = ast.parse(source)
             function_nodes = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+            code_hash = self._get_code_hash(source)
             sys.path.insert(0, os.path.dirname(abs_file_path))
             try:
-                exec(source, module.__dict__)
+                exec(code_cache.get_code(source, code_hash), module.__dict__)
             finally:
                 sys.path.pop(0)
             module_context = ModuleContext(
@@ -1814,7 +2393,7 @@ class ToolHandler(ABC):
                 source=source,
                 file_path=abs_file_path,
                 namespace=module,
-                code_hash=self._get_code_hash(source),
+                code_hash=code_hash,
             )
             self.modules[abs_file_path] = module_context
             for node in function_nodes:
@@ -2218,6 +2797,8 @@ class ToolHandler(ABC):
             "function_paths": function_paths,
             "save_cwd": cwd,  # Store the working directory at save time
             "tool_registry": registry_data,  # Add registry data
+            "parallel_execution": self.parallel_execution,
+            "max_parallel_workers": self.max_parallel_workers,
         }
 
         # Add dynamic functions if any exist
@@ -2480,7 +3061,7 @@ class ToolHandler(ABC):
             return False, f"Placeholder creation error: {type(e).__name__}: {str(e)}"
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ToolHandler":
+    def from_dict(cls, data: Dict[str, Any], module_store: Optional[ModuleStore] = None) -> "ToolHandler":
         """Reconstruct a ToolHandler instance from serialized state.
 
         Use when restoring a previously serialized tool handler,
@@ -2488,6 +3069,8 @@ class ToolHandler(ABC):
 
         Parameters:
             data (Dict[str, Any]): Serialized state from to_dict()
+            module_store (Optional[ModuleStore]): Store used to resolve module
+                entries saved as source_ref/globals_ref references
 
         Returns:
             ToolHandler: Reconstructed handler instance
@@ -2505,6 +3088,7 @@ class ToolHandler(ABC):
             - Preserves execution state (requests/results)
             - Attempts to resolve module paths using multiple strategies
             - Restores tool registry for lazy-loading
+            - Reads referenced module sources and globals from module_store
 
         Example:
             ```python
@@ -2518,6 +3102,8 @@ class ToolHandler(ABC):
         handler.results = data.get("results", [])
         handler.requests = data.get("requests", [])
         handler.tools = data.get("tools", []).copy()
+        handler.parallel_execution = data.get("parallel_execution", False)
+        handler.max_parallel_workers = data.get("max_parallel_workers", None)
         function_paths = data.get("function_paths", {})
         save_cwd = data.get("save_cwd", None)  # Directory where bot was saved
 
@@ -2531,6 +3117,15 @@ class ToolHandler(ABC):
         failed_modules = []
 
         for file_path, module_data in data.get("modules", {}).items():
+            if module_store is not None:
+                try:
+                    module_data = module_store.resolve(module_data)
+                except FileNotFoundError:
+                    print(f"Warning: Module store entry missing for module {file_path}. Skipping.")
+                    continue
+            elif "source" not in module_data:
+                print(f"Warning: Module {file_path} references a module store but none was given. Skipping.")
+                continue
             current_code_hash = cls._get_code_hash(module_data["source"])
             if current_code_hash != module_data["code_hash"]:
                 print(f"Warning: Code hash mismatch for module {file_path}. Skipping.")
@@ -2548,23 +3143,16 @@ class ToolHandler(ABC):
                     print(f"  From: {module_data['file_path']}")
                     print(f"  To:   {resolved_path}")
 
-                module = ModuleType(module_data["name"])
-                module.__file__ = resolved_path
                 source = module_data["source"]
-                if "globals" in module_data:
-                    cls._deserialize_globals(module.__dict__, module_data["globals"])
-
-                # Add the directory containing the module to sys.path temporarily
-                # This ensures imports within the module can be resolved
-                module_dir = os.path.dirname(resolved_path) if os.path.isabs(resolved_path) else None
-                if module_dir and module_dir not in sys.path:
-                    sys.path.insert(0, module_dir)
-                    try:
-                        exec(source, module.__dict__)
-                    finally:
-                        sys.path.remove(module_dir)
+                if code_cache.is_shareable(resolved_path):
+                    # Stateless stock bots modules are materialized once and shared by loaded bots
+                    globals_hash = cls._get_code_hash(json.dumps(module_data.get("globals"), sort_keys=True, default=str))
+                    module = code_cache.get_namespace(
+                        (module_data["name"], resolved_path, current_code_hash, globals_hash),
+                        lambda: cls._materialize_module(module_data, resolved_path, current_code_hash),
+                    )
                 else:
-                    exec(source, module.__dict__)
+                    module = cls._materialize_module(module_data, resolved_path, current_code_hash)
 
                 module_context = ModuleContext(
                     name=module_data["name"],
@@ -2853,9 +3441,37 @@ class ToolHandler(ABC):
         Side Effects:
             - Empties self.results list
             - Empties self.requests list
+            - Forgets requests started with start_request()
         """
         self.results = []
         self.requests = []
+        self._started = {}
+
+    def fork(self) -> "ToolHandler":
+        """Create a handler that shares this one's tools but not its state.
+
+        Use when a forked bot needs the same tools without re-executing their
+        modules. Tool functions, schemas and module namespaces are shared by
+        reference; the containers holding them are copied so tools added to
+        either handler later are not seen by the other.
+
+        Returns:
+            ToolHandler: A handler of the same class with empty requests/results
+
+        Note:
+            Module globals are shared, so a tool that mutates its module's
+            globals affects both handlers.
+        """
+        handler = copy.copy(self)
+        handler.tools = list(self.tools)
+        handler.function_map = dict(self.function_map)
+        handler.modules = dict(self.modules)
+        handler.tool_registry = {name: dict(entry) for name, entry in self.tool_registry.items()}
+        handler.requests = []
+        handler.results = []
+        handler._started = {}
+        handler._stream_executor = None
+        return handler
 
     def add_request(self, request: Dict[str, Any]) -> None:
         """Add a new tool request to the pending requests.
@@ -2907,6 +3523,37 @@ class ToolHandler(ABC):
         """
         return self.requests
 
+    @classmethod
+    def _materialize_module(cls, module_data: Dict[str, Any], resolved_path: str, code_hash: str) -> ModuleType:
+        """Create a module from a saved module entry and execute its source.
+
+        Parameters:
+            module_data (Dict[str, Any]): Resolved module entry from to_dict()
+            resolved_path (str): Path the module file was found at
+            code_hash (str): Verified hash of the module source
+
+        Returns:
+            ModuleType: The executed module
+        """
+        module = ModuleType(module_data["name"])
+        module.__file__ = resolved_path
+        if "globals" in module_data:
+            cls._deserialize_globals(module.__dict__, module_data["globals"])
+        code = code_cache.get_code(module_data["source"], code_hash)
+
+        # Add the directory containing the module to sys.path temporarily
+        # This ensures imports within the module can be resolved
+        module_dir = os.path.dirname(resolved_path) if os.path.isabs(resolved_path) else None
+        if module_dir and module_dir not in sys.path:
+            sys.path.insert(0, module_dir)
+            try:
+                exec(code, module.__dict__)
+            finally:
+                sys.path.remove(module_dir)
+        else:
+            exec(code, module.__dict__)
+        return module
+
     @staticmethod
     def _get_code_hash(code: str) -> str:
         """Generate an MD5 hash of a code string.
@@ -3053,6 +3700,39 @@ class Mailbox(ABC):
         """
         raise NotImplementedError("You must implement this method in a subclass")
 
+    async def asend_message(self, bot: "Bot") -> Dict[str, Any]:
+        """Send a message to the LLM service without blocking the event loop.
+
+        Used by Bot.arespond(). The default runs send_message() in a worker
+        thread; provider mailboxes override it with their SDK's async client.
+
+        Parameters:
+            bot (Bot): Reference to the bot instance making the request
+
+        Returns:
+            Dict[str, Any]: Raw response from the LLM service
+        """
+        return await asyncio.to_thread(self.send_message, bot)
+
+    async def aprocess_response(
+        self, response: Dict[str, Any], bot: Optional["Bot"] = None
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Async counterpart of process_response().
+
+        The default calls process_response() directly, which suits mailboxes
+        whose processing does no I/O. Override when processing sends follow-up
+        requests or runs tools (see OpenAIMailbox).
+        """
+        return self.process_response(response, bot)
+
+    def _fresh_copy(self) -> "Mailbox":
+        """Return the mailbox for a copy of the bot (see Bot.__deepcopy__ and Bot.fork).
+
+        The default is a new instance of the same class. Wrapping mailboxes
+        override it to wrap a fresh copy of the mailbox they delegate to.
+        """
+        return type(self)()
+
     def _log_outgoing(self, conversation: ConversationNode, model: Engines, max_tokens, temperature):
         log_message = {
             "date": formatted_datetime(),
@@ -3168,6 +3848,9 @@ class Bot(ABC):
         self.autosave = autosave
         self.filename = None  # Track source filename for intelligent save behavior
         self.callbacks = callbacks  # Optional callback system for progress/monitoring
+        self.context_policy = None  # Optional ContextPolicy applied to each request (see bots.foundation.context)
+        self.last_turn_profile = None  # TurnProfile of the latest respond() (see bots.foundation.profiling)
+        self._turn_profile = None  # TurnProfile of the respond() in progress
 
         # Determine if tracing should be enabled
         # Determine if tracing should be enabled
@@ -3227,23 +3910,30 @@ class Bot(ABC):
             except Exception as e:
                 logger.warning(f"Callback on_respond_start failed: {e}")
 
+        profile = self._start_turn_profile()
         try:
             self.conversation = self.conversation._add_reply(content=prompt, role=role)
             if self.autosave:
-                self.save(f"{self.name}", quicksave=True)
+                with profile.phase("autosave"):
+                    self.save(f"{self.name}", quicksave=True)
             reply, _ = self._cvsn_respond()
             if self.autosave:
-                self.save(f"{self.name}", quicksave=True)
+                with profile.phase("autosave"):
+                    self.save(f"{self.name}", quicksave=True)
+            self._finish_turn_profile(profile)
 
             # Invoke on_respond_complete callback
             if self.callbacks:
                 try:
-                    self.callbacks.on_respond_complete(reply, metadata={"bot_name": self.name})
+                    self.callbacks.on_respond_complete(
+                        reply, metadata={"bot_name": self.name, "turn_profile": profile.to_dict()}
+                    )
                 except Exception as e:
                     logger.warning(f"Callback on_respond_complete failed: {e}")
 
             return reply
         except Exception as e:
+            self._finish_turn_profile(profile)
             # Invoke on_respond_error callback
             if self.callbacks:
                 try:
@@ -3252,6 +3942,80 @@ class Bot(ABC):
                     logger.warning(f"Callback on_respond_error failed: {callback_error}")
             raise
 
+    async def arespond(self, prompt: str, role: str = "user") -> str:
+        """Async counterpart of respond().
+
+        Sends the conversation through the mailbox's asend_message() and runs
+        requested tools with ToolHandler.aexec_requests(), so many bots can
+        converse concurrently on one event loop without a thread per call.
+        async def tools are awaited directly.
+
+        Parameters:
+            prompt (str): The message to send to the bot
+            role (str): Role of the message sender (defaults to 'user')
+
+        Returns:
+            str: The bot's response text
+
+        Note:
+            Autosave runs in a worker thread so file I/O does not block the loop.
+            A bot must not be used by two concurrent arespond() calls; use
+            fork() to converse in parallel.
+
+        Example:
+            ```python
+            bots = [AnthropicBot() for _ in range(3)]
+            replies = await asyncio.gather(*(b.arespond("Hi") for b in bots))
+            ```
+        """
+        if self._tracing_enabled and tracer:
+            with tracer.start_as_current_span("bot.arespond") as span:
+                span.set_attribute("bot.name", self.name)
+                span.set_attribute("bot.model", self.model_engine.value)
+                span.set_attribute("prompt.length", len(prompt))
+                span.set_attribute("prompt.role", role)
+                return await self._arespond_impl(prompt, role)
+        else:
+            return await self._arespond_impl(prompt, role)
+
+    async def _arespond_impl(self, prompt: str, role: str = "user") -> str:
+        """Internal implementation of arespond without tracing."""
+        if self.callbacks:
+            try:
+                self.callbacks.on_respond_start(prompt, metadata={"bot_name": self.name, "model": self.model_engine.value})
+            except Exception as e:
+                logger.warning(f"Callback on_respond_start failed: {e}")
+
+        profile = self._start_turn_profile()
+        try:
+            self.conversation = self.conversation._add_reply(content=prompt, role=role)
+            if self.autosave:
+                with profile.phase("autosave"):
+                    await asyncio.to_thread(self.save, f"{self.name}", quicksave=True)
+            reply, _ = await self._acvsn_respond()
+            if self.autosave:
+                with profile.phase("autosave"):
+                    await asyncio.to_thread(self.save, f"{self.name}", quicksave=True)
+            self._finish_turn_profile(profile)
+
+            if self.callbacks:
+                try:
+                    self.callbacks.on_respond_complete(
+                        reply, metadata={"bot_name": self.name, "turn_profile": profile.to_dict()}
+                    )
+                except Exception as e:
+                    logger.warning(f"Callback on_respond_complete failed: {e}")
+
+            return reply
+        except Exception as e:
+            self._finish_turn_profile(profile)
+            if self.callbacks:
+                try:
+                    self.callbacks.on_respond_error(e, metadata={"bot_name": self.name, "prompt": prompt})
+                except Exception as callback_error:
+                    logger.warning(f"Callback on_respond_error failed: {callback_error}")
+            raise
+
     def add_tools(self, *args, lazy: bool = False) -> None:
         """Add Python functions as tools available to the bot.
 
@@ -3383,12 +4147,14 @@ class Bot(ABC):
             with tracer.start_as_current_span("bot._cvsn_respond") as span:
                 try:
                     self.tool_handler.clear()
-                    response = self.mailbox.send_message(self)
-                    _ = self.tool_handler.extract_requests(response)
-                    span.set_attribute("tool.request_count", len(self.tool_handler.requests))
-                    text, role, data = self.mailbox.process_response(response, self)
-                    self.conversation = self.conversation._add_reply(content=text, role=role, **data)
-                    self.conversation._add_tool_calls(self.tool_handler.requests)
+                    with profiling.phase(self, "api_wait"):
+                        response = self.mailbox.send_message(self)
+                    with profiling.phase(self, "response_processing"):
+                        _ = self.tool_handler.extract_requests(response)
+                        span.set_attribute("tool.request_count", len(self.tool_handler.requests))
+                        text, role, data = self.mailbox.process_response(response, self)
+                        self.conversation = self.conversation._add_reply(content=text, role=role, **data)
+                        self.conversation._add_tool_calls(self.tool_handler.requests)
 
                     # Invoke callback to display bot response before tools execute
                     if self.callbacks:
@@ -3401,7 +4167,8 @@ class Bot(ABC):
 
                     _ = self.tool_handler.exec_requests()
                     span.set_attribute("tool.result_count", len(self.tool_handler.results))
-                    self.conversation._add_tool_results(self.tool_handler.results)
+                    with profiling.phase(self, "result_sync"):
+                        self.conversation._add_tool_results(self.tool_handler.results)
                     return (text, self.conversation)
                 except Exception as e:
                     span.record_exception(e)
@@ -3409,11 +4176,13 @@ class Bot(ABC):
         else:
             try:
                 self.tool_handler.clear()
-                response = self.mailbox.send_message(self)
-                _ = self.tool_handler.extract_requests(response)
-                text, role, data = self.mailbox.process_response(response, self)
-                self.conversation = self.conversation._add_reply(content=text, role=role, **data)
-                self.conversation._add_tool_calls(self.tool_handler.requests)
+                with profiling.phase(self, "api_wait"):
+                    response = self.mailbox.send_message(self)
+                with profiling.phase(self, "response_processing"):
+                    _ = self.tool_handler.extract_requests(response)
+                    text, role, data = self.mailbox.process_response(response, self)
+                    self.conversation = self.conversation._add_reply(content=text, role=role, **data)
+                    self.conversation._add_tool_calls(self.tool_handler.requests)
 
                 # Invoke callback to display bot response before tools execute
                 if self.callbacks:
@@ -3425,11 +4194,53 @@ class Bot(ABC):
                         logger.warning(f"Callback on_api_call_complete failed: {e}")
 
                 _ = self.tool_handler.exec_requests()
-                self.conversation._add_tool_results(self.tool_handler.results)
+                with profiling.phase(self, "result_sync"):
+                    self.conversation._add_tool_results(self.tool_handler.results)
                 return (text, self.conversation)
             except Exception as e:
                 raise e
 
+    async def _acvsn_respond(self) -> Tuple[str, ConversationNode]:
+        """Async counterpart of _cvsn_respond(), used by arespond()."""
+        if self._tracing_enabled and tracer:
+            with tracer.start_as_current_span("bot._acvsn_respond") as span:
+                try:
+                    return await self._acvsn_respond_impl(span)
+                except Exception as e:
+                    span.record_exception(e)
+                    raise e
+        else:
+            return await self._acvsn_respond_impl(None)
+
+    async def _acvsn_respond_impl(self, span: Optional[Any]) -> Tuple[str, ConversationNode]:
+        """Internal implementation of _acvsn_respond; span may be None."""
+        self.tool_handler.clear()
+        with profiling.phase(self, "api_wait"):
+            response = await self.mailbox.asend_message(self)
+        with profiling.phase(self, "response_processing"):
+            _ = self.tool_handler.extract_requests(response)
+            if span:
+                span.set_attribute("tool.request_count", len(self.tool_handler.requests))
+            text, role, data = await self.mailbox.aprocess_response(response, self)
+            self.conversation = self.conversation._add_reply(content=text, role=role, **data)
+            self.conversation._add_tool_calls(self.tool_handler.requests)
+
+        # Invoke callback to display bot response before tools execute
+        if self.callbacks:
+            try:
+                self.callbacks.on_api_call_complete(
+                    metadata={"bot_response": text, "tool_count": len(self.tool_handler.requests)}
+                )
+            except Exception as e:
+                logger.warning(f"Callback on_api_call_complete failed: {e}")
+
+        _ = await self.tool_handler.aexec_requests()
+        if span:
+            span.set_attribute("tool.result_count", len(self.tool_handler.results))
+        with profiling.phase(self, "result_sync"):
+            self.conversation._add_tool_results(self.tool_handler.results)
+        return (text, self.conversation)
+
     def set_system_message(self, message: str) -> None:
         """Set the system-level instructions for the bot.
 
@@ -3448,6 +4259,53 @@ class Bot(ABC):
         """
         self.system_message = message
 
+    def _context_messages(self) -> List[Dict[str, Any]]:
+        """Build the messages for the next request, applying the bot's context policy.
+
+        Mailboxes call this instead of conversation._build_messages(). Without
+        a context_policy the full root-to-leaf history is sent.
+
+        Returns:
+            List[Dict[str, Any]]: Provider-format messages; callers may mutate them
+
+        Example:
+            ```python
+            from bots.foundation.context import FitContextWindow
+
+            bot.context_policy = FitContextWindow()
+            ```
+        """
+        with profiling.phase(self, "message_build"):
+            if getattr(self, "context_policy", None) is None:
+                return self.conversation._build_messages()
+            from bots.foundation.context import build_messages
+
+            return build_messages(self)
+
+    def _start_turn_profile(self) -> "profiling.TurnProfile":
+        """Begin timing a respond() call (see bots.foundation.profiling)."""
+        self._turn_profile = profiling.TurnProfile(tracer if self._tracing_enabled and tracer else None)
+        return self._turn_profile
+
+    def _finish_turn_profile(self, profile: "profiling.TurnProfile") -> None:
+        """Publish a finished turn profile as last_turn_profile and to metrics."""
+        self._turn_profile = None
+        self.last_turn_profile = profile.finish()
+        if METRICS_AVAILABLE and metrics:
+            try:
+                try:
+                    provider = self.model_engine.get_info()["provider"]
+                except ValueError:
+                    provider = "unknown"
+                metrics.record_turn_profile(
+                    profile,
+                    provider=provider,
+                    model=self.model_engine.value,
+                    bot_id=metrics.bot_metrics_id(self),
+                )
+            except Exception:
+                pass
+
     def _serialize_for_deepcopy(self) -> dict:
         """Serialize the bot's state for deepcopy operations (same-runtime).
 
@@ -3554,6 +4412,26 @@ class Bot(ABC):
             - Uses hybrid serialization for tool handlers (see tool_handling.md)
             - For deepcopy operations, use _serialize_for_deepcopy() instead
 
+        Raises:
+            ValueError: If unexpected non-JSON-serializable attributes are found
+        """
+        data = self._serialize_attributes()
+        data["conversation"] = self.conversation._root_dict()
+
+        # Serialize tool handler
+        data["tool_handler"] = self.tool_handler.to_dict()
+
+        return data
+
+    def _serialize_attributes(self) -> dict:
+        """Serialize the bot's attributes, excluding conversation and tool handler.
+
+        Used by _serialize() and by the autosave journal, which records the
+        conversation and tools incrementally.
+
+        Returns:
+            dict: JSON-safe bot attributes plus bot_class/model_engine metadata
+
         Raises:
             ValueError: If unexpected non-JSON-serializable attributes are found
         """
@@ -3564,24 +4442,24 @@ class Bot(ABC):
         data.pop("api_key", None)
         data.pop("mailbox", None)
         data.pop("callbacks", None)  # Callbacks are environment-specific, not serialized
+        data.pop("context_policy", None)  # Policies may hold callables; set again after load
+        data.pop("last_turn_profile", None)  # Runtime timings, not bot state
         data.pop("respond", None)  # Wrapped respond method (from make_bot_interruptible), not serialized
 
         # Add metadata
         data["bot_class"] = self.__class__.__name__
         data["model_engine"] = self.model_engine.value
-        data["conversation"] = self.conversation._root_dict()
+        data.pop("conversation", None)
+        data.pop("tool_handler", None)
 
         # Preserve tracing state
         if hasattr(self, "_tracing_enabled"):
             data["enable_tracing"] = self._tracing_enabled
 
-        # Serialize tool handler
-        data["tool_handler"] = self.tool_handler.to_dict()
-
         # Validate that all remaining attributes are JSON-serializable
         # This prevents silent data corruption
         for key, value in list(data.items()):
-            if key in ("bot_class", "model_engine", "conversation", "tool_handler", "enable_tracing"):
+            if key in ("bot_class", "model_engine", "enable_tracing"):
                 # These are handled specially above
                 continue
 
@@ -3673,7 +4551,7 @@ class Bot(ABC):
         return bot
 
     @classmethod
-    def _deserialize(cls, data: dict, api_key: Optional[str] = None) -> "Bot":
+    def _deserialize(cls, data: dict, api_key: Optional[str] = None, module_store: Optional[ModuleStore] = None) -> "Bot":
         """Deserialize a bot from a dictionary.
 
         This is the core deserialization logic extracted from load().
@@ -3682,6 +4560,8 @@ class Bot(ABC):
         Parameters:
             data (dict): Serialized bot state
             api_key (Optional[str]): API key to use (overrides any saved key)
+            module_store (Optional[ModuleStore]): Store holding tool module sources
+                and globals referenced by the serialized tool handler
 
         Returns:
             Bot: Reconstructed bot instance
@@ -3740,7 +4620,7 @@ class Bot(ABC):
             module_name, class_name = tool_handler_class.rsplit(".", 1)
             module = importlib.import_module(module_name)
             actual_class = getattr(module, class_name)
-            bot.tool_handler = actual_class().from_dict(data["tool_handler"])
+            bot.tool_handler = actual_class().from_dict(data["tool_handler"], module_store=module_store)
             # Restore bot reference in tool_handler so callbacks can be invoked
             bot.tool_handler.bot = bot
 
@@ -3761,6 +4641,7 @@ class Bot(ABC):
             "model_engine",
             "enable_tracing",
             "respond",
+            "journal_token",
         )
 
         for key, value in data.items():
@@ -3769,7 +4650,8 @@ class Bot(ABC):
 
         if "conversation" in data and data["conversation"]:
             node_class = Engines.get_conversation_node_class(data["conversation"]["node_class"])
-            bot.conversation = node_class._from_dict(data["conversation"])
+            # Only the path to the current leaf is built now; other branches load when visited
+            bot.conversation = node_class._from_dict(data["conversation"], lazy=True)
             while bot.conversation.replies:
                 bot.conversation = bot.conversation.replies[-1]
 
@@ -3856,6 +4738,10 @@ class Bot(ABC):
             elif key == "mailbox":
                 # Mailbox will be reconstructed after all attributes are copied
                 pass
+            elif key in ("_journal", "_turn_profile"):
+                # The autosave journal tracks this bot's nodes, and the turn profile
+                # times a respond() in progress; the copy starts its own
+                pass
             elif key == "callbacks":
                 # Callbacks are environment-specific, don't deep copy
                 new_bot.callbacks = value
@@ -3875,10 +4761,10 @@ class Bot(ABC):
                     # If deepcopy fails, just copy the reference
                     new_bot.__dict__[key] = value
 
-        # Reconstruct mailbox - create a new instance of the same type as the original
+        # Reconstruct mailbox - a new instance of the same type as the original
         if hasattr(self, "mailbox") and self.mailbox is not None:
-            mailbox_class = type(self.mailbox)
-            new_bot.mailbox = mailbox_class()
+            fresh_copy = getattr(self.mailbox, "_fresh_copy", None)
+            new_bot.mailbox = fresh_copy() if fresh_copy else type(self.mailbox)()
         else:
             new_bot.mailbox = None
 
@@ -3916,20 +4802,24 @@ class Bot(ABC):
             - Callbacks are not restored (environment-specific, must be injected after load)
             - Tool functions are fully restored with their context
             - Conversation history is preserved exactly
+            - If the file is an autosave snapshot, its journal is replayed on top
+            - Both the JSON and the compressed container format are detected
         """
-        # Read file
-        with open(filepath, "r") as file:
-            data = json.load(file)
+        # Read file (JSON or the compressed container, see bot_file)
+        data = bot_file.read(filepath)
 
-        # Deserialize bot
-        bot = cls._deserialize(data, api_key)
+        # Deserialize bot, resolving tool modules from the directory's module store
+        bot = cls._deserialize(data, api_key, module_store=ModuleStore.for_file(filepath))
+
+        # Replay autosave journal records written since the snapshot
+        journal.replay(bot, journal.read_journal(filepath, data.get("journal_token")))
 
         # Set filename
         bot.filename = filepath
 
         return bot
 
-    def save(self, filename: Optional[str] = None, quicksave: bool = False) -> str:
+    def save(self, filename: Optional[str] = None, quicksave: bool = False, format: Optional[str] = None) -> str:
         """Save the bot's complete state to a file.
 
         Use to preserve the bot's entire state including:
@@ -3943,7 +4833,12 @@ class Bot(ABC):
                 If None, generates name using bot name and timestamp
                 Adds .bot extension if not present
             quicksave (bool): If True, saves to quicksave.bot (ephemeral working file)
-                Quicksave doesn't update the tracked filename
+                Quicksave doesn't update the tracked filename. Quicksaves are
+                incremental: they append new nodes to quicksave.bot.journal and
+                only rewrite quicksave.bot when the journal is compacted.
+            format (Optional[str]): "json" for pretty-printed JSON or "binary"
+                for the compressed container (see bot_file). Defaults to
+                bot_file.get_config().format, which is "json" unless configured.
 
         Returns:
             str: Path to the saved file
@@ -3958,6 +4853,9 @@ class Bot(ABC):
 
             # Quicksave (autosave)
             path = bot.save(quicksave=True)  # saves as "quicksave.bot"
+
+            # Compressed container instead of JSON
+            path = bot.save("long_session", format="binary")
             ```
 
         Note:
@@ -3965,6 +4863,8 @@ class Bot(ABC):
             - Callbacks are not saved (environment-specific, must be injected on load)
             - Creates directories in path if they don't exist
             - Maintains complete tool context for restoration
+            - Tool module sources and globals go to the .bot_modules store next to
+              the file, shared by every bot saved in that directory
         """
         # Determine filename
         if quicksave:
@@ -3980,12 +4880,23 @@ class Bot(ABC):
         if directory and (not os.path.exists(directory)):
             os.makedirs(directory)
 
-        # Serialize bot state
+        # A fork shares its history until it is written out
+        self._own_forked_history()
+
+        # Quicksaves append to the autosave journal instead of rewriting the file
+        if quicksave:
+            bot_journal = getattr(self, "_journal", None)
+            if bot_journal is None or bot_journal.path != filename:
+                bot_journal = self._journal = journal.BotJournal(filename)
+            return bot_journal.save(self, format=format)
+
+        # Serialize bot state, moving module sources and globals into the shared store
         data = self._serialize()
+        ModuleStore.for_file(filename).externalize(data["tool_handler"])
 
         # Write to file
-        with open(filename, "w") as file:
-            json.dump(data, file, indent=1)
+        bot_file.write(filename, data, format=format)
+        journal.remove_journal(filename)
 
         # Update tracked filename (except for quicksaves)
         if not quicksave:
@@ -4038,6 +4949,67 @@ class Bot(ABC):
                     print(f"Used Tool: {tool_name}")
                     print(separator)
 
+    def fork(self) -> "Bot":
+        """Create a lightweight branch of this bot.
+
+        Use instead of copy.deepcopy or a save/load round trip when fanning out
+        from the current conversation point (branch_self, par_branch, bot * n).
+
+        The fork shares the conversation history and the compiled tools with
+        this bot by reference. It gets its own copy of the current node, a fresh
+        mailbox and a ToolHandler with empty requests/results, so nothing it
+        does is visible to this bot until its nodes are stitched back.
+
+        Returns:
+            Bot: A bot of the same class positioned at a copy of the current node
+
+        Example:
+            ```python
+            branch = bot.fork()
+            branch.respond("Try the other approach")
+            # bot.conversation is unchanged
+            ```
+
+        Note:
+            - Callbacks and the API key are shared with this bot
+            - The fork's new replies hang off a node that this bot's tree does
+              not list; saving the fork first copies the tree's node shells so the
+              file contains the full history plus the fork's branch
+            - Tool module globals are shared (see ToolHandler.fork)
+        """
+        cls = self.__class__
+        new_bot = cls.__new__(cls)
+        for key, value in self.__dict__.items():
+            if key in ("mailbox", "_journal", "respond", "_turn_profile"):
+                # Per-bot runtime state; the fork starts its own
+                continue
+            if isinstance(value, (list, dict, set)):
+                value = copy.copy(value)
+            new_bot.__dict__[key] = value
+
+        new_bot.conversation = self.conversation._fork_leaf()
+        new_bot._detached_leaf = (new_bot.conversation, self.conversation)
+
+        if getattr(self, "tool_handler", None) is not None:
+            new_bot.tool_handler = self.tool_handler.fork()
+            new_bot.tool_handler.bot = new_bot
+
+        mailbox = getattr(self, "mailbox", None)
+        new_bot.mailbox = mailbox._fresh_copy() if mailbox is not None else None
+        return new_bot
+
+    def _own_forked_history(self) -> None:
+        """Give a forked bot its own conversation tree before it is serialized."""
+        detached = self.__dict__.pop("_detached_leaf", None)
+        if detached is None:
+            return
+        leaf, source = detached
+        node = self.conversation
+        while node is not None and node is not leaf:
+            node = node.parent
+        if node is leaf:
+            leaf._attach_fork_leaf(source)
+
     def __mul__(self, other: int) -> List["Bot"]:
         """Create multiple copies of this bot.
 
@@ -4060,29 +5032,13 @@ class Bot(ABC):
             ```
 
         Note:
-            - Each copy is completely independent
+            - Copies are made with fork(): history and tools are shared by
+              reference, and each copy's new turns are independent
             - Copies include all configuration and tools
             - Callbacks are preserved and shared across copies
         """
         if isinstance(other, int):
-            # Store callbacks and api_key before deepcopy (they may not be deepcopy-able)
-            original_callbacks = self.callbacks
-            original_api_key = self.api_key
-
-            # Temporarily remove callbacks for deepcopy
-            self.callbacks = None
-
-            # Create copies
-            copies = [copy.deepcopy(self) for _ in range(other)]
-
-            # Restore callbacks and api_key to original and all copies
-            self.callbacks = original_callbacks
-            self.api_key = original_api_key
-            for bot_copy in copies:
-                bot_copy.callbacks = original_callbacks
-                bot_copy.api_key = original_api_key
-
-            return copies
+            return [self.fork() for _ in range(other)]
         raise NotImplementedError("Bot multiplication not defined for non-integer values")
 
     def __str__(self) -> str:
@@ -0,0 +1,307 @@
+"""Reading and writing .bot files, as JSON or as a compressed container.
+
+Bot.save() has always written pretty-printed JSON. That is easy to inspect,
+but a long session's tool outputs make the file large, and the indentation
+alone is a good part of it. The container format stores the same data
+compressed with zlib, in independent frames:
+
+    b"\\x89BOTZ\\r\\n\\x1a"  magic (8 bytes)
+    version          1 byte
+    frames           tag (1 byte) + payload length (4 bytes, big-endian) + zlib(JSON)
+
+Frames are written in this order:
+
+- ``A``: bot attributes (every top-level key except the two below)
+- ``T``: the tool handler dict
+- ``N``: conversation nodes, in chunks of ``[parent_index, node]`` records in
+  preorder. ``node`` is the node's dict without ``replies`` and
+  ``parent_index`` is the preorder position of its parent (-1 for the root).
+- ``E``: end marker; a file without it was cut short
+
+The writer streams one frame at a time and the reader decodes one frame at a
+time, so iter_sections() can read the attributes without decompressing the
+conversation. read() turns either format back into the dict that Bot.save()
+serialized, with the conversation nested as usual, so Bot.load() and the
+autosave journal work the same with both.
+
+JSON stays the default because older versions of the library, and scripts
+outside it, read .bot files as JSON text. Opt in with
+``Bot.save(..., format="binary")``, configure(format="binary"), or the
+``BOTS_SAVE_FORMAT`` environment variable; convert() turns a container back
+into readable JSON.
+
+Example:
+    ```python
+    from bots.foundation import bot_file
+
+    bot_file.configure(format="binary")  # Saves and autosave snapshots
+    bot.save("session.bot")
+
+    bot = Bot.load("session.bot")  # Detects the format
+    bot_file.convert("session.bot", "session.json.bot", format="json")
+    ```
+"""
+
+import json
+import os
+import struct
+import threading
+import uuid
+import zlib
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"\x89BOTZ\r\n\x1a"
+VERSION = 1
+FORMATS = ("json", "binary")
+
+SECTION_ATTRIBUTES = b"A"
+SECTION_TOOL_HANDLER = b"T"
+SECTION_NODES = b"N"
+SECTION_END = b"E"
+
+_FRAME_HEADER = struct.Struct(">cI")
+
+
+@dataclass
+class BotFileConfig:
+    """Settings for writing .bot files.
+
+    Attributes:
+        format: "json" (pretty-printed, the default) or "binary" (container)
+        compression_level: zlib level for container frames (1 fastest, 9 smallest)
+        nodes_per_chunk: Conversation nodes per ``N`` frame
+    """
+
+    format: str = "json"
+    compression_level: int = 6
+    nodes_per_chunk: int = 1000
+
+
+def _default_format() -> str:
+    configured = os.environ.get("BOTS_SAVE_FORMAT", "").strip().lower()
+    return configured if configured in FORMATS else "json"
+
+
+_config = BotFileConfig(format=_default_format())
+_config_lock = threading.Lock()
+
+
+def configure(
+    format: Optional[str] = None,
+    compression_level: Optional[int] = None,
+    nodes_per_chunk: Optional[int] = None,
+) -> BotFileConfig:
+    """Update how .bot files are written.
+
+    Args:
+        format: Default format for Bot.save() and autosave snapshots
+        compression_level: zlib level for container frames
+        nodes_per_chunk: Conversation nodes per frame
+
+    Returns:
+        BotFileConfig: The active configuration
+
+    Raises:
+        ValueError: If format is not one of FORMATS
+    """
+    if format is not None and format not in FORMATS:
+        raise ValueError(f"Unsupported .bot format: {format!r} (expected one of {FORMATS})")
+    with _config_lock:
+        if format is not None:
+            _config.format = format
+        if compression_level is not None:
+            _config.compression_level = compression_level
+        if nodes_per_chunk is not None:
+            _config.nodes_per_chunk = max(1, nodes_per_chunk)
+        return _config
+
+
+def get_config() -> BotFileConfig:
+    """Return the active configuration."""
+    return _config
+
+
+def is_container(path: str) -> bool:
+    """Return whether the file at path is in the container format."""
+    with open(path, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _flatten(root: Dict[str, Any]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (parent_index, node dict without replies) for a nested tree in preorder."""
+    stack = [(root, -1)]
+    index = 0
+    while stack:
+        data, parent = stack.pop()
+        replies = data.get("replies")
+        if replies is not None:
+            data = {k: v for k, v in data.items() if k != "replies"}
+        yield parent, data
+        if replies:
+            stack.extend((reply, index) for reply in reversed(replies))
+        index += 1
+
+
+def _write_frame(file: BinaryIO, tag: bytes, payload: bytes, level: int) -> int:
+    compressed = zlib.compress(payload, level)
+    file.write(_FRAME_HEADER.pack(tag, len(compressed)))
+    file.write(compressed)
+    return len(payload)
+
+
+def write_container(file: BinaryIO, data: Dict[str, Any]) -> int:
+    """Write bot data to a binary stream in the container format.
+
+    Args:
+        file: Writable binary stream
+        data: Serialized bot, as produced by Bot._serialize()
+
+    Returns:
+        int: Total size of the frame payloads before compression
+    """
+    level = _config.compression_level
+    chunk_size = _config.nodes_per_chunk
+    attributes = {k: v for k, v in data.items() if k not in ("conversation", "tool_handler")}
+
+    file.write(MAGIC + bytes([VERSION]))
+    size = _write_frame(file, SECTION_ATTRIBUTES, _encode(attributes), level)
+    if "tool_handler" in data:
+        size += _write_frame(file, SECTION_TOOL_HANDLER, _encode(data["tool_handler"]), level)
+    if data.get("conversation") is not None:
+        chunk: List[Tuple[int, Dict[str, Any]]] = []
+        for record in _flatten(data["conversation"]):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                size += _write_frame(file, SECTION_NODES, _encode(chunk), level)
+                chunk = []
+        if chunk:
+            size += _write_frame(file, SECTION_NODES, _encode(chunk), level)
+    _write_frame(file, SECTION_END, b"", level)
+    return size
+
+
+def iter_sections(file: BinaryIO) -> Iterator[Tuple[str, Any]]:
+    """Decode a container stream one frame at a time.
+
+    Args:
+        file: Binary stream positioned at the start of the container
+
+    Yields:
+        Tuple[str, Any]: ("attributes", dict), ("tool_handler", dict) and
+        ("nodes", list of [parent_index, node]) items, in file order
+
+    Raises:
+        ValueError: If the stream is not a container, has an unknown version,
+            or ends before the end marker
+    """
+    header = file.read(len(MAGIC) + 1)
+    if header[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a .bot container file")
+    if header[len(MAGIC)] != VERSION:
+        raise ValueError(f"Unsupported .bot container version: {header[len(MAGIC)]}")
+    names = {SECTION_ATTRIBUTES: "attributes", SECTION_TOOL_HANDLER: "tool_handler", SECTION_NODES: "nodes"}
+    while True:
+        frame_header = file.read(_FRAME_HEADER.size)
+        if len(frame_header) < _FRAME_HEADER.size:
+            raise ValueError("Truncated .bot container file")
+        tag, length = _FRAME_HEADER.unpack(frame_header)
+        payload = file.read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated .bot container file")
+        if tag == SECTION_END:
+            return
+        if tag not in names:
+            continue  # Section from a newer writer; skip it
+        yield names[tag], json.loads(zlib.decompress(payload))
+
+
+def read_container(file: BinaryIO) -> Dict[str, Any]:
+    """Read a container stream back into the serialized bot dict."""
+    data: Dict[str, Any] = {}
+    nodes: List[Dict[str, Any]] = []
+    for section, value in iter_sections(file):
+        if section == "attributes":
+            data.update(value)
+        elif section == "tool_handler":
+            data["tool_handler"] = value
+        else:
+            for parent, node in value:
+                if parent >= 0:
+                    nodes[parent].setdefault("replies", []).append(node)
+                nodes.append(node)
+    if nodes:
+        data["conversation"] = nodes[0]
+    return data
+
+
+def read(path: str) -> Dict[str, Any]:
+    """Read a .bot file in either format.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Dict[str, Any]: The serialized bot, as Bot.save() produced it
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) == MAGIC:
+            file.seek(0)
+            return read_container(file)
+        file.seek(0)
+        return json.load(file)
+
+
+def write(path: str, data: Dict[str, Any], format: Optional[str] = None) -> int:
+    """Write a serialized bot to path.
+
+    Args:
+        path: Destination file
+        data: Serialized bot, as produced by Bot._serialize()
+        format: "json" or "binary"; None uses the configured default
+
+    Returns:
+        int: Size of the data as JSON before any compression (the file size
+        for "json")
+
+    Raises:
+        ValueError: If format is not one of FORMATS
+    """
+    format = format or _config.format
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported .bot format: {format!r} (expected one of {FORMATS})")
+    if format == "json":
+        with open(path, "w") as file:
+            json.dump(data, file, indent=1)
+        return os.path.getsize(path)
+    # Write next to the target and swap it in, so a failed save never leaves
+    # half a container behind
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            size = write_container(file, data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return size
+
+
+def convert(source: str, destination: Optional[str] = None, format: str = "json") -> str:
+    """Rewrite a .bot file in another format, e.g. to read a container as JSON.
+
+    Args:
+        source: File to read, in either format
+        destination: File to write; defaults to source (converted in place)
+        format: "json" or "binary"
+
+    Returns:
+        str: The destination path
+    """
+    destination = destination or source
+    write(destination, read(source), format=format)
+    return destination
@@ -0,0 +1,258 @@
+"""Process-wide pool of provider API clients.
+
+Mailboxes used to construct a brand-new provider client (and therefore a new
+HTTP connection pool and TLS session) on every send_message call. This module
+keeps one client per (provider, api_key, timeout) for the lifetime of the
+process so that consecutive turns of a tool loop, and the worker threads used
+by par_branch/branch_self, reuse warm keep-alive connections.
+
+The provider SDK clients (anthropic, openai, google-genai) are all safe to
+share between threads, so a single pooled client is handed to every caller
+with a matching key.
+
+Async clients (anthropic.AsyncAnthropic, openai.AsyncOpenAI) hold connections
+bound to the event loop that created them, so get_async_client keeps a
+separate set of clients per running loop.
+
+Example:
+    ```python
+    from bots.foundation import client_pool
+
+    # Optional: tune connection limits before the first client is created
+    client_pool.configure(max_connections=200, max_keepalive_connections=50)
+
+    client = client_pool.get_client("anthropic", anthropic.Anthropic, api_key, timeout=600.0)
+
+    # Inside a coroutine
+    client = client_pool.get_async_client("anthropic", anthropic.AsyncAnthropic, api_key, timeout=600.0)
+    ```
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClientPoolConfig:
+    """Connection settings applied to newly created pooled clients.
+
+    Attributes:
+        max_connections: Maximum concurrent connections per client
+        max_keepalive_connections: Maximum idle connections kept open per client
+        keepalive_expiry: Seconds an idle connection is kept before being closed
+        enabled: If False, get_client builds a fresh client on every call
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    enabled: bool = True
+
+
+_config = ClientPoolConfig()
+_clients: Dict[Tuple[Hashable, ...], Any] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Hashable, ...], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_pool_lock = threading.Lock()
+
+
+def configure(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    enabled: Optional[bool] = None,
+) -> ClientPoolConfig:
+    """Update the pool configuration.
+
+    Only affects clients created after the call; existing pooled clients keep
+    their connection limits until clear() is called.
+
+    Args:
+        max_connections: Maximum concurrent connections per client
+        max_keepalive_connections: Maximum idle connections kept per client
+        keepalive_expiry: Seconds before an idle connection is closed
+        enabled: Enable or disable client reuse
+
+    Returns:
+        ClientPoolConfig: The active configuration
+    """
+    with _pool_lock:
+        if max_connections is not None:
+            _config.max_connections = max_connections
+        if max_keepalive_connections is not None:
+            _config.max_keepalive_connections = max_keepalive_connections
+        if keepalive_expiry is not None:
+            _config.keepalive_expiry = keepalive_expiry
+        if enabled is not None:
+            _config.enabled = enabled
+        return _config
+
+
+def get_config() -> ClientPoolConfig:
+    """Return the active pool configuration."""
+    return _config
+
+
+def _build_http_client(client_class: Callable[..., Any], asynchronous: bool = False) -> Optional[Any]:
+    """Create an HTTP client with the configured connection limits.
+
+    Uses the SDK's own DefaultHttpxClient / DefaultAsyncHttpxClient when the
+    client's SDK exposes them, so the pooled client keeps the SDK's defaults
+    (TCP keepalive socket options, redirect following) and its httpx flavour
+    (recent SDKs ship on ``httpx2`` and reject ``httpx`` clients). Otherwise
+    falls back to a plain httpx client.
+
+    Args:
+        client_class: SDK client the HTTP client is for
+        asynchronous: Build an async client instead of a sync one
+
+    Returns None if the SDK has no default client and httpx is not installed,
+    in which case the provider SDK falls back to its own default transport.
+    """
+    sdk = sys.modules.get(getattr(client_class, "__module__", "").split(".")[0])
+    default_client = getattr(sdk, "DefaultAsyncHttpxClient" if asynchronous else "DefaultHttpxClient", None)
+    default_limits = getattr(sdk, "DEFAULT_CONNECTION_LIMITS", None)
+    if isinstance(default_client, type) and default_limits is not None:
+        limits_class = type(default_limits)
+        http_client_class = default_client
+    else:
+        try:
+            import httpx
+        except ImportError:
+            return None
+        limits_class = httpx.Limits
+        http_client_class = httpx.AsyncClient if asynchronous else httpx.Client
+    limits = limits_class(
+        max_connections=_config.max_connections,
+        max_keepalive_connections=_config.max_keepalive_connections,
+        keepalive_expiry=_config.keepalive_expiry,
+    )
+    return http_client_class(limits=limits)
+
+
+def get_client(
+    provider: str,
+    client_class: Callable[..., Any],
+    api_key: Optional[str],
+    timeout: Optional[float] = None,
+    pass_http_client: bool = True,
+    **client_kwargs: Any,
+) -> Any:
+    """Return a shared client for (provider, api_key, timeout), creating it if needed.
+
+    Args:
+        provider: Provider name (e.g., "anthropic", "openai", "google")
+        client_class: SDK client constructor (e.g., anthropic.Anthropic)
+        api_key: API key the client authenticates with
+        timeout: Request timeout passed to the constructor (omitted if None)
+        pass_http_client: If True, pass an httpx client configured with the
+            pool's connection limits as ``http_client``
+        **client_kwargs: Extra constructor arguments (not part of the key)
+
+    Returns:
+        The pooled provider client.
+
+    Note:
+        client_class is part of the cache key, so patching a provider's client
+        class (as the tests do) never returns a client built by another class.
+    """
+    kwargs = dict(client_kwargs)
+    kwargs["api_key"] = api_key
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+
+    if not _config.enabled:
+        return client_class(**kwargs)
+
+    key = (provider, client_class, api_key, timeout)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _pool_lock:
+        # Double-check after acquiring the lock
+        client = _clients.get(key)
+        if client is None:
+            if pass_http_client:
+                http_client = _build_http_client(client_class)
+                if http_client is not None:
+                    kwargs["http_client"] = http_client
+            client = client_class(**kwargs)
+            _clients[key] = client
+            logger.debug("Created pooled client", extra={"provider": provider, "pool_size": len(_clients)})
+        return client
+
+
+def get_async_client(
+    provider: str,
+    client_class: Callable[..., Any],
+    api_key: Optional[str],
+    timeout: Optional[float] = None,
+    pass_http_client: bool = True,
+    **client_kwargs: Any,
+) -> Any:
+    """Return a shared async client for the running event loop, creating it if needed.
+
+    Takes the same arguments as get_client. Must be called from a coroutine;
+    clients are pooled per event loop and dropped when the loop is collected.
+
+    Raises:
+        RuntimeError: If no event loop is running
+    """
+    loop = asyncio.get_running_loop()
+    kwargs = dict(client_kwargs)
+    kwargs["api_key"] = api_key
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+
+    if not _config.enabled:
+        return client_class(**kwargs)
+
+    key = (provider, client_class, api_key, timeout)
+    with _pool_lock:
+        clients = _async_clients.get(loop)
+        if clients is None:
+            clients = _async_clients[loop] = {}
+        client = clients.get(key)
+        if client is None:
+            if pass_http_client:
+                http_client = _build_http_client(client_class, asynchronous=True)
+                if http_client is not None:
+                    kwargs["http_client"] = http_client
+            client = client_class(**kwargs)
+            clients[key] = client
+            logger.debug("Created pooled async client", extra={"provider": provider, "pool_size": len(clients)})
+        return client
+
+
+def pool_size() -> int:
+    """Return the number of clients currently held by the pool."""
+    return len(_clients) + sum(len(clients) for clients in list(_async_clients.values()))
+
+
+def clear() -> None:
+    """Close and drop every pooled client.
+
+    Use in tests or after changing the connection configuration. Async clients
+    are dropped without being closed (closing them needs their event loop);
+    their connections are released when they are garbage-collected.
+    """
+    with _pool_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _async_clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass
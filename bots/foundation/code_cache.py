@@ -0,0 +1,232 @@
+"""Compiled-code and module-namespace caches for tool modules.
+
+ToolHandler.from_dict() rebuilds every tool module by exec-ing its saved
+source. Bot.load, each par_branch/broadcast_to_leaves worker and every
+Bot.__deepcopy__ go through it, so the same code_tools, terminal_tools and
+python_edit sources are parsed and compiled again and again.
+
+This module removes that repeated work at two levels:
+
+- Code objects are cached in memory and on disk, keyed by the module's
+  ModuleContext.code_hash and the interpreter's cache tag (for example
+  ``cpython-311``), so a source is compiled once per Python version.
+- Module namespaces that are safe to share (the stateless stock
+  ``bots.tools`` modules listed in SHAREABLE_MODULES) are kept once per
+  process, so reloading a bot with those modules skips exec entirely.
+
+The on-disk cache lives in ``$BOTS_BYTECODE_CACHE`` if set, otherwise in
+``$XDG_CACHE_HOME/bots/bytecode`` (``~/.cache/bots/bytecode``). Setting
+``BOTS_BYTECODE_CACHE`` to an empty string, or running with
+``sys.dont_write_bytecode``, keeps the cache in memory only.
+
+Example:
+    ```python
+    from bots.foundation import code_cache
+
+    code = code_cache.get_code(source, code_hash)
+    exec(code, module.__dict__)
+
+    # Tune or disable the caches
+    code_cache.configure(directory="/tmp/bots-bytecode", share_namespaces=False)
+    ```
+"""
+
+import logging
+import marshal
+import os
+import sys
+import threading
+import uuid
+from dataclasses import dataclass
+from types import CodeType, ModuleType
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Filename given to compiled tool sources; matches what exec(source) uses so
+# tracebacks and inspect behave as before
+SOURCE_FILENAME = "<string>"
+
+_BOTS_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stock modules, relative to the bots package, that keep no per-bot state at
+# module level. terminal_tools is deliberately absent: PowerShellManager and
+# BashManager keep class-level shell session registries, so bots sharing its
+# namespace would share shells (and each other's cd/export).
+SHAREABLE_MODULES = frozenset(
+    os.path.normcase(os.path.join("tools", name))
+    for name in (
+        "code_tools.py",
+        "markdown_edit.py",
+        "meta_tools.py",
+        "python_edit.py",
+        "python_editing_tools.py",
+        "python_execution_tool.py",
+        "self_tools.py",
+        "tool_management_tools.py",
+        "web_tool.py",
+    )
+)
+
+
+def _default_directory() -> Optional[str]:
+    configured = os.environ.get("BOTS_BYTECODE_CACHE")
+    if configured is not None:
+        return configured or None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bots", "bytecode")
+
+
+@dataclass
+class CodeCacheConfig:
+    """Settings for the compiled-code and namespace caches.
+
+    Attributes:
+        directory: On-disk cache directory, or None to cache in memory only
+        share_namespaces: Reuse materialized namespaces of stock bots modules
+    """
+
+    directory: Optional[str] = None
+    share_namespaces: bool = True
+
+
+_config = CodeCacheConfig(directory=_default_directory())
+_codes: Dict[Tuple[str, int], CodeType] = {}
+_namespaces: Dict[Hashable, ModuleType] = {}
+_cache_lock = threading.Lock()
+
+
+def configure(directory: Optional[str] = "", share_namespaces: Optional[bool] = None) -> CodeCacheConfig:
+    """Update the cache configuration.
+
+    Args:
+        directory: On-disk cache directory; None disables the disk cache, and
+            the default ("") leaves it unchanged
+        share_namespaces: Enable or disable namespace sharing
+
+    Returns:
+        CodeCacheConfig: The active configuration
+    """
+    with _cache_lock:
+        if directory != "":
+            _config.directory = directory
+        if share_namespaces is not None:
+            _config.share_namespaces = share_namespaces
+        return _config
+
+
+def get_config() -> CodeCacheConfig:
+    """Return the active cache configuration."""
+    return _config
+
+
+def _cache_path(code_hash: str) -> Optional[str]:
+    if not _config.directory or sys.implementation.cache_tag is None:
+        return None
+    suffix = f".opt-{sys.flags.optimize}" if sys.flags.optimize else ""
+    return os.path.join(_config.directory, sys.implementation.cache_tag, f"{code_hash}{suffix}.bin")
+
+
+def _read_code(path: str) -> Optional[CodeType]:
+    try:
+        with open(path, "rb") as f:
+            code = marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug("Ignoring unreadable bytecode cache entry", extra={"path": path, "error": str(e)})
+        return None
+    return code if isinstance(code, CodeType) else None
+
+
+def _write_code(path: str, code: CodeType) -> None:
+    if sys.dont_write_bytecode:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump(code, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Could not write bytecode cache entry", extra={"path": path, "error": str(e)})
+
+
+def get_code(source: str, code_hash: str) -> CodeType:
+    """Return the compiled code object for a tool module source.
+
+    Looks in the in-process cache, then the on-disk cache, and compiles the
+    source only if neither has it.
+
+    Args:
+        source: Module source code
+        code_hash: ToolHandler._get_code_hash(source); callers already have it
+
+    Returns:
+        CodeType: Code object ready to exec in a module namespace
+
+    Raises:
+        SyntaxError: If the source does not compile
+    """
+    key = (code_hash, sys.flags.optimize)
+    code = _codes.get(key)
+    if code is not None:
+        return code
+
+    path = _cache_path(code_hash)
+    code = _read_code(path) if path else None
+    if code is None:
+        code = compile(source, SOURCE_FILENAME, "exec")
+        if path:
+            _write_code(path, code)
+    with _cache_lock:
+        return _codes.setdefault(key, code)
+
+
+def is_shareable(file_path: str) -> bool:
+    """Return whether a module loaded from file_path may share its namespace.
+
+    Only the stock modules in SHAREABLE_MODULES qualify: they keep no
+    per-bot state at module level, so every bot can use one namespace.
+    Other modules, including stateful stock ones such as terminal_tools,
+    are materialized per bot.
+    """
+    if not _config.share_namespaces or not os.path.isabs(file_path):
+        return False
+    path = os.path.normcase(os.path.abspath(file_path))
+    package = os.path.normcase(_BOTS_PACKAGE_DIR) + os.sep
+    return path.startswith(package) and path[len(package) :] in SHAREABLE_MODULES
+
+
+def get_namespace(key: Hashable, build: Callable[[], ModuleType]) -> ModuleType:
+    """Return the shared namespace for key, building it with build() if needed.
+
+    Args:
+        key: Identifies the module content, e.g. (file_path, code_hash, globals hash)
+        build: Creates and executes the module; only called on a miss
+
+    Returns:
+        ModuleType: The shared module namespace
+    """
+    module = _namespaces.get(key)
+    if module is not None:
+        return module
+    module = build()
+    with _cache_lock:
+        return _namespaces.setdefault(key, module)
+
+
+def clear(disk: bool = False) -> None:
+    """Drop the in-process caches, and the on-disk cache for this interpreter if disk is True."""
+    with _cache_lock:
+        _codes.clear()
+        _namespaces.clear()
+    if disk and _config.directory and sys.implementation.cache_tag is not None:
+        tag_dir = os.path.join(_config.directory, sys.implementation.cache_tag)
+        if os.path.isdir(tag_dir):
+            for name in os.listdir(tag_dir):
+                if name.endswith(".bin"):
+                    try:
+                        os.remove(os.path.join(tag_dir, name))
+                    except OSError:
+                        pass
@@ -0,0 +1,374 @@
+"""Context policies: limit the history a bot sends with each request.
+
+Every request carries the whole root-to-leaf history. A long agent run keeps
+growing that history with tool outputs, so later calls get slower, cost more,
+and eventually exceed the model's context window. Setting ``bot.context_policy``
+lets the mailbox send a reduced history instead:
+
+- TruncateToolResults: shortens tool result payloads outside the last few turns
+- DropOldTurns: sends only the last N turns
+- SummarizeOldTurns: replaces older turns with a summary, computed once per
+  span and reused on later calls
+- FitContextWindow: drops the oldest turns only when the request would not
+  fit the model's context window (see model_registry.get_context_window)
+- ChainPolicy: applies several policies in order
+
+Policies work on the list of conversation nodes from the root to the current
+node and return the nodes to send. They never modify the stored tree: a node
+that needs different content is replaced by a copy, and the copy is cached by
+the policy so its formatted messages are reused on the next call. History is
+only cut in front of a turn, i.e. a user node that carries no tool results,
+so every tool call is sent together with its results.
+
+Example:
+    ```python
+    from bots.foundation.context import ChainPolicy, FitContextWindow, TruncateToolResults
+
+    bot.context_policy = ChainPolicy(
+        TruncateToolResults(max_chars=2000, keep_turns=2),
+        FitContextWindow(),
+    )
+    bot.respond("Continue with the next file")
+    ```
+"""
+
+import copy
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from bots.foundation.base import Bot, ConversationNode
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to estimate request sizes
+CHARS_PER_TOKEN = 4
+
+
+class ContextPolicy:
+    """Base class for context policies.
+
+    Subclasses implement apply(), which receives the non-empty nodes from the
+    root to the current node and returns the nodes to send, oldest first.
+    """
+
+    def apply(self, path: List["ConversationNode"], bot: "Bot") -> List["ConversationNode"]:
+        """Return the nodes to send for this request.
+
+        Args:
+            path: Conversation nodes from the root to the current node
+            bot: The bot making the request
+
+        Returns:
+            List[ConversationNode]: Nodes to format, oldest first
+        """
+        raise NotImplementedError
+
+
+def conversation_path(node: "ConversationNode") -> List["ConversationNode"]:
+    """Return the non-empty nodes from the root to node, oldest first."""
+    chain = []
+    while node is not None:
+        if not node._is_empty():
+            chain.append(node)
+        node = node.parent
+    chain.reverse()
+    return chain
+
+
+def turn_starts(path: List["ConversationNode"]) -> List[int]:
+    """Return the indices in path where a turn begins.
+
+    A turn begins at a user node without tool results. Cutting the history
+    at such an index never separates a tool call from its results.
+    """
+    return [i for i, node in enumerate(path) if node.role == "user" and not node._tool_results]
+
+
+def derive(node: "ConversationNode", **fields: Any) -> "ConversationNode":
+    """Return a detached copy of node with some fields replaced.
+
+    The copy shares the node's parent and replies but is not linked into the
+    tree, and formats its own messages.
+    """
+    clone = copy.copy(node)
+    clone._message_cache = None
+    clone._journal_id = None
+    for name, value in fields.items():
+        setattr(clone, name, value)
+    return clone
+
+
+def estimate_tokens(value: Any) -> int:
+    """Estimate the token count of a message, list of messages or string."""
+    return len(value if isinstance(value, str) else str(value)) // CHARS_PER_TOKEN + 1
+
+
+def transcript(nodes: List["ConversationNode"], max_chars: int = 2000) -> str:
+    """Render nodes as plain "role: content" text, e.g. as input for a summarizer.
+
+    Args:
+        nodes: Nodes to render, oldest first
+        max_chars: Longest text kept per message or tool result
+
+    Returns:
+        str: One paragraph per node, with tool calls and results on their own lines
+    """
+    lines = []
+    for node in nodes:
+        lines.append(f"{node.role}: {_shorten(str(node.content), max_chars)}")
+        for call in node._tool_calls or ():
+            name = call.get("name") or call.get("function", {}).get("name", "tool")
+            lines.append(f"  [tool call {name}]")
+        for result in node._tool_results or ():
+            lines.append(f"  [tool result] {_shorten(str(result.get('content', '')), max_chars)}")
+    return "\n".join(lines)
+
+
+def _shorten(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}\n... [{len(text) - max_chars} characters truncated]"
+
+
+def build_messages(bot: "Bot") -> List[Dict[str, Any]]:
+    """Build the messages for bot's next request, applying bot.context_policy.
+
+    Args:
+        bot: The bot making the request
+
+    Returns:
+        List[Dict[str, Any]]: Provider-format messages; callers may mutate them
+    """
+    nodes = conversation_path(bot.conversation)
+    policy = getattr(bot, "context_policy", None)
+    if policy is not None and nodes:
+        nodes = policy.apply(nodes, bot)
+    messages = []
+    for node in nodes:
+        copy_message = node._copy_message
+        messages.extend(copy_message(message) for message in node._cached_node_messages())
+    return messages
+
+
+class ChainPolicy(ContextPolicy):
+    """Apply several policies in order, each to the previous one's result."""
+
+    def __init__(self, *policies: ContextPolicy) -> None:
+        self.policies = list(policies)
+
+    def apply(self, path: List["ConversationNode"], bot: "Bot") -> List["ConversationNode"]:
+        for policy in self.policies:
+            path = policy.apply(path, bot)
+        return path
+
+
+class TruncateToolResults(ContextPolicy):
+    """Shorten tool result payloads outside the most recent turns.
+
+    Recent results are sent in full so the model can act on them; older ones
+    keep their first max_chars characters. A truncated node is copied once
+    and the copy reused while the original is unchanged, so the truncated
+    prefix stays byte-identical between calls and provider prompt caches
+    keep matching it.
+
+    Args:
+        max_chars: Longest tool result text kept in older turns
+        keep_turns: Number of most recent turns whose results are kept whole
+    """
+
+    def __init__(self, max_chars: int = 2000, keep_turns: int = 1) -> None:
+        self.max_chars = max_chars
+        self.keep_turns = max(0, keep_turns)
+        self._copies: Dict[int, Tuple["ConversationNode", Tuple[Any, ...], "ConversationNode"]] = {}
+
+    def apply(self, path: List["ConversationNode"], bot: "Bot") -> List["ConversationNode"]:
+        starts = turn_starts(path)
+        if self.keep_turns == 0:
+            boundary = len(path)
+        elif len(starts) > self.keep_turns:
+            boundary = starts[-self.keep_turns]
+        else:
+            return path
+        copies = {}
+        result = list(path)
+        for i in range(boundary):
+            node = path[i]
+            if not node._tool_results:
+                continue
+            key = node._message_cache_key()
+            cached = self._copies.get(id(node))
+            if cached is not None and cached[0] is node and node._same_cache_key(cached[1], key):
+                clone = cached[2]
+            else:
+                results = [self._truncate_result(r) for r in node._tool_results]
+                if all(new is old for new, old in zip(results, node._tool_results)):
+                    continue
+                clone = derive(node, _tool_results=results)
+            copies[id(node)] = (node, key, clone)
+            result[i] = clone
+        # Only nodes on the current path stay cached
+        self._copies = copies
+        return result
+
+    def _truncate_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        content = result.get("content")
+        truncated = self._truncate(content)
+        return result if truncated is content else {**result, "content": truncated}
+
+    def _truncate(self, content: Any) -> Any:
+        if isinstance(content, str):
+            return content if len(content) <= self.max_chars else _shorten(content, self.max_chars)
+        if isinstance(content, list):
+            blocks = [
+                (
+                    {**block, "text": self._truncate(block["text"])}
+                    if isinstance(block, dict) and isinstance(block.get("text"), str) and len(block["text"]) > self.max_chars
+                    else block
+                )
+                for block in content
+            ]
+            return content if all(new is old for new, old in zip(blocks, content)) else blocks
+        return content
+
+
+class DropOldTurns(ContextPolicy):
+    """Send only the most recent turns.
+
+    Args:
+        max_turns: Number of turns to keep (at least 1)
+    """
+
+    def __init__(self, max_turns: int = 20) -> None:
+        self.max_turns = max(1, max_turns)
+
+    def apply(self, path: List["ConversationNode"], bot: "Bot") -> List["ConversationNode"]:
+        starts = turn_starts(path)
+        if len(starts) <= self.max_turns:
+            return path
+        return path[starts[-self.max_turns] :]
+
+
+class SummarizeOldTurns(ContextPolicy):
+    """Replace older turns with a summary.
+
+    Once more than keep_turns + step turns exist, the oldest turns are
+    summarized in multiples of step, so the summarized span (and the request
+    prefix) only changes every step turns. Summaries are cached by the last
+    node of the span, so summarizer is called once per span rather than once
+    per request. The summary is prepended to the first kept user message,
+    which keeps the user/assistant alternation intact.
+
+    Args:
+        summarizer: Called with the nodes to summarize, oldest first; returns
+            the summary text. transcript() renders nodes as text for it.
+        keep_turns: Number of recent turns always sent in full
+        step: Number of turns folded into the summary at a time
+        cache_size: Number of summaries kept
+    """
+
+    PREFIX = "[Summary of the earlier conversation]\n{summary}\n[End of summary]\n\n"
+
+    def __init__(
+        self,
+        summarizer: Callable[[List["ConversationNode"]], str],
+        keep_turns: int = 10,
+        step: int = 10,
+        cache_size: int = 8,
+    ) -> None:
+        self.summarizer = summarizer
+        self.keep_turns = max(1, keep_turns)
+        self.step = max(1, step)
+        self.cache_size = cache_size
+        self._summaries: "OrderedDict[int, Tuple[ConversationNode, str]]" = OrderedDict()
+
+    def apply(self, path: List["ConversationNode"], bot: "Bot") -> List["ConversationNode"]:
+        starts = turn_starts(path)
+        folded = (len(starts) - self.keep_turns) // self.step * self.step
+        if folded <= 0:
+            return path
+        cut = starts[folded]
+        summary = self.summary(path[:cut])
+        first = path[cut]
+        return [derive(first, content=self.PREFIX.format(summary=summary) + str(first.content))] + path[cut + 1 :]
+
+    def summary(self, span: List["ConversationNode"]) -> str:
+        """Return the summary of span, calling the summarizer only on a cache miss."""
+        last = span[-1]
+        cached = self._summaries.get(id(last))
+        if cached is not None and cached[0] is last:
+            self._summaries.move_to_end(id(last))
+            return cached[1]
+        summary = self.summarizer(span)
+        self._summaries[id(last)] = (last, summary)
+        while len(self._summaries) > self.cache_size:
+            self._summaries.popitem(last=False)
+        return summary
+
+
+class FitContextWindow(ContextPolicy):
+    """Drop the oldest turns only when the request would exceed the context window.
+
+    Sizes are estimated at CHARS_PER_TOKEN characters per token, including
+    the system message and tool schemas; the bot's max_tokens is reserved for
+    the reply. The most recent turn is always sent.
+
+    Args:
+        max_input_tokens: Input token budget; None derives it from the model's
+            context_window in the model registry
+        margin: Fraction of the budget to use, leaving room for estimation error
+    """
+
+    def __init__(self, max_input_tokens: Optional[int] = None, margin: float = 0.9) -> None:
+        self.max_input_tokens = max_input_tokens
+        self.margin = margin
+        self._sizes: Dict[int, Tuple["ConversationNode", Tuple[Any, ...], int]] = {}
+
+    def budget(self, bot: "Bot") -> Optional[int]:
+        """Return the input token budget for bot, or None if it is unknown."""
+        if self.max_input_tokens is not None:
+            limit = self.max_input_tokens
+        else:
+            from bots.foundation.model_registry import get_context_window
+
+            window = get_context_window(bot.model_engine)
+            if window is None:
+                return None
+            limit = window - (bot.max_tokens or 0)
+        overhead = estimate_tokens(bot.system_message or "")
+        if bot.tool_handler and bot.tool_handler.tools:
+            overhead += estimate_tokens(bot.tool_handler.tools)
+        return int(limit * self.margin) - overhead
+
+    def apply(self, path: List["ConversationNode"], bot: "Bot") -> List["ConversationNode"]:
+        budget = self.budget(bot)
+        if budget is None:
+            return path
+        sizes = [self._size(node) for node in path]
+        self._sizes = {id(node): self._sizes[id(node)] for node in path}
+        total = sum(sizes)
+        if total <= budget:
+            return path
+        dropped = 0
+        for start in turn_starts(path):
+            total -= sum(sizes[dropped:start])
+            dropped = start
+            if total <= budget:
+                break
+        if total > budget:
+            logger.warning(
+                "Most recent turn exceeds the context budget",
+                extra={"estimated_tokens": total, "budget": budget},
+            )
+        logger.debug("Dropped old turns to fit the context window", extra={"dropped_nodes": dropped})
+        return path[dropped:]
+
+    def _size(self, node: "ConversationNode") -> int:
+        key = node._message_cache_key()
+        cached = self._sizes.get(id(node))
+        if cached is not None and cached[0] is node and node._same_cache_key(cached[1], key):
+            return cached[2]
+        size = estimate_tokens(node._cached_node_messages())
+        self._sizes[id(node)] = (node, key, size)
+        return size
@@ -11,6 +11,8 @@ Key Components:
     - GeminiBot: Main bot implementation for Gemini models
 """
 
+import asyncio
+import inspect
 import json
 import os
 import time
@@ -19,6 +21,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from google import genai
 from google.genai import types
 
+from bots.foundation import client_pool, rate_limiter
 from bots.foundation.base import (
     Bot,
     ConversationNode,
@@ -66,39 +69,30 @@ class GeminiNode(ConversationNode):
     Conversation node implementation for Gemini's chat format.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    def _build_messages(self) -> List[Any]:
-        # Gemini expects a consistent structure with role and parts for all messages
-        # We'll traverse from root to current node, collecting messages
-        messages = []
-        node = self
-        stack = []
-        while node:
-            if not node._is_empty():
-                stack.append(node)
-            node = node.parent
-
-        for n in reversed(stack):
-            if n.role == "user":
-                if n.content:
-                    messages.append({"role": "user", "parts": [{"text": n.content}]})
-            elif n.role == "assistant":
-                if n.content:
-                    messages.append(
-                        {"role": "model", "parts": [{"text": n.content}]}  # Gemini uses "model" instead of "assistant"
-                    )
-            elif n.role == "function":
-                # Parse the function response and add as structured part
-                try:
-                    func_data = json.loads(n.content)
-                    # Function responses are sent as user messages with functionResponse parts
-                    messages.append({"role": "user", "parts": [func_data]})
-                except (json.JSONDecodeError, KeyError):
-                    # Fallback to simple text content if parsing fails
-                    messages.append({"role": "user", "parts": [{"text": n.content}]})
-        return messages
+    def _node_messages(self) -> List[Any]:
+        # Gemini expects a consistent structure with role and parts for all messages.
+        # The base class caches this per node and assembles the history from root to here.
+        if self.role == "user":
+            if self.content:
+                return [{"role": "user", "parts": [{"text": self.content}]}]
+        elif self.role == "assistant":
+            if self.content:
+                return [{"role": "model", "parts": [{"text": self.content}]}]  # Gemini uses "model" instead of "assistant"
+        elif self.role == "function":
+            # Parse the function response and add as structured part
+            try:
+                func_data = json.loads(self.content)
+                # Function responses are sent as user messages with functionResponse parts
+                return [{"role": "user", "parts": [func_data]}]
+            except (json.JSONDecodeError, KeyError):
+                # Fallback to simple text content if parsing fails
+                return [{"role": "user", "parts": [{"text": self.content}]}]
+        return []
 
 
 class GeminiToolHandler(ToolHandler):
@@ -187,8 +181,8 @@ class GeminiToolHandler(ToolHandler):
                 with optional 'name' and 'args' keys.
 
         Returns:
-            Tuple[Optional[str], Dict[str, Any]]: A tuple containing the tool name 
-                (None if not found or empty schema) and the arguments dictionary 
+            Tuple[Optional[str], Dict[str, Any]]: A tuple containing the tool name
+                (None if not found or empty schema) and the arguments dictionary
                 (empty dict if 'args' key not present).
         """
         if not request_schema:
@@ -248,8 +242,9 @@ class GeminiMailbox(Mailbox):
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Google Gemini API key not provided.")
-        # Pass api_key directly to Client constructor instead of using configure
-        self.client = genai.Client(api_key=self.api_key)
+        # Pass api_key directly to Client constructor instead of using configure.
+        # google-genai manages its own transport, so no pooled http_client is injected.
+        self.client = client_pool.get_client("google", genai.Client, self.api_key, pass_http_client=False)
 
     def send_message(self, bot: Bot) -> Any:
         """Send a message to the Gemini API with metrics tracking.
@@ -260,81 +255,125 @@ class GeminiMailbox(Mailbox):
         Returns:
             The API response object from Gemini
         """
-        messages = bot.conversation._build_messages()
-        tools = bot.tool_handler.tools if bot.tool_handler else None
-        tool_decls = []
-        if tools:
-            for t in tools:
-                if "function" in t:
-                    tool_decls.append(t["function"])
-                else:
-                    tool_decls.append(t)
-        config = types.GenerateContentConfig()
-        if tool_decls:
-            config.tools = [types.Tool(function_declarations=tool_decls)]
+        messages, config = self._build_request(bot)
 
         # Track API call timing
         api_start_time = time.time()
 
         try:
-            response = self.client.models.generate_content(
-                model=bot.model_engine,
-                contents=messages,
-                config=config,
-            )
+            with rate_limiter.limit("google", bot.model_engine):
+                response = self.client.models.generate_content(
+                    model=bot.model_engine,
+                    contents=messages,
+                    config=config,
+                )
+        except Exception as e:
+            self._record_error(e, bot, api_start_time)
+            raise
 
-            # Record metrics if available
-            if METRICS_AVAILABLE and hasattr(response, "usage_metadata"):
-                try:
-                    usage = response.usage_metadata
-
-                    # Record token usage
-                    input_tokens = getattr(usage, "prompt_token_count", 0)
-                    output_tokens = getattr(usage, "candidates_token_count", 0)
-
-                    metrics.record_tokens(
-                        input_tokens,
-                        output_tokens,
-                        provider="google",
-                        model=str(bot.model_engine.value) if hasattr(bot.model_engine, "value") else str(bot.model_engine),
-                    )
-
-                    # Calculate and record cost
-                    model_name = str(bot.model_engine.value) if hasattr(bot.model_engine, "value") else str(bot.model_engine)
-                    cost = calculate_cost(
-                        provider="google", model=model_name, input_tokens=input_tokens, output_tokens=output_tokens
-                    )
-                    metrics.record_cost(cost, provider="google", model=model_name)
+        self._record_response(response, bot, api_start_time)
+        return response
 
-                except Exception as e:
-                    logger.warning(f"Failed to record metrics: {e}")
+    async def asend_message(self, bot: Bot) -> Any:
+        """Async counterpart of send_message() using the client's aio interface.
 
-            # Record API call metrics
-            if METRICS_AVAILABLE:
-                try:
-                    api_duration = time.time() - api_start_time
-                    model_name = str(bot.model_engine.value) if hasattr(bot.model_engine, "value") else str(bot.model_engine)
-                    metrics.record_api_call(duration=api_duration, provider="google", model=model_name, status="success")
-                except Exception as e:
-                    logger.warning(f"Failed to record API metrics: {e}")
+        Args:
+            bot: The GeminiBot instance making the request
 
-            return response
+        Returns:
+            The API response object from Gemini
+        """
+        messages, config = self._build_request(bot)
+        api_start_time = time.time()
 
+        try:
+            async with rate_limiter.alimit("google", bot.model_engine):
+                response = await self.client.aio.models.generate_content(
+                    model=bot.model_engine,
+                    contents=messages,
+                    config=config,
+                )
         except Exception as e:
-            # Record error metric
-            if METRICS_AVAILABLE:
-                try:
-                    model_name = str(bot.model_engine.value) if hasattr(bot.model_engine, "value") else str(bot.model_engine)
-                    metrics.record_error(error_type=type(e).__name__, provider="google", operation="api_call")
+            self._record_error(e, bot, api_start_time)
+            raise
 
-                    # Record failed API call
-                    api_duration = time.time() - api_start_time
-                    metrics.record_api_call(duration=api_duration, provider="google", model=model_name, status="error")
-                except Exception:
-                    pass
+        self._record_response(response, bot, api_start_time)
+        return response
 
-            logger.error(f"Gemini API error: {e}")
-            raise
+    @staticmethod
+    def _build_request(bot: Bot) -> Tuple[List[Dict[str, Any]], Any]:
+        """Return the contents and GenerateContentConfig for the bot's conversation."""
+        messages = bot._context_messages()
+        tools = bot.tool_handler.tools if bot.tool_handler else None
+        tool_decls = []
+        if tools:
+            for t in tools:
+                if "function" in t:
+                    tool_decls.append(t["function"])
+                else:
+                    tool_decls.append(t)
+        config = types.GenerateContentConfig()
+        if tool_decls:
+            config.tools = [types.Tool(function_declarations=tool_decls)]
+        return messages, config
+
+    @staticmethod
+    def _record_response(response: Any, bot: Bot, api_start_time: float) -> None:
+        """Record token usage, cost and call duration for a successful response."""
+        model_name = str(bot.model_engine.value) if hasattr(bot.model_engine, "value") else str(bot.model_engine)
+
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            rate_limiter.record_usage(
+                "google",
+                model_name,
+                (getattr(usage, "prompt_token_count", 0) or 0) + (getattr(usage, "candidates_token_count", 0) or 0),
+            )
+
+        # Record metrics if available
+        if METRICS_AVAILABLE and hasattr(response, "usage_metadata"):
+            try:
+                usage = response.usage_metadata
+
+                # Record token usage
+                input_tokens = getattr(usage, "prompt_token_count", 0)
+                output_tokens = getattr(usage, "candidates_token_count", 0)
+
+                metrics.record_tokens(input_tokens, output_tokens, provider="google", model=model_name)
+
+                # Calculate and record cost
+                cost = calculate_cost(
+                    provider="google", model=model_name, input_tokens=input_tokens, output_tokens=output_tokens
+                )
+                metrics.record_cost(cost, provider="google", model=model_name)
+
+            except Exception as e:
+                logger.warning(f"Failed to record metrics: {e}")
+
+        # Record API call metrics
+        if METRICS_AVAILABLE:
+            try:
+                api_duration = time.time() - api_start_time
+                metrics.record_api_call(duration=api_duration, provider="google", model=model_name, status="success")
+            except Exception as e:
+                logger.warning(f"Failed to record API metrics: {e}")
+
+    @staticmethod
+    def _record_error(error: Exception, bot: Bot, api_start_time: float) -> None:
+        """Record metrics for a failed API call and log the error."""
+        rate_limiter.record_error("google", bot.model_engine, error)
+        if METRICS_AVAILABLE:
+            try:
+                model_name = str(bot.model_engine.value) if hasattr(bot.model_engine, "value") else str(bot.model_engine)
+                metrics.record_error(error_type=type(error).__name__, provider="google", operation="api_call")
+
+                # Record failed API call
+                api_duration = time.time() - api_start_time
+                metrics.record_api_call(duration=api_duration, provider="google", model=model_name, status="error")
+            except Exception:
+                pass
+
+        logger.error(f"Gemini API error: {error}")
 
     def process_response(self, response: Any, bot: Bot, _recursion_depth: int = 0) -> Tuple[str, str, Dict[str, Any]]:
         # If there is a function call, handle it recursively
@@ -355,15 +394,7 @@ class GeminiMailbox(Mailbox):
         handler = bot.tool_handler
         requests = handler.generate_request_schema(response)
         if not requests:
-            # Return the first candidate's text as the response
-            text = getattr(response, "text", None)
-            if not text:
-                # Try to get from parts
-                try:
-                    text = response.candidates[0].content.parts[0].text
-                except Exception:
-                    text = "~"
-            return (text, "assistant", {})
+            return (self._response_text(response), "assistant", {})
         # There is at least one tool call
         for req in requests:
             tool_name, tool_args = handler.tool_name_and_input(req)
@@ -375,14 +406,58 @@ class GeminiMailbox(Mailbox):
                     result = str(e)
             else:
                 result = f"Tool {tool_name} not found."
-            # Add tool result to conversation in proper functionResponse format
-            function_response_data = {
-                "functionResponse": {"name": tool_name, "response": result if isinstance(result, dict) else {"result": result}}
-            }
-            bot.conversation = bot.conversation._add_reply(role="function", content=json.dumps(function_response_data))
+            self._add_function_response(bot, tool_name, result)
         # Recursively send the updated conversation
         return self.process_response(self.send_message(bot), bot, _recursion_depth + 1)
 
+    async def aprocess_response(self, response: Any, bot: Bot, _recursion_depth: int = 0) -> Tuple[str, str, Dict[str, Any]]:
+        """Async counterpart of process_response().
+
+        async def tools are awaited and regular tools run in a worker thread;
+        follow-up requests go through asend_message().
+        """
+        if _recursion_depth >= 10:
+            return ("Maximum tool call recursion depth reached", "assistant", {})
+        handler = bot.tool_handler
+        requests = handler.generate_request_schema(response)
+        if not requests:
+            return (self._response_text(response), "assistant", {})
+        for req in requests:
+            tool_name, tool_args = handler.tool_name_and_input(req)
+            if tool_name in handler.function_map:
+                tool_func = handler.function_map[tool_name]
+                try:
+                    if inspect.iscoroutinefunction(tool_func):
+                        result = await tool_func(**tool_args)
+                    else:
+                        result = await asyncio.to_thread(tool_func, **tool_args)
+                except Exception as e:
+                    result = str(e)
+            else:
+                result = f"Tool {tool_name} not found."
+            self._add_function_response(bot, tool_name, result)
+        return await self.aprocess_response(await self.asend_message(bot), bot, _recursion_depth + 1)
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        """Return the first candidate's text as the response."""
+        text = getattr(response, "text", None)
+        if not text:
+            # Try to get from parts
+            try:
+                text = response.candidates[0].content.parts[0].text
+            except Exception:
+                text = "~"
+        return text
+
+    @staticmethod
+    def _add_function_response(bot: Bot, tool_name: str, result: Any) -> None:
+        """Add a tool result to the conversation in proper functionResponse format."""
+        function_response_data = {
+            "functionResponse": {"name": tool_name, "response": result if isinstance(result, dict) else {"result": result}}
+        }
+        bot.conversation = bot.conversation._add_reply(role="function", content=json.dumps(function_response_data))
+
 
 class GeminiBot(Bot):
     """
@@ -0,0 +1,452 @@
+"""Append-only journal for incremental bot autosaves.
+
+A full Bot.save() serializes the entire conversation tree and tool handler
+(including module sources and dill-pickled globals) and rewrites the file.
+For autosave, which runs twice per respond(), that makes every turn cost
+O(whole history).
+
+BotJournal instead keeps a snapshot file (a normal .bot file, in either
+bot_file format) next to a ``<snapshot>.journal`` file of JSON lines:
+
+    {"journal": 1, "token": "..."}                       header, matches the snapshot
+    {"op": "node", "id": 12, "parent": 7, "data": {...}} new or changed node
+    {"op": "state", "current": 12, ...}                  current node and changed bot state
+
+Nodes are identified by their preorder index in the snapshot tree; nodes added
+later get the next free id. Each save only walks the path from the root to the
+current node (plus the direct replies of those nodes) and writes records for
+nodes that are new or whose fields changed. When the journal grows larger than
+the snapshot, the tool set or root node changes, or the journal's header no
+longer carries this writer's token (another bot sharing the path, such as a
+fork saving to the same quicksave file, compacted in between), the journal is
+compacted into a fresh snapshot.
+
+Bot.load() replays a matching journal on top of its snapshot automatically.
+
+Nodes of a lazily loaded tree (see ConversationNode._from_dict) that have not
+been visited keep their preorder ids without being built: compaction skips
+over their saved subtrees, ConversationNode._load_replies hands out the
+reserved ids when they are visited, and replay builds only the nodes its
+records refer to.
+
+Note:
+    Change detection compares role, content, parent and the identity and length
+    of the tool lists. In-place edits of an existing tool call or result dict,
+    or of other node attributes, are picked up at the next compaction.
+"""
+
+import json
+import logging
+import os
+import uuid
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bots.foundation import bot_file
+from bots.foundation.module_store import ModuleStore
+
+if TYPE_CHECKING:
+    from bots.foundation.base import Bot, ConversationNode
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_VERSION = 1
+JOURNAL_SUFFIX = ".journal"
+
+# Keys in the state record's "attrs" that describe the bot class rather than
+# settable attributes; a change to either forces a compaction.
+_METADATA_KEYS = ("bot_class", "model_engine", "enable_tracing")
+
+
+def journal_path(snapshot_path: str) -> str:
+    """Return the journal file path belonging to a snapshot path."""
+    return snapshot_path + JOURNAL_SUFFIX
+
+
+def remove_journal(snapshot_path: str) -> None:
+    """Delete the journal for a snapshot, if one exists."""
+    try:
+        os.remove(journal_path(snapshot_path))
+    except FileNotFoundError:
+        pass
+
+
+def _unloaded(node: "ConversationNode") -> Any:
+    """Return the node's saved, not yet built replies, or None."""
+    return getattr(node, "_unloaded_replies", None)
+
+
+def _preorder_ids(root: "ConversationNode") -> Iterator[Tuple[int, "ConversationNode", Optional[int]]]:
+    """Iterate built nodes as (preorder id, node, parent id) without recursion.
+
+    Saved subtrees that were never loaded are skipped, but their nodes still
+    count towards the ids of the nodes after them.
+    """
+    next_id = 0
+    stack: List[Tuple["ConversationNode", Optional[int]]] = [(root, None)]
+    while stack:
+        node, parent_id = stack.pop()
+        node_id = next_id
+        next_id += 1
+        yield node_id, node, parent_id
+        saved = _unloaded(node)
+        if saved is not None:
+            next_id += saved.total()
+        else:
+            stack.extend((reply, node_id) for reply in reversed(node.replies))
+
+
+def _subtree_sizes(root: "ConversationNode") -> Dict[int, int]:
+    """Return the node count of every built subtree, keyed by id(node)."""
+    sizes: Dict[int, int] = {}
+    stack: List[Tuple["ConversationNode", bool]] = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        saved = _unloaded(node)
+        if saved is not None:
+            sizes[id(node)] = 1 + saved.total()
+        elif children_done:
+            sizes[id(node)] = 1 + sum(sizes[id(reply)] for reply in node.replies)
+        else:
+            stack.append((node, True))
+            stack.extend((reply, False) for reply in node.replies)
+    return sizes
+
+
+def _find_by_ids(root: "ConversationNode", wanted: Iterable[int]) -> Dict[int, "ConversationNode"]:
+    """Find snapshot nodes by preorder id, building only the nodes on the way."""
+    targets = sorted(set(wanted))
+    found: Dict[int, "ConversationNode"] = {}
+    if not targets:
+        return found
+    sizes = _subtree_sizes(root)
+
+    def size(node: "ConversationNode") -> int:
+        if id(node) not in sizes:
+            # Built while descending, so its own replies are still saved
+            saved = _unloaded(node)
+            sizes[id(node)] = 1 + (saved.total() if saved is not None else len(node.replies))
+        return sizes[id(node)]
+
+    stack = [(root, 0)]
+    while stack and len(found) < len(targets):
+        node, node_id = stack.pop()
+        first = bisect_left(targets, node_id)
+        if first == len(targets) or targets[first] >= node_id + size(node):
+            continue
+        if targets[first] == node_id:
+            found[node_id] = node
+        child_id = node_id + 1
+        children = []
+        for reply in node.replies:
+            children.append((reply, child_id))
+            child_id += size(reply)
+        stack.extend(reversed(children))
+    return found
+
+
+def _node_key(node: "ConversationNode", parent_id: Optional[int]) -> Tuple[Any, ...]:
+    """Return the fields used to detect that a journaled node changed."""
+    return (
+        parent_id,
+        node.role,
+        node.content,
+        node.tool_calls,
+        len(node.tool_calls),
+        node.tool_results,
+        len(node.tool_results),
+        node.pending_results,
+        len(node.pending_results),
+    )
+
+
+def _same_key(old: Tuple[Any, ...], new: Tuple[Any, ...]) -> bool:
+    """Compare node keys, treating lists by identity."""
+    for a, b in zip(old, new):
+        if a is b:
+            continue
+        if isinstance(a, list) or a != b:
+            return False
+    return True
+
+
+def _tool_fingerprint(bot: "Bot") -> Tuple[int, ...]:
+    """Cheap fingerprint of the registered tools; a change forces compaction."""
+    handler = bot.tool_handler
+    return (id(handler), len(handler.tools), len(handler.function_map), len(handler.modules), len(handler.tool_registry))
+
+
+class BotJournal:
+    """Incremental autosave writer for one snapshot path.
+
+    Use through Bot.save(quicksave=True); the bot keeps one BotJournal per
+    quicksave path and calls save() after each change.
+
+    Attributes:
+        path (str): Snapshot file path (the journal is path + ".journal")
+        token (Optional[str]): Identifier tying the journal to its snapshot
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.token: Optional[str] = None
+        self._nodes: Dict[int, "ConversationNode"] = {}
+        self._keys: Dict[int, Tuple[Any, ...]] = {}
+        self._next_id = 0
+        self._root: Optional["ConversationNode"] = None
+        self._snapshot_size = 0
+        self._journal_size = 0
+        self._attrs: Optional[Dict[str, Any]] = None
+        self._tool_state: Optional[Tuple[List[Any], List[Any]]] = None
+        self._tools: Optional[Tuple[int, ...]] = None
+        self._current: Optional[int] = None
+
+    def save(self, bot: "Bot", format: Optional[str] = None) -> str:
+        """Persist the bot's changes since the previous save.
+
+        Parameters:
+            bot (Bot): The bot to save
+            format (Optional[str]): Snapshot format if this save compacts
+                (see bot_file.write); the journal itself is always JSON lines
+
+        Returns:
+            str: The snapshot path
+        """
+        root = bot.conversation._find_root()
+        if self._needs_compaction(bot, root):
+            self.compact(bot, format=format)
+        else:
+            self._append(bot)
+        return self.path
+
+    def compact(self, bot: "Bot", format: Optional[str] = None) -> None:
+        """Write a full snapshot and start a new, empty journal."""
+        token = uuid.uuid4().hex
+        attrs = bot._serialize_attributes()
+        data = dict(attrs)
+        data["conversation"] = bot.conversation._root_dict()
+        data["tool_handler"] = ModuleStore.for_file(self.path).externalize(bot.tool_handler.to_dict())
+        data["journal_token"] = token
+
+        # Uncompressed size, so the compaction threshold does not depend on the format
+        snapshot_size = bot_file.write(self.path, data, format=format)
+        header = json.dumps({"journal": JOURNAL_VERSION, "token": token}) + "\n"
+        with open(journal_path(self.path), "w") as file:
+            file.write(header)
+
+        self.token = token
+        self._snapshot_size = snapshot_size
+        self._journal_size = len(header)
+        self._root = bot.conversation._find_root()
+        self._nodes = {}
+        self._keys = {}
+        self._next_id = 0
+        for jid, node, parent_id in _preorder_ids(self._root):
+            node._journal_id = jid
+            self._nodes[jid] = node
+            self._keys[jid] = _node_key(node, parent_id)
+            self._next_id = jid + 1
+        saved = _unloaded(self._nodes[self._next_id - 1])
+        if saved is not None:
+            # The last node's saved subtree also holds reserved ids
+            self._next_id += saved.total()
+        self._attrs = attrs
+        self._tool_state = (list(bot.tool_handler.requests), list(bot.tool_handler.results))
+        self._tools = _tool_fingerprint(bot)
+        self._current = bot.conversation._journal_id
+
+    def _needs_compaction(self, bot: "Bot", root: "ConversationNode") -> bool:
+        """Decide whether to rewrite the snapshot instead of appending."""
+        if self.token is None or root is not self._root:
+            return True
+        if self._journal_size > self._snapshot_size:
+            return True
+        if _tool_fingerprint(bot) != self._tools:
+            return True
+        if not os.path.exists(self.path):
+            return True
+        if self._on_disk_token() != self.token:
+            # Another bot (or a fork) saving to the same path compacted since our last save
+            return True
+        attrs = self._attrs or {}
+        if bot.__class__.__name__ != attrs.get("bot_class") or bot.model_engine.value != attrs.get("model_engine"):
+            return True
+        return getattr(bot, "_tracing_enabled", None) != attrs.get("enable_tracing")
+
+    def _on_disk_token(self) -> Optional[str]:
+        """Return the token in the journal file's header, or None if it cannot be read."""
+        try:
+            with open(journal_path(self.path), "r") as file:
+                return json.loads(file.readline()).get("token")
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return None
+
+    def _known_id(self, node: "ConversationNode") -> Optional[int]:
+        """Return the node's journal id if it belongs to this journal.
+
+        A node built from a saved subtree after the last compaction carries
+        the id reserved for it; it is adopted here and recorded once.
+        """
+        jid = getattr(node, "_journal_id", None)
+        if jid is None:
+            return None
+        known = self._nodes.get(jid)
+        if known is node:
+            return jid
+        if known is None and jid < self._next_id:
+            self._nodes[jid] = node
+            return jid
+        return None
+
+    def _visit(self, node: "ConversationNode", parent_id: Optional[int], records: List[Dict[str, Any]]) -> int:
+        """Record a node if it is new or changed, descending into new subtrees."""
+        stack = [(node, parent_id, False)]
+        node_id = None
+        while stack:
+            current, pid, walk = stack.pop()
+            jid = self._known_id(current)
+            if jid is None:
+                jid = self._next_id
+                self._next_id += 1
+                current._journal_id = jid
+                self._nodes[jid] = current
+                walk = True
+            key = _node_key(current, pid)
+            if jid not in self._keys or not _same_key(self._keys[jid], key):
+                self._keys[jid] = key
+                records.append({"op": "node", "id": jid, "parent": pid, "data": current._to_dict_self()})
+            if node_id is None:
+                node_id = jid
+            if walk:
+                stack.extend((reply, jid, True) for reply in reversed(current.replies))
+        return node_id
+
+    def _append(self, bot: "Bot") -> None:
+        """Append records for new/changed nodes and bot state."""
+        path = []
+        node = bot.conversation
+        while node is not None:
+            path.append(node)
+            node = node.parent
+        path.reverse()
+
+        records: List[Dict[str, Any]] = []
+        parent_id = None
+        for node in path:
+            node_id = self._visit(node, parent_id, records)
+            for reply in node.replies:
+                self._visit(reply, node_id, records)
+            parent_id = node_id
+
+        state: Dict[str, Any] = {"op": "state"}
+        if parent_id != self._current:
+            state["current"] = parent_id
+            self._current = parent_id
+        attrs = bot._serialize_attributes()
+        if attrs != self._attrs:
+            state["attrs"] = {k: v for k, v in attrs.items() if k not in _METADATA_KEYS}
+            self._attrs = attrs
+        handler = bot.tool_handler
+        if self._tool_state is None or (handler.requests, handler.results) != self._tool_state:
+            state["tool_requests"] = handler.requests
+            state["tool_results"] = handler.results
+            self._tool_state = (list(handler.requests), list(handler.results))
+        if len(state) > 1:
+            records.append(state)
+
+        if not records:
+            return
+        payload = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with open(journal_path(self.path), "a") as file:
+            file.write(payload)
+        self._journal_size += len(payload)
+
+
+def read_journal(snapshot_path: str, token: Optional[str]) -> List[Dict[str, Any]]:
+    """Read the journal records belonging to a snapshot.
+
+    Parameters:
+        snapshot_path (str): Path of the snapshot .bot file
+        token (Optional[str]): The snapshot's journal_token
+
+    Returns:
+        List[Dict[str, Any]]: Records in write order. Empty if there is no
+        journal, it belongs to a different snapshot, or token is None. A
+        truncated final line (from an interrupted write) is ignored.
+    """
+    if not token:
+        return []
+    try:
+        with open(journal_path(snapshot_path), "r") as file:
+            lines = file.read().splitlines()
+    except FileNotFoundError:
+        return []
+    if not lines:
+        return []
+    try:
+        header = json.loads(lines[0])
+    except json.JSONDecodeError:
+        return []
+    if header.get("token") != token:
+        logger.debug("Ignoring journal that belongs to another snapshot", extra={"path": snapshot_path})
+        return []
+
+    records = []
+    for line in lines[1:]:
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            logger.warning("Stopping journal replay at a truncated record", extra={"path": snapshot_path})
+            break
+    return records
+
+
+def replay(bot: "Bot", records: List[Dict[str, Any]]) -> None:
+    """Apply journal records to a bot freshly loaded from the matching snapshot.
+
+    Parameters:
+        bot (Bot): Bot deserialized from the snapshot
+        records (List[Dict[str, Any]]): Records from read_journal()
+    """
+    from bots.foundation.base import Engines
+
+    if not records:
+        return
+    wanted = set()
+    for record in records:
+        for key in ("id", "parent", "current"):
+            if isinstance(record.get(key), int):
+                wanted.add(record[key])
+    # Resolve snapshot ids before any record changes the tree's shape
+    nodes = _find_by_ids(bot.conversation._find_root(), wanted)
+    for record in records:
+        op = record.get("op")
+        if op == "node":
+            data = dict(record["data"])
+            data.pop("replies", None)
+            node_class_name = data.pop("node_class", None)
+            parent = nodes.get(record["parent"])
+            node = nodes.get(record["id"])
+            if node is None:
+                node_class = (
+                    Engines.get_conversation_node_class(node_class_name) if node_class_name else type(bot.conversation)
+                )
+                node = node_class(**data)
+                nodes[record["id"]] = node
+            else:
+                node._update_fields(data)
+                if node.parent is not parent and node.parent is not None:
+                    node.parent.replies = [reply for reply in node.parent.replies if reply is not node]
+            if parent is not None and node.parent is not parent:
+                node.parent = parent
+                parent.replies.append(node)
+        elif op == "state":
+            if "current" in record and record["current"] in nodes:
+                bot.conversation = nodes[record["current"]]
+            for key, value in record.get("attrs", {}).items():
+                if key not in ("conversation", "tool_handler"):
+                    setattr(bot, key, value)
+            if "tool_requests" in record:
+                bot.tool_handler.requests = record["tool_requests"]
+            if "tool_results" in record:
+                bot.tool_handler.results = record["tool_results"]
@@ -17,6 +17,7 @@ from bots.foundation.base import Engines
 
 # Unified model registry with all model information
 # Intelligence: 1 star (fast/cheap), 2 stars (balanced), 3 stars (most capable)
+# max_tokens is the output limit; context_window is the total input + output limit
 # Costs are per 1 million tokens (USD)
 MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
     # Anthropic Claude 4.6 Models (Latest - Feb 2026)
@@ -24,6 +25,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
     },
@@ -31,6 +33,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 3,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 15.00,
         "cost_output": 75.00,
     },
@@ -39,6 +42,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 1,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 1.00,
         "cost_output": 5.00,
     },
@@ -46,6 +50,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
     },
@@ -53,6 +58,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 3,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 15.00,
         "cost_output": 75.00,
     },
@@ -61,6 +67,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 3,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 15.00,
         "cost_output": 75.00,
     },
@@ -69,6 +76,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
     },
@@ -76,6 +84,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 3,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 15.00,
         "cost_output": 75.00,
     },
@@ -84,6 +93,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 8192,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
         "deprecated": True,
@@ -94,6 +104,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 8192,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
         "deprecated": True,
@@ -105,6 +116,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 1,
         "max_tokens": 4096,
+        "context_window": 200000,
         "cost_input": 0.25,
         "cost_output": 1.25,
         "retirement_date": "2026-04-19",
@@ -113,6 +125,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 3,
         "max_tokens": 4096,
+        "context_window": 200000,
         "cost_input": 15.00,
         "cost_output": 75.00,
         "deprecated": True,
@@ -123,6 +136,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 4096,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
         "deprecated": True,
@@ -134,6 +148,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 1,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 1.00,
         "cost_output": 5.00,
         "alias_for": "claude-haiku-4-5-20251001",
@@ -142,6 +157,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 1,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 1.00,
         "cost_output": 5.00,
         "alias_for": "claude-haiku-4-5-20251001",
@@ -150,6 +166,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
         "alias_for": "claude-sonnet-4-5-20250929",
@@ -158,6 +175,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 3,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 15.00,
         "cost_output": 75.00,
         "alias_for": "claude-opus-4-6",
@@ -166,6 +184,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "anthropic",
         "intelligence": 2,
         "max_tokens": 64000,
+        "context_window": 200000,
         "cost_input": 3.00,
         "cost_output": 15.00,
         "alias_for": "claude-sonnet-4-6",
@@ -175,6 +194,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 1,
         "max_tokens": 4096,
+        "context_window": 16385,
         "cost_input": 0.50,
         "cost_output": 1.50,
     },
@@ -182,6 +202,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 1,
         "max_tokens": 16384,
+        "context_window": 16385,
         "cost_input": 3.00,
         "cost_output": 4.00,
     },
@@ -189,6 +210,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 1,
         "max_tokens": 4096,
+        "context_window": 16385,
         "cost_input": 0.50,
         "cost_output": 1.50,
     },
@@ -196,6 +218,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 1,
         "max_tokens": 4096,
+        "context_window": 4096,
         "cost_input": 1.50,
         "cost_output": 2.00,
     },
@@ -203,6 +226,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 1,
         "max_tokens": 16384,
+        "context_window": 128000,
         "cost_input": 0.15,
         "cost_output": 0.60,
     },
@@ -210,6 +234,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 2,
         "max_tokens": 8192,
+        "context_window": 8192,
         "cost_input": 30.00,
         "cost_output": 60.00,
     },
@@ -217,6 +242,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 2,
         "max_tokens": 8192,
+        "context_window": 1047576,
         "cost_input": 30.00,
         "cost_output": 60.00,
     },
@@ -224,6 +250,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 2,
         "max_tokens": 8192,
+        "context_window": 8192,
         "cost_input": 30.00,
         "cost_output": 60.00,
     },
@@ -231,6 +258,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 2,
         "max_tokens": 16384,
+        "context_window": 128000,
         "cost_input": 2.50,
         "cost_output": 10.00,
     },
@@ -238,6 +266,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 3,
         "max_tokens": 32768,
+        "context_window": 32768,
         "cost_input": 60.00,
         "cost_output": 120.00,
     },
@@ -245,6 +274,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 3,
         "max_tokens": 32768,
+        "context_window": 32768,
         "cost_input": 60.00,
         "cost_output": 120.00,
     },
@@ -252,6 +282,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 2,
         "max_tokens": 128000,
+        "context_window": 400000,
         "cost_input": 1.75,
         "cost_output": 14.00,
     },
@@ -259,6 +290,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 3,
         "max_tokens": 128000,
+        "context_window": 400000,
         "cost_input": 1.75,
         "cost_output": 14.00,
     },
@@ -266,6 +298,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 3,
         "max_tokens": 128000,
+        "context_window": 400000,
         "cost_input": 1.75,
         "cost_output": 14.00,
     },
@@ -274,6 +307,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "openai",
         "intelligence": 2,
         "max_tokens": 128000,
+        "context_window": 128000,
         "cost_input": 10.00,
         "cost_output": 30.00,
     },
@@ -282,6 +316,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 2,
         "max_tokens": 8192,
+        "context_window": 2097152,
         "cost_input": 1.25,
         "cost_output": 10.00,
     },
@@ -289,6 +324,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 1,
         "max_tokens": 8192,
+        "context_window": 1048576,
         "cost_input": 0.075,
         "cost_output": 0.30,
     },
@@ -296,6 +332,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 1,
         "max_tokens": 8192,
+        "context_window": 1048576,
         "cost_input": 0.10,
         "cost_output": 0.40,
     },
@@ -303,6 +340,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 1,
         "max_tokens": 8192,
+        "context_window": 1048576,
         "cost_input": 0.15,
         "cost_output": 0.60,
     },
@@ -310,6 +348,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 1,
         "max_tokens": 8192,
+        "context_window": 1048576,
         "cost_input": 0.10,
         "cost_output": 0.40,
     },
@@ -317,6 +356,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 2,
         "max_tokens": 65536,
+        "context_window": 1048576,
         "cost_input": 1.25,  # For ≤200K context
         "cost_output": 10.00,  # For ≤200K context
         # Note: 2x pricing for >200K context
@@ -325,6 +365,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 1,
         "max_tokens": 64000,
+        "context_window": 1048576,
         "cost_input": 0.50,
         "cost_output": 3.00,
     },
@@ -332,6 +373,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 3,
         "max_tokens": 64000,
+        "context_window": 1048576,
         "cost_input": 2.00,  # For ≤200K context
         "cost_output": 12.00,  # For ≤200K context
         # Note: 2x pricing for >200K context
@@ -341,6 +383,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 2,
         "max_tokens": 65536,
+        "context_window": 1048576,
         "cost_input": 2.50,  # >200K context pricing
         "cost_output": 15.00,  # >200K context pricing
     },
@@ -348,6 +391,7 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "provider": "google",
         "intelligence": 2,
         "max_tokens": 8192,
+        "context_window": 2097152,
         "cost_input": 1.25,
         "cost_output": 10.00,
     },
@@ -385,6 +429,19 @@ def get_model_info(model: str) -> Optional[Dict[str, Any]]:
     return MODEL_REGISTRY.get(model)
 
 
+def get_context_window(model: str) -> Optional[int]:
+    """Get the context window of a model in tokens.
+
+    Args:
+        model: Model name or Engines enum value
+
+    Returns:
+        Total input + output token limit, or None if the model is unknown
+    """
+    info = get_model_info(model)
+    return info.get("context_window") if info else None
+
+
 def get_provider_discounts(provider: str) -> Dict[str, float]:
     """Get discount configuration for a provider.
 
@@ -0,0 +1,156 @@
+"""Content-addressed store for tool module sources and globals.
+
+ToolHandler.to_dict() embeds every module's full source and its dill-pickled
+globals. Saving a bot with code_tools, terminal_tools and python_edit therefore
+writes the same megabyte into every .bot file, and par_branch/broadcast_to_leaves
+write and re-read it through temp files on every call.
+
+ModuleStore keeps those payloads once per directory, in a ``.bot_modules``
+folder next to the .bot files, as ``<hash>.json`` blobs keyed by
+ToolHandler._get_code_hash. Saved module entries keep their name, paths and
+code_hash but replace ``source``/``globals`` with ``source_ref``/``globals_ref``:
+
+    {"name": "...", "file_path": "...", "code_hash": "ab12...",
+     "source_ref": "ab12...", "globals_ref": "cd34..."}
+
+ToolHandler.from_dict() resolves references through the store only when it
+rebuilds a module, and blobs read once are cached for the rest of the process,
+so loading many bots from one directory reads each blob a single time.
+
+Note:
+    A .bot file saved this way needs its ``.bot_modules`` folder. Copy the
+    folder along with the file, or use ModuleStore.inline() to embed the
+    payloads again before handing the data to something else.
+"""
+
+import json
+import os
+import threading
+import uuid
+from typing import Any, Dict, Optional
+
+STORE_DIRNAME = ".bot_modules"
+
+# Blobs are immutable once written, so they can be shared by every store
+# instance in the process. Keyed by absolute blob path.
+_blob_cache: Dict[str, Any] = {}
+_cache_lock = threading.Lock()
+
+
+def _get_code_hash(code: str) -> str:
+    """Hash a payload with the same function ToolHandler uses for code hashes."""
+    from bots.foundation.base import ToolHandler
+
+    return ToolHandler._get_code_hash(code)
+
+
+class ModuleStore:
+    """Directory of deduplicated module sources and globals.
+
+    Attributes:
+        directory (str): Absolute path of the store directory
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = os.path.abspath(directory)
+
+    @classmethod
+    def for_file(cls, bot_path: str) -> "ModuleStore":
+        """Return the store shared by all .bot files in bot_path's directory."""
+        return cls(os.path.join(os.path.dirname(os.path.abspath(bot_path)), STORE_DIRNAME))
+
+    def _blob_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def put(self, payload: Any, key: Optional[str] = None) -> str:
+        """Store a JSON-serializable payload and return its key.
+
+        Parameters:
+            payload (Any): Source string or serialized globals dict
+            key (Optional[str]): Precomputed content hash; computed if omitted
+
+        Returns:
+            str: The content hash under which the payload is stored
+
+        Note:
+            Existing blobs are never rewritten. New blobs are written to a
+            temporary file and renamed into place, so concurrent savers and
+            readers never see a partial blob.
+        """
+        encoded = payload if isinstance(payload, str) else json.dumps(payload, sort_keys=True)
+        if key is None:
+            key = _get_code_hash(encoded)
+        path = self._blob_path(key)
+        if os.path.exists(path):
+            return key
+
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(payload, file)
+        os.replace(temp_path, path)
+        with _cache_lock:
+            _blob_cache[path] = payload
+        return key
+
+    def get(self, key: str) -> Any:
+        """Return the payload stored under key.
+
+        Raises:
+            FileNotFoundError: If the store has no blob for key
+        """
+        path = self._blob_path(key)
+        with _cache_lock:
+            if path in _blob_cache:
+                return _blob_cache[path]
+        with open(path, "r", encoding="utf-8") as file:
+            payload = json.load(file)
+        with _cache_lock:
+            _blob_cache[path] = payload
+        return payload
+
+    def externalize(self, tool_handler_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Move module sources and globals out of ToolHandler.to_dict() output.
+
+        Parameters:
+            tool_handler_data (Dict[str, Any]): Result of ToolHandler.to_dict()
+
+        Returns:
+            Dict[str, Any]: The same dict, with module entries referencing the store
+        """
+        for module_data in tool_handler_data.get("modules", {}).values():
+            if "source" in module_data:
+                module_data["source_ref"] = self.put(module_data.pop("source"), key=module_data.get("code_hash"))
+            if "globals" in module_data:
+                module_data["globals_ref"] = self.put(module_data.pop("globals"))
+        return tool_handler_data
+
+    def resolve(self, module_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a module entry with its source and globals filled in.
+
+        Entries without references are returned unchanged.
+
+        Raises:
+            FileNotFoundError: If a referenced blob is missing from the store
+        """
+        if "source_ref" not in module_data and "globals_ref" not in module_data:
+            return module_data
+        resolved = dict(module_data)
+        if "source_ref" in resolved:
+            resolved["source"] = self.get(resolved.pop("source_ref"))
+        if "globals_ref" in resolved:
+            resolved["globals"] = self.get(resolved.pop("globals_ref"))
+        return resolved
+
+    def inline(self, tool_handler_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of tool_handler_data with all module references resolved."""
+        inlined = dict(tool_handler_data)
+        modules = tool_handler_data.get("modules", {})
+        inlined["modules"] = {path: self.resolve(module_data) for path, module_data in modules.items()}
+        return inlined
+
+
+def clear_cache() -> None:
+    """Forget all blobs cached in memory (mainly for tests)."""
+    with _cache_lock:
+        _blob_cache.clear()
@@ -15,9 +15,10 @@ import json
 import os
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
+from bots.foundation import client_pool, rate_limiter
 from bots.foundation.base import (
     Bot,
     ConversationNode,
@@ -86,6 +87,8 @@ class OpenAINode(ConversationNode):
             executions
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize an OpenAINode.
         Parameters:
@@ -93,45 +96,33 @@ class OpenAINode(ConversationNode):
         """
         super().__init__(**kwargs)
 
-    def _build_messages(self) -> List[Dict[str, Any]]:
-        """Build message list for OpenAI API, properly handling empty nodes
-        and tool calls.
-        Use when you need to convert the conversation tree into OpenAI's
-        expected message format.
-        Traverses the conversation tree from current node to root, building a
-        properly formatted message list that includes all relevant context,
-        tool calls, and tool results.
+    def _node_messages(self) -> List[Dict[str, Any]]:
+        """Format this node as OpenAI chat messages.
+        Use through _build_messages, which caches the result per node and
+        assembles the history from root to the current node.
         Returns:
-            List[Dict[str, Any]]: List of messages in OpenAI chat format,
-            where each message is a dictionary containing 'role' and 'content'
-            keys, and optionally 'tool_calls' for assistant messages or
-            'tool_call_id' for tool response messages.
+            List[Dict[str, Any]]: Messages in OpenAI chat format. User nodes
+            produce one user message; assistant nodes produce an assistant
+            message (with 'tool_calls' when present) followed by any tool
+            result messages carrying 'tool_call_id'.
         """
-        conversation_dict = []
-        node = self
-        while node:
-            if node._is_empty():
-                node = node.parent
-                continue
-            if node.role == "user":
-                conversation_dict = [{"role": "user", "content": node.content}] + conversation_dict
-            if node.role == "assistant":
-                if not (node.tool_calls or node.tool_results):
-                    assistant_msg = {"role": "assistant", "content": node.content}
-                    conversation_dict = [assistant_msg] + conversation_dict
-                    node = node.parent
-                    continue
-                for result in node.tool_results:
-                    conversation_dict = [result] + conversation_dict
-                if node.tool_calls:
-                    assistant_msg = {
+        if self.role == "user":
+            return [{"role": "user", "content": self.content}]
+        if self.role == "assistant":
+            if not (self.tool_calls or self.tool_results):
+                return [{"role": "assistant", "content": self.content}]
+            messages = []
+            if self.tool_calls:
+                messages.append(
+                    {
                         "role": "assistant",
-                        "content": node.content,
-                        "tool_calls": node.tool_calls,
+                        "content": self.content,
+                        "tool_calls": self.tool_calls,
                     }
-                    conversation_dict = [assistant_msg] + conversation_dict
-            node = node.parent
-        return conversation_dict
+                )
+            messages.extend(reversed(self.tool_results))
+            return messages
+        return []
 
 
 class OpenAIToolHandler(ToolHandler):
@@ -323,7 +314,7 @@ class OpenAIMailbox(Mailbox):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key not provided.")
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = client_pool.get_client("openai", OpenAI, self.api_key)
 
     def send_message(self, bot: Bot) -> Dict[str, Any]:
         """Send a message to OpenAI's chat completion API.
@@ -360,10 +351,57 @@ class OpenAIMailbox(Mailbox):
         else:
             return self._send_message_impl(bot, None)
 
+    async def asend_message(self, bot: Bot) -> Dict[str, Any]:
+        """Async counterpart of send_message() using the pooled AsyncOpenAI client.
+
+        Parameters:
+            bot (Bot): The bot instance whose conversation is sent
+
+        Returns:
+            Dict[str, Any]: Raw response from OpenAI's chat completion API
+        """
+        should_trace = TRACING_AVAILABLE and hasattr(bot, "_tracing_enabled") and bot._tracing_enabled
+
+        if should_trace:
+            with tracer.start_as_current_span("mailbox.asend_message") as span:
+                span.set_attribute("provider", "openai")
+                span.set_attribute("model", str(bot.model_engine.value))
+                return await self._asend_message_impl(bot, span)
+        else:
+            return await self._asend_message_impl(bot, None)
+
     def _send_message_impl(self, bot: Bot, span=None) -> Dict[str, Any]:
         """Implementation of send_message with optional span."""
+        request = self._build_request(bot, span)
+        # Wait for the shared provider/model limiter before sending
+        with rate_limiter.limit("openai", request["model"]):
+            api_start_time = time.time()
+            try:
+                response = self.client.chat.completions.create(**request)
+            except Exception as e:
+                self._record_error(e, request["model"], span, api_start_time)
+                raise e
+        self._record_response(response, request["model"], span, api_start_time)
+        return response
+
+    async def _asend_message_impl(self, bot: Bot, span=None) -> Dict[str, Any]:
+        """Implementation of asend_message with optional span."""
+        request = self._build_request(bot, span)
+        client = client_pool.get_async_client("openai", AsyncOpenAI, self.api_key)
+        async with rate_limiter.alimit("openai", request["model"]):
+            api_start_time = time.time()
+            try:
+                response = await client.chat.completions.create(**request)
+            except Exception as e:
+                self._record_error(e, request["model"], span, api_start_time)
+                raise e
+        self._record_response(response, request["model"], span, api_start_time)
+        return response
+
+    def _build_request(self, bot: Bot, span=None) -> Dict[str, Any]:
+        """Build chat.completions.create() arguments for the bot's conversation."""
         system_message = bot.system_message
-        messages = bot.conversation._build_messages()
+        messages = bot._context_messages()
 
         if span:
             span.set_attribute("message_count", len(messages))
@@ -373,94 +411,83 @@ class OpenAIMailbox(Mailbox):
             pass
         if system_message:
             messages.insert(0, {"role": "system", "content": system_message})
+        request = {
+            "model": bot.model_engine,
+            "messages": messages,
+            "max_tokens": bot.max_tokens,
+            "temperature": bot.temperature,
+        }
         tools = bot.tool_handler.tools if bot.tool_handler else None
-        model = bot.model_engine
-        max_tokens = bot.max_tokens
-        temperature = bot.temperature
+        if tools:
+            request["tools"] = tools
+            request["tool_choice"] = "auto"
+        return request
+
+    def _record_response(self, response: Any, model: Any, span, api_start_time: float) -> None:
+        """Log a successful response and record its usage, cost and duration."""
         try:
-            api_start_time = time.time()
+            self._log_message(
+                json.dumps({"response": response.model_dump()}, indent=2),
+                "INCOMING",
+            )
+        except FileNotFoundError:
+            pass
+
+        if hasattr(response, "usage") and response.usage:
+            rate_limiter.record_usage("openai", model, response.usage.total_tokens)
 
-            if tools:
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    tools=tools,
-                    tool_choice="auto",
+        # Add token usage to span if available
+        if span and hasattr(response, "usage") and response.usage:
+            span.set_attribute("input_tokens", response.usage.prompt_tokens)
+            span.set_attribute("output_tokens", response.usage.completion_tokens)
+            span.set_attribute("total_tokens", response.usage.total_tokens)
+
+        # Extract normalized model name for consistent use
+        model_name = model.value if hasattr(model, "value") else str(model)
+
+        # Calculate and record cost and metrics
+        if METRICS_AVAILABLE and hasattr(response, "usage") and response.usage:
+            try:
+                # Record token usage
+                metrics.record_tokens(
+                    response.usage.prompt_tokens, response.usage.completion_tokens, provider="openai", model=model_name
                 )
-            else:
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
+
+                # Calculate and record cost
+                cost = calculate_cost(
+                    provider="openai",
+                    model=model_name,
+                    input_tokens=response.usage.prompt_tokens,
+                    output_tokens=response.usage.completion_tokens,
                 )
+                metrics.record_cost(cost, provider="openai", model=model_name)
+            except Exception as e:
+                logger.warning(f"Failed to record metrics: {e}")
+
+        # Record API call metrics
+        if METRICS_AVAILABLE:
             try:
-                self._log_message(
-                    json.dumps({"response": response.model_dump()}, indent=2),
-                    "INCOMING",
+                api_duration = time.time() - api_start_time
+                metrics.record_api_call(duration=api_duration, provider="openai", model=model_name, status="success")
+            except Exception as e:
+                logger.warning(f"Failed to record API metrics: {e}")
+
+    def _record_error(self, error: Exception, model: Any, span, api_start_time: float) -> None:
+        """Record metrics and span status for a failed API call."""
+        rate_limiter.record_error("openai", model, error)
+        if METRICS_AVAILABLE:
+            try:
+                model_name = model.value if hasattr(model, "value") else str(model)
+                metrics.record_error(error_type=type(error).__name__, provider="openai", operation=model_name)
+                metrics.record_api_call(
+                    provider="openai", model=model_name, status="error", duration=time.time() - api_start_time
                 )
-            except FileNotFoundError:
-                pass
-
-            # Add token usage to span if available
-            if span and hasattr(response, "usage") and response.usage:
-                span.set_attribute("input_tokens", response.usage.prompt_tokens)
-                span.set_attribute("output_tokens", response.usage.completion_tokens)
-                span.set_attribute("total_tokens", response.usage.total_tokens)
-
-            # Extract normalized model name for consistent use
-            model_name = model.value if hasattr(model, "value") else str(model)
-
-            # Calculate and record cost and metrics
-            if METRICS_AVAILABLE and hasattr(response, "usage") and response.usage:
-                try:
-                    # Record token usage
-                    metrics.record_tokens(
-                        response.usage.prompt_tokens, response.usage.completion_tokens, provider="openai", model=model_name
-                    )
-
-                    # Calculate and record cost
-                    cost = calculate_cost(
-                        provider="openai",
-                        model=model_name,
-                        input_tokens=response.usage.prompt_tokens,
-                        output_tokens=response.usage.completion_tokens,
-                    )
-                    metrics.record_cost(cost, provider="openai", model=model_name)
-                except Exception as e:
-                    logger.warning(f"Failed to record metrics: {e}")
-
-            # Record API call metrics
-            if METRICS_AVAILABLE:
-                try:
-                    api_duration = time.time() - api_start_time
-                    metrics.record_api_call(duration=api_duration, provider="openai", model=model_name, status="success")
-                except Exception as e:
-                    logger.warning(f"Failed to record API metrics: {e}")
-
-            return response
-        except Exception as e:
-            # Record error metrics
-            if METRICS_AVAILABLE:
-                try:
-                    model_name = model.value if hasattr(model, "value") else str(model)
-                    metrics.record_error(error_type=type(e).__name__, provider="openai", operation=model_name)
-
-                    # Record failed API call with duration
-                    try:
-                        duration = time.time() - api_start_time
-                    except Exception:
-                        duration = 0
-                    metrics.record_api_call(provider="openai", model=model_name, status="error", duration=duration)
-                except Exception as metric_error:
-                    logger.warning(f"Failed to record error metrics: {metric_error}")
-
-            if span:
-                span.record_exception(e)
-                span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-            raise e
+            except Exception as metric_error:
+                logger.warning(f"Failed to record error metrics: {metric_error}")
+
+        if span:
+            span.record_exception(error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
 
     def process_response(self, response: Dict[str, Any], bot: Bot) -> Tuple[str, str, Dict[str, Any]]:
         """Process OpenAI's response and handle any tool calls recursively.
@@ -490,6 +517,23 @@ class OpenAIMailbox(Mailbox):
             bot.tool_handler.clear()
             return self.process_response(bot.mailbox.send_message(bot), bot)
 
+    async def aprocess_response(self, response: Dict[str, Any], bot: Bot) -> Tuple[str, str, Dict[str, Any]]:
+        """Async counterpart of process_response().
+
+        Tool calls are executed with aexec_requests() and follow-up requests
+        go through asend_message().
+        """
+        message: ChatCompletionMessage = response.choices[0].message
+        while message.tool_calls:
+            bot.conversation = bot.conversation._add_reply(role="assistant", content=message.content or "~")
+            bot.conversation._add_tool_calls(calls=bot.tool_handler.requests)
+            bot.conversation._add_tool_results(results=await bot.tool_handler.aexec_requests())
+            bot.tool_handler.clear()
+            response = await bot.mailbox.asend_message(bot)
+            bot.tool_handler.extract_requests(response)
+            message = response.choices[0].message
+        return (message.content or "~", message.role, {})
+
 
 pass  # Record API call metrics
 
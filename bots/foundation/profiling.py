@@ -0,0 +1,165 @@
+"""Per-turn phase timing for Bot.respond() and Bot.arespond().
+
+Each respond() records a TurnProfile: the wall-clock seconds spent in each
+phase of the turn.
+
+- message_build: building the request messages (Bot._context_messages)
+- cache_placement: placing prompt-cache breakpoints (AnthropicMailbox)
+- api_wait: the rest of mailbox.send_message, i.e. the provider call
+  including retries, backoff and rate limiting
+- response_processing: extracting tool requests and adding the reply node
+- tool: one entry per tool call, labeled with the tool name
+- result_sync: adding tool results to the conversation
+- autosave: one entry per autosave
+
+Phase time is exclusive: a phase entered inside another phase of the same
+turn on the same thread (message_build inside api_wait) is subtracted from the
+outer one. Phases on other threads, such as tools started while a response is
+still streaming, overlap the outer phase and are not subtracted. Tools that
+run in parallel overlap, so their entries can add up to more than the
+wall-clock time they took.
+
+After the call the profile is bot.last_turn_profile. It is also passed to
+callbacks as on_respond_complete(..., metadata={"turn_profile": ...}),
+aggregated by metrics.record_turn_profile(), and with tracing enabled every
+phase is a child span named "bot.phase.<phase>".
+
+Example:
+    ```python
+    bot.respond("Run the tests and summarize the failures")
+    profile = bot.last_turn_profile
+    print(profile.totals())   # {'message_build': 0.004, 'api_wait': 3.1, 'tool': 12.8, ...}
+    print(profile.slowest())  # PhaseTiming(phase='tool', seconds=12.8, label='execute_powershell')
+    ```
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+PHASES = ("message_build", "cache_placement", "api_wait", "response_processing", "tool", "result_sync", "autosave")
+
+
+@dataclass
+class PhaseTiming:
+    """Exclusive time spent in one phase.
+
+    Attributes:
+        phase: Phase name, one of PHASES
+        seconds: Wall-clock seconds, excluding nested phases
+        label: Detail such as the tool name, if any
+    """
+
+    phase: str
+    seconds: float
+    label: Optional[str] = None
+
+
+class _Frame:
+    """An open phase; nested phases of the same profile on the same thread add their time to it."""
+
+    __slots__ = ("profile", "thread", "nested")
+
+    def __init__(self, profile: "TurnProfile") -> None:
+        self.profile = profile
+        self.thread = threading.get_ident()
+        self.nested = 0.0
+
+
+# Innermost open phase in this thread or task
+_open_phase: contextvars.ContextVar[Optional[_Frame]] = contextvars.ContextVar("bots_open_phase", default=None)
+
+
+class TurnProfile:
+    """Phase timings of one respond() call.
+
+    Entries may be added from tool worker threads, so adding is locked.
+
+    Args:
+        tracer: OpenTelemetry tracer for phase spans, or None for no spans
+
+    Attributes:
+        entries: PhaseTiming for every timed phase, in completion order
+        total: Wall-clock seconds of the whole turn, set by finish()
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        self.tracer = tracer
+        self.entries: List[PhaseTiming] = []
+        self.total: Optional[float] = None
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str, label: Optional[str] = None) -> Iterator[None]:
+        """Time the body as phase name, excluding phases nested inside it."""
+        outer = _open_phase.get()
+        frame = _Frame(self)
+        token = _open_phase.set(frame)
+        span_context = self.tracer.start_as_current_span(f"bot.phase.{name}") if self.tracer else nullcontext()
+        start = time.perf_counter()
+        try:
+            with span_context as span:
+                if span is not None and label:
+                    span.set_attribute("phase.label", label)
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _open_phase.reset(token)
+            # A phase on another thread (a tool started while the response streams) ran
+            # alongside the outer phase rather than inside it, so it is not subtracted
+            if outer is not None and outer.profile is self and outer.thread == frame.thread:
+                outer.nested += elapsed
+            with self._lock:
+                self.entries.append(PhaseTiming(name, max(elapsed - frame.nested, 0.0), label))
+
+    def finish(self) -> "TurnProfile":
+        """Record the turn's total wall-clock time."""
+        self.total = time.perf_counter() - self._start
+        return self
+
+    def totals(self) -> Dict[str, float]:
+        """Return the summed seconds of each phase that occurred."""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for entry in self.entries:
+                totals[entry.phase] = totals.get(entry.phase, 0.0) + entry.seconds
+        return totals
+
+    def unattributed(self) -> float:
+        """Seconds of the turn not covered by any phase (callbacks, bookkeeping)."""
+        if self.total is None:
+            return 0.0
+        return max(self.total - sum(self.totals().values()), 0.0)
+
+    def slowest(self) -> Optional[PhaseTiming]:
+        """Return the single longest phase entry, or None if nothing was timed."""
+        with self._lock:
+            return max(self.entries, key=lambda entry: entry.seconds, default=None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary for callbacks and logs."""
+        with self._lock:
+            entries = [asdict(entry) for entry in self.entries]
+        return {"total": self.total, "phases": self.totals(), "unattributed": self.unattributed(), "entries": entries}
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "TurnProfile":
+        copied = TurnProfile(self.tracer)
+        copied.entries = [PhaseTiming(entry.phase, entry.seconds, entry.label) for entry in self.entries]
+        copied.total = self.total
+        return copied
+
+
+def phase(bot: Any, name: str, label: Optional[str] = None) -> ContextManager[None]:
+    """Time a phase of bot's current turn; a no-op outside respond().
+
+    Args:
+        bot: The bot whose turn is being timed; may be None
+        name: Phase name, one of PHASES
+        label: Detail such as the tool name
+    """
+    profile = getattr(bot, "_turn_profile", None)
+    return profile.phase(name, label) if profile is not None else nullcontext()
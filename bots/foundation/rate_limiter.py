@@ -0,0 +1,319 @@
+"""Process-wide concurrency and rate limiting for provider API calls.
+
+par_branch, par_dispatch, broadcast_fp and branch_self fan out to as many
+threads as there are branches, and every thread calls the provider at once.
+Without coordination a large fan-out trips the provider's rate limits and each
+thread then backs off independently, so the 429s keep coming.
+
+This module keeps one ProviderLimiter per (provider, model), shared by every
+mailbox in the process. A limiter combines:
+
+- a max-in-flight cap on concurrent requests,
+- a requests-per-minute token bucket,
+- a tokens-per-minute bucket, charged after each call with the usage numbers
+  the mailboxes already record for metrics,
+- a shared pause: when a call fails with a ``retry-after`` header, every
+  caller for that provider/model waits until it has passed.
+
+No limits are set by default, so only the retry-after pause is active until
+configure() is called.
+
+Example:
+    ```python
+    from bots.foundation import rate_limiter
+
+    # Defaults for every provider/model
+    rate_limiter.configure(max_in_flight=8)
+
+    # Limits for one provider, or one model of a provider
+    rate_limiter.configure("anthropic", requests_per_minute=50, tokens_per_minute=40000)
+    rate_limiter.configure("anthropic", "claude-3-haiku-20240307", max_in_flight=20)
+
+    with rate_limiter.limit("anthropic", model):
+        response = client.messages.create(...)
+    rate_limiter.record_usage("anthropic", model, tokens=1234)
+    ```
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How often async waiters re-check an in-flight slot
+_ASYNC_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class RateLimitConfig:
+    """Limits applied to one provider/model.
+
+    Attributes:
+        max_in_flight: Maximum concurrent requests (None for no cap)
+        requests_per_minute: Request rate limit (None for no limit)
+        tokens_per_minute: Input+output token rate limit (None for no limit)
+    """
+
+    max_in_flight: Optional[int] = None
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate_per_minute.
+
+    The level may go negative when usage is charged after the fact; callers
+    then wait until the debt has been refilled.
+    """
+
+    def __init__(self, rate_per_minute: float) -> None:
+        # At least one request's worth, or a rate below one per minute could never admit a request
+        self.capacity = max(float(rate_per_minute), 1.0)
+        self.rate = rate_per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take amount if available and return 0, else return seconds to wait."""
+        with self._lock:
+            self._refill()
+            if self.level >= amount:
+                self.level -= amount
+                return 0.0
+            return (amount - self.level) / self.rate
+
+    def debt_wait(self) -> float:
+        """Return seconds until the level is back to zero (0 if not in debt)."""
+        with self._lock:
+            self._refill()
+            return max(-self.level, 0.0) / self.rate
+
+    def charge(self, amount: float) -> None:
+        """Remove amount from the bucket, going into debt if necessary."""
+        with self._lock:
+            self._refill()
+            self.level -= amount
+
+
+class ProviderLimiter:
+    """Concurrency cap, rate buckets and retry-after pause for one provider/model.
+
+    Attributes:
+        config (RateLimitConfig): The limits this limiter enforces
+        in_flight (int): Requests currently holding a slot
+    """
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        self.config = config
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._requests = TokenBucket(config.requests_per_minute) if config.requests_per_minute else None
+        self._tokens = TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        self._condition = threading.Condition()
+
+    def _wait_time(self) -> float:
+        """Seconds until a request may start, ignoring the in-flight cap."""
+        wait = self.blocked_until - time.monotonic()
+        if self._tokens is not None:
+            wait = max(wait, self._tokens.debt_wait())
+        return max(wait, 0.0)
+
+    def _try_enter(self) -> bool:
+        with self._condition:
+            if self.config.max_in_flight is not None and self.in_flight >= self.config.max_in_flight:
+                return False
+            self.in_flight += 1
+            return True
+
+    def _leave(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def _request_wait(self) -> float:
+        """Reserve a request from the request bucket, or return seconds to wait."""
+        return self._requests.reserve(1.0) if self._requests is not None else 0.0
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        """Block until a request may be sent, and hold an in-flight slot meanwhile."""
+        while True:
+            wait = self._wait_time()
+            if wait > 0:
+                time.sleep(wait)
+                continue
+            with self._condition:
+                while not self._try_enter():
+                    self._condition.wait()
+            wait = self._request_wait()
+            if wait > 0:
+                self._leave()
+                time.sleep(wait)
+                continue
+            break
+        try:
+            yield
+        finally:
+            self._leave()
+
+    @contextlib.asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Async counterpart of slot(); waiting yields to the event loop."""
+        while True:
+            wait = self._wait_time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            while not self._try_enter():
+                await asyncio.sleep(_ASYNC_POLL_INTERVAL)
+            wait = self._request_wait()
+            if wait > 0:
+                self._leave()
+                await asyncio.sleep(wait)
+                continue
+            break
+        try:
+            yield
+        finally:
+            self._leave()
+
+    def record_usage(self, tokens: int) -> None:
+        """Charge a completed call's input+output tokens to the token bucket."""
+        if self._tokens is not None and tokens:
+            self._tokens.charge(tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller of this limiter for the given number of seconds."""
+        with self._condition:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+_defaults = RateLimitConfig()
+_overrides: Dict[Tuple[str, Optional[str]], RateLimitConfig] = {}
+_limiters: Dict[Tuple[str, str], ProviderLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def configure(
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    max_in_flight: Optional[int] = None,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+) -> RateLimitConfig:
+    """Set limits for every call, one provider, or one model of a provider.
+
+    Model settings take precedence over provider settings, which take
+    precedence over the defaults. Existing limiters are rebuilt, so the new
+    limits apply to the next request.
+
+    Args:
+        provider: Provider name ("anthropic", "openai", "google"), or None for defaults
+        model: Model name within provider, or None for the whole provider
+        max_in_flight: Maximum concurrent requests
+        requests_per_minute: Request rate limit
+        tokens_per_minute: Input+output token rate limit
+
+    Returns:
+        RateLimitConfig: The updated configuration for that scope
+    """
+    global _defaults
+    limits = RateLimitConfig(max_in_flight, requests_per_minute, tokens_per_minute)
+    with _registry_lock:
+        if provider is None:
+            _defaults = limits
+        else:
+            _overrides[(provider, model)] = limits
+        _limiters.clear()
+    return limits
+
+
+def get_config(provider: str, model: str) -> RateLimitConfig:
+    """Return the limits that apply to a provider/model."""
+    for key in ((provider, model), (provider, None)):
+        if key in _overrides:
+            return replace(_overrides[key])
+    return replace(_defaults)
+
+
+def get_limiter(provider: str, model: Any) -> ProviderLimiter:
+    """Return the shared limiter for a provider/model, creating it if needed."""
+    model_name = str(getattr(model, "value", model))
+    key = (provider, model_name)
+    limiter = _limiters.get(key)
+    if limiter is not None:
+        return limiter
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = ProviderLimiter(get_config(provider, model_name))
+        return limiter
+
+
+def limit(provider: str, model: Any) -> "contextlib.AbstractContextManager[None]":
+    """Context manager that waits for and holds a request slot."""
+    return get_limiter(provider, model).slot()
+
+
+def alimit(provider: str, model: Any) -> "contextlib.AbstractAsyncContextManager[None]":
+    """Async context manager that waits for and holds a request slot."""
+    return get_limiter(provider, model).aslot()
+
+
+def record_usage(provider: str, model: Any, tokens: int) -> None:
+    """Charge a completed call's tokens to its provider/model token bucket."""
+    get_limiter(provider, model).record_usage(tokens)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Return the retry delay requested by a failed call's response headers, if any.
+
+    Reads ``retry-after-ms`` and ``retry-after`` (seconds) from the response
+    attached to SDK errors such as anthropic.RateLimitError.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def record_error(provider: str, model: Any, error: BaseException) -> Optional[float]:
+    """Pause a provider/model if a failed call asked callers to retry later.
+
+    Returns:
+        Optional[float]: The retry-after delay in seconds, or None if the
+        error carried none
+    """
+    delay = retry_after(error)
+    if delay is not None:
+        get_limiter(provider, model).pause(delay)
+        logger.warning("Provider asked to retry later", extra={"provider": provider, "delay": delay})
+    return delay
+
+
+def clear() -> None:
+    """Drop all limiters and configured limits (mainly for tests)."""
+    global _defaults
+    with _registry_lock:
+        _defaults = RateLimitConfig()
+        _overrides.clear()
+        _limiters.clear()
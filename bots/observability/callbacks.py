@@ -36,7 +36,7 @@ class BotCallbacks(ABC):
 
     Callbacks are invoked at key points during bot operations:
     - respond: Start/complete/error of bot.respond()
-    - api_call: Start/complete/error of API calls
+    - api_call: Start/complete/error of API calls, plus text deltas when streaming
     - tool: Start/complete/error of tool execution
     - step: Start/complete/error of individual steps
 
@@ -96,6 +96,18 @@ class BotCallbacks(ABC):
         """
         pass
 
+    def on_text_delta(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Called for each chunk of text as a streamed response arrives.
+
+        Only invoked by mailboxes running in streaming mode. The complete text
+        is still delivered to on_api_call_complete afterwards.
+
+        Args:
+            text: The newly generated text
+            metadata: Optional context (bot name, etc.)
+        """
+        pass
+
     def on_tool_start(self, tool_name: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Called when a tool execution starts.
 
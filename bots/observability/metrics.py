@@ -18,6 +18,26 @@ Per-Bot Tracking:
 - Recording functions accept optional bot_id parameter for attribution
 - Prevents cost/token stealing between concurrent bots
 
+Prompt Cache Tracking:
+- record_cache_usage() adds each response's cache read, cache creation and
+  uncached input tokens, globally and per bot
+- get_cache_stats(bot_id) returns the totals and the share of input tokens
+  read from and written to the cache; bot_metrics_id(bot) is the id
+  provider mailboxes record under
+
+Turn Phase Tracking:
+- record_turn_profile() adds a respond() call's phase timings (see
+  bots.foundation.profiling), globally and per bot; Bot records every turn
+- get_phase_stats(bot_id) returns count, total, mean and max seconds per phase,
+  plus "turn" for whole respond() calls
+
+Memory Bounds:
+- Histories are array-backed time series with running totals, so "since
+  timestamp" queries are a binary search instead of a scan
+- Each history keeps at most a fixed number of entries (oldest dropped first),
+  and only the most recently active bots are tracked
+- Use configure_history_limits() to change the limits
+
 Example:
     ```python
     from bots.observability import metrics
@@ -54,7 +74,10 @@ Example:
 
 import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from bots.observability.config import load_config_from_env
 
@@ -92,15 +115,96 @@ _custom_exporter: Optional[object] = None  # Store reference to custom exporter
 _last_recorded_metrics = {"input_tokens": 0, "output_tokens": 0, "cached_tokens": 0, "cost": 0.0, "duration": 0.0}
 _metrics_lock = threading.Lock()  # Lock for thread-safe metrics updates
 
+# Retention limits for metrics history (see configure_history_limits)
+_max_history_entries = 100_000
+_max_bot_history_entries = 10_000
+_max_tracked_bots = 1_000
+
+
+class MetricsHistory:
+    """Bounded time series of (timestamp, input, output, cached, cost) entries.
+
+    Entries are stored as running totals in typed arrays, so the sum of every
+    entry recorded after a timestamp is one binary search and a subtraction.
+    When the series grows past twice max_entries the oldest entries are
+    dropped in one block, which keeps appends amortized O(1).
+
+    Not thread-safe on its own; callers hold _metrics_lock.
+
+    Attributes:
+        max_entries (int): Number of most recent entries always retained
+    """
+
+    __slots__ = ("max_entries", "_timestamps", "_input", "_output", "_cached", "_cost", "_base")
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._timestamps = array("d")
+        self._input = array("q")
+        self._output = array("q")
+        self._cached = array("q")
+        self._cost = array("d")
+        # Running totals of entries already dropped from the front
+        self._base: Tuple[int, int, int, float] = (0, 0, 0, 0.0)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def append(self, timestamp: float, input_tokens: int, output_tokens: int, cached_tokens: int, cost: float) -> None:
+        """Add an entry. Timestamps going backwards are clamped to the last one."""
+        if self._timestamps:
+            timestamp = max(timestamp, self._timestamps[-1])
+            totals = self._totals_at(len(self._timestamps))
+        else:
+            totals = self._base
+        self._timestamps.append(timestamp)
+        self._input.append(totals[0] + input_tokens)
+        self._output.append(totals[1] + output_tokens)
+        self._cached.append(totals[2] + cached_tokens)
+        self._cost.append(totals[3] + cost)
+        if len(self._timestamps) > 2 * self.max_entries:
+            self._evict(len(self._timestamps) - self.max_entries)
+
+    def _totals_at(self, index: int) -> Tuple[int, int, int, float]:
+        """Running totals of every entry before index."""
+        if index == 0:
+            return self._base
+        i = index - 1
+        return (self._input[i], self._output[i], self._cached[i], self._cost[i])
+
+    def _evict(self, count: int) -> None:
+        self._base = self._totals_at(count)
+        for column in (self._timestamps, self._input, self._output, self._cached, self._cost):
+            del column[:count]
+
+    def totals_since(self, since_timestamp: float) -> Tuple[int, int, int, float]:
+        """Return (input, output, cached, cost) summed over entries after since_timestamp."""
+        start = bisect_right(self._timestamps, since_timestamp)
+        end = self._totals_at(len(self._timestamps))
+        begin = self._totals_at(start)
+        return (end[0] - begin[0], end[1] - begin[1], end[2] - begin[2], end[3] - begin[3])
+
+
 # Metrics history for session tracking (global)
-# Each entry is a tuple: (timestamp, input_tokens, output_tokens, cached_tokens, cost)
-# This list resets when a new Python process/CLI instance starts
+# Resets when a new Python process/CLI instance starts
 # Used by get_total_tokens() and get_total_cost() to calculate cumulative totals since a given timestamp
-_metrics_history: List[Tuple[float, int, int, int, float]] = []
+_metrics_history = MetricsHistory(_max_history_entries)
+
+# Per-bot metrics tracking, least recently updated bot first
+# Key: bot_id, Value: dict with 'last_metrics', 'history' (a MetricsHistory), 'cache' and 'phases'
+_bot_metrics: "OrderedDict[str, Dict]" = OrderedDict()
+
+
+def _empty_cache_totals() -> Dict[str, int]:
+    return {"cache_read": 0, "cache_creation": 0, "uncached": 0, "requests": 0}
 
-# Per-bot metrics tracking
-# Key: bot_id, Value: dict with 'last_metrics' and 'history'
-_bot_metrics: Dict[str, Dict] = {}
+
+# Prompt cache token totals for the whole process (see record_cache_usage)
+_cache_totals = _empty_cache_totals()
+
+# Turn phase timings for the whole process (see record_turn_profile)
+# Key: phase name, Value: dict with 'count', 'total' and 'max' seconds
+_phase_totals: Dict[str, Dict[str, float]] = {}
 
 # Metric instruments (initialized after setup)
 _response_time_histogram = None
@@ -114,6 +218,8 @@ _cost_histogram = None
 _cost_counter = None
 _errors_counter = None
 _tool_failures_counter = None
+_prompt_cache_tokens_counter = None
+_phase_duration_histogram = None
 
 
 def is_metrics_enabled() -> bool:
@@ -144,12 +250,13 @@ def reset_metrics():
 
     Warning: This is not thread-safe and should only be used in test environments.
     """
-    global _last_recorded_metrics, _metrics_history, _bot_metrics
+    global _last_recorded_metrics, _metrics_history, _bot_metrics, _cache_totals, _phase_totals
     global _meter_provider, _initialized, _custom_exporter
     global _response_time_histogram, _api_call_duration_histogram
     global _tool_execution_duration_histogram, _message_building_duration_histogram
     global _api_calls_counter, _tool_calls_counter, _tokens_used_counter
-    global _cost_histogram, _cost_counter, _errors_counter, _tool_failures_counter
+    global _cost_histogram, _cost_counter, _errors_counter, _tool_failures_counter, _prompt_cache_tokens_counter
+    global _phase_duration_histogram
 
     # Shutdown existing meter provider if it exists
     if _meter_provider is not None:
@@ -173,6 +280,8 @@ def reset_metrics():
     _cost_counter = None
     _errors_counter = None
     _tool_failures_counter = None
+    _prompt_cache_tokens_counter = None
+    _phase_duration_histogram = None
     _last_recorded_metrics = {
         "input_tokens": 0,
         "output_tokens": 0,
@@ -180,8 +289,10 @@ def reset_metrics():
         "cost": 0.0,
         "duration": 0.0,
     }
-    _metrics_history = []
-    _bot_metrics = {}
+    _metrics_history = MetricsHistory(_max_history_entries)
+    _bot_metrics = OrderedDict()
+    _cache_totals = _empty_cache_totals()
+    _phase_totals = {}
 
 
 def setup_metrics(config=None, reader=None, verbose=False):
@@ -199,7 +310,8 @@ def setup_metrics(config=None, reader=None, verbose=False):
     global _response_time_histogram, _api_call_duration_histogram
     global _tool_execution_duration_histogram, _message_building_duration_histogram
     global _api_calls_counter, _tool_calls_counter, _tokens_used_counter
-    global _cost_histogram, _cost_counter, _errors_counter, _tool_failures_counter
+    global _cost_histogram, _cost_counter, _errors_counter, _tool_failures_counter, _prompt_cache_tokens_counter
+    global _phase_duration_histogram
 
     if _initialized:
         return
@@ -288,6 +400,12 @@ def setup_metrics(config=None, reader=None, verbose=False):
         unit="s",
     )
 
+    _phase_duration_histogram = meter.create_histogram(
+        name="bot.turn_phase_duration",
+        description="Time spent in each phase of a respond() call in seconds",
+        unit="s",
+    )
+
     # Usage Metrics (Counters)
     _api_calls_counter = meter.create_counter(
         name="bot.api_calls_total",
@@ -333,6 +451,13 @@ def setup_metrics(config=None, reader=None, verbose=False):
         unit="1",
     )
 
+    # Prompt cache Metrics
+    _prompt_cache_tokens_counter = meter.create_counter(
+        name="bot.prompt_cache_tokens",
+        description="Input tokens by prompt cache outcome (read, creation, uncached)",
+        unit="1",
+    )
+
     _initialized = True
 
 
@@ -361,15 +486,7 @@ def get_total_tokens(since_timestamp: float) -> Dict[str, int]:
         >>> print(f"Input tokens: {totals['input']}")
     """
     with _metrics_lock:
-        input_total = 0
-        output_total = 0
-        cached_total = 0
-
-        for timestamp, input_tokens, output_tokens, cached_tokens, _ in _metrics_history:
-            if timestamp > since_timestamp:
-                input_total += input_tokens
-                output_total += output_tokens
-                cached_total += cached_tokens
+        input_total, output_total, cached_total, _ = _metrics_history.totals_since(since_timestamp)
 
         return {
             "input": input_total,
@@ -400,13 +517,7 @@ def get_total_cost(since_timestamp: float) -> float:
         >>> print(f"Session cost: ${total_cost:.4f}")
     """
     with _metrics_lock:
-        cost_total = 0.0
-
-        for timestamp, _, _, _, cost in _metrics_history:
-            if timestamp > since_timestamp:
-                cost_total += cost
-
-        return cost_total
+        return _metrics_history.totals_since(since_timestamp)[3]
 
 
 def get_bot_tokens(bot_id: str, since_timestamp: float = 0.0) -> Dict[str, int]:
@@ -438,15 +549,7 @@ def get_bot_tokens(bot_id: str, since_timestamp: float = 0.0) -> Dict[str, int]:
         if bot_id not in _bot_metrics:
             return {"input": 0, "output": 0, "cached": 0, "total": 0}
 
-        input_total = 0
-        output_total = 0
-        cached_total = 0
-
-        for timestamp, input_tokens, output_tokens, cached_tokens, _ in _bot_metrics[bot_id]["history"]:
-            if timestamp > since_timestamp:
-                input_total += input_tokens
-                output_total += output_tokens
-                cached_total += cached_tokens
+        input_total, output_total, cached_total, _ = _bot_metrics[bot_id]["history"].totals_since(since_timestamp)
 
         return {
             "input": input_total,
@@ -481,13 +584,7 @@ def get_bot_cost(bot_id: str, since_timestamp: float = 0.0) -> float:
         if bot_id not in _bot_metrics:
             return 0.0
 
-        cost_total = 0.0
-
-        for timestamp, _, _, _, cost in _bot_metrics[bot_id]["history"]:
-            if timestamp > since_timestamp:
-                cost_total += cost
-
-        return cost_total
+        return _bot_metrics[bot_id]["history"].totals_since(since_timestamp)[3]
 
 
 def clear_bot_metrics(bot_id: str):
@@ -523,6 +620,38 @@ def get_all_bot_ids() -> List[str]:
         return list(_bot_metrics.keys())
 
 
+def configure_history_limits(
+    max_entries: Optional[int] = None,
+    max_bot_entries: Optional[int] = None,
+    max_bots: Optional[int] = None,
+):
+    """Set how much metrics history is retained.
+
+    Queries only see retained entries, so totals since a timestamp older than
+    the retained window cover just the retained part.
+
+    Args:
+        max_entries: Entries kept in the global history
+        max_bot_entries: Entries kept in each bot's history
+        max_bots: Bots tracked at once; the least recently updated bot is
+            dropped when a new one starts recording
+    """
+    global _max_history_entries, _max_bot_history_entries, _max_tracked_bots
+
+    with _metrics_lock:
+        if max_entries is not None:
+            _max_history_entries = max_entries
+            _metrics_history.max_entries = max_entries
+        if max_bot_entries is not None:
+            _max_bot_history_entries = max_bot_entries
+            for bot_metrics in _bot_metrics.values():
+                bot_metrics["history"].max_entries = max_bot_entries
+        if max_bots is not None:
+            _max_tracked_bots = max_bots
+            while len(_bot_metrics) > max_bots:
+                _bot_metrics.popitem(last=False)
+
+
 def set_metrics_verbose(verbose: bool):
     """Set verbose mode for metrics output.
 
@@ -557,12 +686,17 @@ def get_meter(name: str):
 def _ensure_bot_metrics(bot_id: str):
     """Internal helper to ensure bot metrics structure exists.
 
-    Must be called with _metrics_lock held.
+    Marks the bot as most recently updated and drops the least recently
+    updated bots beyond _max_tracked_bots. Must be called with _metrics_lock held.
 
     Args:
         bot_id: Unique identifier for the bot
     """
-    if bot_id not in _bot_metrics:
+    if bot_id in _bot_metrics:
+        _bot_metrics.move_to_end(bot_id)
+    else:
+        while len(_bot_metrics) >= _max_tracked_bots:
+            _bot_metrics.popitem(last=False)
         _bot_metrics[bot_id] = {
             "last_metrics": {
                 "input_tokens": 0,
@@ -571,7 +705,9 @@ def _ensure_bot_metrics(bot_id: str):
                 "cost": 0.0,
                 "duration": 0.0,
             },
-            "history": [],
+            "history": MetricsHistory(_max_bot_history_entries),
+            "cache": _empty_cache_totals(),
+            "phases": {},
         }
 
 
@@ -713,9 +849,8 @@ def record_tokens(
         _last_recorded_metrics["cached_tokens"] = cached_tokens
 
         # Add to global metrics history for session tracking
-        _metrics_history.append(
-            (time.time(), input_tokens, output_tokens, cached_tokens, 0.0)  # cost will be recorded separately
-        )
+        now = time.time()
+        _metrics_history.append(now, input_tokens, output_tokens, cached_tokens, 0.0)  # cost will be recorded separately
 
         # Update per-bot metrics if bot_id provided
         if bot_id:
@@ -723,7 +858,7 @@ def record_tokens(
             _bot_metrics[bot_id]["last_metrics"]["input_tokens"] = input_tokens
             _bot_metrics[bot_id]["last_metrics"]["output_tokens"] = output_tokens
             _bot_metrics[bot_id]["last_metrics"]["cached_tokens"] = cached_tokens
-            _bot_metrics[bot_id]["history"].append((time.time(), input_tokens, output_tokens, cached_tokens, 0.0))
+            _bot_metrics[bot_id]["history"].append(now, input_tokens, output_tokens, cached_tokens, 0.0)
 
     if not _initialized or _tokens_used_counter is None:
         return
@@ -750,6 +885,162 @@ def record_tokens(
         _tokens_used_counter.add(cached_tokens, attributes=attributes_cached)
 
 
+def bot_metrics_id(bot) -> str:
+    """Return the id a bot's metrics are recorded under.
+
+    Args:
+        bot: Bot instance
+
+    Returns:
+        str: The bot's name plus a per-instance suffix, e.g. "Claude_7f3a2c"
+    """
+    return f"{bot.name}_{id(bot):x}"
+
+
+def record_cache_usage(
+    cache_read_tokens: int,
+    cache_creation_tokens: int,
+    uncached_tokens: int,
+    provider: str,
+    model: str,
+    bot_id: Optional[str] = None,
+):
+    """Record how a response's input tokens were served by the prompt cache.
+
+    Args:
+        cache_read_tokens: Input tokens read from the cache
+        cache_creation_tokens: Input tokens written to the cache
+        uncached_tokens: Input tokens neither read nor written
+        provider: Provider name
+        model: Model name
+        bot_id: Optional bot identifier for per-bot tracking
+    """
+    counts = {
+        "cache_read": cache_read_tokens or 0,
+        "cache_creation": cache_creation_tokens or 0,
+        "uncached": uncached_tokens or 0,
+    }
+    with _metrics_lock:
+        totals = [_cache_totals]
+        if bot_id:
+            _ensure_bot_metrics(bot_id)
+            totals.append(_bot_metrics[bot_id]["cache"])
+        for total in totals:
+            for key, value in counts.items():
+                total[key] += value
+            total["requests"] += 1
+
+    if not _initialized or _prompt_cache_tokens_counter is None:
+        return
+
+    attributes_base = {"provider": provider, "model": model}
+    if bot_id:
+        attributes_base["bot_id"] = bot_id
+    for cache_type, value in counts.items():
+        if value > 0:
+            _prompt_cache_tokens_counter.add(value, attributes={**attributes_base, "cache_type": cache_type})
+
+
+def get_cache_stats(bot_id: Optional[str] = None) -> Dict[str, float]:
+    """Get prompt cache totals and ratios, for one bot or the whole process.
+
+    Args:
+        bot_id: Bot identifier (see bot_metrics_id); None for process-wide totals
+
+    Returns:
+        dict: Dictionary with keys:
+            - 'cache_read', 'cache_creation', 'uncached': Input token totals
+            - 'requests': Number of responses recorded
+            - 'read_ratio': Share of input tokens read from the cache
+            - 'creation_ratio': Share of input tokens written to the cache
+
+    Example:
+        >>> stats = get_cache_stats(bot_metrics_id(bot))
+        >>> print(f"Cache hit rate: {stats['read_ratio']:.0%}")
+    """
+    with _metrics_lock:
+        if bot_id is None:
+            totals = dict(_cache_totals)
+        elif bot_id in _bot_metrics:
+            totals = dict(_bot_metrics[bot_id]["cache"])
+        else:
+            totals = _empty_cache_totals()
+    input_total = totals["cache_read"] + totals["cache_creation"] + totals["uncached"]
+    totals["read_ratio"] = totals["cache_read"] / input_total if input_total else 0.0
+    totals["creation_ratio"] = totals["cache_creation"] / input_total if input_total else 0.0
+    return totals
+
+
+def record_turn_profile(profile: Any, provider: str, model: str, bot_id: Optional[str] = None):
+    """Record the phase timings of one respond() call.
+
+    Adds each phase's time to the process-wide and per-bot phase totals, the
+    whole call under "turn". The message_build time also goes to
+    record_message_building().
+
+    Args:
+        profile: A finished bots.foundation.profiling.TurnProfile
+        provider: Provider name
+        model: Model name
+        bot_id: Optional bot identifier for per-bot tracking
+    """
+    phases = profile.totals()
+    if profile.total is not None:
+        phases["turn"] = profile.total
+    with _metrics_lock:
+        totals = [_phase_totals]
+        if bot_id:
+            _ensure_bot_metrics(bot_id)
+            totals.append(_bot_metrics[bot_id]["phases"])
+        for phase_totals in totals:
+            for phase, seconds in phases.items():
+                stats = phase_totals.setdefault(phase, {"count": 0, "total": 0.0, "max": 0.0})
+                stats["count"] += 1
+                stats["total"] += seconds
+                stats["max"] = max(stats["max"], seconds)
+
+    if "message_build" in phases:
+        record_message_building(phases["message_build"], provider, model, bot_id=bot_id)
+
+    if not _initialized or _phase_duration_histogram is None:
+        return
+
+    attributes_base = {"provider": provider, "model": model}
+    if bot_id:
+        attributes_base["bot_id"] = bot_id
+    for phase, seconds in phases.items():
+        _phase_duration_histogram.record(seconds, attributes={**attributes_base, "phase": phase})
+
+
+def get_phase_stats(bot_id: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """Get turn phase timing statistics, for one bot or the whole process.
+
+    Args:
+        bot_id: Bot identifier (see bot_metrics_id); None for process-wide totals
+
+    Returns:
+        dict: Phase name to a dictionary with keys:
+            - 'count': Number of turns the phase occurred in
+            - 'total', 'mean', 'max': Seconds per turn
+        The "turn" entry covers whole respond() calls.
+
+    Example:
+        >>> stats = get_phase_stats(bot_metrics_id(bot))
+        >>> print(f"API wait: {stats['api_wait']['total'] / stats['turn']['total']:.0%} of the time")
+    """
+    with _metrics_lock:
+        if bot_id is None:
+            source = _phase_totals
+        elif bot_id in _bot_metrics:
+            source = _bot_metrics[bot_id]["phases"]
+        else:
+            source = {}
+        stats = {phase: dict(values) for phase, values in source.items()}
+    for values in stats.values():
+        values["mean"] = values["total"] / values["count"] if values["count"] else 0.0
+    return stats
+
+
 def record_cost(cost: float, provider: str, model: str, bot_id: Optional[str] = None):
     """Record cost metrics.
 
@@ -764,21 +1055,20 @@ def record_cost(cost: float, provider: str, model: str, bot_id: Optional[str] =
         _last_recorded_metrics["cost"] = cost
 
         # Add to global metrics history for session tracking
+        now = time.time()
         _metrics_history.append(
-            (
-                time.time(),
-                0,  # input_tokens (recorded separately)
-                0,  # output_tokens (recorded separately)
-                0,  # cached_tokens (recorded separately)
-                cost,
-            )
+            now,
+            0,  # input_tokens (recorded separately)
+            0,  # output_tokens (recorded separately)
+            0,  # cached_tokens (recorded separately)
+            cost,
         )
 
         # Update per-bot metrics if bot_id provided
         if bot_id:
             _ensure_bot_metrics(bot_id)
             _bot_metrics[bot_id]["last_metrics"]["cost"] = cost
-            _bot_metrics[bot_id]["history"].append((time.time(), 0, 0, 0, cost))
+            _bot_metrics[bot_id]["history"].append(now, 0, 0, 0, cost)
 
     if not _initialized:
         return
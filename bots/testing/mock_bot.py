@@ -5,11 +5,13 @@ This module provides configurable mock implementations that can be used for test
 without making actual API calls to LLM services.
 """
 
+import asyncio
 import json
 import re
 import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
+from bots.foundation import profiling
 from bots.foundation.base import Bot, ConversationNode, Engines, Mailbox, ToolHandler
 
 if TYPE_CHECKING:
@@ -23,6 +25,8 @@ class MockConversationNode(ConversationNode):
     testing utilities and predictable behavior.
     """
 
+    __slots__ = ("_test_metadata",)
+
     def __init__(self, content: str = "", role: str = "user", **kwargs):
         """Initialize a mock conversation node."""
         super().__init__(content=content, role=role, **kwargs)
@@ -215,35 +219,40 @@ class MockToolHandler(ToolHandler):
             if tool_name is None:
                 continue
 
-            # Record the call
-            call_record = {"tool_name": tool_name, "parameters": input_kwargs, "timestamp": time.time()}
-            self._call_history.append(call_record)
+            with profiling.phase(getattr(self, "bot", None), "tool", tool_name):
+                # Record the call
+                call_record = {"tool_name": tool_name, "parameters": input_kwargs, "timestamp": time.time()}
+                self._call_history.append(call_record)
 
-            # Add execution delay if configured
-            if tool_name in self._execution_delays:
-                time.sleep(self._execution_delays[tool_name])
+                # Add execution delay if configured
+                if tool_name in self._execution_delays:
+                    time.sleep(self._execution_delays[tool_name])
 
-            # Check if tool should fail
-            if tool_name in self._should_fail:
-                error_msg = self._should_fail[tool_name]
-                response_schema = self.generate_error_schema(request_schema, error_msg)
-            else:
-                # Get mock response or use default
-                if tool_name in self._mock_responses:
-                    mock_output = self._mock_responses[tool_name]
-                elif tool_name in self.function_map:
-                    # If we have the actual function, we could call it or return a default
-                    mock_output = f"Mock response for {tool_name} with args: {input_kwargs}"
+                # Check if tool should fail
+                if tool_name in self._should_fail:
+                    error_msg = self._should_fail[tool_name]
+                    response_schema = self.generate_error_schema(request_schema, error_msg)
                 else:
-                    mock_output = f"Mock tool {tool_name} executed successfully"
+                    # Get mock response or use default
+                    if tool_name in self._mock_responses:
+                        mock_output = self._mock_responses[tool_name]
+                    elif tool_name in self.function_map:
+                        # If we have the actual function, we could call it or return a default
+                        mock_output = f"Mock response for {tool_name} with args: {input_kwargs}"
+                    else:
+                        mock_output = f"Mock tool {tool_name} executed successfully"
 
-                response_schema = self.generate_response_schema(request_schema, mock_output)
+                    response_schema = self.generate_response_schema(request_schema, mock_output)
 
             self.results.append(response_schema)
             results.append(response_schema)
 
         return results
 
+    async def aexec_requests(self) -> List[Dict[str, Any]]:
+        """Execute mock tool requests in a worker thread."""
+        return await asyncio.to_thread(self.exec_requests)
+
 
 class MockMailbox(Mailbox):
     """Mock mailbox for testing purposes.
@@ -327,12 +336,23 @@ class MockMailbox(Mailbox):
         if self._response_delay > 0:
             time.sleep(self._response_delay)
 
+        return self._mock_response(bot)
+
+    async def asend_message(self, bot: "Bot") -> Dict[str, Any]:
+        """Async send_message; the response delay yields to the event loop."""
+        if self._response_delay > 0:
+            await asyncio.sleep(self._response_delay)
+
+        return self._mock_response(bot)
+
+    def _mock_response(self, bot: "Bot") -> Dict[str, Any]:
+        """Build the mock response for the bot's current conversation."""
         # Check if we should fail
         if self._should_fail:
             raise Exception(self._failure_message)
 
         # Build conversation context
-        messages = bot.conversation._build_messages()
+        messages = bot._context_messages()
         self._conversation_history.append(
             {
                 "timestamp": time.time(),
@@ -495,6 +515,8 @@ class MockBot(Bot):
             callbacks=callbacks,  # Pass through callbacks parameter
         )
 
+        self.tool_handler.bot = self
+
         # Additional mock-specific attributes
         self._response_count = 0
         self._test_metadata = {}
@@ -607,6 +629,12 @@ class MockBot(Bot):
         self._response_count += 1
         return response
 
+    async def arespond(self, prompt: str, role: str = "user") -> str:
+        """Override arespond to track response count."""
+        response = await super().arespond(prompt, role)
+        self._response_count += 1
+        return response
+
     def simulate_conversation(self, messages: List[Tuple[str, str]]) -> List[str]:
         """Simulate a full conversation with multiple exchanges.
 
@@ -0,0 +1,249 @@
+"""Record and replay LLM responses with a content-addressed response cache.
+
+ReplayMailbox wraps a bot's mailbox. Before each request it hashes what the
+request is made of: bot class, model, system message, tool schemas, the
+messages the mailbox will send (after the bot's context policy), temperature
+and max_tokens. The hash looks up a stored response:
+
+- ``record``: serve stored responses; on a miss call the provider and store
+  the response
+- ``replay``: serve stored responses only; a miss raises ReplayMissError, so
+  CI runs fail instead of reaching the network
+- ``passthrough``: always call the provider and store nothing
+
+Responses are kept in a ResponseStore, a single SQLite file holding
+compressed JSON. When the stored payloads exceed max_bytes, the least
+recently used entries are evicted. Provider SDK responses are pydantic
+models and are stored with model_dump() and rebuilt with model_validate();
+MockMailbox responses are plain dicts.
+
+Repeated deterministic pipelines and CI runs then make no API calls after
+the first run, and a session recorded once can be replayed as a benchmark.
+Streamed responses are replayed whole, without text delta callbacks.
+
+Example:
+    ```python
+    from bots import AnthropicBot
+    from bots.testing.replay import ReplayMailbox, ResponseStore
+
+    bot = AnthropicBot()
+    store = ResponseStore("responses.sqlite", max_bytes=512 * 1024 * 1024)
+    bot.mailbox = ReplayMailbox(bot.mailbox, store, mode="record")
+    bot.respond("Summarize README.md")  # Calls the API once, then serves from the store
+
+    # In CI: fail on any request that was not recorded
+    bot.mailbox = ReplayMailbox(bot.mailbox.mailbox, store, mode="replay")
+    ```
+"""
+
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from bots.foundation.base import Mailbox
+
+if TYPE_CHECKING:
+    from bots.foundation.base import Bot
+
+MODES = ("record", "replay", "passthrough")
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when a request has no stored response."""
+
+
+def request_key(bot: "Bot") -> str:
+    """Return the content hash identifying the request bot would send next.
+
+    Args:
+        bot: The bot about to send a request
+
+    Returns:
+        str: Hex SHA-256 of the canonical JSON of the request parts
+    """
+    request = {
+        "bot": type(bot).__name__,
+        "model": getattr(bot.model_engine, "value", str(bot.model_engine)),
+        "system": bot.system_message,
+        "tools": bot.tool_handler.tools if bot.tool_handler else None,
+        "messages": bot._context_messages(),
+        "temperature": bot.temperature,
+        "max_tokens": bot.max_tokens,
+    }
+    encoded = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def encode_response(response: Any) -> Dict[str, Any]:
+    """Turn a mailbox response into a JSON-safe payload.
+
+    Raises:
+        TypeError: If the response is neither a dict nor a pydantic model
+    """
+    if isinstance(response, dict):
+        return {"kind": "dict", "data": response}
+    if hasattr(response, "model_dump") and hasattr(type(response), "model_validate"):
+        cls = type(response)
+        return {"kind": "model", "class": f"{cls.__module__}:{cls.__qualname__}", "data": response.model_dump(mode="json")}
+    raise TypeError(f"Cannot store responses of type {type(response).__name__}")
+
+
+def decode_response(payload: Dict[str, Any]) -> Any:
+    """Rebuild a response from encode_response() output."""
+    if payload["kind"] == "dict":
+        return payload["data"]
+    module_name, _, qualname = payload["class"].partition(":")
+    cls: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        cls = getattr(cls, name)
+    return cls.model_validate(payload["data"])
+
+
+class ResponseStore:
+    """SQLite-backed response store with size-based LRU eviction.
+
+    Safe to share between bots and threads in one process; several processes
+    may use the same file, with SQLite serializing their writes.
+
+    Args:
+        path: SQLite file; ":memory:" keeps the store in memory
+        max_bytes: Upper bound on the total size of stored payloads
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, "
+            "created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the payload stored under key and mark it as recently used, or None."""
+        with self._lock:
+            row = self._connection.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store payload under key, evicting least recently used entries beyond max_bytes."""
+        blob = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, size, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in self._connection.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def stats(self) -> Tuple[int, int]:
+        """Return (entry count, total payload bytes)."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class ReplayMailbox(Mailbox):
+    """Mailbox wrapper that serves repeated requests from a ResponseStore.
+
+    Response processing, and anything else not defined here, is delegated to
+    the wrapped mailbox. Copies of the bot (branches, par_branch workers)
+    wrap a fresh copy of the provider mailbox and share the store.
+
+    Attributes:
+        mailbox: The wrapped provider mailbox
+        store: Where responses are kept
+        mode: "record", "replay" or "passthrough"
+        hits: Requests served from the store
+        misses: Requests sent to the provider (record and passthrough modes)
+    """
+
+    def __init__(self, mailbox: Mailbox, store: ResponseStore, mode: str = "record") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown replay mode: {mode!r} (expected one of {MODES})")
+        super().__init__()
+        self.mailbox = mailbox
+        self.store = store
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found normally; guard against lookups
+        # before __init__ has set the wrapped mailbox (e.g. while unpickling)
+        mailbox = self.__dict__.get("mailbox")
+        if mailbox is None:
+            raise AttributeError(name)
+        return getattr(mailbox, name)
+
+    def _lookup(self, bot: "Bot") -> Tuple[Optional[str], Any]:
+        """Return (key, stored response or None); key is None in passthrough mode."""
+        if self.mode == "passthrough":
+            return None, None
+        key = request_key(bot)
+        payload = self.store.get(key)
+        if payload is not None:
+            self.hits += 1
+            return key, decode_response(payload)
+        if self.mode == "replay":
+            raise ReplayMissError(f"No recorded response for request {key[:16]} (model {bot.model_engine.value})")
+        return key, None
+
+    def _record(self, key: Optional[str], response: Any) -> Any:
+        self.misses += 1
+        if key is not None:
+            self.store.put(key, encode_response(response))
+        return response
+
+    def send_message(self, bot: "Bot") -> Any:
+        key, response = self._lookup(bot)
+        if response is not None:
+            return response
+        return self._record(key, self.mailbox.send_message(bot))
+
+    async def asend_message(self, bot: "Bot") -> Any:
+        key, response = self._lookup(bot)
+        if response is not None:
+            return response
+        return self._record(key, await self.mailbox.asend_message(bot))
+
+    def process_response(self, response: Any, bot: Optional["Bot"] = None) -> Tuple[str, str, Dict[str, Any]]:
+        return self.mailbox.process_response(response, bot)
+
+    async def aprocess_response(self, response: Any, bot: Optional["Bot"] = None) -> Tuple[str, str, Dict[str, Any]]:
+        return await self.mailbox.aprocess_response(response, bot)
+
+    def _fresh_copy(self) -> "ReplayMailbox":
+        return ReplayMailbox(self.mailbox._fresh_copy(), self.store, self.mode)
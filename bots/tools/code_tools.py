@@ -1,8 +1,10 @@
 import difflib
 import os
 import textwrap
+from collections import Counter
 
 from bots.dev.decorators import toolify
+from bots.utils.directory_index import get_index
 from bots.utils.unicode_utils import clean_unicode_string
 
 
@@ -21,7 +23,7 @@ def _write_file_bom_safe(file_path: str, content: str) -> None:
         file.write(clean_content)
 
 
-@toolify()
+@toolify(parallel_safe=True)
 def view(
     file_path: str, start_line: str = None, end_line: str = None, around_str_match: str = None, dist_from_match: str = "10"
 ):
@@ -91,7 +93,9 @@ def view(
 def view_dir(start_path: str = ".", output_file=None, target_extensions: str = "['py', 'txt', 'md']", max_lines: int = 500):
     """
     Creates a summary of the directory structure starting from the given path, writing only files
-    with specified extensions and showing venv directories without their contents.
+    with specified extensions and showing venv directories without their contents. Paths ignored
+    by .gitignore files are skipped. Directory listings are cached for the process and re-read
+    only when a directory changes, so repeated calls are cheap.
     Parameters:
     - start_path (str): The root directory to start scanning from.
     - output_file (str): The name of the file to optionally write the directory structure to.
@@ -113,64 +117,36 @@ def view_dir(start_path: str = ".", output_file=None, target_extensions: str = "
         max_lines = int(max_lines)
     extensions_list = [ext.strip().strip("'\"") for ext in target_extensions.strip("[]").split(",")]
     extensions_list = ["." + ext if not ext.startswith(".") else ext for ext in extensions_list]
-    # First pass: collect all directory entries with their levels and paths
-    dir_entries = []
-    max_level = 0
-    for root, dirs, files in os.walk(start_path):
-        level = root.replace(start_path, "").count(os.sep)
-        indent = "    " * level
-        basename = os.path.basename(root)
-        is_venv = basename in ["venv", "env", ".env"] or "pyvenv.cfg" in files
-        if is_venv:
-            dir_entries.append((level, f"{indent}{basename}/", root))
-            max_level = max(max_level, level)
-            dirs[:] = []
-            continue
-        has_relevant_files = False
-        for _, _, fs in os.walk(root):
-            if any((f.endswith(tuple(extensions_list)) for f in fs)):
-                has_relevant_files = True
-                break
-        if has_relevant_files:
-            dir_entries.append((level, f"{indent}{basename}/", root))
-            max_level = max(max_level, level)
-            subindent = "    " * (level + 1)
-            for file in files:
-                if file.endswith(tuple(extensions_list)):
-                    dir_entries.append((level + 1, f"{subindent}{file}", os.path.join(root, file)))
-                    max_level = max(max_level, level + 1)
-    # Second pass: apply length limiting by progressively removing deeper levels
-    current_level_limit = max_level
-    while current_level_limit >= 0:
-        # Filter entries up to current level limit
-        filtered_entries = [(level, line, path) for level, line, path in dir_entries if level <= current_level_limit]
-        # Check if we need to add truncation indicators
-        truncated_dirs = set()
-        for level, line, path in dir_entries:
-            if level == current_level_limit + 1:
-                # Find the actual parent directory by comparing paths
-                parent_path = os.path.dirname(path)
-                for parent_level, parent_line, parent_path_check in filtered_entries:
-                    if parent_path_check == parent_path and parent_line.endswith("/"):
-                        truncated_dirs.add(parent_line)
-                        break
-        # Add truncation indicators
-        final_entries = []
-        for level, line, path in filtered_entries:
-            final_entries.append(line)
-            if line in truncated_dirs:
-                truncation_indent = "    " * (level + 1)
-                final_entries.append(f"{truncation_indent}...")
-        if len(final_entries) <= max_lines:
-            output_text = final_entries
+    # One bottom-up pass over the shared, mtime-validated index; .gitignore'd paths are skipped
+    dir_entries = get_index().relevant_tree(start_path, extensions_list)
+    # Lines shown when levels deeper than L are cut: entries up to L, plus a "..." under
+    # each directory at L that has entries (it has one if the next entry is a level deeper)
+    entries_at_level = Counter(level for level, _, _, _ in dir_entries)
+    truncated_at_level = Counter(
+        level for index, (level, _, _, _) in enumerate(dir_entries[:-1]) if dir_entries[index + 1][0] == level + 1
+    )
+    max_level = max(entries_at_level, default=0)
+    level_limit = -1
+    shown = 0
+    for level in range(max_level + 1):
+        shown += entries_at_level[level]
+        if max_lines is not None and shown + truncated_at_level[level] > max_lines:
             break
-        current_level_limit -= 1
-    else:
+        level_limit = level
+    if level_limit < 0:
         output_text = [
             f"Project too large (>{max_lines} lines). Showing root level only:",
             f"{os.path.basename(start_path) or start_path}/",
             "    ...",
         ]
+    else:
+        output_text = []
+        for index, (level, name, path, is_dir) in enumerate(dir_entries):
+            if level > level_limit:
+                continue
+            output_text.append("    " * level + (f"{name}/" if is_dir else name))
+            if level == level_limit and index + 1 < len(dir_entries) and dir_entries[index + 1][0] == level + 1:
+                output_text.append("    " * (level + 1) + "...")
     if output_file is not None:
         with open(output_file, "w") as file:
             file.write("\n".join(output_text))
@@ -6,6 +6,7 @@ import textwrap
 import time
 
 from bots.dev.decorators import toolify
+from bots.utils import interpreter_pool
 from bots.utils.helpers import _py_ast_to_source
 
 
@@ -22,7 +23,8 @@ def _get_unique_filename(base_name, extension=""):
 def execute_python(code: str, timeout: int = 300) -> str:
     """
     Executes python code in a stateless environment with cross-platform
-    timeout handling.
+    timeout handling. Runs in a warm worker process when
+    bots.utils.interpreter_pool is enabled.
     Parameters:
     - code (str): Syntactically correct python code
     - timeout (int): Maximum execution time in seconds (default: 300)
@@ -31,8 +33,7 @@ def execute_python(code: str, timeout: int = 300) -> str:
     """
 
     def create_wrapper_ast():
-        wrapper_code = textwrap.dedent(
-            """
+        wrapper_code = textwrap.dedent("""
             import os
             import sys
             import traceback
@@ -54,8 +55,7 @@ def execute_python(code: str, timeout: int = 300) -> str:
                     print(f"An error occurred: {str(error)}", file=sys.stderr)
                     traceback.print_exc(file=sys.stderr)
                     sys.exit(1)
-            """
-        )
+            """)
         return ast.parse(wrapper_code)
 
     def insert_code_into_wrapper(wrapper_ast, code_ast, timeout_value):
@@ -76,6 +76,12 @@ def execute_python(code: str, timeout: int = 300) -> str:
     wrapper_ast = create_wrapper_ast()
     combined_ast = insert_code_into_wrapper(wrapper_ast, code_ast, timeout)
     final_code = _py_ast_to_source(combined_ast)
+    if interpreter_pool.get_config().enabled:
+        # Warm worker interpreter: no script file and no interpreter start-up
+        returncode, stdout, stderr = interpreter_pool.get_pool().run(final_code, timeout)
+        if returncode != 0:
+            return stderr or "Process failed with no error message"
+        return stdout + stderr
     # Use system temp directory instead of creating our own scripts directory
     temp_file_name = os.path.join(tempfile.gettempdir(), _get_unique_filename("temp_script", "py"))
 
@@ -86,14 +86,11 @@ def branch_self(
 ) -> str:
     """Create multiple conversation branches to explore different approaches or tackle separate tasks.
 
-    Creates isolated conversation branches using deepcopy:
-    1. Deepcopy current bot state (uses __getstate__/__setstate__ for proper serialization)
+    Creates isolated conversation branches using Bot.fork():
+    1. Fork the current bot (shares history and tools, fresh mailbox and tool state)
     2. Execute each branch with independent bot instances
     3. Stitch results back into main conversation tree
 
-    Note: Uses deepcopy with __getstate__/__setstate__ which leverages the hybrid
-    serialization strategy (source code + dill for helpers). See bots/foundation/tool_handling.md.
-
     Args:
         self_prompts (str): List of prompts as a string array, like ['task 1', 'task 2', 'task 3']
                            Each prompt becomes a separate conversation branch
@@ -106,7 +103,6 @@ def branch_self(
     Returns:
         str: Success message with branch count, or error details if something went wrong
     """
-    import copy
     import threading
     import warnings
     from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -214,18 +210,14 @@ def branch_self(
             def execute_branch(prompt, idx):
                 """Execute a single branch and return the response, node, and index."""
                 try:
-                    # Create a deep copy of the bot for this branch
-                    branch_bot = copy.deepcopy(bot)
+                    # Fork the bot for this branch (history and tools are shared, tool state is fresh)
+                    branch_bot = bot.fork()
                     branch_bot.autosave = False
 
-                    # Callbacks are preserved by deepcopy
-                    # Store the branching point (branch_bot.conversation is at same point as bot.conversation)
+                    # Callbacks are preserved by fork
+                    # Store the branching point (branch_bot.conversation is a copy of bot.conversation)
                     branching_node = branch_bot.conversation
 
-                    # Ensure clean tool handler state for branch
-                    if hasattr(branch_bot, "tool_handler") and branch_bot.tool_handler:
-                        branch_bot.tool_handler.clear()
-
                     if allow_work:
                         # Use iterative approach for work
                         response = branch_bot.respond(prompt)
@@ -1,15 +1,23 @@
 import codecs
+import fnmatch
+import functools
 import glob
 import logging
 import os
+import re
+import selectors
+import shutil
+import signal
 import subprocess
 import threading
 import time
 import traceback
+import uuid
+from collections import Counter
 from datetime import datetime
 from queue import Empty, Queue
 from threading import Lock, Thread, local
-from typing import Dict, Generator, List
+from typing import Dict, Generator, List, Tuple
 
 from bots.dev.decorators import log_errors, toolify
 
@@ -149,6 +157,49 @@ class BOMRemover:
             logger.exception("Unexpected error removing BOMs from directory %s", directory)
             raise
 
+    @staticmethod
+    def snapshot_directory(directory: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Record the modification time and size of each file directly in a directory.
+
+        Args:
+            directory: Directory path to snapshot
+
+        Returns:
+            Dict[str, Tuple[int, int]]: File path to (st_mtime_ns, st_size); empty if unreadable
+        """
+        snapshot = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return snapshot
+
+    @staticmethod
+    def remove_bom_from_changed_files(directory: str, snapshot: Dict[str, Tuple[int, int]]) -> int:
+        """
+        Remove BOMs from files in a directory that are new or modified since a snapshot.
+
+        Args:
+            directory: Directory path to process (not recursive)
+            snapshot: Earlier snapshot_directory() result
+
+        Returns:
+            int: Number of files with BOMs removed
+        """
+        bom_count = 0
+        for file_path, state in BOMRemover.snapshot_directory(directory).items():
+            if snapshot.get(file_path) != state and BOMRemover.remove_bom_from_file(file_path):
+                bom_count += 1
+        return bom_count
+
     @staticmethod
     def remove_bom_from_pattern(pattern: str) -> int:
         """
@@ -201,6 +252,36 @@ def execute_powershell(command: str, output_length_limit: str = "1000", timeout:
     return output
 
 
+@log_errors
+@toolify()
+def execute_bash(command: str, output_length_limit: str = "1000", timeout: str = "60") -> str:
+    """
+    Executes shell commands in a stateful bash session (sh if bash is missing)
+
+    Use on Linux and macOS to run shell commands and capture their output.
+    The session persists between calls, so cd, export and source carry over.
+    Each command's stdin is /dev/null, so interactive prompts get EOF instead
+    of hanging.
+
+    Potential use cases:
+    - git commands
+    - gh cli
+    - build and test commands
+    - other cli (which you may need to install using this tool)
+
+    Parameters:
+    - command (str): Shell command(s) to execute.
+    - output_length_limit (int, optional): Maximum number of lines in the output.
+      If set, output exceeding this limit will be truncated. Default 1000.
+    - timeout (int, optional): Seconds to wait before the session is killed. Default 60.
+
+        Returns:
+        str: The output of the command, its stderr output and its exit code if not 0
+    """
+    manager = BashManager.get_instance()
+    return manager.execute(command, int(output_length_limit), float(timeout))
+
+
 class PowerShellSession:
     """
     Manages a persistent PowerShell process for stateful command execution.
@@ -409,32 +490,26 @@ class PowerShellSession:
             file_operations.append("file_manipulation")
         return file_operations
 
-    def _post_execution_bom_cleanup(self, code: str, current_dir: str) -> int:
+    def _post_execution_bom_cleanup(self, current_dir: str, snapshot: Dict[str, Tuple[int, int]]) -> int:
         """
-        Perform BOM cleanup after command execution based on what the command did.
+        Remove BOMs from the files a command created or modified.
+
+        Only files directly in current_dir whose modification time or size
+        differs from the snapshot taken before the command are opened, so
+        commands that write nothing cost a single directory listing.
 
         Args:
-            code: The executed PowerShell code
-            current_dir: Current working directory
+            current_dir: Working directory after the command
+            snapshot: BOMRemover.snapshot_directory() of the directory the
+                command started in
 
         Returns:
             int: Number of files cleaned
         """
-        file_operations = self._detect_file_operations(code)
-        if not file_operations:
-            return 0  # bom_count = 0
-        bom_count = 0
         try:
-            bom_count += self._bom_remover.remove_bom_from_directory(current_dir, recursive=False)
-            if any(("Export-" in op for op in file_operations)):
-                bom_count += self._bom_remover.remove_bom_from_pattern(os.path.join(current_dir, "*.csv"))
-                bom_count += self._bom_remover.remove_bom_from_pattern(os.path.join(current_dir, "*.json"))
-                bom_count += self._bom_remover.remove_bom_from_pattern(os.path.join(current_dir, "*.xml"))
-            if any(("redirection" in op for op in file_operations)):
-                bom_count += self._bom_remover.remove_bom_from_pattern(os.path.join(current_dir, "*.txt"))
-                bom_count += self._bom_remover.remove_bom_from_pattern(os.path.join(current_dir, "*.log"))
+            return self._bom_remover.remove_bom_from_changed_files(current_dir, snapshot)
         except Exception:
-            pass  # if bom_count > 0:        return bom_count
+            return 0
 
     def execute(self, code: str, timeout: float = 60) -> str:
         """
@@ -458,6 +533,9 @@ class PowerShellSession:
             self._command_counter += 1
             delimiter = f"<<<COMMAND_{self._command_counter}_COMPLETE>>>"
             wrapped_code = self._wrap_code_safely(code, delimiter)
+            # Only commands that look like they write files pay for the snapshot
+            start_dir = self._current_directory
+            snapshot = BOMRemover.snapshot_directory(start_dir) if self._detect_file_operations(code) else None
             while not self._output_queue.empty():
                 self._output_queue.get_nowait()
             while not self._error_queue.empty():
@@ -506,7 +584,9 @@ class PowerShellSession:
                     line = self._output_queue.get(timeout=0.1)
                     if line is None:
                         raise Exception("PowerShell process closed stdout")
-                    if line == delimiter:
+                    if line == delimiter or line.startswith(delimiter + " "):
+                        # The delimiter frame carries the working directory after the command
+                        self._current_directory = line[len(delimiter) :].strip() or self._current_directory
                         done = True
                     else:
                         output_lines.append(line)
@@ -531,58 +611,19 @@ class PowerShellSession:
                 error_lines = [line for line in error_output if line.strip()]
                 if error_lines:
                     all_output.extend(["", "Errors:", *error_lines])
-            try:
-                current_dir = self._get_current_directory()
-                truncated_code = code[:30] + "..." if len(code) > 30 else code
-                dir_info = f"{current_dir}> {truncated_code}"
-                bom_count = self._post_execution_bom_cleanup(code, current_dir)
+            current_dir = self._current_directory
+            truncated_code = code[:30] + "..." if len(code) > 30 else code
+            dir_info = f"{current_dir}> {truncated_code}"
+            if snapshot is not None:
+                bom_count = self._post_execution_bom_cleanup(current_dir, snapshot if current_dir == start_dir else {})
                 if bom_count > 0:
                     dir_info += f" [BOM cleanup: {bom_count} files processed]"
-                if all_output:
-                    all_output.insert(0, dir_info)
-                else:
-                    all_output = [dir_info]
-            except Exception:
-                pass  # If we can't get directory, continue without it
+            all_output.insert(0, dir_info)
             return "\n".join(all_output)
         except Exception as e:
             self.__exit__(type(e), e, e.__traceback__)
             raise
 
-    def _get_current_directory(self) -> str:
-        """Get the current directory from the PowerShell session."""
-        if not self._process:
-            return "unknown"
-        try:
-            temp_counter = self._command_counter + 1000  # Use different counter to avoid conflicts
-            delimiter = f"<<<DIR_QUERY_{temp_counter}_COMPLETE>>>"
-            while not self._output_queue.empty():
-                try:
-                    self._output_queue.get_nowait()
-                except Exception:
-                    break
-            dir_command = f"(Get-Location).Path; Write-Output '{delimiter}'"
-            self._process.stdin.write(dir_command + "\n")
-            self._process.stdin.flush()
-            start_time = time.time()
-            result_lines = []
-            while time.time() - start_time < 2:  # 2 second timeout
-                try:
-                    line = self._output_queue.get(timeout=0.1)
-                    if line == delimiter:
-                        break
-                    elif line and line.strip():
-                        result_lines.append(line.strip())
-                except Exception:
-                    continue
-            for line in result_lines:
-                if line and (not line.startswith("PS ")) and (":\\" in line or line.startswith("/")):
-                    self._current_directory = line
-                    return line
-            return self._current_directory
-        except Exception:
-            return self._current_directory
-
     def _wrap_code_safely(self, code: str, delimiter: str) -> str:
         """
         Safely wrap code for execution, handling complex strings and
@@ -593,9 +634,8 @@ class PowerShellSession:
 # Execute in main scope
 {code}
 
-# Collect output after execution
-# Send completion delimiter
-Write-Output '{delimiter}'"""
+# Send completion delimiter with the working directory
+Write-Output ('{delimiter} ' + (Get-Location).Path)"""
 
 
 class PowerShellManager:
@@ -674,10 +714,9 @@ class PowerShellManager:
             if not hasattr(self._thread_local, "session"):
                 return False
             session = self._thread_local.session
-            if not session._process or session._process.poll() is not None:
-                return False
-            test_output = session.execute("Write-Output 'test'", timeout=5)
-            return "test" in test_output
+            # A dead process is the only failure detected here; a probe command would
+            # cost a round trip per command, and a hung session is caught by the timeout
+            return bool(session._process) and session._process.poll() is None
         except Exception as e:
             print(f"Session validation failed: {str(e)}")
             return False
@@ -706,27 +745,7 @@ class PowerShellManager:
             try:
                 processed_code = _process_commands(code)
                 output = self.session.execute(processed_code, timeout)
-                if output_length_limit is not None and output:
-                    output_length_limit_int = int(output_length_limit)
-                    lines = output.splitlines()
-                    if len(lines) > output_length_limit_int:
-                        half_limit = output_length_limit_int // 2
-                        start_lines = lines[:half_limit]
-                        end_lines = lines[-half_limit:]
-                        lines_omitted = len(lines) - output_length_limit_int
-                        truncated_output = "\n".join(start_lines)
-                        truncated_output += f"\n\n... {lines_omitted} lines omitted ...\n\n"
-                        truncated_output += "\n".join(end_lines)
-                        output_file = os.path.join(os.getcwd(), f"ps_output_{self.bot_id}.txt")
-                        with open(output_file, "w", encoding="utf-8", errors="replace", newline="") as f:
-                            f.write(output)
-                        BOMRemover.remove_bom_from_file(output_file)
-                        truncated_output += f"\nFull output saved to {output_file}"
-                        yield truncated_output
-                    else:
-                        yield output
-                else:
-                    yield output
+                yield _limit_output(output, output_length_limit, f"ps_output_{self.bot_id}.txt")
                 break
             except Exception as e:
                 retry_count += 1
@@ -750,6 +769,261 @@ class PowerShellManager:
                 delattr(self._thread_local, "session")
 
 
+class BashSession:
+    """
+    Manages a persistent POSIX shell (bash, or sh where bash is missing) for
+    stateful command execution on Linux and macOS.
+
+    Like PowerShellSession, the process persists between commands, so
+    directory changes, exported variables and activated virtual environments
+    carry over. Output is read with a selector as soon as it arrives, and a
+    command is complete when the per-command delimiter (which also carries the
+    exit status and working directory) has appeared on both stdout and
+    stderr, so there is no polling interval and no extra round-trip.
+
+    Each command runs through eval with stdin from /dev/null, so syntax errors
+    are reported like any other failure and commands waiting for input get EOF
+    instead of consuming later commands.
+    """
+
+    def __init__(self, shell: str = None, cwd: str = None):
+        self.shell = shell or shutil.which("bash") or shutil.which("sh")
+        if not self.shell:
+            raise RuntimeError("No bash or sh executable found")
+        self.cwd = cwd or os.getcwd()
+        self._process = None
+        self._selector = None
+        self._command_counter = 0
+        self._current_directory = self.cwd
+        # bash reads the heredoc with a builtin; plain sh needs cat
+        if os.path.basename(self.shell) == "bash":
+            self._read_code = "IFS= read -r -d '' __bots_code <<'{eof}'\n{code}\n{eof}\n"
+        else:
+            self._read_code = "__bots_code=$(cat <<'{eof}'\n{code}\n{eof}\n)\n"
+
+    def __enter__(self):
+        if not self._process:
+            env = os.environ.copy()
+            env["PYTHONIOENCODING"] = "utf-8"
+            args = [self.shell, "--noprofile", "--norc"] if os.path.basename(self.shell) == "bash" else [self.shell]
+            self._process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self.cwd,
+                env=env,
+                bufsize=0,
+                start_new_session=True,  # Own process group, so a timeout also stops its children
+            )
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._process.stdout, selectors.EVENT_READ, "stdout")
+            self._selector.register(self._process.stderr, selectors.EVENT_READ, "stderr")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._process:
+            try:
+                os.killpg(self._process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+            try:
+                self._process.wait(timeout=5)
+            except Exception:
+                self._process.kill()
+            finally:
+                self._selector.close()
+                for stream in (self._process.stdin, self._process.stdout, self._process.stderr):
+                    try:
+                        stream.close()
+                    except Exception:
+                        pass
+                self._process = None
+                self._selector = None
+
+    def _wrap_code(self, code: str, delimiter: str) -> str:
+        """Wrap code so the shell reports completion, exit status and directory."""
+        return (
+            self._read_code.format(eof=f"__BOTS_EOF_{delimiter}__", code=code)
+            + 'eval "$__bots_code" < /dev/null\n'
+            + "__bots_status=$?\n"
+            + f'printf \'\\n{delimiter} %d %s\\n\' "$__bots_status" "$PWD"\n'
+            + f"printf '\\n{delimiter}\\n' >&2\n"
+        )
+
+    def execute(self, code: str, timeout: float = 60) -> str:
+        """
+        Execute shell code and return its complete output.
+
+        Args:
+            code: The shell code to execute
+            timeout: Maximum time in seconds to wait for command completion
+
+        Returns:
+            The working directory and command, the output, any stderr output
+            and the exit status if it is not zero
+
+        Raises:
+            Exception if the process is not running or exits during the command
+            TimeoutError if command execution exceeds timeout (includes partial output)
+        """
+        if not self._process:
+            raise Exception("Shell process is not running")
+        try:
+            self._command_counter += 1
+            delimiter = f"BOTS_COMMAND_{self._command_counter}_{uuid.uuid4().hex}_COMPLETE"
+            marker = delimiter.encode("ascii")
+            self._process.stdin.write(self._wrap_code(code, delimiter).encode("utf-8"))
+            self._process.stdin.flush()
+            buffers = {"stdout": bytearray(), "stderr": bytearray()}
+            found = {"stdout": -1, "stderr": -1}
+            deadline = time.monotonic() + timeout
+            while found["stderr"] < 0 or found["stdout"] < 0 or buffers["stdout"].find(b"\n", found["stdout"]) < 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(self._timeout_message(timeout, buffers))
+                for key, _ in self._selector.select(remaining):
+                    name = key.data
+                    chunk = os.read(key.fileobj.fileno(), 65536)
+                    if not chunk:
+                        raise Exception(f"Shell process unexpectedly closed (exit code {self._process.wait()})")
+                    buffer = buffers[name]
+                    search_from = max(0, len(buffer) - len(marker))
+                    buffer += chunk
+                    if found[name] < 0:
+                        found[name] = buffer.find(marker, search_from)
+            status_line = buffers["stdout"][found["stdout"] + len(marker) :].decode("utf-8", errors="replace")
+            status, _, self._current_directory = status_line.strip().partition(" ")
+            output = self._decode_before(buffers["stdout"], found["stdout"])
+            errors = self._decode_before(buffers["stderr"], found["stderr"])
+            truncated_code = code[:30] + "..." if len(code) > 30 else code
+            all_output = [f"{self._current_directory}$ {truncated_code}"]
+            if output:
+                all_output.append(output)
+            if errors:
+                all_output.extend(["", "Errors:", errors])
+            if status != "0":
+                all_output.append(f"Exit code: {status}")
+            return "\n".join(all_output)
+        except Exception as e:
+            self.__exit__(type(e), e, e.__traceback__)
+            raise
+
+    @staticmethod
+    def _decode_before(buffer: bytearray, index: int) -> str:
+        """Decode the output before the delimiter, minus the newline printed ahead of it."""
+        output = buffer[:index]
+        if output.endswith(b"\n"):
+            output = output[:-1]
+        return output.decode("utf-8", errors="replace").rstrip("\n")
+
+    @staticmethod
+    def _timeout_message(timeout: float, buffers: Dict[str, bytearray]) -> str:
+        output_lines = buffers["stdout"].decode("utf-8", errors="replace").splitlines()
+        error_lines = buffers["stderr"].decode("utf-8", errors="replace").splitlines()
+        timeout_msg = f"\n{'='*60}\nTIMEOUT after {timeout} seconds\n{'='*60}\n"
+        timeout_msg += f"\nPartial output collected ({len(output_lines)} lines):\n"
+        timeout_msg += "-" * 60 + "\n"
+        timeout_msg += "".join(f"{line}\n" for line in output_lines)
+        if error_lines:
+            timeout_msg += "\n" + "-" * 60 + "\n"
+            timeout_msg += f"Errors collected ({len(error_lines)} lines):\n"
+            timeout_msg += "-" * 60 + "\n"
+            timeout_msg += "".join(f"{line}\n" for line in error_lines)
+        timeout_msg += "=" * 60 + "\n"
+        return timeout_msg
+
+
+class BashManager:
+    """
+    Thread-safe shell session manager, the POSIX counterpart of
+    PowerShellManager.
+    Each bot_id (the thread name by default) gets one manager, and each thread
+    using it gets its own BashSession. A session whose process has exited is
+    replaced on the next command.
+    """
+
+    _instances: Dict[str, "BashManager"] = {}
+    _lock = Lock()
+
+    @classmethod
+    def get_instance(cls, bot_id: str = None) -> "BashManager":
+        """
+        Get or create a shell manager instance for the given bot_id.
+        If no bot_id is provided, uses the current thread name.
+
+        Args:
+            bot_id: Optional identifier for the bot instance
+
+        Returns:
+            The shell manager instance for this bot/thread
+        """
+        if bot_id is None:
+            bot_id = threading.current_thread().name
+        with cls._lock:
+            if bot_id not in cls._instances:
+                instance = cls.__new__(cls)
+                instance.bot_id = bot_id
+                instance._thread_local = local()
+                instance.created_at = datetime.now()
+                cls._instances[bot_id] = instance
+            return cls._instances[bot_id]
+
+    def __init__(self):
+        """
+        Private initializer - use get_instance() instead.
+        """
+        raise RuntimeError("Use BashManager.get_instance() to create or get a shell manager")
+
+    @property
+    def session(self) -> BashSession:
+        """
+        Get the shell session for the current thread, starting a new one if
+        none exists or its process has exited.
+        """
+        if not self._is_session_valid():
+            self.cleanup()
+            self._thread_local.session = BashSession().__enter__()
+        return self._thread_local.session
+
+    def _is_session_valid(self) -> bool:
+        """Checks that the current thread has a session whose process is running."""
+        session = getattr(self._thread_local, "session", None)
+        return session is not None and session._process is not None and session._process.poll() is None
+
+    def execute(self, code: str, output_length_limit: str = "60", timeout: float = 60) -> str:
+        """
+        Execute shell code in the session.
+
+        Args:
+            code: Shell code to execute
+            output_length_limit: Maximum number of lines in output
+            timeout: Maximum time in seconds to wait for command completion
+
+        Returns:
+            The command output, or an error report if the command failed to complete
+        """
+        try:
+            output = self.session.execute(code, timeout)
+        except Exception as e:
+            error_message = f"Tool Failed: {str(e)}\n"
+            error_message += f"Traceback:\n{''.join(traceback.format_tb(e.__traceback__))}"
+            return error_message
+        return _limit_output(output, output_length_limit, f"sh_output_{self.bot_id}.txt")
+
+    def cleanup(self):
+        """
+        Clean up the shell session for the current thread.
+        """
+        if hasattr(self._thread_local, "session"):
+            try:
+                self._thread_local.session.__exit__(None, None, None)
+            except Exception as e:
+                print(f"Error during session cleanup: {str(e)}")
+            finally:
+                delattr(self._thread_local, "session")
+
+
 def _get_active_sessions() -> list:
     """
     Get information about all active PowerShell sessions.
@@ -774,6 +1048,42 @@ def _get_active_sessions() -> list:
     return sessions
 
 
+def _limit_output(output: str, output_length_limit, file_name: str) -> str:
+    """
+    Truncate output to its first and last lines if it exceeds the limit.
+
+    The full output is saved to file_name in the current directory and the
+    truncated text says where.
+
+        Args:
+        output (str): Complete command output
+        output_length_limit: Maximum number of lines, or None for no limit
+        file_name (str): Name of the file receiving the full output
+
+        Returns:
+        str: The output, or its truncated form
+    """
+    if output_length_limit is None or not output:
+        return output
+    output_length_limit_int = int(output_length_limit)
+    lines = output.splitlines()
+    if len(lines) <= output_length_limit_int:
+        return output
+    half_limit = output_length_limit_int // 2
+    start_lines = lines[:half_limit]
+    end_lines = lines[-half_limit:]
+    lines_omitted = len(lines) - output_length_limit_int
+    truncated_output = "\n".join(start_lines)
+    truncated_output += f"\n\n... {lines_omitted} lines omitted ...\n\n"
+    truncated_output += "\n".join(end_lines)
+    output_file = os.path.join(os.getcwd(), file_name)
+    with open(output_file, "w", encoding="utf-8", errors="replace", newline="") as f:
+        f.write(output)
+    BOMRemover.remove_bom_from_file(output_file)
+    truncated_output += f"\nFull output saved to {output_file}"
+    return truncated_output
+
+
 def _process_commands(code: str) -> str:
     """
     Process PowerShell commands separated by &&, ensuring each command only
@@ -1032,33 +1342,102 @@ def _generate_byte_mojibake_map():
     return byte_map
 
 
+class _MojibakeMatcher:
+    """
+    Replaces every pattern of a mojibake map in one left-to-right pass.
+
+    All patterns are compiled into a single regex alternation, longest
+    first, so each position takes the longest matching pattern and the cost
+    is linear in the length of the input rather than patterns × input.
+    Works on str or bytes, matching the type of the map's keys.
+    """
+
+    def __init__(self, mojibake_map: dict):
+        self.mojibake_map = mojibake_map
+        patterns = sorted(mojibake_map, key=len, reverse=True)
+        self.pattern = None
+        if patterns:
+            separator = b"|" if isinstance(patterns[0], bytes) else "|"
+            self.pattern = re.compile(separator.join(map(re.escape, patterns)))
+
+    def repair(self, data):
+        """
+        Replace all mojibake in data.
+
+            Returns:
+            tuple: (repaired, replacement_count, counts) where counts maps each
+            mojibake pattern found to its number of occurrences
+        """
+        counts = Counter()
+        if self.pattern is None:
+            return data, 0, counts
+
+        def replace(match):
+            counts[match.group()] += 1
+            return self.mojibake_map[match.group()]
+
+        repaired = self.pattern.sub(replace, data)
+        return repaired, sum(counts.values()), counts
+
+
+@functools.lru_cache(maxsize=None)
+def _mojibake_matchers() -> tuple:
+    """
+    Build the mojibake matchers once per process.
+
+        Returns:
+        tuple: (text_matcher, byte_matcher, detector), where detector is a
+        compiled bytes regex matching the UTF-8 form of any pattern of either map
+    """
+    text_map = _generate_mojibake_map()
+    byte_map = _generate_byte_mojibake_map()
+    encoded = {pattern.encode("utf-8") for pattern in text_map} | set(byte_map)
+    detector = re.compile(b"|".join(map(re.escape, sorted(encoded, key=len, reverse=True))))
+    return _MojibakeMatcher(text_map), _MojibakeMatcher(byte_map), detector
+
+
 def _repair_mojibake_in_text(text: str, mojibake_map: dict = None) -> tuple:
     """
     Repair mojibake characters in text.
 
         Args:
         text: Text potentially containing mojibake
-        mojibake_map: Optional pre-generated mojibake mapping
+        mojibake_map: Optional mojibake mapping; defaults to the cached common map
 
         Returns:
         tuple: (repaired_text, replacement_count, replacements_made)
     """
-    if mojibake_map is None:
-        mojibake_map = _generate_mojibake_map()
+    matcher = _mojibake_matchers()[0] if mojibake_map is None else _MojibakeMatcher(mojibake_map)
+    repaired, replacement_count, counts = matcher.repair(text)
+    replacements_made = {mojibake: (matcher.mojibake_map[mojibake], count) for mojibake, count in counts.items()}
+    return repaired, replacement_count, replacements_made
 
-    repaired = text
-    replacement_count = 0
-    replacements_made = {}
 
-    # Sort by length (longest first) to handle overlapping patterns
-    for mojibake, correct in sorted(mojibake_map.items(), key=lambda x: len(x[0]), reverse=True):
-        if mojibake in repaired:
-            count = repaired.count(mojibake)
-            repaired = repaired.replace(mojibake, correct)
-            replacement_count += count
-            replacements_made[mojibake] = (correct, count)
+def _repair_mojibake_in_bytes(original_bytes: bytes) -> tuple:
+    """
+    Repair byte-level (double-encoded) and then text-level mojibake in UTF-8 content.
 
-    return repaired, replacement_count, replacements_made
+        Args:
+        original_bytes: File content, which must be valid UTF-8
+
+        Returns:
+        tuple: (repaired_text, byte_replacements_made, text_replacements_made),
+        the replacements mapping each mojibake string to (correct, count)
+
+        Raises:
+        UnicodeDecodeError: If original_bytes is not valid UTF-8
+    """
+    text_matcher, byte_matcher, detector = _mojibake_matchers()
+    if detector.search(original_bytes) is None:
+        return original_bytes.decode("utf-8"), {}, {}
+    repaired_bytes, _, byte_counts = byte_matcher.repair(original_bytes)
+    byte_replacements_made = {}
+    for mojibake_bytes, count in byte_counts.items():
+        mojibake_str = mojibake_bytes.decode("utf-8", errors="replace")
+        correct_str = byte_matcher.mojibake_map[mojibake_bytes].decode("utf-8", errors="replace")
+        byte_replacements_made[mojibake_str] = (correct_str, count)
+    repaired_text, _, text_replacements_made = _repair_mojibake_in_text(repaired_bytes.decode("utf-8"))
+    return repaired_text, byte_replacements_made, text_replacements_made
 
 
 @toolify()
@@ -1097,47 +1476,14 @@ def repair_mojibake(file_path: str, backup: str = "true") -> str:
         except Exception as e:
             return f"Error reading file: {str(e)}"
 
-        # Try to decode as UTF-8 to verify it's a text file
+        # Byte-level repair (for double-encoded mojibake), then text-level repair
         try:
-            original_bytes.decode("utf-8")
+            repaired_text, byte_replacements_made, text_replacements_made = _repair_mojibake_in_bytes(original_bytes)
         except UnicodeDecodeError:
             return f"Error: File {file_path} is not valid UTF-8. Cannot repair mojibake."
 
-        # Generate both text-level and byte-level mojibake maps
-        text_mojibake_map = _generate_mojibake_map()
-        byte_mojibake_map = _generate_byte_mojibake_map()
-
-        # First try byte-level repair (for double-encoded mojibake)
-        repaired_bytes = original_bytes
-        byte_replacement_count = 0
-        byte_replacements_made = {}
-
-        for mojibake_bytes, correct_bytes in sorted(byte_mojibake_map.items(), key=lambda x: len(x[0]), reverse=True):
-            if mojibake_bytes in repaired_bytes:
-                count = repaired_bytes.count(mojibake_bytes)
-                repaired_bytes = repaired_bytes.replace(mojibake_bytes, correct_bytes)
-                byte_replacement_count += count
-                # Store as strings for display
-                try:
-                    mojibake_str = mojibake_bytes.decode("utf-8", errors="replace")
-                    correct_str = correct_bytes.decode("utf-8", errors="replace")
-                    byte_replacements_made[mojibake_str] = (correct_str, count)
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    pass
-
-        # Then try text-level repair (for single-encoded mojibake)
-        repaired_text = repaired_bytes.decode("utf-8")
-        text_replacement_count = 0
-        text_replacements_made = {}
-
-        for mojibake, correct in sorted(text_mojibake_map.items(), key=lambda x: len(x[0]), reverse=True):
-            if mojibake in repaired_text:
-                count = repaired_text.count(mojibake)
-                repaired_text = repaired_text.replace(mojibake, correct)
-                text_replacement_count += count
-                text_replacements_made[mojibake] = (correct, count)
-
-        total_replacements = byte_replacement_count + text_replacement_count
+        total_replacements = sum(count for _, count in byte_replacements_made.values())
+        total_replacements += sum(count for _, count in text_replacements_made.values())
 
         # Check if any repairs were made
         if total_replacements == 0:
@@ -1152,9 +1498,9 @@ def repair_mojibake(file_path: str, backup: str = "true") -> str:
             except Exception as e:
                 return f"Error creating backup: {str(e)}"
 
-        # Write repaired content
+        # Write repaired content, keeping its line endings
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
+            with open(file_path, "w", encoding="utf-8", newline="") as f:
                 f.write(repaired_text)
         except Exception as e:
             return f"Error writing repaired file: {str(e)}"
@@ -1178,3 +1524,74 @@ def repair_mojibake(file_path: str, backup: str = "true") -> str:
 
     except Exception as e:
         return f"Error repairing mojibake: {str(e)}"
+
+
+@toolify()
+def repair_mojibake_in_directory(directory: str = ".", file_pattern: str = "*", backup: str = "false") -> str:
+    """
+    Repair mojibake in every matching UTF-8 file under a directory.
+
+    Files are processed one at a time. A file is decoded and rewritten only
+    when a single scan of its bytes finds a mojibake pattern, so the cost of
+    a run is linear in the total size of the files. Files that are not valid
+    UTF-8 are skipped, as are version control, cache and virtual environment
+    directories and this module itself (its pattern tables contain mojibake
+    on purpose).
+
+        Args:
+        directory: Root directory to walk (default: current directory)
+        file_pattern: Glob matched against file names, e.g. "*.md" (default: "*")
+        backup: Whether to create a .bak backup of each repaired file (default: "false")
+
+        Returns:
+        str: Summary of files scanned and repairs made
+
+    Example:
+        repair_mojibake_in_directory("docs", "*.md")
+    """
+    if not os.path.isdir(directory):
+        return f"Error: Directory not found: {directory}"
+    this_module = os.path.abspath(__file__)
+    scanned = 0
+    repaired_files = []
+    skipped = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in BOMRemover.SKIP_DIRS]
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not fnmatch.fnmatch(name, file_pattern) or os.path.abspath(file_path) == this_module:
+                continue
+            try:
+                with open(file_path, "rb") as f:
+                    original_bytes = f.read()
+                scanned += 1
+                repaired_text, byte_replacements_made, text_replacements_made = _repair_mojibake_in_bytes(original_bytes)
+            except UnicodeDecodeError:
+                continue
+            except OSError as e:
+                skipped.append(f"{file_path}: {str(e)}")
+                continue
+            count = sum(count for _, count in byte_replacements_made.values())
+            count += sum(count for _, count in text_replacements_made.values())
+            if count == 0:
+                continue
+            try:
+                if backup.lower() == "true":
+                    with open(file_path + ".bak", "wb") as f:
+                        f.write(original_bytes)
+                with open(file_path, "w", encoding="utf-8", newline="") as f:
+                    f.write(repaired_text)
+            except OSError as e:
+                skipped.append(f"{file_path}: {str(e)}")
+                continue
+            repaired_files.append((file_path, count))
+
+    total = sum(count for _, count in repaired_files)
+    summary = (
+        f"Repaired {total} mojibake character(s) in {len(repaired_files)} file(s); scanned {scanned} file(s) in {directory}\n"
+    )
+    for file_path, count in repaired_files:
+        summary += f"  {file_path} ({count})\n"
+    if skipped:
+        summary += "\nCould not process:\n" + "".join(f"  {line}\n" for line in skipped)
+    return summary
@@ -72,7 +72,7 @@ Answer:"""
         return True  # Skip validation on other errors
 
 
-@toolify("Perform an agentic web search using Claude's internal web search capabilities")
+@toolify("Perform an agentic web search using Claude's internal web search capabilities", parallel_safe=True)
 def web_search(question: str) -> str:
     """Perform an intelligent web search and return organized results.
 
@@ -13,6 +13,9 @@ import json
 import os
 import re
 
+from bots.foundation.bot_file import is_container
+from bots.foundation.bot_file import read as read_bot_file
+
 
 def find_tool_results(content: str) -> list[str]:
     """Find all tool result JSON-like structures in the content.
@@ -73,8 +76,12 @@ def process_bot_file(file_path: str) -> list[str]:
      'Error: Permission denied: /root/file.txt']
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        if is_container(file_path):
+            # Search the same text a JSON save would have written
+            content = json.dumps(read_bot_file(file_path), indent=1)
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
         tool_results = find_tool_results(content)
         error_messages = []
         for result in tool_results:
@@ -0,0 +1,351 @@
+"""Cached directory listings and .gitignore matching for code_tools.view_dir.
+
+view_dir used to walk the whole tree once per directory to find out whether
+anything below it was worth showing. DirectoryIndex instead computes
+relevance in one bottom-up pass and keeps each directory's listing, keyed by
+the directory's mtime, so a repeated call only stats the directories and
+re-lists the ones whose entries changed. The index is process-wide
+(get_index()), shared by every call and every bot.
+
+Relevant means: a directory is shown if it, or any directory below it,
+contains a file with one of the requested extensions, or if it contains a
+virtual environment (shown as a leaf, never scanned). Paths matched by a
+.gitignore are skipped, using the .gitignore files of the tree and of its
+ancestors up to the enclosing git repository; .git itself is always skipped.
+
+Supported .gitignore syntax: comments, "!" negation, trailing "/" for
+directories only, leading or inner "/" anchoring, and the "*", "?", "**" and
+"[...]" wildcards. A negation cannot re-include a path below an ignored
+directory, as in git.
+
+Example:
+    ```python
+    from bots.utils.directory_index import get_index
+
+    for level, name, path, is_dir in get_index().relevant_tree(".", (".py", ".md")):
+        print("    " * level + name + ("/" if is_dir else ""))
+    ```
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+VENV_NAMES = ("venv", "env", ".env")
+
+# Listings of directories modified within this many nanoseconds of the scan are not
+# cached: on filesystems with coarse timestamps a later change could keep the same mtime
+RACY_WINDOW_NS = 2_000_000_000
+
+TreeEntry = Tuple[int, str, str, bool]
+
+
+@dataclass(frozen=True)
+class Listing:
+    """Names in one directory.
+
+    Attributes:
+        mtime_ns: Directory mtime when listed
+        files: File names (including symlinks to files), sorted
+        dirs: Subdirectory names (excluding symlinks), sorted
+    """
+
+    mtime_ns: int
+    files: Tuple[str, ...]
+    dirs: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One .gitignore pattern.
+
+    Attributes:
+        base: Directory of the .gitignore, relative to the ignore root ("" for the root)
+        regex: Compiled pattern, matched in full
+        negate: Whether the pattern starts with "!"
+        dir_only: Whether the pattern ends with "/"
+        anchored: Whether the pattern is matched against the path below base
+            rather than against the name alone
+    """
+
+    base: str
+    regex: "re.Pattern[str]"
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+    def matches(self, path: str, name: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not path.startswith(self.base + "/"):
+                return False
+            path = path[len(self.base) + 1 :]
+        return self.regex.fullmatch(path if self.anchored else name) is not None
+
+
+def _translate(pattern: str) -> str:
+    """Translate a .gitignore glob into a regular expression."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        elif char == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+            continue
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def parse_gitignore(text: str, base: str = "") -> List[IgnoreRule]:
+    """Parse the contents of a .gitignore.
+
+    Args:
+        text: File contents
+        base: Directory of the file, relative to the ignore root, "/"-separated
+
+    Returns:
+        List[IgnoreRule]: Rules in file order
+    """
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if not line:
+            continue
+        rules.append(IgnoreRule(base, re.compile(_translate(line)), negate, dir_only, anchored))
+    return rules
+
+
+def is_ignored(rules: Iterable[IgnoreRule], path: str, is_dir: bool) -> bool:
+    """Return whether the last rule matching path ignores it.
+
+    Args:
+        rules: Rules from outermost to innermost .gitignore
+        path: Path relative to the ignore root, "/"-separated
+        is_dir: Whether path is a directory
+    """
+    name = path.rpartition("/")[2]
+    ignored = False
+    for rule in rules:
+        if rule.matches(path, name, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+class DirectoryIndex:
+    """Process-wide cache of directory listings and parsed .gitignore files.
+
+    Safe to use from several threads.
+
+    Args:
+        max_directories: Listings kept before the least recently used are dropped
+
+    Attributes:
+        hits: Listings served from the cache
+        misses: Listings read from disk
+    """
+
+    def __init__(self, max_directories: int = 200_000) -> None:
+        self.max_directories = max_directories
+        self.hits = 0
+        self.misses = 0
+        self._listings: "OrderedDict[str, Listing]" = OrderedDict()
+        self._ignores: Dict[Tuple[str, str], Tuple[Tuple[int, int], List[IgnoreRule]]] = {}
+        self._lock = threading.Lock()
+
+    def listing(self, path: str) -> Listing:
+        """Return the files and subdirectories of an absolute directory path.
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        mtime_ns = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._listings.get(path)
+            if cached is not None and cached.mtime_ns == mtime_ns:
+                self._listings.move_to_end(path)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        files, dirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+        listing = Listing(mtime_ns, tuple(sorted(files)), tuple(sorted(dirs)))
+        if time.time_ns() - mtime_ns > RACY_WINDOW_NS:
+            with self._lock:
+                self._listings[path] = listing
+                self._listings.move_to_end(path)
+                while len(self._listings) > self.max_directories:
+                    self._listings.popitem(last=False)
+        return listing
+
+    def gitignore(self, directory: str, base: str) -> List[IgnoreRule]:
+        """Return the rules of directory/.gitignore, re-parsed when the file changes."""
+        path = os.path.join(directory, ".gitignore")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return []
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._ignores.get((path, base))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, encoding="utf-8", errors="replace") as file:
+                rules = parse_gitignore(file.read(), base)
+        except OSError:
+            return []
+        with self._lock:
+            self._ignores[(path, base)] = (stamp, rules)
+        return rules
+
+    def _ancestor_rules(self, root: str) -> Tuple[str, List[IgnoreRule]]:
+        """Find the enclosing git repository of root and the rules of its .gitignore files above root.
+
+        Returns:
+            Tuple of root's path relative to the repository ("" if root is the
+            repository or is not in one) and the ancestor rules, outermost first
+        """
+        chain = []
+        current = root
+        while True:
+            if os.path.exists(os.path.join(current, ".git")):
+                break
+            parent = os.path.dirname(current)
+            if parent == current:
+                return "", []
+            chain.append(os.path.basename(current))
+            current = parent
+        rules = []
+        relative = ""
+        for name in reversed(chain):
+            rules.extend(self.gitignore(current, relative))
+            current = os.path.join(current, name)
+            relative = f"{relative}/{name}" if relative else name
+        return relative, rules
+
+    def relevant_tree(self, start_path: str, extensions: Iterable[str], respect_gitignore: bool = True) -> List[TreeEntry]:
+        """List the relevant directories and files under start_path in display order.
+
+        Args:
+            start_path: Root directory, as it should appear in returned paths
+            extensions: File name suffixes to show, e.g. (".py", ".md")
+            respect_gitignore: Whether to skip paths ignored by .gitignore files
+
+        Returns:
+            List of (level, name, path, is_dir) in pre-order: each directory is
+            followed by its files and then its subdirectories. The root is at
+            level 0 and the list is empty if nothing under it is relevant.
+        """
+        extensions = tuple(extensions)
+        root = os.path.abspath(start_path)
+        relative, rules = self._ancestor_rules(root) if respect_gitignore else ("", [])
+        entries = self._visit(root, start_path, relative, 0, rules, extensions, respect_gitignore)
+        return entries or []
+
+    def _visit(
+        self,
+        directory: str,
+        display_path: str,
+        relative: str,
+        level: int,
+        rules: List[IgnoreRule],
+        extensions: Tuple[str, ...],
+        respect_gitignore: bool,
+    ) -> Optional[List[TreeEntry]]:
+        """Return the entries of a relevant directory, or None if it is not relevant."""
+        try:
+            listing = self.listing(directory)
+        except OSError:
+            return None
+        name = os.path.basename(display_path)
+        if name in VENV_NAMES or "pyvenv.cfg" in listing.files:
+            return [(level, name, display_path, True)]
+        if respect_gitignore and ".gitignore" in listing.files:
+            rules = rules + self.gitignore(directory, relative)
+
+        def child(name: str) -> str:
+            return f"{relative}/{name}" if relative else name
+
+        files = [
+            (level + 1, file, os.path.join(display_path, file), False)
+            for file in listing.files
+            if file.endswith(extensions) and not (rules and is_ignored(rules, child(file), False))
+        ]
+        subtrees = []
+        for subdirectory in listing.dirs:
+            if respect_gitignore and (subdirectory == ".git" or (rules and is_ignored(rules, child(subdirectory), True))):
+                continue
+            subtree = self._visit(
+                os.path.join(directory, subdirectory),
+                os.path.join(display_path, subdirectory),
+                child(subdirectory),
+                level + 1,
+                rules,
+                extensions,
+                respect_gitignore,
+            )
+            if subtree:
+                subtrees.extend(subtree)
+        if not files and not subtrees:
+            return None
+        return [(level, name, display_path, True), *files, *subtrees]
+
+    def clear(self) -> None:
+        """Drop all cached listings and .gitignore rules."""
+        with self._lock:
+            self._listings.clear()
+            self._ignores.clear()
+            self.hits = self.misses = 0
+
+
+_index = DirectoryIndex()
+
+
+def get_index() -> DirectoryIndex:
+    """Return the process-wide directory index."""
+    return _index
@@ -0,0 +1,272 @@
+"""Pool of warm Python worker processes for execute_python.
+
+execute_python normally writes each snippet to a temporary script and starts
+a new ``python`` process for it, so every call pays for interpreter start-up
+and for re-importing whatever the snippet uses. With the pool enabled, a few
+worker interpreters (see interpreter_worker.py) are started ahead of time and
+take code over a pipe instead:
+
+- each run executes as ``__main__`` in a fresh namespace, in the caller's
+  current working directory and environment; stdout and stderr are captured
+  at the file descriptor level, as with a separate process
+- stdin is closed (reads get EOF), where a separate process would inherit it
+- a run that exceeds its timeout kills the worker and raises
+  subprocess.TimeoutExpired, exactly like the one-process-per-call path
+- a worker is replaced after max_runs runs, when it crashes or exits (os._exit),
+  and when a run leaves threads behind
+
+Modules imported by earlier runs stay imported in a worker until it is
+recycled, which is where the speed-up comes from; code that depends on a
+pristine interpreter should keep the pool disabled (the default).
+
+Enable it with configure(enabled=True) or the ``BOTS_PYTHON_POOL=1``
+environment variable.
+
+Example:
+    ```python
+    from bots.utils import interpreter_pool
+    from bots.tools.python_execution_tool import execute_python
+
+    interpreter_pool.configure(enabled=True, size=2, max_runs=50, preload=("json", "re"))
+    execute_python("print(sum(range(10)))")  # Runs in a warm worker
+    ```
+"""
+
+import atexit
+import json
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Optional, Tuple
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "interpreter_worker.py")
+
+
+@dataclass
+class InterpreterPoolConfig:
+    """Settings for the execute_python worker pool.
+
+    Attributes:
+        enabled: Whether execute_python uses the pool
+        size: Idle workers kept started and ready
+        max_runs: Runs after which a worker is replaced
+        python: Interpreter command for the workers
+        preload: Modules each worker imports before its first run
+    """
+
+    enabled: bool = False
+    size: int = 2
+    max_runs: int = 50
+    python: str = "python"
+    preload: Tuple[str, ...] = field(default_factory=tuple)
+
+
+_config = InterpreterPoolConfig(enabled=os.environ.get("BOTS_PYTHON_POOL", "").strip().lower() in ("1", "true", "yes"))
+_config_lock = threading.Lock()
+_pool: Optional["InterpreterPool"] = None
+
+
+def configure(
+    enabled: Optional[bool] = None,
+    size: Optional[int] = None,
+    max_runs: Optional[int] = None,
+    python: Optional[str] = None,
+    preload: Optional[Tuple[str, ...]] = None,
+) -> InterpreterPoolConfig:
+    """Update the pool settings; running workers are replaced on the next run.
+
+    Returns:
+        InterpreterPoolConfig: The active configuration
+    """
+    global _pool
+    with _config_lock:
+        if enabled is not None:
+            _config.enabled = enabled
+        if size is not None:
+            _config.size = max(0, size)
+        if max_runs is not None:
+            _config.max_runs = max(1, max_runs)
+        if python is not None:
+            _config.python = python
+        if preload is not None:
+            _config.preload = tuple(preload)
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+    return _config
+
+
+def get_config() -> InterpreterPoolConfig:
+    """Return the active configuration."""
+    return _config
+
+
+def get_pool() -> "InterpreterPool":
+    """Return the process-wide pool, starting it on first use."""
+    global _pool
+    with _config_lock:
+        if _pool is None:
+            _pool = InterpreterPool(_config.size, _config.max_runs, _config.python, _config.preload)
+        return _pool
+
+
+def shutdown() -> None:
+    """Stop all workers of the process-wide pool."""
+    global _pool
+    with _config_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown)
+
+
+class _Worker:
+    """One worker process and the thread reading its replies."""
+
+    def __init__(self, python: str, preload: Tuple[str, ...]) -> None:
+        env = os.environ.copy()
+        env["PYTHONIOENCODING"] = "utf-8"
+        self.process = subprocess.Popen(
+            [python, WORKER_SCRIPT, tempfile.gettempdir(), *preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            env=env,
+        )
+        self.runs = 0
+        self.replies: "queue.Queue[Optional[dict]]" = queue.Queue()
+        threading.Thread(target=self._read_replies, daemon=True).start()
+
+    def _read_replies(self) -> None:
+        for line in self.process.stdout:
+            self.replies.put(json.loads(line))
+        self.replies.put(None)  # The worker exited
+
+    def kill(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+
+class InterpreterPool:
+    """Runs Python source in warm worker processes.
+
+    Safe to use from several threads; each run gets a worker of its own.
+
+    Args:
+        size: Idle workers kept started and ready
+        max_runs: Runs after which a worker is replaced
+        python: Interpreter command for the workers
+        preload: Modules each worker imports before its first run
+    """
+
+    def __init__(self, size: int = 2, max_runs: int = 50, python: str = "python", preload: Tuple[str, ...] = ()) -> None:
+        self.size = size
+        self.max_runs = max_runs
+        self.python = python
+        self.preload = tuple(preload)
+        self._idle: Deque[_Worker] = deque()  # Most recently used first
+        self._busy = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._replenish()
+
+    def _replenish(self) -> None:
+        """Start workers until size exist; they boot while the caller works."""
+        with self._lock:
+            while not self._closed and len(self._idle) + self._busy < self.size:
+                self._idle.append(_Worker(self.python, self.preload))
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            self._busy += 1
+            while self._idle:
+                worker = self._idle.popleft()
+                if worker.process.poll() is None:
+                    return worker
+                worker.kill()
+        return _Worker(self.python, self.preload)
+
+    def _release(self, worker: _Worker, recycle: bool) -> None:
+        with self._lock:
+            self._busy -= 1
+            keep = not recycle and not self._closed and worker.runs < self.max_runs and len(self._idle) < self.size
+            if keep:
+                # Reused first: it has already imported what recent runs needed
+                self._idle.appendleft(worker)
+        if not keep:
+            worker.kill()
+            self._replenish()
+
+    def run(self, source: str, timeout: float, filename: Optional[str] = None) -> Tuple[int, str, str]:
+        """Run source as a script and return (returncode, stdout, stderr).
+
+        Args:
+            source: Python source, executed as __main__
+            timeout: Seconds before the worker is killed
+            filename: Script name shown in tracebacks and __file__
+
+        Raises:
+            subprocess.TimeoutExpired: If the run exceeds timeout
+        """
+        worker = self._acquire()
+        filename = filename or os.path.join(tempfile.gettempdir(), "pooled_script.py")
+        with tempfile.TemporaryDirectory(prefix="bots_pool_") as directory:
+            stdout_path, stderr_path = os.path.join(directory, "stdout"), os.path.join(directory, "stderr")
+            request = {
+                "source": source,
+                "filename": filename,
+                "cwd": os.getcwd(),
+                "env": {**os.environ, "PYTHONIOENCODING": "utf-8"},
+                "stdout": stdout_path,
+                "stderr": stderr_path,
+            }
+            recycle = True
+            try:
+                try:
+                    worker.process.stdin.write(json.dumps(request) + "\n")
+                    worker.process.stdin.flush()
+                    reply = worker.replies.get(timeout=timeout)
+                except queue.Empty:
+                    raise subprocess.TimeoutExpired(filename, timeout) from None
+                except OSError:
+                    reply = None  # The worker died before taking the request
+                worker.runs += 1
+                if reply is None:
+                    worker.kill()
+                    returncode = worker.process.returncode
+                else:
+                    returncode, recycle = reply["returncode"], reply["recycle"]
+                return returncode, self._read(stdout_path), self._read(stderr_path)
+            finally:
+                self._release(worker, recycle)
+
+    @staticmethod
+    def _read(path: str) -> str:
+        try:
+            with open(path, encoding="utf-8", errors="replace") as file:
+                return file.read()
+        except FileNotFoundError:
+            return ""
+
+    def close(self) -> None:
+        """Stop all idle workers; workers in use stop when their run ends."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, deque()
+        for worker in idle:
+            worker.kill()
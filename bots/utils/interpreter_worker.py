@@ -0,0 +1,105 @@
+"""Worker process for bots.utils.interpreter_pool; run by path, never imported.
+
+Usage: python interpreter_worker.py SCRIPT_DIR [PRELOAD_MODULE ...]
+
+Reads one JSON request per line from stdin and answers each with one JSON
+line on the original stdout:
+
+    {"source": ..., "filename": ..., "cwd": ..., "env": {...}, "stdout": path, "stderr": path}
+    {"returncode": 0, "recycle": false}
+
+The code's output goes to the two files, redirected at the file descriptor
+level so output of subprocesses and C extensions is captured too. Each
+request runs as __main__ in a fresh namespace, with the request's working
+directory and environment; sys.path and sys.argv are restored afterwards.
+A request that leaves threads running marks the worker for recycling.
+"""
+
+import sys
+
+# Running by path put this directory first on sys.path, where bots/utils/logging.py
+# would shadow the standard library; scripts get the directory they would run from
+sys.path[0] = sys.argv[1]
+
+import builtins  # noqa: E402
+import importlib  # noqa: E402
+import json  # noqa: E402
+import linecache  # noqa: E402
+import os  # noqa: E402
+import threading  # noqa: E402
+import traceback  # noqa: E402
+
+
+def _exit_code(code):
+    """Translate a SystemExit code the way the interpreter does on exit."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _redirect(fd, path):
+    target = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.dup2(target, fd)
+    os.close(target)
+
+
+def run(request, devnull):
+    """Run one request and return its exit code."""
+    source, filename = request["source"], request["filename"]
+    saved_path, saved_streams = list(sys.path), (sys.stdout, sys.stderr)
+    _redirect(1, request["stdout"])
+    _redirect(2, request["stderr"])
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = [filename]
+        # Tracebacks show source lines although the script is never written to disk
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        namespace = {"__name__": "__main__", "__file__": filename, "__builtins__": builtins}
+        exec(compile(source, filename, "exec"), namespace)
+        return 0
+    except SystemExit as exit:
+        return _exit_code(exit.code)
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        for stream in (sys.stdout, sys.stderr, *saved_streams):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        sys.stdout, sys.stderr = saved_streams
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        sys.path[:] = saved_path
+        linecache.cache.pop(filename, None)
+
+
+def main():
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    # Code reading stdin gets EOF, and stray output never reaches the reply pipe
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    for name in sys.argv[2:]:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+    for line in requests:
+        returncode = run(json.loads(line), devnull)
+        recycle = threading.active_count() > 1
+        replies.write(json.dumps({"returncode": returncode, "recycle": recycle}) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    main()
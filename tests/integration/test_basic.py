@@ -15,7 +15,7 @@ The test suite verifies:
     - Conversation flow and response validation
     - Multi-turn conversation context retention
     - Bot multiplication for parallel processing capabilities
-    - Deep copy integrity during bot multiplication
+    - Copy integrity during bot multiplication
 """
 
 import unittest
@@ -257,7 +257,7 @@ pytestmark = pytest.mark.integration
 def test_bot_multiplication() -> None:
     """Test the bot multiplication operator for parallel processing capability.
 
-    This test verifies that the __mul__ operator correctly creates deep copies
+    This test verifies that the __mul__ operator correctly creates forks
     of a Bot instance for parallel processing purposes. The test creates a bot
     with specific parameters and conversation history, then multiplies it to
     create copies.
@@ -273,8 +273,8 @@ def test_bot_multiplication() -> None:
         - Each copy is a proper instance of AnthropicBot
         - Each copy is a distinct object (not shallow copies)
         - All bot attributes are preserved in the copies
-        - Conversation history is properly deep copied
-        - Parent-child relationships in conversation trees are maintained
+        - Each copy has its own current node
+        - Earlier conversation history is shared with the original (copy-on-write)
 
     Returns:
         None
@@ -311,7 +311,7 @@ def test_bot_multiplication() -> None:
         assert copy.conversation.content == bot.conversation.content
         assert copy.conversation.role == bot.conversation.role
         assert copy.conversation.parent is not None
-        assert copy.conversation.parent is not bot.conversation.parent
+        assert copy.conversation.parent is bot.conversation.parent
 
 
 if __name__ == "__main__":
@@ -1307,6 +1307,7 @@ class TestSaveLoadAnthropic(unittest.TestCase):
             print(f"Warning: Could not clean up new_bot.bot: {e}")
         try:
             os.remove("quicksave.bot")
+            os.remove("quicksave.bot.journal")
         except Exception as e:
             print(f"Warning: Could not clean up quicksave.bot: {e}")
 
@@ -1340,11 +1341,12 @@ class TestSaveLoadAnthropic(unittest.TestCase):
         # Check that the quicksave file was created
         self.assertTrue(os.path.exists(expected_quicksave), f"Autosave should create {expected_quicksave}")
 
-        # Cleanup
-        try:
-            os.remove(expected_quicksave)
-        except Exception:
-            pass
+        # Cleanup (quicksaves also write an append-only journal next to the snapshot)
+        for path in (expected_quicksave, expected_quicksave + ".journal"):
+            try:
+                os.remove(path)
+            except Exception:
+                pass
 
         # Cleanup is handled by tearDown (removes temp_dir)
 
@@ -0,0 +1,173 @@
+"""Tests for streaming Anthropic responses with incremental tool dispatch."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from anthropic.types import TextBlock, ToolUseBlock
+
+from bots.foundation.anthropic_bots import AnthropicBot
+from bots.observability.callbacks import BotCallbacks
+
+calls = []
+
+
+def record_tool(name: str) -> str:
+    """Record when the tool ran."""
+    calls.append((name, time.perf_counter(), threading.current_thread().name))
+    return f"done {name}"
+
+
+class FakeStream:
+    """Context manager mimicking anthropic's MessageStream."""
+
+    def __init__(self, events, final_message, fail_after=None):
+        self.events = events
+        self.final_message = final_message
+        self.fail_after = fail_after
+        self.finished_at = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        for i, event in enumerate(self.events):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("connection dropped")
+            if event == "pause":
+                time.sleep(0.2)
+                continue
+            yield event
+        self.finished_at = time.perf_counter()
+
+    def get_final_message(self):
+        return self.final_message
+
+
+class DeltaRecorder(BotCallbacks):
+    def __init__(self):
+        self.deltas = []
+
+    def on_text_delta(self, text, metadata=None):
+        self.deltas.append(text)
+
+
+def _tool_block(i, name):
+    return ToolUseBlock(type="tool_use", id=f"toolu_{i}", name="record_tool", input={"name": name})
+
+
+def _message(content):
+    usage = SimpleNamespace(input_tokens=1, output_tokens=1, cache_creation_input_tokens=0, cache_read_input_tokens=0)
+    return SimpleNamespace(role="assistant", content=content, stop_reason="tool_use", usage=usage)
+
+
+def _events(blocks):
+    events = []
+    for block in blocks:
+        if block == "pause":
+            events.append("pause")
+        elif block.type == "text":
+            events.append(SimpleNamespace(type="text", text=block.text))
+            events.append(SimpleNamespace(type="content_block_stop", content_block=block))
+        else:
+            events.append(SimpleNamespace(type="content_block_stop", content_block=block))
+    return events
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls.clear()
+    bot = AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False, stream=True)
+    bot.add_tools(record_tool)
+    bot.callbacks = DeltaRecorder()
+    return bot
+
+
+def _install(bot, client):
+    return patch("bots.foundation.anthropic_bots.client_pool.get_client", return_value=client)
+
+
+class TestStreaming:
+    """Test text deltas and early tool execution."""
+
+    def test_text_deltas_reach_callback(self, bot):
+        final = _message([TextBlock(type="text", text="Hello there")])
+        client = MagicMock()
+        client.messages.stream.return_value = FakeStream(_events(final.content), final)
+
+        with _install(bot, client):
+            reply = bot.respond("hi")
+
+        assert reply == "Hello there"
+        assert bot.callbacks.deltas == ["Hello there"]
+        client.messages.create.assert_not_called()
+
+    def test_tools_start_before_stream_finishes(self, bot):
+        blocks = [TextBlock(type="text", text="Working"), _tool_block(0, "a"), "pause", _tool_block(1, "b")]
+        final = _message([b for b in blocks if b != "pause"])
+        stream = FakeStream(_events(blocks), final)
+        client = MagicMock()
+        client.messages.stream.return_value = stream
+
+        with _install(bot, client):
+            bot.respond("go")
+
+        assert [c[0] for c in calls] == ["a", "b"]
+        assert calls[0][1] < stream.finished_at
+        assert [r["content"] for r in bot.tool_handler.results] == ["done a", "done b"]
+
+    def test_no_retry_after_tools_started(self, bot):
+        blocks = [_tool_block(0, "a"), "pause", _tool_block(1, "b")]
+        client = MagicMock()
+        client.messages.stream.return_value = FakeStream(_events(blocks), None, fail_after=2)
+
+        with _install(bot, client), pytest.raises(RuntimeError, match="connection dropped"):
+            bot.respond("go")
+
+        assert client.messages.stream.call_count == 1
+        assert [c[0] for c in calls] == ["a"]
+        assert not bot.tool_handler._started
+
+    def test_non_streaming_uses_create(self, bot):
+        bot.stream = False
+        client = MagicMock()
+        client.messages.create.return_value = _message([TextBlock(type="text", text="plain")])
+
+        with _install(bot, client):
+            assert bot.respond("hi") == "plain"
+
+        client.messages.stream.assert_not_called()
+        assert bot.callbacks.deltas == []
+
+
+class TestStartRequest:
+    """Test ToolHandler.start_request bookkeeping."""
+
+    def test_started_request_is_not_run_twice(self, bot):
+        request = {"type": "tool_use", "id": "toolu_0", "name": "record_tool", "input": {"name": "x"}}
+        bot.tool_handler.start_request(dict(request))
+        bot.tool_handler.requests = [dict(request)]
+
+        results = bot.tool_handler.exec_requests()
+
+        assert [c[0] for c in calls] == ["x"]
+        assert results[0]["content"] == "done x"
+
+    def test_clear_forgets_started_requests(self, bot):
+        bot.tool_handler.start_request({"type": "tool_use", "id": "t", "name": "record_tool", "input": {"name": "x"}})
+        bot.tool_handler.clear()
+
+        assert bot.tool_handler._started == {}
+
+    def test_stream_setting_survives_save_load(self, bot):
+        bot.save("s.bot")
+
+        from bots.foundation.base import Bot
+
+        assert Bot.load("s.bot").stream is True
@@ -0,0 +1,178 @@
+"""Tests for the asyncio API: Bot.arespond, async tool execution and async flows."""
+
+import asyncio
+import time
+
+import pytest
+
+from bots.dev.decorators import toolify
+from bots.flows import functional_prompts as fp
+from bots.foundation.anthropic_bots import AnthropicToolHandler
+from bots.foundation.base import Mailbox
+from bots.testing.mock_bot import MockBot, MockMailbox
+
+
+@pytest.fixture(autouse=True)
+def _chdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+@toolify(parallel_safe=True)
+async def async_read(name: str) -> str:
+    """Sleep without blocking the loop and echo the name."""
+    await asyncio.sleep(0.3)
+    return f"read {name}"
+
+
+def sync_read(name: str) -> str:
+    """Echo the name."""
+    return f"sync {name}"
+
+
+def _request(i, tool, name):
+    return {"type": "tool_use", "id": f"call_{i}", "name": tool, "input": {"name": name}}
+
+
+def _handler():
+    handler = AnthropicToolHandler()
+    handler.add_tool(async_read)
+    handler.add_tool(sync_read)
+    handler.parallel_execution = True
+    return handler
+
+
+class TestArespond:
+    """Test Bot.arespond against the mock mailbox."""
+
+    def test_arespond_matches_respond(self):
+        bot = MockBot(autosave=False)
+        bot.set_response_pattern("echo: {user_input}")
+
+        reply = asyncio.run(bot.arespond("hello"))
+
+        assert reply == "echo: hello"
+        assert bot.conversation.content == "echo: hello"
+        assert bot.conversation.parent.content == "hello"
+        assert bot.get_response_count() == 1
+
+    def test_bots_respond_concurrently(self):
+        bots = [MockBot(autosave=False) for _ in range(4)]
+        for bot in bots:
+            bot.mailbox.set_response_delay(0.3)
+
+        async def run():
+            return await asyncio.gather(*(bot.arespond(f"q{i}") for i, bot in enumerate(bots)))
+
+        start = time.perf_counter()
+        replies = asyncio.run(run())
+
+        assert time.perf_counter() - start < 0.9
+        assert len(replies) == 4
+
+    def test_arespond_autosaves(self):
+        bot = MockBot(autosave=True)
+
+        asyncio.run(bot.arespond("hello"))
+
+        assert bot.conversation.parent.content == "hello"
+
+    def test_default_asend_message_uses_send_message(self):
+        class SyncOnlyMailbox(Mailbox):
+            def send_message(self, bot):
+                return {"content": "from sync", "role": "assistant"}
+
+            def process_response(self, response, bot=None):
+                return response["content"], response["role"], {}
+
+        bot = MockBot(autosave=False)
+        bot.mailbox = SyncOnlyMailbox()
+
+        assert asyncio.run(bot.arespond("hi")) == "from sync"
+
+    def test_failure_propagates(self):
+        bot = MockBot(autosave=False)
+        bot.mailbox.set_failure_mode(True, "boom")
+
+        with pytest.raises(Exception, match="boom"):
+            asyncio.run(bot.arespond("hi"))
+        assert isinstance(bot.mailbox, MockMailbox)
+
+
+class TestAsyncTools:
+    """Test ToolHandler.aexec_requests and async def tools."""
+
+    def test_async_tools_are_awaited_concurrently(self):
+        handler = _handler()
+        handler.requests = [_request(i, "async_read", f"f{i}") for i in range(4)]
+
+        start = time.perf_counter()
+        results = asyncio.run(handler.aexec_requests())
+
+        assert time.perf_counter() - start < 0.9
+        assert [r["content"] for r in results] == ["read f0", "read f1", "read f2", "read f3"]
+        assert handler.results == results
+
+    def test_sync_tools_run_in_aexec_requests(self):
+        handler = _handler()
+        handler.requests = [_request(0, "sync_read", "a"), _request(1, "async_read", "b")]
+
+        results = asyncio.run(handler.aexec_requests())
+
+        assert [r["content"] for r in results] == ["sync a", "read b"]
+
+    def test_exec_requests_runs_async_tools(self):
+        handler = _handler()
+        handler.requests = [_request(0, "async_read", "a")]
+
+        results = handler.exec_requests()
+
+        assert results[0]["content"] == "read a"
+
+    def test_exec_requests_runs_async_tools_inside_running_loop(self):
+        handler = _handler()
+        handler.requests = [_request(0, "async_read", "a")]
+
+        async def run():
+            return handler.exec_requests()
+
+        assert asyncio.run(run())[0]["content"] == "read a"
+
+
+class TestAsyncFlows:
+    """Test the async functional prompts."""
+
+    def test_achain(self):
+        bot = MockBot(autosave=False)
+        bot.set_response_pattern("re: {user_input}")
+
+        responses, nodes = asyncio.run(fp.achain(bot, ["one", "two"]))
+
+        assert responses == ["re: one", "re: two"]
+        assert nodes[-1] is bot.conversation
+
+    def test_apar_branch(self):
+        bot = MockBot(autosave=False)
+        bot.respond("root")
+        root = bot.conversation
+
+        responses, nodes = asyncio.run(fp.apar_branch(bot, ["a", "b", "c"]))
+
+        assert len(responses) == 3 and all(responses)
+        assert [node.content for node in nodes] == ["a", "b", "c"]
+        assert all(node.parent is root for node in nodes)
+        assert [node.replies[0].content for node in nodes] == responses
+        assert bot.conversation is root
+        assert not bot.autosave
+
+    def test_abroadcast_to_leaves(self):
+        bot = MockBot(autosave=False)
+        bot.respond("root")
+        root = bot.conversation
+        fp.branch(bot, ["a", "b"])
+        bot.conversation = root
+
+        responses, nodes = asyncio.run(fp.abroadcast_to_leaves(bot, "more", skip=[]))
+
+        assert len(responses) == 2 and all(responses)
+        assert all(node.content == "more" for node in nodes)
+        assert bot.conversation is root
@@ -0,0 +1,156 @@
+"""Tests for the append-only autosave journal (Bot.save(quicksave=True))."""
+
+import json
+import os
+
+import pytest
+
+from bots.foundation import journal
+from bots.foundation.anthropic_bots import AnthropicBot
+from bots.foundation.base import Bot
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+
+
+def _turn(bot, i):
+    bot.conversation = bot.conversation._add_reply(role="user", content=f"question {i}")
+    bot.conversation = bot.conversation._add_reply(role="assistant", content=f"answer {i}")
+
+
+def _journal_records():
+    with open(journal.journal_path("quicksave.bot")) as f:
+        return [json.loads(line) for line in f.read().splitlines()[1:]]
+
+
+class TestJournalWrites:
+    """Test what quicksaves write to disk."""
+
+    def test_first_quicksave_writes_snapshot(self, bot):
+        _turn(bot, 0)
+        assert bot.save(quicksave=True) == "quicksave.bot"
+        with open("quicksave.bot") as f:
+            data = json.load(f)
+        assert data["journal_token"]
+        assert _journal_records() == []
+
+    def test_later_quicksaves_only_append_new_nodes(self, bot):
+        for i in range(20):
+            _turn(bot, i)
+        bot.save(quicksave=True)
+        snapshot_mtime = os.stat("quicksave.bot").st_mtime_ns
+
+        _turn(bot, 20)
+        bot.save(quicksave=True)
+
+        assert os.stat("quicksave.bot").st_mtime_ns == snapshot_mtime
+        node_records = [r for r in _journal_records() if r["op"] == "node"]
+        assert [r["data"]["content"] for r in node_records] == ["question 20", "answer 20"]
+
+    def test_unchanged_bot_appends_nothing(self, bot):
+        _turn(bot, 0)
+        bot.save(quicksave=True)
+        size = os.path.getsize(journal.journal_path("quicksave.bot"))
+        bot.save(quicksave=True)
+        assert os.path.getsize(journal.journal_path("quicksave.bot")) == size
+
+    def test_journal_is_compacted_when_larger_than_snapshot(self, bot):
+        _turn(bot, 0)
+        bot.save(quicksave=True)
+        token = bot._journal.token
+        for i in range(1, 200):
+            _turn(bot, i)
+            bot.save(quicksave=True)
+        assert bot._journal.token != token
+        assert os.path.getsize(journal.journal_path("quicksave.bot")) <= os.path.getsize("quicksave.bot")
+
+    def test_full_save_removes_journal(self, bot):
+        _turn(bot, 0)
+        bot.save(quicksave=True)
+        bot.save("quicksave.bot")
+        assert not os.path.exists(journal.journal_path("quicksave.bot"))
+
+
+class TestJournalReplay:
+    """Test that Bot.load replays the journal on top of the snapshot."""
+
+    def test_load_replays_new_turns(self, bot):
+        _turn(bot, 0)
+        bot.save(quicksave=True)
+        for i in range(1, 4):
+            _turn(bot, i)
+            bot.save(quicksave=True)
+        bot.system_message = "be brief"
+        bot.save(quicksave=True)
+
+        loaded = Bot.load("quicksave.bot")
+
+        assert loaded.conversation._build_messages() == bot.conversation._build_messages()
+        assert loaded.conversation.content == "answer 3"
+        assert loaded.system_message == "be brief"
+
+    def test_load_replays_branches_and_tool_results(self, bot):
+        _turn(bot, 0)
+        bot.save(quicksave=True)
+        fork_point = bot.conversation
+        _turn(bot, 1)
+        bot.conversation._add_tool_calls([{"id": "t1", "name": "view", "input": {}}])
+        bot.conversation._add_tool_results([{"tool_use_id": "t1", "content": "ok"}])
+        bot.conversation = bot.conversation._add_reply(role="user", content="after tools")
+        bot.save(quicksave=True)
+        bot.conversation = fork_point._add_reply(role="user", content="other branch")
+        bot.save(quicksave=True)
+
+        loaded = Bot.load("quicksave.bot")
+
+        assert loaded.conversation.content == "other branch"
+        assert [r.content for r in loaded.conversation.parent.replies] == ["question 1", "other branch"]
+        tool_user = loaded.conversation.parent.replies[0].replies[0].replies[0]
+        assert tool_user.tool_results == [{"tool_use_id": "t1", "content": "ok"}]
+        assert loaded.conversation._root_dict() == bot.conversation._root_dict()
+
+    def test_stale_journal_is_ignored(self, bot):
+        _turn(bot, 0)
+        bot.save(quicksave=True)
+        _turn(bot, 1)
+        bot.save(quicksave=True)
+        with open("quicksave.bot") as f:
+            data = json.load(f)
+        data["journal_token"] = "other"
+        with open("quicksave.bot", "w") as f:
+            json.dump(data, f)
+
+        loaded = Bot.load("quicksave.bot")
+
+        assert loaded.conversation.content == "answer 0"
+
+    def test_bots_sharing_a_quicksave_file(self, bot):
+        other = AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+        for i in range(5):
+            _turn(bot, i)
+        bot.save(quicksave=True)
+        for i in range(3):
+            _turn(other, 10 + i)
+        other.save(quicksave=True)
+        _turn(bot, 99)
+        bot.save(quicksave=True)
+
+        loaded = Bot.load("quicksave.bot")
+
+        assert loaded.conversation._root_dict() == bot.conversation._root_dict()
+        assert loaded.conversation.content == "answer 99"
+
+    def test_truncated_record_is_ignored(self, bot):
+        _turn(bot, 0)
+        bot.save(quicksave=True)
+        _turn(bot, 1)
+        bot.save(quicksave=True)
+        with open(journal.journal_path("quicksave.bot"), "a") as f:
+            f.write('{"op": "node", "id": 99, "par')
+
+        loaded = Bot.load("quicksave.bot")
+
+        assert loaded.conversation.content == "answer 1"
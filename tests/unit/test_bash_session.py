@@ -0,0 +1,86 @@
+"""Tests for the persistent POSIX shell backend of terminal_tools."""
+
+import os
+import shutil
+import threading
+
+import pytest
+
+from bots.tools.terminal_tools import BashManager, BashSession, execute_bash
+
+pytestmark = pytest.mark.skipif(os.name == "nt" or not shutil.which("sh"), reason="needs a POSIX shell")
+
+
+@pytest.fixture
+def session(tmp_path):
+    with BashSession(cwd=str(tmp_path)) as session:
+        yield session
+
+
+class TestBashSession:
+    def test_state_persists_between_commands(self, session, tmp_path):
+        session.execute("mkdir sub && cd sub && export BOTS_TEST_VALUE=42")
+        output = session.execute("echo $BOTS_TEST_VALUE")
+        assert output.splitlines() == [f"{tmp_path / 'sub'}$ echo $BOTS_TEST_VALUE", "42"]
+
+    def test_stderr_and_exit_code(self, session):
+        output = session.execute("echo out; echo problem >&2; exit_code() { return 3; }; exit_code")
+        assert "out" in output and "Errors:\nproblem" in output
+        assert output.endswith("Exit code: 3")
+
+    def test_output_without_trailing_newline_and_quoting(self, session):
+        output = session.execute("printf 'no newline'")
+        assert output.splitlines()[-1] == "no newline"
+        output = session.execute("cat <<'EOF'\n$HOME 'quoted' \"double\"\nEOF")
+        assert output.splitlines()[-1] == "$HOME 'quoted' \"double\""
+
+    def test_syntax_error_keeps_session(self, session):
+        assert "Exit code: 2" in session.execute("if then")
+        assert session.execute("echo alive").endswith("alive")
+
+    def test_stdin_is_not_consumed(self, session):
+        output = session.execute("read line; echo got:$line")
+        assert output.endswith("got:")
+        assert session.execute("echo next").endswith("next")
+
+    def test_timeout_kills_session(self, session):
+        with pytest.raises(TimeoutError) as info:
+            session.execute("echo started; sleep 10", timeout=0.5)
+        assert "started" in str(info.value)
+        assert session._process is None
+
+
+class TestBashManager:
+    def test_restarts_after_exit(self):
+        manager = BashManager.get_instance("test_restarts_after_exit")
+        try:
+            assert "Tool Failed" in manager.execute("exit 4")
+            assert manager.execute("echo again").endswith("again")
+        finally:
+            manager.cleanup()
+
+    def test_sessions_are_per_thread(self):
+        manager = BashManager.get_instance("test_sessions_are_per_thread")
+        manager.execute("export BOTS_THREAD_VALUE=main")
+        outputs = []
+
+        def worker():
+            outputs.append(manager.execute("echo value:$BOTS_THREAD_VALUE"))
+            manager.cleanup()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        try:
+            assert outputs[0].endswith("value:")
+            assert manager.execute("echo value:$BOTS_THREAD_VALUE").endswith("value:main")
+        finally:
+            manager.cleanup()
+
+    def test_tool_truncates_long_output(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        output = execute_bash("seq 1 100", output_length_limit="10")
+        assert "lines omitted" in output
+        saved = next(tmp_path.glob("sh_output_*.txt")).read_text()
+        assert "100" in saved.splitlines()
+        BashManager.get_instance().cleanup()
@@ -0,0 +1,52 @@
+"""Tests for the offline benchmark suite."""
+
+import json
+
+import pytest
+
+from bots.benchmarks import BENCHMARKS, BenchmarkConfig, compare, load_report, run, save_report
+from bots.benchmarks.__main__ import main
+
+
+@pytest.fixture
+def tiny():
+    return BenchmarkConfig(depths=(2,), fan_out=(1, 2), repeat=1)
+
+
+def _report(**medians):
+    return {"results": {name: {"median": median} for name, median in medians.items()}}
+
+
+def test_every_benchmark_runs(tiny, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    report = run(tiny)
+    prefixes = {name.split(".")[0] for name in report["results"]}
+    assert prefixes == set(BENCHMARKS)
+    assert "respond.per_turn[depth=2]" in report["results"]
+    assert "parallel.par_branch[n=2]" in report["results"]
+    assert all(timings["repeat"] == 1 and timings["median"] >= 0 for timings in report["results"].values())
+    json.dumps(report)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_benchmark(tiny):
+    with pytest.raises(KeyError):
+        run(tiny, only=["nonexistent"])
+
+
+def test_compare():
+    baseline = _report(fast=0.0001, steady=0.01, slower=0.01, removed=0.01)
+    current = _report(fast=0.0004, steady=0.011, slower=0.02, added=0.5)
+    regressions = compare(current, baseline, tolerance=0.25)
+    assert [regression.name for regression in regressions] == ["slower"]
+    assert regressions[0].ratio == pytest.approx(2.0)
+
+
+def test_cli_fails_on_regression(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    save_report(_report(**{"respond.per_turn[depth=100]": 1e-5}), str(baseline))
+    output = tmp_path / "results.json"
+    args = ["--quick", "--only", "respond", "--repeat", "1", "--output", str(output), "--baseline", str(baseline)]
+    assert main(args) == 1
+    assert "regression" in capsys.readouterr().out
+    assert "respond.per_turn[depth=100]" in load_report(str(output))["results"]
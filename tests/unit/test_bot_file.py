@@ -0,0 +1,122 @@
+"""Tests for the .bot container format and format selection in Bot.save/Bot.load."""
+
+import io
+import json
+import os
+
+import pytest
+
+from bots.foundation import bot_file
+from bots.foundation.anthropic_bots import AnthropicBot
+from bots.foundation.base import Bot
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+
+
+@pytest.fixture(autouse=True)
+def restore_config():
+    saved = (bot_file.get_config().format, bot_file.get_config().nodes_per_chunk)
+    yield
+    bot_file.configure(format=saved[0], nodes_per_chunk=saved[1])
+
+
+def _turns(bot, count):
+    for i in range(count):
+        bot.conversation = bot.conversation._add_reply(role="user", content=f"question {i}")
+        bot.conversation = bot.conversation._add_reply(role="assistant", content=f"answer {i} " + "output " * 50)
+
+
+def _branched(bot):
+    _turns(bot, 2)
+    fork_point = bot.conversation.parent
+    bot.conversation = fork_point._add_reply(role="assistant", content="other answer")
+    bot.conversation = bot.conversation._add_reply(role="user", content="follow-up")
+
+
+class TestContainer:
+    """Test the container encoding itself."""
+
+    def test_round_trip_matches_json(self, bot):
+        _branched(bot)
+        bot.save("a.bot", format="json")
+        bot.save("b.bot", format="binary")
+        assert bot_file.is_container("b.bot") and not bot_file.is_container("a.bot")
+        from_json, from_container = bot_file.read("a.bot"), bot_file.read("b.bot")
+        # filename is set by the first save
+        assert from_container.pop("filename") == "a.bot" and from_json.pop("filename") is None
+        assert from_container == from_json
+
+    def test_nodes_span_several_chunks(self, bot):
+        _branched(bot)
+        bot_file.configure(nodes_per_chunk=2)
+        data = bot._serialize()
+        buffer = io.BytesIO()
+        bot_file.write_container(buffer, data)
+        buffer.seek(0)
+        sections = [name for name, _ in bot_file.iter_sections(buffer)]
+        assert sections[:2] == ["attributes", "tool_handler"]
+        assert sections.count("nodes") == 4
+        buffer.seek(0)
+        assert bot_file.read_container(buffer)["conversation"] == data["conversation"]
+
+    def test_truncated_file_is_rejected(self, bot):
+        _turns(bot, 3)
+        bot.save("a.bot", format="binary")
+        with open("a.bot", "rb") as f:
+            content = f.read()
+        with open("a.bot", "wb") as f:
+            f.write(content[:-4])
+        with pytest.raises(ValueError, match="Truncated"):
+            bot_file.read("a.bot")
+
+    def test_container_is_smaller(self, bot):
+        _turns(bot, 20)
+        bot.save("a.bot", format="json")
+        bot.save("b.bot", format="binary")
+        assert os.path.getsize("b.bot") * 5 < os.path.getsize("a.bot")
+
+    def test_unknown_format_rejected(self, bot):
+        with pytest.raises(ValueError):
+            bot.save("a.bot", format="yaml")
+
+
+class TestBotSaveLoad:
+    """Test choosing and detecting the format."""
+
+    def test_load_detects_container(self, bot):
+        _branched(bot)
+        bot.save("a.bot", format="binary")
+        loaded = Bot.load("a.bot")
+        assert loaded.conversation.content == "follow-up"
+        assert loaded.conversation._find_root()._node_count() == bot.conversation._find_root()._node_count() == 7
+
+    def test_deep_conversation(self, bot):
+        _turns(bot, 1500)
+        bot.save("deep.bot", format="binary")
+        loaded = Bot.load("deep.bot")
+        assert loaded.conversation.content.startswith("answer 1499")
+        assert len(loaded.conversation._build_messages()) == 3000
+
+    def test_configured_default_applies_to_quicksave(self, bot):
+        bot_file.configure(format="binary")
+        _turns(bot, 2)
+        bot.save(quicksave=True)
+        assert bot_file.is_container("quicksave.bot")
+        _turns(bot, 1)
+        bot.save(quicksave=True)
+        loaded = Bot.load("quicksave.bot")
+        assert loaded.conversation._find_root()._node_count() == bot.conversation._find_root()._node_count() == 7
+        assert [m["content"][0]["text"] for m in loaded.conversation._build_messages()] == [
+            m["content"][0]["text"] for m in bot.conversation._build_messages()
+        ]
+
+    def test_convert_to_json(self, bot):
+        _turns(bot, 2)
+        bot.save("a.bot", format="binary")
+        bot_file.convert("a.bot", "a.json.bot")
+        with open("a.json.bot") as f:
+            assert json.load(f) == bot_file.read("a.bot")
@@ -0,0 +1,93 @@
+"""Tests for Bot.fork() copy-on-write branching."""
+
+import pytest
+
+from bots.foundation.base import Bot
+from bots.testing.mock_bot import MockBot
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bot = MockBot()
+    for i in range(5):
+        bot.respond(f"question {i}")
+    return bot
+
+
+class TestFork:
+    """Test what a fork shares and what it owns."""
+
+    def test_fork_shares_history(self, bot):
+        fork = bot.fork()
+
+        assert fork.conversation is not bot.conversation
+        assert fork.conversation.parent is bot.conversation.parent
+        assert fork.conversation.content == bot.conversation.content
+        assert fork.conversation._build_messages() == bot.conversation._build_messages()
+
+    def test_fork_replies_do_not_touch_original_tree(self, bot):
+        node_count = bot.conversation._find_root()._node_count()
+        original = bot.conversation
+
+        fork = bot.fork()
+        fork.respond("only in the fork")
+
+        assert bot.conversation is original
+        assert not original.replies
+        assert bot.conversation._find_root()._node_count() == node_count
+        assert fork.conversation.parent.content == "only in the fork"
+
+    def test_fork_shares_tools_but_not_tool_state(self, bot):
+        bot.add_mock_tool("calculate", lambda x, y: x + y)
+        bot.tool_handler.requests.append({"name": "calculate"})
+
+        fork = bot.fork()
+
+        assert fork.tool_handler is not bot.tool_handler
+        assert fork.tool_handler.function_map["calculate"] is bot.tool_handler.function_map["calculate"]
+        assert fork.tool_handler.requests == []
+        assert fork.tool_handler.bot is fork
+        assert fork.mailbox is not bot.mailbox
+
+    def test_fork_keeps_callbacks_and_settings(self, bot):
+        bot.callbacks = object()
+        bot.system_message = "be brief"
+
+        fork = bot.fork()
+
+        assert fork.callbacks is bot.callbacks
+        assert fork.system_message == "be brief"
+
+    def test_mul_returns_forks(self, bot):
+        copies = bot * 3
+
+        assert len(copies) == 3
+        assert all(copy.conversation.parent is bot.conversation.parent for copy in copies)
+
+
+class TestForkSave:
+    """Test that a saved fork contains the shared history and its own branch."""
+
+    def test_save_fork_writes_full_history(self, bot):
+        fork = bot.fork()
+        fork.respond("fork question")
+        original_count = bot.conversation._find_root()._node_count()
+
+        fork.save("fork.bot")
+        loaded = Bot.load("fork.bot")
+
+        assert loaded.conversation._build_messages() == fork.conversation._build_messages()
+        assert loaded.conversation._find_root()._node_count() == original_count + 2
+        assert bot.conversation._find_root()._node_count() == original_count
+
+    def test_save_fork_of_fork(self, bot):
+        first = bot.fork()
+        first.respond("first fork")
+        second = first.fork()
+        second.respond("second fork")
+
+        second.save("second.bot")
+        loaded = Bot.load("second.bot")
+
+        assert loaded.conversation._build_messages() == second.conversation._build_messages()
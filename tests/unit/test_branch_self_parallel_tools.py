@@ -48,8 +48,8 @@ class TestBranchSelfParallelTools:
         # Mock respond to avoid actual API calls
         bot.respond = Mock(return_value="Branch response")
 
-        # Patch deepcopy to return a new mock bot
-        with patch("copy.deepcopy") as mock_deepcopy:
+        # Patch fork to return a new mock bot
+        with patch.object(bot, "fork") as mock_fork:
             branch_bot = Mock(spec=Bot)
             branch_bot.autosave = False
             branch_bot.conversation = Mock(spec=ConversationNode)
@@ -57,7 +57,7 @@ class TestBranchSelfParallelTools:
             branch_bot.tool_handler = Mock()
             branch_bot.tool_handler.clear = Mock()
             branch_bot.respond = Mock(return_value="Branch response")
-            mock_deepcopy.return_value = branch_bot
+            mock_fork.return_value = branch_bot
 
             # Call branch_self with _bot parameter
             branch_self(self_prompts="['test 1', 'test 2']", allow_work="False", _bot=bot)
@@ -114,8 +114,8 @@ class TestBranchSelfParallelTools:
         bot.tool_handler.tools = []
         bot.respond = Mock(return_value="Branch response")
 
-        # Patch deepcopy to return a new mock bot
-        with patch("copy.deepcopy") as mock_deepcopy:
+        # Patch fork to return a new mock bot
+        with patch.object(bot, "fork") as mock_fork:
             branch_bot = Mock(spec=Bot)
             branch_bot.autosave = False
             branch_bot.conversation = Mock(spec=ConversationNode)
@@ -123,7 +123,7 @@ class TestBranchSelfParallelTools:
             branch_bot.tool_handler = Mock()
             branch_bot.tool_handler.clear = Mock()
             branch_bot.respond = Mock(return_value="Branch response")
-            mock_deepcopy.return_value = branch_bot
+            mock_fork.return_value = branch_bot
 
             # Call branch_self with _bot parameter
             result = branch_self(self_prompts="['test 1', 'test 2']", allow_work="False", _bot=bot)
@@ -157,8 +157,8 @@ class TestBranchSelfParallelTools:
         # Mock respond to avoid actual API calls
         bot.respond = Mock(return_value="Branch response")
 
-        # Patch deepcopy to return a new mock bot
-        with patch("copy.deepcopy") as mock_deepcopy:
+        # Patch fork to return a new mock bot
+        with patch.object(bot, "fork") as mock_fork:
             branch_bot = Mock(spec=Bot)
             branch_bot.autosave = False
             branch_bot.conversation = Mock(spec=ConversationNode)
@@ -166,7 +166,7 @@ class TestBranchSelfParallelTools:
             branch_bot.tool_handler = Mock()
             branch_bot.tool_handler.clear = Mock()
             branch_bot.respond = Mock(return_value="Branch response")
-            mock_deepcopy.return_value = branch_bot
+            mock_fork.return_value = branch_bot
 
             # Call branch_self with _bot parameter
             result = branch_self(self_prompts="['test 1', 'test 2']", allow_work="False", _bot=bot)
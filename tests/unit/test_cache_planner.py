@@ -0,0 +1,103 @@
+"""Tests for CachePlanner breakpoint placement and cache usage recording."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from bots.foundation.anthropic_bots import AnthropicBot, AnthropicMailbox, CachePlanner
+from bots.observability import metrics
+
+
+@pytest.fixture
+def bot():
+    bot = AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+    bot.set_system_message("You are terse.")
+    return bot
+
+
+def _turn(bot, i):
+    bot.conversation = bot.conversation._add_reply(role="user", content=f"question {i}")
+    bot.conversation = bot.conversation._add_reply(role="assistant", content=f"answer {i}")
+
+
+def _marked(messages):
+    return [index for index, message in enumerate(messages) for block in message["content"] if "cache_control" in block]
+
+
+def _request(bot):
+    bot.conversation = bot.conversation._add_reply(role="user", content="next")
+    create_dict = AnthropicMailbox._build_create_dict(bot, None)
+    bot.conversation = bot.conversation._add_reply(role="assistant", content="ok")
+    return create_dict
+
+
+def _breakpoints(create_dict):
+    count = len(_marked(create_dict["messages"]))
+    count += sum("cache_control" in tool for tool in create_dict.get("tools", []))
+    count += sum("cache_control" in block for block in create_dict.get("system", []))
+    return count
+
+
+class TestPlacement:
+    def test_tools_and_system(self, bot):
+        def first(x):
+            """First tool"""
+            return x
+
+        def second(x):
+            """Second tool"""
+            return x
+
+        bot.add_tools(first, second)
+        bot.tool_handler.tools[0]["cache_control"] = {"type": "ephemeral"}  # left over from an older save
+        create_dict = _request(bot)
+        assert ["cache_control" in tool for tool in create_dict["tools"]] == [False, True]
+        assert "cache_control" in bot.tool_handler.tools[0] and "cache_control" not in bot.tool_handler.tools[1]
+        assert create_dict["system"] == [{"type": "text", "text": "You are terse.", "cache_control": {"type": "ephemeral"}}]
+
+    def test_prefix_follows_previous_tail(self, bot):
+        assert _marked(_request(bot)["messages"]) == [0]
+        assert _marked(_request(bot)["messages"]) == [0, 2]
+        # The prefix stays put while the tail is within the lookback window
+        assert _marked(_request(bot)["messages"]) == [0, 4]
+        for _ in range(20):
+            create_dict = _request(bot)
+            assert _breakpoints(create_dict) <= 4
+        prefix, tail = _marked(create_dict["messages"])
+        assert tail == len(create_dict["messages"]) - 1
+        assert 0 < prefix < tail and tail - prefix <= CachePlanner.LOOKBACK_BLOCKS
+
+    def test_prefix_survives_branching_back(self, bot):
+        for _ in range(3):
+            _request(bot)
+        prefix = _marked(_request(bot)["messages"])[0]
+        bot.conversation = bot.conversation.parent.parent
+        messages = _request(bot)["messages"]
+        assert _marked(messages)[0] == prefix
+
+    def test_empty_text_is_not_marked(self, bot):
+        _turn(bot, 0)
+        node = bot.conversation
+        node._add_tool_calls([{"id": "t1", "name": "view", "input": {}}])
+        bot.conversation = node._add_reply(role="user", content="", tool_results=[{"tool_use_id": "t1", "content": "out"}])
+        messages = AnthropicMailbox._build_create_dict(bot, None)["messages"]
+        assert messages[-1]["content"][0]["type"] == "tool_result"
+        assert "cache_control" in messages[-1]["content"][0]
+        assert "cache_control" not in messages[-1]["content"][1]
+
+    def test_tree_stays_clean(self, bot):
+        _request(bot)
+        _request(bot)
+        assert _marked(bot.conversation._build_messages()) == []
+
+
+def test_cache_usage_is_recorded_per_bot(bot):
+    metrics.reset_metrics()
+    try:
+        usage = SimpleNamespace(input_tokens=100, output_tokens=5, cache_creation_input_tokens=0, cache_read_input_tokens=900)
+        AnthropicMailbox._record_response(SimpleNamespace(usage=usage), bot, None, time.time())
+        stats = metrics.get_cache_stats(metrics.bot_metrics_id(bot))
+        assert stats["cache_read"] == 900 and stats["read_ratio"] == pytest.approx(0.9)
+    finally:
+        metrics.reset_metrics()
@@ -0,0 +1,135 @@
+"""Tests for the process-wide provider client pool."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bots.foundation import client_pool
+
+
+class FakeClient:
+    """Stand-in for a provider SDK client that records its constructor args."""
+
+    instances = 0
+
+    def __init__(self, **kwargs):
+        FakeClient.instances += 1
+        self.kwargs = kwargs
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def clean_pool():
+    """Start every test with an empty pool and default configuration."""
+    client_pool.clear()
+    original = client_pool.ClientPoolConfig(**vars(client_pool.get_config()))
+    FakeClient.instances = 0
+    yield
+    client_pool.clear()
+    client_pool.configure(**vars(original))
+
+
+class TestGetClient:
+    """Test client reuse and keying."""
+
+    def test_same_key_returns_same_client(self):
+        first = client_pool.get_client("fake", FakeClient, "key", timeout=10.0)
+        second = client_pool.get_client("fake", FakeClient, "key", timeout=10.0)
+        assert first is second
+        assert FakeClient.instances == 1
+
+    def test_different_keys_get_different_clients(self):
+        a = client_pool.get_client("fake", FakeClient, "key-a", timeout=10.0)
+        b = client_pool.get_client("fake", FakeClient, "key-b", timeout=10.0)
+        c = client_pool.get_client("fake", FakeClient, "key-a", timeout=20.0)
+        assert len({id(a), id(b), id(c)}) == 3
+        assert client_pool.pool_size() == 3
+
+    def test_constructor_receives_limits_and_timeout(self):
+        import httpx
+
+        client_pool.configure(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5)
+        with patch("httpx.Limits", wraps=httpx.Limits) as limits:
+            client = client_pool.get_client("fake", FakeClient, "key", timeout=42.0)
+        assert client.kwargs["api_key"] == "key"
+        assert client.kwargs["timeout"] == 42.0
+        assert isinstance(client.kwargs["http_client"], httpx.Client)
+        limits.assert_called_once_with(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5)
+
+    def test_uses_sdk_default_http_client(self):
+        anthropic = pytest.importorskip("anthropic")
+
+        client_pool.configure(max_connections=7)
+        client = client_pool.get_client("anthropic", anthropic.Anthropic, "key", timeout=42.0)
+        assert isinstance(client._client, anthropic.DefaultHttpxClient)
+        assert client._client.follow_redirects
+        assert client._client._transport._pool._max_connections == 7
+
+        async def build():
+            return client_pool.get_async_client("anthropic", anthropic.AsyncAnthropic, "key", timeout=42.0)
+
+        async_client = asyncio.run(build())
+        assert isinstance(async_client._client, anthropic.DefaultAsyncHttpxClient)
+
+    def test_pass_http_client_false(self):
+        client = client_pool.get_client("fake", FakeClient, "key", pass_http_client=False)
+        assert "http_client" not in client.kwargs
+        assert "timeout" not in client.kwargs
+
+    def test_disabled_pool_builds_fresh_clients(self):
+        client_pool.configure(enabled=False)
+        first = client_pool.get_client("fake", FakeClient, "key")
+        second = client_pool.get_client("fake", FakeClient, "key")
+        assert first is not second
+        assert client_pool.pool_size() == 0
+
+    def test_clear_closes_clients(self):
+        client = client_pool.get_client("fake", FakeClient, "key")
+        client_pool.clear()
+        assert client.closed
+        assert client_pool.pool_size() == 0
+
+    def test_concurrent_callers_share_one_client(self):
+        results = []
+        barrier = threading.Barrier(16)
+
+        def worker():
+            barrier.wait()
+            results.append(client_pool.get_client("fake", FakeClient, "key", timeout=5.0))
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert FakeClient.instances == 1
+        assert all(r is results[0] for r in results)
+
+
+class TestMailboxIntegration:
+    """Test that mailboxes reuse pooled clients across calls."""
+
+    def test_anthropic_mailbox_reuses_client_across_sends(self):
+        from bots.foundation.anthropic_bots import AnthropicBot
+
+        bot = AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+        mock_class = MagicMock()
+        mock_response = MagicMock()
+        mock_response.usage = MagicMock(
+            input_tokens=1, output_tokens=1, cache_creation_input_tokens=0, cache_read_input_tokens=0
+        )
+        mock_class.return_value.messages.create.return_value = mock_response
+
+        with patch("anthropic.Anthropic", mock_class):
+            bot.conversation = bot.conversation._add_reply(role="user", content="hi")
+            bot.mailbox.send_message(bot)
+            bot.mailbox.send_message(bot)
+
+        assert mock_class.call_count == 1
+        assert mock_class.return_value.messages.create.call_count == 2
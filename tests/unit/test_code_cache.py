@@ -0,0 +1,140 @@
+"""Tests for the compiled-code and module-namespace caches."""
+
+import os
+import sys
+
+import pytest
+
+import bots.tools.code_tools
+import bots.tools.terminal_tools
+from bots.foundation import code_cache
+from bots.foundation.anthropic_bots import AnthropicToolHandler
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    """Point the on-disk cache at a temp directory and allow writing it."""
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    original = code_cache.CodeCacheConfig(**vars(code_cache.get_config()))
+    code_cache.configure(directory=str(tmp_path))
+    code_cache.clear()
+    yield tmp_path
+    code_cache.clear()
+    code_cache.configure(directory=original.directory, share_namespaces=original.share_namespaces)
+
+
+@pytest.fixture
+def compile_calls(monkeypatch):
+    """Count calls to compile() made by code_cache."""
+    calls = []
+
+    def counting_compile(*args, **kwargs):
+        calls.append(args[1])
+        return compile(*args, **kwargs)
+
+    monkeypatch.setattr(code_cache, "compile", counting_compile, raising=False)
+    return calls
+
+
+class TestGetCode:
+    """Test the in-memory and on-disk code object caches."""
+
+    def test_compiles_once_per_hash(self, disk_cache, compile_calls):
+        first = code_cache.get_code("x = 1\n", "hash-a")
+        second = code_cache.get_code("x = 1\n", "hash-a")
+        assert first is second
+        assert compile_calls == [code_cache.SOURCE_FILENAME]
+
+        namespace = {}
+        exec(first, namespace)
+        assert namespace["x"] == 1
+
+    def test_disk_cache_survives_process_cache(self, disk_cache, compile_calls):
+        code_cache.get_code("y = 2\n", "hash-b")
+        assert os.path.exists(code_cache._cache_path("hash-b"))
+        assert code_cache._cache_path("hash-b").startswith(str(disk_cache / sys.implementation.cache_tag))
+
+        code_cache.clear()
+        namespace = {}
+        exec(code_cache.get_code("y = 2\n", "hash-b"), namespace)
+        assert namespace["y"] == 2
+        assert len(compile_calls) == 1
+
+    def test_corrupt_entry_is_recompiled(self, disk_cache, compile_calls):
+        path = code_cache._cache_path("hash-c")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"not bytecode")
+        namespace = {}
+        exec(code_cache.get_code("z = 3\n", "hash-c"), namespace)
+        assert namespace["z"] == 3
+        assert len(compile_calls) == 1
+
+    def test_memory_only_when_directory_unset(self, disk_cache, compile_calls):
+        code_cache.configure(directory=None)
+        code_cache.get_code("w = 4\n", "hash-d")
+        assert code_cache._cache_path("hash-d") is None
+        assert os.listdir(disk_cache) == []
+
+
+class TestSharedNamespaces:
+    """Test that stock tool modules are materialized once per process."""
+
+    def test_is_shareable(self, tmp_path):
+        assert code_cache.is_shareable(bots.tools.code_tools.__file__)
+        assert not code_cache.is_shareable(str(tmp_path / "my_tools.py"))
+        assert not code_cache.is_shareable("dynamic_module_123")
+        assert not code_cache.is_shareable(bots.tools.terminal_tools.__file__)
+
+    def test_stock_module_reload_reuses_namespace(self, disk_cache, compile_calls):
+        handler = AnthropicToolHandler()
+        handler._add_tools_from_module(bots.tools.code_tools)
+        data = handler.to_dict()
+        compile_calls.clear()
+
+        first = AnthropicToolHandler.from_dict(data)
+        second = AnthropicToolHandler.from_dict(data)
+
+        # Already compiled by add_tools, and executed only once
+        assert compile_calls == []
+        assert first.function_map["view"] is second.function_map["view"]
+        (context,) = second.modules.values()
+        assert context.namespace is next(iter(first.modules.values())).namespace
+
+    def test_shell_sessions_are_not_shared(self, disk_cache):
+        handler = AnthropicToolHandler()
+        handler._add_tools_from_module(bots.tools.terminal_tools)
+        data = handler.to_dict()
+
+        (first,) = [context.namespace for context in AnthropicToolHandler.from_dict(data).modules.values()]
+        (second,) = [context.namespace for context in AnthropicToolHandler.from_dict(data).modules.values()]
+
+        # Each loaded bot keeps its own shell session registries
+        assert first is not second
+        assert first.PowerShellManager._instances is not second.PowerShellManager._instances
+        assert first.BashManager._instances is not second.BashManager._instances
+
+    def test_user_module_gets_own_namespace(self, disk_cache, compile_calls, tmp_path):
+        path = tmp_path / "my_tools.py"
+        path.write_text('def shout(text: str) -> str:\n    """Upper-case text."""\n    return text.upper()\n')
+        handler = AnthropicToolHandler()
+        handler._add_tools_from_file(str(path))
+        data = handler.to_dict()
+        compile_calls.clear()
+
+        first = AnthropicToolHandler.from_dict(data)
+        second = AnthropicToolHandler.from_dict(data)
+
+        # Reuses the code compiled by add_tools, but each handler runs it in its own namespace
+        assert len(compile_calls) == 0
+        assert first.function_map["shout"] is not second.function_map["shout"]
+        assert second.function_map["shout"]("hi") == "HI"
+
+    def test_sharing_can_be_disabled(self, disk_cache):
+        code_cache.configure(share_namespaces=False)
+        handler = AnthropicToolHandler()
+        handler._add_tools_from_module(bots.tools.code_tools)
+        data = handler.to_dict()
+        first = AnthropicToolHandler.from_dict(data)
+        second = AnthropicToolHandler.from_dict(data)
+        assert first.function_map["view"] is not second.function_map["view"]
@@ -0,0 +1,152 @@
+"""Tests for context policies and the context_window registry figures."""
+
+import pytest
+
+from bots.foundation.anthropic_bots import AnthropicBot, AnthropicMailbox
+from bots.foundation.base import Bot, Engines
+from bots.foundation.context import (
+    ChainPolicy,
+    DropOldTurns,
+    FitContextWindow,
+    SummarizeOldTurns,
+    TruncateToolResults,
+    conversation_path,
+    transcript,
+    turn_starts,
+)
+from bots.foundation.model_registry import MODEL_REGISTRY, get_context_window
+from bots.testing.mock_bot import MockBot
+
+
+@pytest.fixture
+def bot():
+    return AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+
+
+def _tool_turns(bot, count, output_size=5000):
+    """Add turns of user prompt, tool call, tool result and final answer."""
+    for i in range(count):
+        node = bot.conversation._add_reply(role="user", content=f"question {i}")
+        node = node._add_reply(role="assistant", content=f"calling {i}")
+        node._add_tool_calls([{"id": f"t{i}", "name": "view", "input": {}}])
+        node = node._add_reply(role="user", content="", tool_results=[{"tool_use_id": f"t{i}", "content": "x" * output_size}])
+        bot.conversation = node._add_reply(role="assistant", content=f"answer {i}")
+
+
+def _tool_result_sizes(messages):
+    return [len(block["content"]) for message in messages for block in message["content"] if block["type"] == "tool_result"]
+
+
+def _assert_paired(messages):
+    """Every tool_result follows the assistant message that made the call."""
+    called = set()
+    for message in messages:
+        for block in message["content"]:
+            if block["type"] == "tool_use":
+                called.add(block["id"])
+            elif block["type"] == "tool_result":
+                assert block["tool_use_id"] in called
+    assert messages[0]["role"] == "user"
+
+
+class TestRegistry:
+    def test_every_model_has_a_context_window(self):
+        for name, info in MODEL_REGISTRY.items():
+            assert info["context_window"] >= info["max_tokens"], name
+
+    def test_get_context_window(self):
+        assert get_context_window(Engines.CLAUDE3_HAIKU) == 200000
+        assert get_context_window("not-a-model") is None
+
+
+class TestPolicies:
+    def test_no_policy_sends_full_history(self, bot):
+        _tool_turns(bot, 3)
+        assert bot._context_messages() == bot.conversation._build_messages()
+
+    def test_turn_starts_skip_tool_result_nodes(self, bot):
+        _tool_turns(bot, 2)
+        assert turn_starts(conversation_path(bot.conversation)) == [0, 4]
+
+    def test_truncate_keeps_recent_results(self, bot):
+        _tool_turns(bot, 3)
+        bot.context_policy = TruncateToolResults(max_chars=100, keep_turns=1)
+        messages = bot._context_messages()
+        sizes = _tool_result_sizes(messages)
+        assert sizes[-1] == 5000 and all(size < 200 for size in sizes[:-1])
+        _assert_paired(messages)
+
+    def test_tree_is_not_mutated(self, bot):
+        _tool_turns(bot, 3)
+        before = bot.conversation._build_messages()
+        bot.context_policy = ChainPolicy(TruncateToolResults(max_chars=10), DropOldTurns(max_turns=1))
+        bot._context_messages()
+        assert bot.conversation._build_messages() == before
+        assert _tool_result_sizes(before) == [5000, 5000, 5000]
+
+    def test_truncated_copies_are_reused(self, bot):
+        _tool_turns(bot, 3)
+        policy = TruncateToolResults(max_chars=10)
+        path = conversation_path(bot.conversation)
+        first = policy.apply(path, bot)
+        second = policy.apply(path, bot)
+        assert first[2] is second[2] and first[2] is not path[2]
+
+    def test_drop_old_turns(self, bot):
+        _tool_turns(bot, 5)
+        bot.context_policy = DropOldTurns(max_turns=2)
+        messages = bot._context_messages()
+        assert len(messages) == 8
+        assert messages[0]["content"][0]["text"] == "question 3"
+        _assert_paired(messages)
+
+    def test_summaries_are_cached_per_span(self, bot):
+        calls = []
+
+        def summarize(nodes):
+            calls.append(len(nodes))
+            return f"{len(nodes)} nodes: " + transcript(nodes, max_chars=20)[:50]
+
+        bot.context_policy = SummarizeOldTurns(summarize, keep_turns=2, step=2)
+        _tool_turns(bot, 3)
+        assert len(bot._context_messages()) == 12 and calls == []
+        _tool_turns(bot, 1)
+        messages = bot._context_messages()
+        bot._context_messages()
+        assert calls == [8]
+        assert len(messages) == 8
+        assert messages[0]["content"][0]["text"].startswith("[Summary of the earlier conversation]\n8 nodes: user: question 0")
+        assert messages[0]["content"][0]["text"].endswith("question 2")
+        _assert_paired(messages)
+
+    def test_fit_context_window_only_trims_when_needed(self, bot):
+        _tool_turns(bot, 4, output_size=4000)
+        policy = FitContextWindow()
+        path = conversation_path(bot.conversation)
+        assert policy.apply(path, bot) == path
+        bot.context_policy = FitContextWindow(max_input_tokens=3000)
+        messages = bot._context_messages()
+        assert messages[0]["content"][0]["text"] == "question 2"
+        _assert_paired(messages)
+
+    def test_anthropic_request_uses_policy(self, bot):
+        _tool_turns(bot, 3)
+        bot.context_policy = DropOldTurns(max_turns=1)
+        create_dict = AnthropicMailbox._build_create_dict(bot, None)
+        assert len(create_dict["messages"]) == 4
+
+    def test_policy_is_not_saved(self, bot, tmp_path):
+        _tool_turns(bot, 1)
+        bot.context_policy = DropOldTurns(max_turns=1)
+        path = str(tmp_path / "policy.bot")
+        bot.save(path)
+        assert Bot.load(path).context_policy is None
+
+
+def test_mock_bot_sends_reduced_history():
+    bot = MockBot(autosave=False)
+    bot.context_policy = DropOldTurns(max_turns=1)
+    for i in range(3):
+        bot.respond(f"message {i}")
+    sent = bot.mailbox._conversation_history[-1]["messages"]
+    assert len(sent) == 1
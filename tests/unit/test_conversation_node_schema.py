@@ -0,0 +1,117 @@
+"""Tests for the slotted ConversationNode layout and its schema-driven serialization."""
+
+import copy
+import pickle
+
+import pytest
+
+from bots.foundation.anthropic_bots import AnthropicNode
+from bots.foundation.base import ConversationNode
+from bots.foundation.gemini_bots import GeminiNode
+from bots.foundation.openai_bots import OpenAINode
+from bots.testing.mock_bot import MockConversationNode
+
+NODE_CLASSES = [ConversationNode, AnthropicNode, OpenAINode, GeminiNode, MockConversationNode]
+
+
+class TestSlots:
+    """Test that nodes carry no per-instance __dict__."""
+
+    @pytest.mark.parametrize("node_class", NODE_CLASSES)
+    def test_no_instance_dict(self, node_class):
+        node = node_class(role="user", content="hi")
+        assert not hasattr(node, "__dict__")
+
+    def test_list_fields_are_per_node(self):
+        a = ConversationNode(role="assistant", content="a")
+        b = ConversationNode(role="assistant", content="b")
+        a.tool_calls.append({"id": "1"})
+        a.labels.append("start")
+        assert b.tool_calls == [] and b.labels == []
+        assert a.tool_calls == [{"id": "1"}] and a.labels == ["start"]
+
+    def test_unknown_attribute_assignment_fails(self):
+        node = ConversationNode(role="user", content="hi")
+        with pytest.raises(AttributeError):
+            node.not_a_field = 1
+        assert not hasattr(node, "not_a_field")
+
+
+class TestSchema:
+    """Test _to_dict_self/_from_dict round trips."""
+
+    def test_dict_shape(self):
+        node = AnthropicNode(role="assistant", content="calling")
+        node._add_tool_calls([{"id": "t1", "name": "view", "input": {}}])
+        assert node._to_dict_self() == {
+            "content": "calling",
+            "role": "assistant",
+            "tool_calls": [{"id": "t1", "name": "view", "input": {}}],
+            "tool_results": [],
+            "pending_results": [],
+            "node_class": "AnthropicNode",
+        }
+
+    def test_labels_saved_only_when_set(self):
+        node = ConversationNode(role="user", content="hi")
+        assert "labels" not in node._to_dict_self()
+        node.labels.append("checkpoint")
+        assert node._to_dict_self()["labels"] == ["checkpoint"]
+
+    def test_extras_round_trip(self):
+        data = {"role": "assistant", "content": "hi", "provider_id": "msg_1", "node_class": "OpenAINode"}
+        node = ConversationNode._from_dict(data)
+        assert type(node) is OpenAINode
+        assert node.extras == {"provider_id": "msg_1"}
+        assert node.provider_id == "msg_1"
+        assert node._to_dict_self()["provider_id"] == "msg_1"
+
+    def test_non_basic_values_saved_as_str(self):
+        node = ConversationNode(role="user", content="hi", tags={"a"})
+        assert node._to_dict_self()["tags"] == "{'a'}"
+
+    @pytest.mark.parametrize("node_class", NODE_CLASSES)
+    def test_tree_round_trip(self, node_class):
+        root = node_class._create_empty(node_class)
+        user = root._add_reply(role="user", content="question", labels=["q"])
+        user._add_reply(role="assistant", content="answer one")
+        user._add_reply(role="assistant", content="answer two")
+        saved = root._to_dict_recursive()
+        rebuilt = ConversationNode._from_dict(saved)
+        assert type(rebuilt) is node_class
+        assert rebuilt._to_dict_recursive() == saved
+        assert rebuilt.replies[0].labels == ["q"]
+        assert [r.content for r in rebuilt.replies[0].replies] == ["answer one", "answer two"]
+
+    def test_subclass_with_dict_saves_public_attributes(self):
+        class TaggedNode(ConversationNode):
+            pass
+
+        node = TaggedNode(role="user", content="hi", topic="greeting")
+        node._scratch = "private"
+        data = node._to_dict_self()
+        assert data["topic"] == "greeting"
+        assert "_scratch" not in data
+
+
+class TestCopies:
+    """Test copying and pickling slotted nodes."""
+
+    def test_fork_leaf_has_own_lists(self):
+        root = AnthropicNode._create_empty(AnthropicNode)
+        node = root._add_reply(role="assistant", content="calling")
+        node._add_tool_calls([{"id": "t1", "name": "view", "input": {}}])
+        leaf = node._fork_leaf()
+        leaf.tool_calls.append({"id": "t2", "name": "view", "input": {}})
+        assert len(node.tool_calls) == 1
+        assert leaf.parent is root and leaf not in root.replies
+
+    def test_pickle_and_deepcopy(self):
+        root = MockConversationNode._create_empty()
+        node = root._add_reply(role="user", content="hi", source="cli")
+        node.set_test_metadata("k", "v")
+        for clone in (pickle.loads(pickle.dumps(root)), copy.deepcopy(root)):
+            reply = clone.replies[0]
+            assert reply.content == "hi" and reply.parent is clone
+            assert reply.source == "cli"
+            assert reply.get_test_metadata("k") == "v"
@@ -0,0 +1,113 @@
+"""Tests for the cached directory index behind code_tools.view_dir."""
+
+import os
+import time
+
+import pytest
+
+from bots.tools.code_tools import view_dir
+from bots.utils.directory_index import DirectoryIndex, is_ignored, parse_gitignore
+
+
+def _touch(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _age(directory):
+    """Backdate directory mtimes so the index may cache their listings."""
+    past = time.time() - 3600
+    for root, _, _ in os.walk(directory):
+        os.utime(root, (past, past))
+
+
+def _names(entries):
+    return ["    " * level + name + ("/" if is_dir else "") for level, name, _, is_dir in entries]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "project"
+    _touch(root / "main.py")
+    _touch(root / "notes.log")
+    _touch(root / "pkg" / "module.py")
+    _touch(root / "pkg" / "data.bin")
+    _touch(root / "assets" / "image.png")
+    _touch(root / "venv" / "pyvenv.cfg")
+    _touch(root / "venv" / "lib" / "site.py")
+    return root
+
+
+class TestGitignore:
+    @pytest.mark.parametrize(
+        "pattern, path, is_dir, expected",
+        [
+            ("*.log", "a/b/debug.log", False, True),
+            ("/build", "build", True, True),
+            ("/build", "src/build", True, False),
+            ("docs/*.tmp", "docs/x.tmp", False, True),
+            ("docs/*.tmp", "docs/sub/x.tmp", False, False),
+            ("**/cache", "a/b/cache", True, True),
+            ("out/", "out", False, False),
+            ("out/", "src/out", True, True),
+            ("a/**/z.py", "a/b/c/z.py", False, True),
+            ("file[0-9].py", "file7.py", False, True),
+        ],
+    )
+    def test_patterns(self, pattern, path, is_dir, expected):
+        assert is_ignored(parse_gitignore(pattern), path, is_dir) is expected
+
+    def test_negation_and_comments(self):
+        rules = parse_gitignore("# comment\n*.log\n!keep.log\n")
+        assert is_ignored(rules, "drop.log", False)
+        assert not is_ignored(rules, "keep.log", False)
+
+    def test_nested_base(self):
+        rules = parse_gitignore("/generated.py", base="pkg")
+        assert is_ignored(rules, "pkg/generated.py", False)
+        assert not is_ignored(rules, "generated.py", False)
+
+
+class TestDirectoryIndex:
+    def test_relevant_tree(self, tree):
+        entries = DirectoryIndex().relevant_tree(str(tree), (".py",))
+        assert _names(entries) == ["project/", "    main.py", "    pkg/", "        module.py", "    venv/"]
+
+    def test_gitignore_prunes_files_and_directories(self, tree):
+        _touch(tree / ".gitignore", "pkg/\n")
+        _touch(tree / "sub" / ".gitignore", "*.py\n!keep.py\n")
+        _touch(tree / "sub" / "drop.py")
+        _touch(tree / "sub" / "keep.py")
+        (tree / ".git").mkdir()
+        _touch(tree / ".git" / "hooks" / "hook.py")
+        entries = DirectoryIndex().relevant_tree(str(tree), (".py",))
+        assert _names(entries) == ["project/", "    main.py", "    sub/", "        keep.py", "    venv/"]
+
+    def test_ancestor_gitignore_applies(self, tree):
+        (tree / ".git").mkdir()
+        _touch(tree / ".gitignore", "module.py\n")
+        entries = DirectoryIndex().relevant_tree(str(tree / "pkg"), (".py",))
+        assert entries == []
+
+    def test_listing_cache_is_invalidated_by_mtime(self, tree):
+        _age(tree)
+        index = DirectoryIndex()
+        index.relevant_tree(str(tree), (".py",))
+        misses = index.misses
+        index.relevant_tree(str(tree), (".py",))
+        assert index.misses == misses and index.hits > 0
+        _touch(tree / "pkg" / "added.py")
+        entries = index.relevant_tree(str(tree), (".py",))
+        assert index.misses == misses + 1
+        assert "        added.py" in _names(entries)
+
+
+class TestViewDir:
+    def test_truncates_deepest_levels(self, tree):
+        full = view_dir(str(tree), target_extensions="['py']")
+        assert full.splitlines() == ["project/", "    main.py", "    pkg/", "        module.py", "    venv/"]
+        _touch(tree / "pkg" / "second.py")
+        truncated = view_dir(str(tree), target_extensions="['py']", max_lines=5)
+        assert truncated.splitlines() == ["project/", "    main.py", "    pkg/", "        ...", "    venv/"]
+        assert view_dir(str(tree), target_extensions="['py']", max_lines=4).splitlines() == ["project/", "    ..."]
+        assert view_dir(str(tree), target_extensions="['py']", max_lines=1).startswith("Project too large")
@@ -0,0 +1,84 @@
+"""Tests for the warm interpreter pool behind execute_python."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from bots.tools.python_execution_tool import execute_python
+from bots.utils import interpreter_pool
+from bots.utils.interpreter_pool import InterpreterPool
+
+PID = "import os\nprint(os.getpid())"
+
+
+@pytest.fixture
+def pool():
+    pool = InterpreterPool(size=1, max_runs=3, python=sys.executable)
+    yield pool
+    pool.close()
+
+
+def _pid(pool):
+    returncode, stdout, _ = pool.run(PID, timeout=30)
+    assert returncode == 0
+    return int(stdout)
+
+
+def test_output_and_exit_codes(pool):
+    assert pool.run("print('out')\nimport sys\nprint('err', file=sys.stderr)", timeout=30) == (0, "out\n", "err\n")
+    assert pool.run("raise SystemExit(3)", timeout=30)[0] == 3
+    returncode, _, stderr = pool.run("1 / 0", timeout=30)
+    assert returncode == 1 and "ZeroDivisionError" in stderr and "1 / 0" in stderr
+    assert pool.run("import os\nos.system('echo from-child')", timeout=30)[1] == "from-child\n"
+
+
+def test_each_run_gets_a_fresh_namespace(pool):
+    pool.run("leaked = 1", timeout=30)
+    assert pool.run("print('leaked' in globals(), __name__)", timeout=30)[1] == "False __main__\n"
+
+
+def test_follows_cwd_and_environment(pool, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BOTS_POOL_TEST", "yes")
+    stdout = pool.run("import os\nprint(os.getcwd())\nprint(os.environ['BOTS_POOL_TEST'])", timeout=30)[1]
+    assert stdout.split() == [os.getcwd(), "yes"]
+
+
+def test_workers_are_reused_then_recycled(pool):
+    pids = [_pid(pool) for _ in range(4)]
+    assert pids[0] == pids[1] == pids[2] != pids[3]
+
+
+def test_timeout_kills_the_worker(pool):
+    first = _pid(pool)
+    with pytest.raises(subprocess.TimeoutExpired):
+        pool.run("while True: pass", timeout=1)
+    assert _pid(pool) != first
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import os\nos._exit(4)",
+        "import threading, time\nthreading.Thread(target=time.sleep, args=(30,), daemon=True).start()",
+    ],
+    ids=["exit", "thread"],
+)
+def test_unhealthy_workers_are_replaced(pool, code):
+    first = _pid(pool)
+    pool.run(code, timeout=30)
+    assert _pid(pool) != first
+
+
+def test_execute_python_uses_the_pool():
+    config = interpreter_pool.get_config()
+    previous = (config.enabled, config.python)
+    interpreter_pool.configure(enabled=True, python=sys.executable)
+    try:
+        assert execute_python("print(6 * 7)") == "42\n"
+        assert "ZeroDivisionError" in execute_python("x = 1 / 0")
+        assert "timed out" in execute_python("while True:\n    pass", timeout=1).lower()
+    finally:
+        interpreter_pool.configure(enabled=previous[0], python=previous[1])
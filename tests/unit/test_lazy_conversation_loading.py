@@ -0,0 +1,146 @@
+"""Tests for lazy loading of saved conversation trees."""
+
+import json
+
+import pytest
+
+from bots.foundation import journal
+from bots.foundation.anthropic_bots import AnthropicBot
+from bots.foundation.base import Bot
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+
+
+def _turn(node, text):
+    node = node._add_reply(role="user", content=f"question {text}")
+    return node._add_reply(role="assistant", content=f"answer {text}")
+
+
+def _branched_bot(bot, branches=3, depth=4):
+    """Give bot a tree of `branches` branches of `depth` turns, ending on the last one."""
+    root = bot.conversation
+    for b in range(branches):
+        node = root
+        for d in range(depth):
+            node = _turn(node, f"{b}.{d}")
+        bot.conversation = node
+    return bot
+
+
+def _contents(node):
+    """Contents of a subtree in preorder (builds every node)."""
+    result = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        result.append(current.content)
+        stack.extend(reversed(current.replies))
+    return result
+
+
+class TestLazyLoad:
+    """Test that Bot.load only builds the active path."""
+
+    def test_only_active_path_is_built(self, bot):
+        _branched_bot(bot)
+        bot.save("tree.bot")
+
+        loaded = Bot.load("tree.bot")
+
+        assert loaded.conversation.content == "answer 2.3"
+        root = loaded.conversation._find_root()
+        # Branches off the active path are built shallowly, their replies stay saved
+        first_branch = root.replies[0]
+        assert first_branch._unloaded_replies is not None
+        assert first_branch.content == "question 0.0"
+        assert loaded.conversation._build_messages() == bot.conversation._build_messages()
+
+    def test_branches_load_on_demand(self, bot):
+        _branched_bot(bot)
+        bot.save("tree.bot")
+        loaded = Bot.load("tree.bot")
+
+        original_root = bot.conversation._find_root()
+        loaded_root = loaded.conversation._find_root()
+        assert _contents(loaded_root) == _contents(original_root)
+        leaf = loaded_root.replies[0]
+        while leaf.replies:
+            leaf = leaf.replies[0]
+        assert leaf.content == "answer 0.3"
+        assert leaf.parent.parent.content == "answer 0.2"
+
+    def test_node_count_does_not_build_nodes(self, bot):
+        _branched_bot(bot)
+        bot.save("tree.bot")
+        loaded = Bot.load("tree.bot")
+        root = loaded.conversation._find_root()
+
+        assert root._node_count() == bot.conversation._find_root()._node_count()
+        assert root.replies[0]._unloaded_replies is not None
+
+    def test_resave_keeps_unvisited_branches(self, bot):
+        _branched_bot(bot)
+        bot.save("tree.bot")
+        with open("tree.bot") as f:
+            saved = json.load(f)["conversation"]
+
+        loaded = Bot.load("tree.bot")
+        loaded.save("copy.bot")
+        with open("copy.bot") as f:
+            resaved = json.load(f)["conversation"]
+
+        assert resaved == saved
+        # Saving did not build the unvisited branches
+        assert loaded.conversation._find_root().replies[0]._unloaded_replies is not None
+
+    def test_from_dict_does_not_modify_input(self, bot):
+        _branched_bot(bot, branches=2, depth=1)
+        data = bot.conversation._root_dict()
+        snapshot = json.dumps(data, sort_keys=True)
+        node = type(bot.conversation)._from_dict(data, lazy=True)
+        _contents(node)
+        type(bot.conversation)._from_dict(data)
+        assert json.dumps(data, sort_keys=True) == snapshot
+
+
+class TestLazyJournal:
+    """Test quicksave journals on lazily loaded trees."""
+
+    def test_journal_on_unvisited_branches(self, bot):
+        _branched_bot(bot)
+        bot.save("tree.bot")
+        loaded = Bot.load("tree.bot")
+        loaded.save(quicksave=True)
+        root = loaded.conversation._find_root()
+        assert root.replies[0]._unloaded_replies is not None
+
+        # Visit an unloaded branch, continue it and autosave
+        node = root.replies[0].replies[0]
+        loaded.conversation = _turn(node, "new")
+        loaded.save(quicksave=True)
+
+        with open(journal.journal_path("quicksave.bot")) as f:
+            records = [json.loads(line) for line in f.read().splitlines()[1:]]
+        node_records = [r for r in records if r["op"] == "node"]
+        assert [r["data"]["content"] for r in node_records][-2:] == ["question new", "answer new"]
+
+        reloaded = Bot.load("quicksave.bot")
+        assert reloaded.conversation.content == "answer new"
+        assert reloaded.conversation.parent.parent.content == "answer 0.0"
+        assert _contents(reloaded.conversation._find_root()) == _contents(root)
+
+    def test_replay_builds_only_referenced_nodes(self, bot):
+        _branched_bot(bot)
+        bot.save(quicksave=True)
+        bot.conversation = _turn(bot.conversation, "extra")
+        bot.save(quicksave=True)
+
+        reloaded = Bot.load("quicksave.bot")
+        assert reloaded.conversation.content == "answer extra"
+        root = reloaded.conversation._find_root()
+        assert root.replies[0]._unloaded_replies is not None
+        assert _contents(root) == _contents(bot.conversation._find_root())
@@ -0,0 +1,114 @@
+"""Tests for per-node cached message building in ConversationNode subclasses."""
+
+from unittest.mock import patch
+
+from bots.foundation.anthropic_bots import AnthropicNode, CacheController
+from bots.foundation.base import ConversationNode
+from bots.foundation.gemini_bots import GeminiNode
+from bots.foundation.openai_bots import OpenAINode
+
+
+def _anthropic_chain(turns):
+    node = AnthropicNode._create_empty(AnthropicNode)
+    for i in range(turns):
+        node = node._add_reply(role="user", content=f"question {i}")
+        node = node._add_reply(role="assistant", content=f"answer {i}")
+        node._add_tool_calls([{"id": f"call_{i}", "name": "view", "input": {"file_path": f"f{i}.py"}}])
+        node._add_tool_results([{"tool_use_id": f"call_{i}", "content": f"contents {i}"}])
+    return node._add_reply(role="user", content="done")
+
+
+def _count_node_messages(node_class):
+    original = node_class._node_messages
+    calls = []
+
+    def counting(self):
+        calls.append(self)
+        return original(self)
+
+    return patch.object(node_class, "_node_messages", counting), calls
+
+
+class TestMessageCache:
+    """Test that nodes reuse their formatted messages."""
+
+    def test_anthropic_format(self):
+        node = _anthropic_chain(1)
+        messages = node._build_messages()
+        assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+        assert messages[1]["content"][1] == {
+            "type": "tool_use",
+            "id": "call_0",
+            "name": "view",
+            "input": {"file_path": "f0.py"},
+        }
+        assert messages[2]["content"][0] == {"type": "tool_result", "tool_use_id": "call_0", "content": "contents 0"}
+        assert messages[2]["content"][1] == {"type": "text", "text": "done"}
+
+    def test_second_build_reuses_cache(self):
+        node = _anthropic_chain(50)
+        first = node._build_messages()
+        patcher, calls = _count_node_messages(AnthropicNode)
+        with patcher:
+            second = node._build_messages()
+            node = node._add_reply(role="assistant", content="new")
+            third = node._build_messages()
+        assert second == first
+        assert calls == [node]
+        assert third[:-1] == first
+
+    def test_reassigning_content_invalidates(self):
+        node = _anthropic_chain(3)
+        node._build_messages()
+        node.parent.content = "edited"
+        assert node._build_messages()[-2]["content"][0]["text"] == "edited"
+
+    def test_appending_tool_results_invalidates(self):
+        root = AnthropicNode._create_empty(AnthropicNode)
+        assistant = root._add_reply(role="user", content="hi")._add_reply(role="assistant", content="calling")
+        assistant._add_tool_calls([{"id": "a", "name": "t", "input": {}}])
+        assert len(assistant._build_messages()[-1]["content"]) == 2
+        assistant._add_tool_calls([{"id": "b", "name": "t", "input": {}}])
+        assert len(assistant._build_messages()[-1]["content"]) == 3
+
+    def test_explicit_invalidation(self):
+        node = _anthropic_chain(1)
+        node._build_messages()
+        node.parent.tool_calls[0]["name"] = "renamed"
+        node.parent._invalidate_message_cache()
+        assert node._build_messages()[1]["content"][1]["name"] == "renamed"
+
+    def test_cache_controller_does_not_leak_into_cache(self):
+        node = _anthropic_chain(10)
+        CacheController().manage_cache_controls(node._build_messages())
+        rebuilt = node._build_messages()
+        assert CacheController().find_cache_control_positions(rebuilt) == []
+
+    def test_openai_tool_messages(self):
+        node = OpenAINode._create_empty(OpenAINode)
+        node = node._add_reply(role="user", content="hi")
+        node = node._add_reply(role="assistant", content="", tool_calls=[{"id": "c1"}])
+        node.tool_results = [{"role": "tool", "tool_call_id": "c1", "content": "ok"}]
+        messages = node._build_messages()
+        assert messages == [
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "c1"}]},
+            {"role": "tool", "tool_call_id": "c1", "content": "ok"},
+        ]
+        messages[2]["content"] = "mutated"
+        assert node._build_messages()[2]["content"] == "ok"
+
+    def test_gemini_and_base_nodes(self):
+        gemini = GeminiNode._create_empty(GeminiNode)._add_reply(role="user", content="hi")
+        gemini = gemini._add_reply(role="assistant", content="hello")
+        assert gemini._build_messages() == [
+            {"role": "user", "parts": [{"text": "hi"}]},
+            {"role": "model", "parts": [{"text": "hello"}]},
+        ]
+        base = ConversationNode._create_empty()._add_reply(role="user", content="hi")
+        assert base._build_messages() == [{"role": "user", "content": "hi", "tool_calls": [], "tool_results": []}]
+
+    def test_cache_not_serialized(self):
+        node = _anthropic_chain(2)
+        node._build_messages()
+        assert "_message_cache" not in node.parent._to_dict_self()
@@ -0,0 +1,92 @@
+"""Tests for the content-addressed tool module store used by Bot.save/Bot.load."""
+
+import json
+import os
+
+import pytest
+
+from bots.foundation import module_store
+from bots.foundation.anthropic_bots import AnthropicBot
+from bots.foundation.base import Bot
+from bots.foundation.module_store import STORE_DIRNAME, ModuleStore
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    module_store.clear_cache()
+    import bots.tools.code_tools as code_tools
+
+    bot = AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+    bot.add_tools(code_tools)
+    return bot
+
+
+def _store_files(directory):
+    return sorted(os.listdir(os.path.join(directory, STORE_DIRNAME)))
+
+
+class TestModuleStoreSave:
+    """Test what Bot.save writes."""
+
+    def test_bot_file_references_store(self, bot, tmp_path):
+        bot.save("a.bot")
+        with open("a.bot") as f:
+            data = json.load(f)
+        modules = data["tool_handler"]["modules"]
+        assert modules
+        for module_data in modules.values():
+            assert "source" not in module_data and "globals" not in module_data
+            assert module_data["source_ref"] == module_data["code_hash"]
+            assert os.path.exists(tmp_path / STORE_DIRNAME / f"{module_data['source_ref']}.json")
+
+    def test_store_is_shared_by_bots_in_directory(self, bot, tmp_path):
+        bot.save("a.bot")
+        files = _store_files(tmp_path)
+        bot.save("b.bot")
+        assert _store_files(tmp_path) == files
+        assert os.path.getsize("b.bot") < 64 * 1024
+
+
+class TestModuleStoreLoad:
+    """Test that Bot.load resolves module references."""
+
+    def test_load_restores_tools(self, bot):
+        bot.save("a.bot")
+        module_store.clear_cache()
+
+        loaded = Bot.load("a.bot")
+
+        assert set(loaded.tool_handler.function_map) == set(bot.tool_handler.function_map)
+        assert loaded.tool_handler.to_dict()["modules"].keys() == bot.tool_handler.to_dict()["modules"].keys()
+
+    def test_inline_saved_files_still_load(self, bot):
+        data = bot._serialize()
+        with open("inline.bot", "w") as f:
+            json.dump(data, f)
+
+        loaded = Bot.load("inline.bot")
+
+        assert set(loaded.tool_handler.function_map) == set(bot.tool_handler.function_map)
+
+    def test_missing_blob_skips_module(self, bot, tmp_path, capsys):
+        bot.save("a.bot")
+        module_store.clear_cache()
+        for name in _store_files(tmp_path):
+            os.remove(tmp_path / STORE_DIRNAME / name)
+
+        loaded = Bot.load("a.bot")
+
+        assert "Module store entry missing" in capsys.readouterr().out
+        assert not loaded.tool_handler.modules
+
+    def test_inline_resolves_references(self, bot, tmp_path):
+        store = ModuleStore.for_file(str(tmp_path / "a.bot"))
+        original = bot.tool_handler.to_dict()
+        externalized = store.externalize(bot.tool_handler.to_dict())
+
+        inlined = store.inline(externalized)
+
+        for path, module_data in original["modules"].items():
+            assert inlined["modules"][path]["source"] == module_data["source"]
+            assert inlined["modules"][path]["globals"] == json.loads(json.dumps(module_data["globals"]))
@@ -0,0 +1,65 @@
+"""Tests for the single-pass mojibake repair in terminal_tools."""
+
+from bots.tools.terminal_tools import (
+    _mojibake_matchers,
+    _repair_mojibake_in_text,
+    repair_mojibake,
+    repair_mojibake_in_directory,
+)
+
+
+def _mojibake(text):
+    return text.encode("utf-8").decode("latin-1")
+
+
+class TestMojibakeRepair:
+    def test_text_repair_counts_each_pattern(self):
+        text = f"{_mojibake('café')} {_mojibake('→')} {_mojibake('→')} plain"
+        repaired, count, made = _repair_mojibake_in_text(text)
+        assert repaired == "café → → plain"
+        assert count == 3
+        assert made[_mojibake("→")] == ("→", 2)
+
+    def test_custom_map_takes_longest_match(self):
+        repaired, count, _ = _repair_mojibake_in_text("abcab", {"ab": "1", "abc": "2"})
+        assert (repaired, count) == ("21", 2)
+
+    def test_matchers_are_built_once(self):
+        assert _mojibake_matchers() is _mojibake_matchers()
+
+    def test_file_repair_keeps_line_endings(self, tmp_path):
+        path = tmp_path / "notes.md"
+        # Double-encoded em dash, built from bytes so the pre-commit hook leaves this file alone
+        double_encoded = b"\xc3\xa2\xe2\x82\xac\xe2\x80\x9d".decode("utf-8")
+        path.write_bytes(f"one {_mojibake('é')}\r\ntwo {double_encoded}\r\n".encode("utf-8"))
+        summary = repair_mojibake(str(path), backup="false")
+        assert summary.startswith("Repaired 2 mojibake character(s)")
+        assert path.read_bytes() == "one é\r\ntwo —\r\n".encode("utf-8")
+
+    def test_clean_file_is_untouched(self, tmp_path):
+        path = tmp_path / "clean.txt"
+        path.write_text("nothing → to fix", encoding="utf-8")
+        assert repair_mojibake(str(path)).startswith("No mojibake found")
+        assert not (tmp_path / "clean.txt.bak").exists()
+
+
+class TestDirectoryRepair:
+    def test_batch_repairs_matching_files(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "a.md").write_text(_mojibake("café"), encoding="utf-8")
+        (tmp_path / "b.txt").write_text(_mojibake("café"), encoding="utf-8")
+        (tmp_path / "c.md").write_text("clean", encoding="utf-8")
+        (tmp_path / "binary.md").write_bytes(b"\xff\xfe" + _mojibake("é").encode("utf-8"))
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "d.md").write_text(_mojibake("é"), encoding="utf-8")
+
+        summary = repair_mojibake_in_directory(str(tmp_path), "*.md", backup="true")
+
+        assert summary.startswith("Repaired 1 mojibake character(s) in 1 file(s); scanned 3 file(s)")
+        assert (tmp_path / "sub" / "a.md").read_text(encoding="utf-8") == "café"
+        assert (tmp_path / "sub" / "a.md.bak").exists()
+        assert (tmp_path / "b.txt").read_text(encoding="utf-8") == _mojibake("café")
+        assert (tmp_path / ".git" / "d.md").read_text(encoding="utf-8") == _mojibake("é")
+
+    def test_missing_directory(self, tmp_path):
+        assert repair_mojibake_in_directory(str(tmp_path / "missing")).startswith("Error")
@@ -1026,5 +1026,89 @@ class TestMetricsHistoryEdgeCases:
         assert result["output"] == 500
 
 
+class TestMetricsHistoryRetention:
+    """Test the bounded, indexed metrics history."""
+
+    def test_totals_since_uses_running_totals(self):
+        history = metrics.MetricsHistory(max_entries=10)
+        history.append(1.0, 10, 1, 0, 0.0)
+        history.append(2.0, 20, 2, 5, 0.5)
+        history.append(3.0, 30, 3, 0, 0.25)
+
+        assert history.totals_since(0.0) == (60, 6, 5, 0.75)
+        assert history.totals_since(1.0) == (50, 5, 5, 0.75)
+        assert history.totals_since(2.5) == (30, 3, 0, 0.25)
+        assert history.totals_since(3.0) == (0, 0, 0, 0.0)
+
+    def test_backwards_timestamp_is_clamped(self):
+        history = metrics.MetricsHistory(max_entries=10)
+        history.append(5.0, 1, 0, 0, 0.0)
+        history.append(4.0, 2, 0, 0, 0.0)
+        assert history.totals_since(4.5)[0] == 3
+
+    def test_history_is_bounded(self):
+        history = metrics.MetricsHistory(max_entries=5)
+        for i in range(100):
+            history.append(float(i), 1, 0, 0, 0.0)
+
+        assert 5 <= len(history) <= 10
+        # Recent entries are always retained
+        assert history.totals_since(94.5)[0] == 5
+        assert history.totals_since(-1.0)[0] == len(history)
+
+    def test_bot_history_limit_and_eviction(self):
+        metrics.reset_metrics()
+        try:
+            metrics.configure_history_limits(max_bot_entries=3, max_bots=2)
+            for _ in range(20):
+                metrics.record_tokens(1, 0, "anthropic", "claude", bot_id="bot_a")
+            metrics.record_tokens(1, 0, "anthropic", "claude", bot_id="bot_b")
+            metrics.record_tokens(1, 0, "anthropic", "claude", bot_id="bot_a")
+            metrics.record_tokens(1, 0, "anthropic", "claude", bot_id="bot_c")
+
+            # bot_b was least recently updated and is dropped
+            assert sorted(metrics.get_all_bot_ids()) == ["bot_a", "bot_c"]
+            assert metrics.get_bot_tokens("bot_a")["input"] <= 6
+            # The global history is unaffected by per-bot limits
+            assert metrics.get_total_tokens(0.0)["input"] == 23
+        finally:
+            metrics.configure_history_limits(max_bot_entries=10_000, max_bots=1_000)
+            metrics.reset_metrics()
+
+
+class TestPromptCacheMetrics:
+    """Test per-bot prompt cache read/creation tracking."""
+
+    def test_cache_stats_per_bot(self):
+        metrics.reset_metrics()
+        try:
+            metrics.record_cache_usage(0, 900, 100, "anthropic", "claude", bot_id="bot_a")
+            metrics.record_cache_usage(900, 50, 50, "anthropic", "claude", bot_id="bot_a")
+            metrics.record_cache_usage(0, 0, 500, "anthropic", "claude", bot_id="bot_b")
+
+            stats = metrics.get_cache_stats("bot_a")
+            assert stats["cache_read"] == 900 and stats["cache_creation"] == 950 and stats["requests"] == 2
+            assert stats["read_ratio"] == pytest.approx(0.45)
+            assert stats["creation_ratio"] == pytest.approx(0.475)
+            assert metrics.get_cache_stats("bot_b")["read_ratio"] == 0.0
+            assert metrics.get_cache_stats("unknown")["requests"] == 0
+            assert metrics.get_cache_stats()["uncached"] == 650
+        finally:
+            metrics.reset_metrics()
+
+    def test_cache_tokens_counter(self, setup_test_metrics):
+        metrics.record_cache_usage(300, 200, 0, "anthropic", "claude", bot_id="bot_a")
+        metric_data = setup_test_metrics.get_metrics_data()
+        points = {
+            point.attributes["cache_type"]: point.value
+            for resource_metric in metric_data.resource_metrics
+            for scope_metric in resource_metric.scope_metrics
+            for metric in scope_metric.metrics
+            if metric.name == "bot.prompt_cache_tokens"
+            for point in metric.data.data_points
+        }
+        assert points == {"cache_read": 300, "cache_creation": 200}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""Tests for PowerShellSession's command framing and BOM cleanup, using a fake process."""
+
+import codecs
+import re
+
+from bots.tools.terminal_tools import BOMRemover, PowerShellSession
+
+
+class FakeStdin:
+    """Answers each written command on the session's output queue, like PowerShell would."""
+
+    def __init__(self, session, directory, on_command=None):
+        self.session = session
+        self.directory = directory
+        self.on_command = on_command
+        self.writes = []
+
+    def write(self, data):
+        text = data.decode("utf-8")
+        self.writes.append(text)
+        if self.on_command:
+            self.on_command(text)
+        self.session._output_queue.put("output line")
+        delimiter = re.search(r"<<<COMMAND_\d+_COMPLETE>>>", text).group(0)
+        self.session._output_queue.put(f"{delimiter} {self.directory}")
+
+    def flush(self):
+        pass
+
+
+class FakeProcess:
+    def __init__(self, stdin):
+        self.stdin = stdin
+
+    def poll(self):
+        return None
+
+
+def _session(directory, on_command=None):
+    session = PowerShellSession()
+    stdin = FakeStdin(session, str(directory), on_command)
+    session._process = FakeProcess(stdin)
+    session._current_directory = str(directory)
+    return session, stdin
+
+
+class TestPowerShellSession:
+    def test_one_round_trip_reports_directory(self, tmp_path):
+        session, stdin = _session(tmp_path)
+        output = session.execute("Get-ChildItem")
+        assert len(stdin.writes) == 1
+        assert "(Get-Location).Path" in stdin.writes[0]
+        assert output.splitlines() == [f"{tmp_path}> Get-ChildItem", "output line"]
+
+    def test_bom_cleanup_only_touches_changed_files(self, tmp_path):
+        untouched = tmp_path / "old.txt"
+        untouched.write_bytes(codecs.BOM_UTF8 + b"old")
+        written = tmp_path / "new.txt"
+        session, _ = _session(tmp_path, lambda code: written.write_bytes(codecs.BOM_UTF8 + b"new"))
+        output = session.execute("'new' | Out-File new.txt")
+        assert "[BOM cleanup: 1 files processed]" in output.splitlines()[0]
+        assert written.read_bytes() == b"new"
+        assert untouched.read_bytes().startswith(codecs.BOM_UTF8)
+
+    def test_commands_without_file_operations_skip_cleanup(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(BOMRemover, "snapshot_directory", staticmethod(lambda directory: calls.append(directory) or {}))
+        session, _ = _session(tmp_path)
+        session.execute("Get-Date")
+        assert calls == []
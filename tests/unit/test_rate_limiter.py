@@ -0,0 +1,187 @@
+"""Tests for the process-wide provider rate limiter."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bots.foundation import client_pool, rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def clean_limiter():
+    """Start every test with no limiters and default (unlimited) configuration."""
+    rate_limiter.clear()
+    yield
+    rate_limiter.clear()
+
+
+def _error_with_headers(headers):
+    error = Exception("rate limited")
+    error.response = MagicMock(headers=headers)
+    return error
+
+
+class TestConfiguration:
+    """Test how limits are resolved for a provider/model."""
+
+    def test_defaults_are_unlimited(self):
+        config = rate_limiter.get_config("anthropic", "model")
+        assert config == rate_limiter.RateLimitConfig()
+
+    def test_model_overrides_provider_overrides_defaults(self):
+        rate_limiter.configure(max_in_flight=1)
+        rate_limiter.configure("anthropic", max_in_flight=2)
+        rate_limiter.configure("anthropic", "haiku", max_in_flight=3)
+        assert rate_limiter.get_config("openai", "gpt").max_in_flight == 1
+        assert rate_limiter.get_config("anthropic", "sonnet").max_in_flight == 2
+        assert rate_limiter.get_config("anthropic", "haiku").max_in_flight == 3
+
+    def test_limiter_is_shared_and_keyed_by_enum_value(self):
+        engine = MagicMock(value="claude-x")
+        assert rate_limiter.get_limiter("anthropic", engine) is rate_limiter.get_limiter("anthropic", "claude-x")
+        assert rate_limiter.get_limiter("anthropic", "a") is not rate_limiter.get_limiter("anthropic", "b")
+
+    def test_configure_rebuilds_limiters(self):
+        before = rate_limiter.get_limiter("openai", "gpt")
+        rate_limiter.configure("openai", max_in_flight=4)
+        after = rate_limiter.get_limiter("openai", "gpt")
+        assert after is not before
+        assert after.config.max_in_flight == 4
+
+
+class TestLimits:
+    """Test the in-flight cap, rate buckets and retry-after pause."""
+
+    def test_max_in_flight_caps_concurrent_threads(self):
+        rate_limiter.configure("fake", max_in_flight=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with rate_limiter.limit("fake", "m"):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(peak) == 8
+        assert max(peak) <= 2
+        assert rate_limiter.get_limiter("fake", "m").in_flight == 0
+
+    def test_slot_released_on_error(self):
+        rate_limiter.configure("fake", max_in_flight=1)
+        with pytest.raises(ValueError):
+            with rate_limiter.limit("fake", "m"):
+                raise ValueError("boom")
+        assert rate_limiter.get_limiter("fake", "m").in_flight == 0
+
+    def test_requests_per_minute_waits_for_refill(self):
+        rate_limiter.configure("fake", requests_per_minute=1200)  # 20/s, burst of 1200
+        limiter = rate_limiter.get_limiter("fake", "m")
+        limiter._requests.level = 1.0
+        start = time.monotonic()
+        with rate_limiter.limit("fake", "m"):
+            pass
+        with rate_limiter.limit("fake", "m"):
+            pass
+        assert time.monotonic() - start >= 0.04
+
+    def test_requests_per_minute_below_one(self):
+        rate_limiter.configure("fake", requests_per_minute=0.5)
+        limiter = rate_limiter.get_limiter("fake", "m")
+        with rate_limiter.limit("fake", "m"):
+            pass
+        assert limiter._requests.reserve(1.0) == pytest.approx(120, rel=0.01)
+
+    def test_token_debt_delays_next_request(self):
+        rate_limiter.configure("fake", tokens_per_minute=6000)  # 100 tokens/s
+        limiter = rate_limiter.get_limiter("fake", "m")
+        rate_limiter.record_usage("fake", "m", 6005)
+        assert limiter._tokens.debt_wait() > 0
+        start = time.monotonic()
+        with rate_limiter.limit("fake", "m"):
+            pass
+        assert time.monotonic() - start >= 0.04
+
+    def test_async_slot_respects_cap(self):
+        rate_limiter.configure("fake", max_in_flight=1)
+        peak = []
+
+        async def call():
+            async with rate_limiter.alimit("fake", "m"):
+                peak.append(rate_limiter.get_limiter("fake", "m").in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(call() for _ in range(4)))
+
+        asyncio.run(main())
+        assert peak == [1, 1, 1, 1]
+
+
+class TestRetryAfter:
+    """Test that provider retry-after headers pause every caller."""
+
+    def test_retry_after_headers(self):
+        assert rate_limiter.retry_after(_error_with_headers({"retry-after-ms": "250"})) == 0.25
+        assert rate_limiter.retry_after(_error_with_headers({"retry-after": "3"})) == 3.0
+        assert rate_limiter.retry_after(_error_with_headers({"retry-after": "soon"})) is None
+        assert rate_limiter.retry_after(Exception("no response")) is None
+
+    def test_record_error_pauses_limiter(self):
+        delay = rate_limiter.record_error("fake", "m", _error_with_headers({"retry-after-ms": "50"}))
+        assert delay == 0.05
+        start = time.monotonic()
+        with rate_limiter.limit("fake", "m"):
+            pass
+        assert time.monotonic() - start >= 0.04
+
+    def test_record_error_without_header_does_not_pause(self):
+        assert rate_limiter.record_error("fake", "m", Exception("boom")) is None
+        assert rate_limiter.get_limiter("fake", "m").blocked_until == 0.0
+
+
+class TestMailboxIntegration:
+    """Test that the Anthropic mailbox goes through the limiter."""
+
+    def test_anthropic_send_charges_tokens_and_holds_slot(self):
+        from bots.foundation.anthropic_bots import AnthropicBot
+
+        client_pool.clear()
+        bot = AnthropicBot(api_key="test-key", autosave=False, enable_tracing=False)
+        rate_limiter.configure("anthropic", max_in_flight=1, tokens_per_minute=1_000_000)
+        limiter = rate_limiter.get_limiter("anthropic", bot.model_engine)
+        seen = []
+
+        def create(**kwargs):
+            seen.append(limiter.in_flight)
+            response = MagicMock()
+            response.usage = MagicMock(
+                input_tokens=10, output_tokens=5, cache_creation_input_tokens=0, cache_read_input_tokens=0
+            )
+            return response
+
+        mock_class = MagicMock()
+        mock_class.return_value.messages.create.side_effect = create
+        try:
+            with patch("anthropic.Anthropic", mock_class):
+                bot.conversation = bot.conversation._add_reply(role="user", content="hi")
+                bot.mailbox.send_message(bot)
+        finally:
+            client_pool.clear()
+
+        assert seen == [1]
+        assert limiter.in_flight == 0
+        assert limiter._tokens.level <= 1_000_000 - 15
@@ -0,0 +1,121 @@
+"""Tests for the content-addressed response store and ReplayMailbox."""
+
+import copy
+import os
+
+import anthropic
+import pytest
+
+from bots.testing.mock_bot import MockBot
+from bots.testing.replay import (
+    ReplayMailbox,
+    ReplayMissError,
+    ResponseStore,
+    decode_response,
+    encode_response,
+    request_key,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResponseStore(str(tmp_path / "responses.sqlite"))
+    yield store
+    store.close()
+
+
+def _bot(store, mode="record"):
+    bot = MockBot(autosave=False)
+    bot.mailbox = ReplayMailbox(bot.mailbox, store, mode=mode)
+    return bot
+
+
+class TestReplayMailbox:
+    def test_identical_requests_are_served_from_store(self, store):
+        reply = _bot(store).respond("hello")
+        second = _bot(store)
+        second.mailbox.set_response_pattern("different")
+        assert second.respond("hello") == reply
+        assert second.mailbox.hits == 1 and second.mailbox.misses == 0
+        assert second.mailbox.mailbox._call_count == 0
+
+    def test_key_covers_request_parts(self, store):
+        bot = _bot(store)
+        bot.conversation = bot.conversation._add_reply(role="user", content="hello")
+        key = request_key(bot)
+        bot.temperature = 0.9
+        assert request_key(bot) != key
+        bot.temperature = 0.3
+        bot.set_system_message("be brief")
+        assert request_key(bot) != key
+
+    def test_replay_miss_raises(self, store):
+        bot = _bot(store, mode="replay")
+        with pytest.raises(ReplayMissError):
+            bot.respond("never recorded")
+
+    def test_passthrough_stores_nothing(self, store):
+        bot = _bot(store, mode="passthrough")
+        bot.respond("hello")
+        assert store.stats()[0] == 0 and bot.mailbox.misses == 1
+
+    def test_unknown_mode(self, store):
+        with pytest.raises(ValueError):
+            _bot(store, mode="sometimes")
+
+    def test_copies_share_the_store(self, store):
+        bot = _bot(store)
+        bot.respond("hello")
+        clone = copy.deepcopy(bot)
+        assert isinstance(clone.mailbox, ReplayMailbox)
+        assert clone.mailbox.store is store and clone.mailbox.mailbox is not bot.mailbox.mailbox
+
+    def test_forks_share_the_store(self, store):
+        bot = _bot(store)
+        bot.respond("hello")
+        fork = bot.fork()
+        assert isinstance(fork.mailbox, ReplayMailbox) and fork.mailbox.store is store
+        fork.respond("again")
+        assert store.stats()[0] == 2
+
+    def test_store_persists(self, tmp_path):
+        path = str(tmp_path / "persist.sqlite")
+        store = ResponseStore(path)
+        _bot(store).respond("hello")
+        store.close()
+        reopened = ResponseStore(path)
+        bot = _bot(reopened, mode="replay")
+        assert bot.respond("hello")
+        reopened.close()
+
+
+class TestResponseStore:
+    def test_lru_eviction(self):
+        payload = {"kind": "dict", "data": {"text": os.urandom(64).hex()}}
+        store = ResponseStore(":memory:", max_bytes=300)
+        store.put("a", payload)
+        store.put("b", payload)
+        store.get("a")
+        store.put("c", payload)
+        count, size = store.stats()
+        assert count == 2 and size <= 300
+        assert store.get("b") is None
+        assert store.get("a") == payload and store.get("c") == payload
+
+    def test_sdk_response_round_trip(self):
+        message = anthropic.types.Message(
+            id="msg_1",
+            type="message",
+            role="assistant",
+            model="claude-haiku-4-5",
+            content=[{"type": "text", "text": "hi"}],
+            stop_reason="end_turn",
+            usage={"input_tokens": 3, "output_tokens": 1},
+        )
+        restored = decode_response(encode_response(message))
+        assert isinstance(restored, anthropic.types.Message)
+        assert restored == message
+
+    def test_unsupported_response(self):
+        with pytest.raises(TypeError):
+            encode_response(object())
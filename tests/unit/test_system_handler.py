@@ -28,6 +28,7 @@ class TestSystemHandlerDataFormat:
         self.mock_config.auto_backup = False
         self.mock_config.auto_restore_on_error = False
         self.mock_config.color = "auto"
+        self.mock_config.stream = False
 
         self.mock_context = MagicMock(spec=CLIContext)
         self.mock_context.config = self.mock_config
@@ -175,6 +176,7 @@ class TestSystemHandlerNoDirectPretty:
         self.mock_config.auto_backup = False
         self.mock_config.auto_restore_on_error = False
         self.mock_config.color = "auto"
+        self.mock_config.stream = False
 
         self.mock_context = MagicMock(spec=CLIContext)
         self.mock_context.config = self.mock_config
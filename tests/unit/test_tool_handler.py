@@ -332,3 +332,40 @@ class TestToolRegistry(unittest.TestCase):
         result = new_handler.load_tool_by_name("registered_tool")
         self.assertTrue(result)
         self.assertIn("registered_tool", new_handler.function_map)
+
+
+class TestToolCallPlan(unittest.TestCase):
+    """Test the per-function call plans used by exec_requests."""
+
+    def test_plan_is_cached_per_function(self):
+        from bots.foundation.base import get_tool_call_plan
+
+        def plain(x):
+            return x
+
+        def needs_bot(x, _bot=None):
+            return x
+
+        async def coroutine_tool(x):
+            return x
+
+        self.assertFalse(get_tool_call_plan(plain).takes_bot)
+        self.assertTrue(get_tool_call_plan(needs_bot).takes_bot)
+        self.assertTrue(get_tool_call_plan(coroutine_tool).is_coroutine)
+        self.assertIs(get_tool_call_plan(plain), get_tool_call_plan(plain))
+
+    def test_bot_injected_from_plan(self):
+        handler = DummyToolHandler()
+        handler.bot = object()
+        seen = []
+
+        def with_bot(x, _bot=None):
+            """Record the injected bot."""
+            seen.append(_bot)
+            return x
+
+        handler.add_tool(with_bot)
+        _, call_kwargs = handler._prepare_tool_call("with_bot", {"x": 1})
+        self.assertIs(call_kwargs["_bot"], handler.bot)
+        _, call_kwargs = handler._prepare_tool_call("with_bot", {"x": 2})
+        self.assertEqual(call_kwargs, {"x": 2, "_bot": handler.bot})
@@ -0,0 +1,161 @@
+"""Tests for opt-in concurrent tool execution in ToolHandler.exec_requests."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from bots.dev.decorators import toolify
+from bots.foundation.anthropic_bots import AnthropicToolHandler
+
+events = []
+events_lock = threading.Lock()
+
+
+@toolify(parallel_safe=True)
+def slow_read(name: str) -> str:
+    """Sleep briefly and echo the name."""
+    with events_lock:
+        events.append(("start", name))
+    time.sleep(0.3)
+    with events_lock:
+        events.append(("end", name))
+    return f"read {name}"
+
+
+@toolify()
+def write_marker(name: str) -> str:
+    """Record a side effect that must not overlap other tools."""
+    with events_lock:
+        events.append(("write", name))
+    return f"wrote {name}"
+
+
+def failing_read(name: str) -> str:
+    """Always raises."""
+    raise ValueError(f"cannot read {name}")
+
+
+failing_read.__parallel_safe__ = True
+
+
+def _request(i, tool, name):
+    return {"type": "tool_use", "id": f"call_{i}", "name": tool, "input": {"name": name}}
+
+
+def _handler(parallel=True):
+    handler = AnthropicToolHandler()
+    handler.add_tool(slow_read)
+    handler.add_tool(write_marker)
+    handler.add_tool(failing_read)
+    handler.parallel_execution = parallel
+    return handler
+
+
+class TestParallelExecution:
+    """Test concurrency, ordering and barriers."""
+
+    def setup_method(self):
+        events.clear()
+
+    def test_parallel_safe_tools_run_concurrently(self):
+        handler = _handler()
+        handler.requests = [_request(i, "slow_read", f"f{i}") for i in range(4)]
+
+        start = time.perf_counter()
+        results = handler.exec_requests()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.9
+        assert [r["tool_use_id"] for r in results] == ["call_0", "call_1", "call_2", "call_3"]
+        assert [r["content"] for r in results] == ["read f0", "read f1", "read f2", "read f3"]
+        assert handler.results == results
+
+    def test_disabled_by_default(self):
+        handler = _handler(parallel=False)
+        handler.requests = [_request(i, "slow_read", f"f{i}") for i in range(2)]
+
+        handler.exec_requests()
+
+        assert [e[0] for e in events] == ["start", "end", "start", "end"]
+
+    def test_unsafe_tool_acts_as_barrier(self):
+        handler = _handler()
+        handler.requests = [
+            _request(0, "slow_read", "a"),
+            _request(1, "slow_read", "b"),
+            _request(2, "write_marker", "w"),
+            _request(3, "slow_read", "c"),
+        ]
+
+        results = handler.exec_requests()
+
+        write_index = events.index(("write", "w"))
+        assert {e for e in events[:write_index]} == {("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")}
+        assert events[write_index + 1 :] == [("start", "c"), ("end", "c")]
+        assert [r["tool_use_id"] for r in results] == ["call_0", "call_1", "call_2", "call_3"]
+
+    def test_errors_keep_their_slot(self):
+        handler = _handler()
+        handler.requests = [
+            _request(0, "slow_read", "a"),
+            _request(1, "failing_read", "b"),
+            _request(2, "missing_tool", "c"),
+        ]
+
+        results = handler.exec_requests()
+
+        assert results[0]["content"] == "read a"
+        assert "cannot read b" in str(results[1]["content"])
+        assert "not found" in str(results[2]["content"])
+
+    def test_callbacks_fire_for_every_tool(self):
+        handler = _handler()
+        handler.bot = MagicMock()
+        handler.requests = [_request(i, "slow_read", f"f{i}") for i in range(3)]
+
+        handler.exec_requests()
+
+        callbacks = handler.bot.callbacks
+        assert callbacks.on_tool_start.call_count == 3
+        assert callbacks.on_tool_complete.call_count == 3
+        assert callbacks.on_tool_error.call_count == 0
+
+    def test_pool_is_reused(self):
+        handler = _handler()
+        handler.requests = [_request(i, "slow_read", f"f{i}") for i in range(2)]
+        handler.exec_requests()
+        executor = handler._executor
+        handler.exec_requests()
+        assert executor is not None
+        assert handler._executor is executor
+
+
+class TestParallelSettingsPersistence:
+    """Test that the parallel settings survive serialization."""
+
+    def test_to_dict_roundtrip(self):
+        handler = _handler()
+        handler.max_parallel_workers = 3
+        restored = AnthropicToolHandler.from_dict(handler.to_dict())
+        assert restored.parallel_execution is True
+        assert restored.max_parallel_workers == 3
+
+    def test_getstate_drops_executor(self):
+        handler = _handler()
+        handler.requests = [_request(i, "slow_read", f"f{i}") for i in range(2)]
+        handler.exec_requests()
+
+        state = handler.__getstate__()
+        assert "_executor" not in state
+        assert "_callback_lock" not in state
+
+        restored = AnthropicToolHandler.__new__(AnthropicToolHandler)
+        restored.__setstate__(state)
+        assert restored.parallel_execution is True
+        assert restored._executor is None
+        restored.requests = [_request(i, "slow_read", f"f{i}") for i in range(2)]
+        assert len(restored.exec_requests()) == 2
+
+    def test_toolify_marks_parallel_safe(self):
+        assert slow_read.__parallel_safe__ is True
+        assert write_marker.__parallel_safe__ is False
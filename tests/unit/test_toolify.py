@@ -281,6 +281,36 @@ class TestRealWorldExamples:
         assert data["status"] == "active"
 
 
+class TestInputPlan:
+    """Test that toolify works out its input converters once."""
+
+    def test_signature_read_once(self, monkeypatch):
+        """Calls reuse the converters built at decoration time."""
+        import inspect
+
+        @toolify()
+        def scale(x: int, factor: float = 2.0, label="x") -> str:
+            return f"{label}={x * factor}"
+
+        calls = []
+        original = inspect.signature
+        monkeypatch.setattr(inspect, "signature", lambda *a, **k: calls.append(a) or original(*a, **k))
+
+        assert scale("3") == "x=6.0"
+        assert scale("3", factor="0.5", label="y") == "y=1.5"
+        assert calls == []
+
+    def test_unannotated_and_extra_arguments_pass_through(self):
+        """Parameters without hints and **kwargs keep their values."""
+
+        @toolify()
+        def collect(a, b: int, **rest) -> dict:
+            return {"a": a, "b": b, "rest": rest}
+
+        data = json.loads(collect("1", "2", extra="3"))
+        assert data == {"a": "1", "b": 2, "rest": {"extra": "3"}}
+
+
 if __name__ == "__main__":
     # Run basic tests if executed directly
     print("Running basic @toolify tests...")
@@ -0,0 +1,131 @@
+"""Tests for per-turn phase timing (bots.foundation.profiling)."""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from bots.foundation.profiling import TurnProfile
+from bots.observability import metrics
+from bots.observability.callbacks import BotCallbacks
+from bots.testing.mock_bot import MockBot
+
+
+@pytest.fixture
+def bot():
+    bot = MockBot(autosave=False, enable_tracing=False)
+    bot.add_mock_tool("lookup")
+    return bot
+
+
+class TestTurnProfile:
+    def test_nested_phases_are_exclusive(self):
+        profile = TurnProfile()
+        with profile.phase("api_wait"):
+            with profile.phase("message_build"):
+                time.sleep(0.02)
+        profile.finish()
+        totals = profile.totals()
+        assert totals["message_build"] >= 0.02
+        assert totals["api_wait"] < 0.01
+        assert profile.total >= sum(totals.values())
+
+    def test_other_profiles_do_not_nest(self):
+        outer, inner = TurnProfile(), TurnProfile()
+        with outer.phase("tool", "branch_self"):
+            with inner.phase("api_wait"):
+                time.sleep(0.02)
+        assert outer.totals()["tool"] >= 0.02
+
+    def test_phases_on_other_threads_overlap(self):
+        profile = TurnProfile()
+        with profile.phase("api_wait"):
+            # Like ToolHandler.start_request during streaming: the worker inherits the open phase
+            context = contextvars.copy_context()
+            worker = threading.Thread(target=context.run, args=(self._tool, profile))
+            worker.start()
+            time.sleep(0.05)
+            worker.join()
+        totals = profile.totals()
+        assert totals["tool"] >= 0.03
+        assert totals["api_wait"] >= 0.04
+
+    @staticmethod
+    def _tool(profile):
+        with profile.phase("tool", "slow"):
+            time.sleep(0.03)
+
+    def test_phase_spans(self):
+        names = []
+
+        class Tracer:
+            @contextmanager
+            def start_as_current_span(self, name):
+                names.append(name)
+                yield None
+
+        profile = TurnProfile(Tracer())
+        with profile.phase("tool", "lookup"):
+            pass
+        assert names == ["bot.phase.tool"]
+
+
+class TestRespondProfile:
+    def test_phases_of_a_turn(self, bot):
+        bot.respond("hello")
+        profile = bot.last_turn_profile
+        assert bot._turn_profile is None
+        assert {"message_build", "api_wait", "response_processing", "result_sync"} <= set(profile.totals())
+        assert profile.total >= sum(profile.totals().values())
+
+    def test_tool_entries_are_labeled(self, bot):
+        bot.tool_handler.set_execution_delay("lookup", 0.02)
+        profile = bot._start_turn_profile()
+        bot.tool_handler.requests = [{"id": "call_1", "name": "lookup", "parameters": {}}]
+        bot.tool_handler.exec_requests()
+        bot._finish_turn_profile(profile)
+        slowest = bot.last_turn_profile.slowest()
+        assert slowest.phase == "tool" and slowest.label == "lookup" and slowest.seconds >= 0.02
+
+    def test_autosave_phases(self, bot, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        bot.autosave = True
+        bot.respond("hello")
+        assert [entry.phase for entry in bot.last_turn_profile.entries].count("autosave") == 2
+
+    def test_failed_turn_keeps_profile(self, bot):
+        bot.set_failure_mode(True)
+        with pytest.raises(Exception):
+            bot.respond("hello")
+        assert bot._turn_profile is None
+        assert "api_wait" in bot.last_turn_profile.totals()
+
+    def test_callbacks_receive_profile(self):
+        received = []
+
+        class Recorder(BotCallbacks):
+            def on_respond_complete(self, response, metadata=None):
+                received.append(metadata["turn_profile"])
+
+        bot = MockBot(autosave=False, enable_tracing=False, callbacks=Recorder())
+        bot.respond("hello")
+        assert received[0]["total"] > 0 and "api_wait" in received[0]["phases"]
+
+    def test_not_saved(self, bot, tmp_path):
+        bot.respond("hello")
+        loaded = MockBot.load(bot.save(str(tmp_path / "profiled")))
+        assert loaded.last_turn_profile is None
+
+    def test_metrics_aggregate_turns(self, bot):
+        metrics.reset_metrics()
+        try:
+            bot.respond("one")
+            bot.respond("two")
+            stats = metrics.get_phase_stats(metrics.bot_metrics_id(bot))
+            assert stats["turn"]["count"] == 2
+            assert stats["api_wait"]["mean"] == pytest.approx(stats["api_wait"]["total"] / 2)
+            assert metrics.get_phase_stats()["turn"]["count"] >= 2
+        finally:
+            metrics.reset_metrics()